@@ -6,7 +6,6 @@ from __future__ import division
 cimport cython
 import numpy as np
 cimport numpy as np
-ctypedef cython.floating DTYPE_t
 from libc.math cimport log, exp, fabs
 from cython.parallel import prange
 
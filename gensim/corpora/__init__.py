@@ -11,7 +11,11 @@ from .svmlightcorpus import SvmLightCorpus  # noqa:F401
 from .lowcorpus import LowCorpus  # noqa:F401
 from .dictionary import Dictionary  # noqa:F401
 from .hashdictionary import HashDictionary  # noqa:F401
+from .compactdictionary import CompactDictionary  # noqa:F401
 from .wikicorpus import WikiCorpus  # noqa:F401
 from .textcorpus import TextCorpus, TextDirectoryCorpus  # noqa:F401
 from .ucicorpus import UciCorpus  # noqa:F401
 from .malletcorpus import MalletCorpus  # noqa:F401
+from .csrcorpus import CsrCorpus  # noqa:F401
+from .prefetchcorpus import PrefetchCorpus  # noqa:F401
+from .compressedcorpus import BlockCompressedCorpus  # noqa:F401
@@ -0,0 +1,45 @@
+#!/usr/bin/env cython
+# coding: utf-8
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: embedsignature=True
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Batch hashing of tokens for :class:`~gensim.corpora.hashdictionary.HashDictionary` (fast Cython version)."""
+
+import numpy as np
+
+
+def adler32_batch(const unsigned char[::1] buf, const long long[::1] offsets):
+    """Compute the Adler-32 checksum of many byte strings at once, without holding the GIL.
+
+    Gives the same values as `zlib.adler32` (unsigned, as in Python 3) applied to each string separately.
+
+    Parameters
+    ----------
+    buf : numpy.ndarray of uint8
+        All strings, concatenated.
+    offsets : numpy.ndarray of int64
+        String `i` is `buf[offsets[i]:offsets[i + 1]]`.
+
+    Returns
+    -------
+    numpy.ndarray of uint32
+        Checksum of each string.
+
+    """
+    cdef Py_ssize_t num_strings = max(offsets.shape[0] - 1, 0)
+    result = np.empty(num_strings, dtype=np.uint32)
+    cdef unsigned int[::1] out = result
+    cdef Py_ssize_t i, j
+    cdef unsigned int a, b
+
+    with nogil:
+        for i in range(num_strings):
+            a, b = 1, 0
+            for j in range(offsets[i], offsets[i + 1]):
+                a = (a + buf[j]) % 65521
+                b = (b + a) % 65521
+            out[i] = (b << 16) | a
+    return result
@@ -11,8 +11,107 @@ from six import string_types
 from six.moves import range
 import logging
 
+import numpy as np
+
 cimport cython
 from libc.stdio cimport sscanf
+from libc.stdlib cimport strtod, strtoll
+
+
+cdef extern from "<ctype.h>" nogil:
+    int isspace(int c)
+
+
+cdef inline bint is_blank(char c) nogil:
+    return c == c' ' or c == c'\t'
+
+
+cdef inline const char *skip_blanks(const char *pos) nogil:
+    # unlike the whitespace skipped by strtoll/strtod, stop at the end of the line
+    while is_blank(pos[0]):
+        pos += 1
+    return pos
+
+
+# powers of ten exactly representable as double
+cdef double *EXACT_POWERS = [
+    1e0, 1e1, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9, 1e10, 1e11,
+    1e12, 1e13, 1e14, 1e15, 1e16, 1e17, 1e18, 1e19, 1e20, 1e21, 1e22,
+]
+
+
+cdef inline double parse_double(const char *pos, char **end) nogil:
+    """Parse a decimal number like `strtod`, with a fast path for short numbers such as those written by MmWriter.
+
+    A mantissa of at most 15 digits and a power of ten of at most 22 are both exact doubles, so their product or
+    quotient is correctly rounded, just like the result of `strtod`.
+
+    """
+    cdef const char *p = pos
+    cdef long long mantissa = 0
+    cdef int digits = 0, scale = 0, exponent = 0, exp_sign = 1
+    cdef bint negative = False
+    cdef double result
+
+    if p[0] == c'-' or p[0] == c'+':
+        negative = p[0] == c'-'
+        p += 1
+    while c'0' <= p[0] <= c'9':
+        if digits < 16:
+            mantissa = mantissa * 10 + (p[0] - c'0')
+            if mantissa:
+                digits += 1
+        else:
+            return strtod(pos, end)
+        p += 1
+    if p[0] == c'.':
+        p += 1
+        while c'0' <= p[0] <= c'9':
+            if digits < 16:
+                mantissa = mantissa * 10 + (p[0] - c'0')
+                if mantissa:
+                    digits += 1
+                scale += 1
+            else:
+                return strtod(pos, end)
+            p += 1
+    if p == pos or (p == pos + 1 and (pos[0] == c'.' or pos[0] == c'-' or pos[0] == c'+')):
+        return strtod(pos, end)
+    if p[0] == c'e' or p[0] == c'E':
+        p += 1
+        if p[0] == c'-' or p[0] == c'+':
+            exp_sign = -1 if p[0] == c'-' else 1
+            p += 1
+        if not (c'0' <= p[0] <= c'9'):
+            return strtod(pos, end)
+        while c'0' <= p[0] <= c'9':
+            exponent = exponent * 10 + (p[0] - c'0')
+            if exponent > 1000:
+                return strtod(pos, end)
+            p += 1
+    exponent = exp_sign * exponent - scale
+    if digits > 15 or exponent > 22 or exponent < -22:
+        return strtod(pos, end)
+    result = <double>mantissa
+    if exponent >= 0:
+        result *= EXACT_POWERS[exponent]
+    else:
+        result /= EXACT_POWERS[-exponent]
+    end[0] = <char *>p
+    return -result if negative else result
+
+
+cdef inline long long parse_long(const char *pos, char **end) nogil:
+    """Parse a non-negative decimal integer like `strtoll`, with a fast path for plain digits."""
+    cdef const char *p = pos
+    cdef long long result = 0
+    while c'0' <= p[0] <= c'9' and p - pos < 18:
+        result = result * 10 + (p[0] - c'0')
+        p += 1
+    if p == pos or c'0' <= p[0] <= c'9':
+        return strtoll(pos, end, 10)
+    end[0] = <char *>p
+    return result
 
 
 logger = logging.getLogger(__name__)
@@ -216,3 +315,135 @@ cdef class MmReader(object):
         if close_fin:
             fin.close()
         return document
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def parse_mm_block(const char[::1] block, bint transposed=True):
+    """Parse complete `docid termid value` lines of an MM file, without holding the GIL.
+
+    Used by :meth:`~gensim.corpora.mmcorpus.MmCorpus.iter_parallel`, so that several threads can parse
+    different parts of the same file at once.
+
+    Parameters
+    ----------
+    block : numpy.ndarray of int8
+        Complete lines from the data section of an MM file, ending with a newline.
+    transposed : bool, optional
+        Do lines represent `doc_id, term_id, value`, instead of `term_id, doc_id, value`?
+
+    Returns
+    -------
+    (numpy.ndarray of int64, numpy.ndarray of int64, numpy.ndarray of float64)
+        0-based document ids, 0-based term ids and values of all lines in `block`.
+
+    """
+    cdef Py_ssize_t size = block.shape[0]
+    cdef Py_ssize_t i, num_lines = 0, num_parsed = 0
+    cdef const char *start
+    cdef const char *pos
+    cdef char *end
+    cdef long long docid, termid
+    cdef double val
+    cdef bint failed = False
+    cdef Py_ssize_t line_start, line_end
+
+    if size and block[size - 1] != c'\n':
+        raise ValueError("MM block must end with a newline")
+    for i in range(size):
+        if block[i] == c'\n':
+            num_lines += 1
+
+    docids_arr = np.empty(num_lines, dtype=np.int64)
+    termids_arr = np.empty(num_lines, dtype=np.int64)
+    vals_arr = np.empty(num_lines, dtype=np.float64)
+    cdef long long[::1] docids = docids_arr
+    cdef long long[::1] termids = termids_arr
+    cdef double[::1] vals = vals_arr
+
+    if size:
+        start = &block[0]
+        with nogil:
+            pos = start
+            while pos < start + size:
+                # skip blank lines
+                while pos < start + size and isspace(pos[0]):
+                    pos += 1
+                if pos >= start + size:
+                    break
+                docid = parse_long(pos, &end)
+                if end == pos or not is_blank(end[0]):
+                    failed = True
+                    break
+                pos = skip_blanks(end)
+                termid = parse_long(pos, &end)
+                if end == pos or isspace(pos[0]) or not is_blank(end[0]):
+                    failed = True
+                    break
+                pos = skip_blanks(end)
+                val = parse_double(pos, &end)
+                if end == pos or isspace(pos[0]):
+                    failed = True
+                    break
+                pos = end
+                # the rest of the line must be whitespace
+                while pos[0] != c'\n':
+                    if not isspace(pos[0]):
+                        failed = True
+                        break
+                    pos += 1
+                if failed:
+                    break
+                if not transposed:
+                    docid, termid = termid, docid
+                # -1 because matrix market indexes are 1-based => convert to 0-based
+                docids[num_parsed] = docid - 1
+                termids[num_parsed] = termid - 1
+                vals[num_parsed] = val
+                num_parsed += 1
+                pos += 1
+        if failed:
+            line_start = pos - start
+            while line_start > 0 and block[line_start - 1] != c'\n':
+                line_start -= 1
+            line_end = line_start
+            while block[line_end] != c'\n':
+                line_end += 1
+            raise ValueError("unable to parse line: {}".format(bytes(block[line_start:line_end])))
+
+    return docids_arr[:num_parsed], termids_arr[:num_parsed], vals_arr[:num_parsed]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def mm_documents(const long long[::1] docids, const long long[::1] termids, const double[::1] vals):
+    """Group the lines parsed by :func:`~gensim.corpora._mmreader.parse_mm_block` into documents.
+
+    Parameters
+    ----------
+    docids : numpy.ndarray of int64
+        0-based document ids, in ascending order.
+    termids : numpy.ndarray of int64
+        0-based term ids.
+    vals : numpy.ndarray of float64
+        Values.
+
+    Returns
+    -------
+    list of (int, list of (int, float))
+        Document number and document in BoW format, for each document stored in the lines.
+
+    """
+    cdef Py_ssize_t i, num_lines = docids.shape[0]
+    cdef long long previd = -1
+    result = []
+    document = None
+    for i in range(num_lines):
+        if docids[i] != previd:
+            if docids[i] < previd:
+                raise ValueError("matrix columns must come in ascending order")
+            previd = docids[i]
+            document = []
+            result.append((previd, document))
+        document.append((termids[i], vals[i]))
+    return result
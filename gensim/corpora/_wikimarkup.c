@@ -0,0 +1,9181 @@
+/* Generated by Cython 0.29.2 */
+
+#define PY_SSIZE_T_CLEAN
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_2"
+#define CYTHON_HEX_VERSION 0x001D02F0
+#define CYTHON_FUTURE_DIVISION 0
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #ifndef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS (PY_VERSION_HEX >= 0x030600B1)
+  #endif
+  #ifndef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #include "longintrepr.h"
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
+  #define Py_OptimizeFlag 0
+#endif
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_USE_DICT_VERSIONS
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+        static PY_UINT64_T __pyx_dict_version = 0;\
+        static PyObject *__pyx_dict_cached_value = NULL;\
+        if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+            (VAR) = __pyx_dict_cached_value;\
+        } else {\
+            (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+            __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+        }\
+    }
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0; // PyThread_create_key reports success always
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif // TSS (Thread Specific Storage) API
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                              0 : _PyUnicode_Ready((PyObject *)(op)))
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : (Py_INCREF(func), func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(WIN32) || defined(MS_WINDOWS)
+  #define _USE_MATH_DEFINES
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+{ \
+  __pyx_filename = __pyx_f[f_index]; __pyx_lineno = lineno; __pyx_clineno = __LINE__; goto Ln_error; \
+}
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__gensim__corpora___wikimarkup
+#define __PYX_HAVE_API__gensim__corpora___wikimarkup
+/* Early includes */
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT 0
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+static const char *__pyx_f[] = {
+  "_wikimarkup.pyx",
+};
+
+/*--- Type declarations ---*/
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        Py_SIZE(list) = len+1;
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* PyUnicode_Substring.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_Substring(
+            PyObject* text, Py_ssize_t start, Py_ssize_t stop);
+
+/* GetItemIntUnicode.proto */
+#define __Pyx_GetItemInt_Unicode(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Unicode_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "string index out of range"), (Py_UCS4)-1))
+static CYTHON_INLINE Py_UCS4 __Pyx_GetItemInt_Unicode_Fast(PyObject* ustring, Py_ssize_t i,
+                                                           int wraparound, int boundscheck);
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+}
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+}
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* BytesEquals.proto */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* UnicodeEquals.proto */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+
+/* Module declarations from 'gensim.corpora._wikimarkup' */
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__finish(PyObject *, PyObject *, Py_ssize_t); /*proto*/
+static CYTHON_INLINE int __pyx_f_6gensim_7corpora_11_wikimarkup__is_word(Py_UCS4); /*proto*/
+static CYTHON_INLINE int __pyx_f_6gensim_7corpora_11_wikimarkup__at(PyObject *, Py_ssize_t, Py_ssize_t, PyObject *); /*proto*/
+static Py_ssize_t __pyx_f_6gensim_7corpora_11_wikimarkup__language_link_start(PyObject *, Py_ssize_t); /*proto*/
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_language_links(PyObject *); /*proto*/
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_delimited(PyObject *, PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_element(PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_categories(PyObject *); /*proto*/
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__replace_urls(PyObject *); /*proto*/
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__simplify_links(PyObject *); /*proto*/
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_table_lines(PyObject *); /*proto*/
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_table_cells(PyObject *); /*proto*/
+static int __pyx_f_6gensim_7corpora_11_wikimarkup__table_attribute_at(PyObject *, Py_ssize_t, Py_ssize_t, int); /*proto*/
+static int __pyx_f_6gensim_7corpora_11_wikimarkup__table_attribute_line(PyObject *, Py_ssize_t, Py_ssize_t, Py_ssize_t, int); /*proto*/
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_table_attributes(PyObject *); /*proto*/
+#define __Pyx_MODULE_NAME "gensim.corpora._wikimarkup"
+extern int __pyx_module_is_main_gensim__corpora___wikimarkup;
+int __pyx_module_is_main_gensim__corpora___wikimarkup = 0;
+
+/* Implementation of 'gensim.corpora._wikimarkup' */
+static PyObject *__pyx_builtin_range;
+static const char __pyx_k_[] = "";
+static const char __pyx_k_c[] = "c";
+static const char __pyx_k_i[] = "i";
+static const char __pyx_k_j[] = "j";
+static const char __pyx_k_n[] = "n";
+static const char __pyx_k_s[] = "s";
+static const char __pyx_k__2[] = "{{";
+    static const char __pyx_k__3[] = "[[";
+    static const char __pyx_k__4[] = "<";
+    static const char __pyx_k__5[] = "</";
+    static const char __pyx_k__6[] = ">";
+    static const char __pyx_k__7[] = "/>";
+    static const char __pyx_k__8[] = "[";
+    static const char __pyx_k__9[] = "://";
+    static const char __pyx_k__10[] = "\n";
+    static const char __pyx_k__11[] = "<!--";
+    static const char __pyx_k__12[] = "-->";
+    static const char __pyx_k__13[] = "!!";
+    static const char __pyx_k__14[] = "\n|";
+    static const char __pyx_k__15[] = "|-||";
+    static const char __pyx_k__16[] = "|||";
+    static const char __pyx_k__17[] = "|\n|";
+    static const char __pyx_k__18[] = "||";
+    static const char __pyx_k__19[] = "[]";
+    static const char __pyx_k__20[] = "]";
+    static const char __pyx_k_bar[] = "bar";
+    static const char __pyx_k_ile[] = "ile:";
+    static const char __pyx_k_old[] = "old";
+    static const char __pyx_k_pos[] = "pos";
+    static const char __pyx_k_ref[] = "ref";
+    static const char __pyx_k_last[] = "last";
+    static const char __pyx_k_mage[] = "mage";
+    static const char __pyx_k_main[] = "__main__";
+    static const char __pyx_k_math[] = "math";
+    static const char __pyx_k_name[] = "__name__";
+    static const char __pyx_k_test[] = "__test__";
+    static const char __pyx_k_text[] = "text";
+    static const char __pyx_k_align[] = "align=";
+    static const char __pyx_k_class[] = "class=";
+    static const char __pyx_k_iters[] = "iters";
+    static const char __pyx_k_range[] = "range";
+    static const char __pyx_k_scope[] = "scope=";
+    static const char __pyx_k_style[] = "style=";
+    static const char __pyx_k_n_open[] = "n_open";
+    static const char __pyx_k_nowiki[] = "nowiki";
+    static const char __pyx_k_pieces[] = "pieces";
+    static const char __pyx_k_prev_c[] = "prev_c";
+    static const char __pyx_k_bgcolor[] = "bgcolor";
+    static const char __pyx_k_colspan[] = "colspan";
+    static const char __pyx_k_n_close[] = "n_close";
+    static const char __pyx_k_rowspan[] = "rowspan";
+    static const char __pyx_k_Category[] = "[[Category:";
+    static const char __pyx_k_in_template[] = "in_template";
+    static const char __pyx_k_remove_file[] = "remove_file";
+    static const char __pyx_k_remove_markup[] = "remove_markup";
+    static const char __pyx_k_simplify_links[] = "simplify_links";
+    static const char __pyx_k_wikimarkup_pyx[] = "_wikimarkup.pyx";
+    static const char __pyx_k_remove_template[] = "remove_template";
+    static const char __pyx_k_promote_remaining[] = "promote_remaining";
+    static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+    static const char __pyx_k_gensim_corpora__wikimarkup[] = "gensim.corpora._wikimarkup";
+    static const char __pyx_k_Wiki_markup_stripping_for_mod_ge[] = "Wiki markup stripping for :mod:`gensim.corpora.wikicorpus` (fast Cython version).\n\nEach regular expression pass of :func:`gensim.corpora.wikicorpus.remove_markup` is replaced by a hand-written scanner\nthat walks the text once, in C, and copies the unchanged parts between matches. The scanners reproduce the matching\nrules of the regular expressions exactly (including lazy and greedy repetitions and lookarounds), so the output is\nthe same as that of the pure Python functions.\n\n";
+    static PyObject *__pyx_kp_u_;
+    static PyObject *__pyx_kp_u_Category;
+    static PyObject *__pyx_kp_u__10;
+    static PyObject *__pyx_kp_u__11;
+    static PyObject *__pyx_kp_u__12;
+    static PyObject *__pyx_kp_u__13;
+    static PyObject *__pyx_kp_u__14;
+    static PyObject *__pyx_kp_u__15;
+    static PyObject *__pyx_kp_u__16;
+    static PyObject *__pyx_kp_u__17;
+    static PyObject *__pyx_kp_u__18;
+    static PyObject *__pyx_kp_u__19;
+    static PyObject *__pyx_kp_u__2;
+    static PyObject *__pyx_kp_u__20;
+    static PyObject *__pyx_kp_u__3;
+    static PyObject *__pyx_kp_u__4;
+    static PyObject *__pyx_kp_u__5;
+    static PyObject *__pyx_kp_u__6;
+    static PyObject *__pyx_kp_u__7;
+    static PyObject *__pyx_kp_u__8;
+    static PyObject *__pyx_kp_u__9;
+    static PyObject *__pyx_kp_u_align;
+    static PyObject *__pyx_n_s_bar;
+    static PyObject *__pyx_n_u_bgcolor;
+    static PyObject *__pyx_n_s_c;
+    static PyObject *__pyx_kp_u_class;
+    static PyObject *__pyx_n_s_cline_in_traceback;
+    static PyObject *__pyx_n_u_colspan;
+    static PyObject *__pyx_n_s_gensim_corpora__wikimarkup;
+    static PyObject *__pyx_n_s_i;
+    static PyObject *__pyx_kp_u_ile;
+    static PyObject *__pyx_n_s_in_template;
+    static PyObject *__pyx_n_s_iters;
+    static PyObject *__pyx_n_s_j;
+    static PyObject *__pyx_n_s_last;
+    static PyObject *__pyx_n_u_mage;
+    static PyObject *__pyx_n_s_main;
+    static PyObject *__pyx_n_u_math;
+    static PyObject *__pyx_n_s_n;
+    static PyObject *__pyx_n_s_n_close;
+    static PyObject *__pyx_n_s_n_open;
+    static PyObject *__pyx_n_s_name;
+    static PyObject *__pyx_n_u_nowiki;
+    static PyObject *__pyx_n_s_old;
+    static PyObject *__pyx_n_s_pieces;
+    static PyObject *__pyx_n_s_pos;
+    static PyObject *__pyx_n_s_prev_c;
+    static PyObject *__pyx_n_s_promote_remaining;
+    static PyObject *__pyx_n_s_range;
+    static PyObject *__pyx_n_u_ref;
+    static PyObject *__pyx_n_s_remove_file;
+    static PyObject *__pyx_n_s_remove_markup;
+    static PyObject *__pyx_n_s_remove_template;
+    static PyObject *__pyx_n_u_rowspan;
+    static PyObject *__pyx_n_s_s;
+    static PyObject *__pyx_kp_u_scope;
+    static PyObject *__pyx_n_s_simplify_links;
+    static PyObject *__pyx_kp_u_style;
+    static PyObject *__pyx_n_s_test;
+    static PyObject *__pyx_n_s_text;
+    static PyObject *__pyx_kp_s_wikimarkup_pyx;
+static PyObject *__pyx_pf_6gensim_7corpora_11_wikimarkup_remove_template(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s); /* proto */
+static PyObject *__pyx_pf_6gensim_7corpora_11_wikimarkup_2remove_file(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s); /* proto */
+static PyObject *__pyx_pf_6gensim_7corpora_11_wikimarkup_4remove_markup(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_text, PyObject *__pyx_v_promote_remaining, PyObject *__pyx_v_simplify_links); /* proto */
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_tuple__21;
+static PyObject *__pyx_tuple__23;
+static PyObject *__pyx_tuple__25;
+static PyObject *__pyx_codeobj__22;
+static PyObject *__pyx_codeobj__24;
+static PyObject *__pyx_codeobj__26;
+/* Late includes */
+
+/* "gensim/corpora/_wikimarkup.pyx":19
+ * 
+ * 
+ * cdef unicode _finish(list pieces, unicode s, Py_ssize_t last):             # <<<<<<<<<<<<<<
+ *     """Append the tail of `s` after `last` to `pieces` and join them; return `s` itself if nothing was replaced."""
+ *     if not pieces:
+ */
+
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__finish(PyObject *__pyx_v_pieces, PyObject *__pyx_v_s, Py_ssize_t __pyx_v_last) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  __Pyx_RefNannySetupContext("_finish", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":21
+ * cdef unicode _finish(list pieces, unicode s, Py_ssize_t last):
+ *     """Append the tail of `s` after `last` to `pieces` and join them; return `s` itself if nothing was replaced."""
+ *     if not pieces:             # <<<<<<<<<<<<<<
+ *         return s
+ *     pieces.append(s[last:])
+ */
+  __pyx_t_1 = (__pyx_v_pieces != Py_None)&&(PyList_GET_SIZE(__pyx_v_pieces) != 0);
+  __pyx_t_2 = ((!__pyx_t_1) != 0);
+  if (__pyx_t_2) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":22
+ *     """Append the tail of `s` after `last` to `pieces` and join them; return `s` itself if nothing was replaced."""
+ *     if not pieces:
+ *         return s             # <<<<<<<<<<<<<<
+ *     pieces.append(s[last:])
+ *     return u''.join(pieces)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_s);
+    __pyx_r = __pyx_v_s;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":21
+ * cdef unicode _finish(list pieces, unicode s, Py_ssize_t last):
+ *     """Append the tail of `s` after `last` to `pieces` and join them; return `s` itself if nothing was replaced."""
+ *     if not pieces:             # <<<<<<<<<<<<<<
+ *         return s
+ *     pieces.append(s[last:])
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":23
+ *     if not pieces:
+ *         return s
+ *     pieces.append(s[last:])             # <<<<<<<<<<<<<<
+ *     return u''.join(pieces)
+ * 
+ */
+  if (unlikely(__pyx_v_pieces == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
+    __PYX_ERR(0, 23, __pyx_L1_error)
+  }
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 23, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_last, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_3); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":24
+ *         return s
+ *     pieces.append(s[last:])
+ *     return u''.join(pieces)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = PyUnicode_Join(__pyx_kp_u_, __pyx_v_pieces); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 24, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":19
+ * 
+ * 
+ * cdef unicode _finish(list pieces, unicode s, Py_ssize_t last):             # <<<<<<<<<<<<<<
+ *     """Append the tail of `s` after `last` to `pieces` and join them; return `s` itself if nothing was replaced."""
+ *     if not pieces:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup._finish", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":27
+ * 
+ * 
+ * cdef inline bint _is_word(Py_UCS4 c):             # <<<<<<<<<<<<<<
+ *     """Same as `\\w` in a unicode regular expression."""
+ *     return c.isalnum() or c == u'_'
+ */
+
+static CYTHON_INLINE int __pyx_f_6gensim_7corpora_11_wikimarkup__is_word(Py_UCS4 __pyx_v_c) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("_is_word", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":29
+ * cdef inline bint _is_word(Py_UCS4 c):
+ *     """Same as `\\w` in a unicode regular expression."""
+ *     return c.isalnum() or c == u'_'             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = Py_UNICODE_ISALNUM(__pyx_v_c); 
+  if (!(__pyx_t_2 != 0)) {
+  } else {
+    __pyx_t_1 = (__pyx_t_2 != 0);
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_c == 95) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":27
+ * 
+ * 
+ * cdef inline bint _is_word(Py_UCS4 c):             # <<<<<<<<<<<<<<
+ *     """Same as `\\w` in a unicode regular expression."""
+ *     return c.isalnum() or c == u'_'
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":32
+ * 
+ * 
+ * cdef inline bint _at(unicode s, Py_ssize_t n, Py_ssize_t pos, unicode literal):             # <<<<<<<<<<<<<<
+ *     """Does `literal` occur in `s` (of length `n`) at `pos`?"""
+ *     cdef Py_ssize_t k, m = len(literal)
+ */
+
+static CYTHON_INLINE int __pyx_f_6gensim_7corpora_11_wikimarkup__at(PyObject *__pyx_v_s, Py_ssize_t __pyx_v_n, Py_ssize_t __pyx_v_pos, PyObject *__pyx_v_literal) {
+  Py_ssize_t __pyx_v_k;
+  Py_ssize_t __pyx_v_m;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  Py_UCS4 __pyx_t_7;
+  Py_UCS4 __pyx_t_8;
+  __Pyx_RefNannySetupContext("_at", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":34
+ * cdef inline bint _at(unicode s, Py_ssize_t n, Py_ssize_t pos, unicode literal):
+ *     """Does `literal` occur in `s` (of length `n`) at `pos`?"""
+ *     cdef Py_ssize_t k, m = len(literal)             # <<<<<<<<<<<<<<
+ *     if pos < 0 or pos + m > n:
+ *         return False
+ */
+  if (unlikely(__pyx_v_literal == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 34, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_literal); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_v_m = __pyx_t_1;
+
+  /* "gensim/corpora/_wikimarkup.pyx":35
+ *     """Does `literal` occur in `s` (of length `n`) at `pos`?"""
+ *     cdef Py_ssize_t k, m = len(literal)
+ *     if pos < 0 or pos + m > n:             # <<<<<<<<<<<<<<
+ *         return False
+ *     for k in range(m):
+ */
+  __pyx_t_3 = ((__pyx_v_pos < 0) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = (((__pyx_v_pos + __pyx_v_m) > __pyx_v_n) != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":36
+ *     cdef Py_ssize_t k, m = len(literal)
+ *     if pos < 0 or pos + m > n:
+ *         return False             # <<<<<<<<<<<<<<
+ *     for k in range(m):
+ *         if s[pos + k] != literal[k]:
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":35
+ *     """Does `literal` occur in `s` (of length `n`) at `pos`?"""
+ *     cdef Py_ssize_t k, m = len(literal)
+ *     if pos < 0 or pos + m > n:             # <<<<<<<<<<<<<<
+ *         return False
+ *     for k in range(m):
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":37
+ *     if pos < 0 or pos + m > n:
+ *         return False
+ *     for k in range(m):             # <<<<<<<<<<<<<<
+ *         if s[pos + k] != literal[k]:
+ *             return False
+ */
+  __pyx_t_1 = __pyx_v_m;
+  __pyx_t_4 = __pyx_t_1;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_k = __pyx_t_5;
+
+    /* "gensim/corpora/_wikimarkup.pyx":38
+ *         return False
+ *     for k in range(m):
+ *         if s[pos + k] != literal[k]:             # <<<<<<<<<<<<<<
+ *             return False
+ *     return True
+ */
+    __pyx_t_6 = (__pyx_v_pos + __pyx_v_k);
+    __pyx_t_7 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_6, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_7 == (Py_UCS4)-1)) __PYX_ERR(0, 38, __pyx_L1_error)
+    __pyx_t_8 = __Pyx_GetItemInt_Unicode(__pyx_v_literal, __pyx_v_k, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_8 == (Py_UCS4)-1)) __PYX_ERR(0, 38, __pyx_L1_error)
+    __pyx_t_2 = ((__pyx_t_7 != __pyx_t_8) != 0);
+    if (__pyx_t_2) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":39
+ *     for k in range(m):
+ *         if s[pos + k] != literal[k]:
+ *             return False             # <<<<<<<<<<<<<<
+ *     return True
+ * 
+ */
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "gensim/corpora/_wikimarkup.pyx":38
+ *         return False
+ *     for k in range(m):
+ *         if s[pos + k] != literal[k]:             # <<<<<<<<<<<<<<
+ *             return False
+ *     return True
+ */
+    }
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":40
+ *         if s[pos + k] != literal[k]:
+ *             return False
+ *     return True             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":32
+ * 
+ * 
+ * cdef inline bint _at(unicode s, Py_ssize_t n, Py_ssize_t pos, unicode literal):             # <<<<<<<<<<<<<<
+ *     """Does `literal` occur in `s` (of length `n`) at `pos`?"""
+ *     cdef Py_ssize_t k, m = len(literal)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("gensim.corpora._wikimarkup._at", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":43
+ * 
+ * 
+ * cdef Py_ssize_t _language_link_start(unicode s, Py_ssize_t end):             # <<<<<<<<<<<<<<
+ *     """Start of the language link `\\n[[xx:Title]]` that ends just before `end`, or -1."""
+ *     cdef Py_ssize_t colon, start, j = end - 3
+ */
+
+static Py_ssize_t __pyx_f_6gensim_7corpora_11_wikimarkup__language_link_start(PyObject *__pyx_v_s, Py_ssize_t __pyx_v_end) {
+  Py_ssize_t __pyx_v_colon;
+  Py_ssize_t __pyx_v_start;
+  Py_ssize_t __pyx_v_j;
+  Py_UCS4 __pyx_v_c;
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_UCS4 __pyx_t_4;
+  int __pyx_t_5;
+  __Pyx_RefNannySetupContext("_language_link_start", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":45
+ * cdef Py_ssize_t _language_link_start(unicode s, Py_ssize_t end):
+ *     """Start of the language link `\\n[[xx:Title]]` that ends just before `end`, or -1."""
+ *     cdef Py_ssize_t colon, start, j = end - 3             # <<<<<<<<<<<<<<
+ *     cdef Py_UCS4 c
+ *     if j < 0 or s[end - 1] != u']' or s[end - 2] != u']':
+ */
+  __pyx_v_j = (__pyx_v_end - 3);
+
+  /* "gensim/corpora/_wikimarkup.pyx":47
+ *     cdef Py_ssize_t colon, start, j = end - 3
+ *     cdef Py_UCS4 c
+ *     if j < 0 or s[end - 1] != u']' or s[end - 2] != u']':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     # title: [^:\]]+
+ */
+  __pyx_t_2 = ((__pyx_v_j < 0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_end - 1);
+  __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_3, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 47, __pyx_L1_error)
+  __pyx_t_2 = ((__pyx_t_4 != 93) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_end - 2);
+  __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_3, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 47, __pyx_L1_error)
+  __pyx_t_2 = ((__pyx_t_4 != 93) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":48
+ *     cdef Py_UCS4 c
+ *     if j < 0 or s[end - 1] != u']' or s[end - 2] != u']':
+ *         return -1             # <<<<<<<<<<<<<<
+ *     # title: [^:\]]+
+ *     while j >= 0:
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":47
+ *     cdef Py_ssize_t colon, start, j = end - 3
+ *     cdef Py_UCS4 c
+ *     if j < 0 or s[end - 1] != u']' or s[end - 2] != u']':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     # title: [^:\]]+
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":50
+ *         return -1
+ *     # title: [^:\]]+
+ *     while j >= 0:             # <<<<<<<<<<<<<<
+ *         c = s[j]
+ *         if c == u':' or c == u']':
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_j >= 0) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "gensim/corpora/_wikimarkup.pyx":51
+ *     # title: [^:\]]+
+ *     while j >= 0:
+ *         c = s[j]             # <<<<<<<<<<<<<<
+ *         if c == u':' or c == u']':
+ *             break
+ */
+    __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_4;
+
+    /* "gensim/corpora/_wikimarkup.pyx":52
+ *     while j >= 0:
+ *         c = s[j]
+ *         if c == u':' or c == u']':             # <<<<<<<<<<<<<<
+ *             break
+ *         j -= 1
+ */
+    switch (__pyx_v_c) {
+      case 58:
+      case 93:
+
+      /* "gensim/corpora/_wikimarkup.pyx":53
+ *         c = s[j]
+ *         if c == u':' or c == u']':
+ *             break             # <<<<<<<<<<<<<<
+ *         j -= 1
+ *     if j < 0 or j == end - 3 or s[j] != u':':
+ */
+      goto __pyx_L8_break;
+
+      /* "gensim/corpora/_wikimarkup.pyx":52
+ *     while j >= 0:
+ *         c = s[j]
+ *         if c == u':' or c == u']':             # <<<<<<<<<<<<<<
+ *             break
+ *         j -= 1
+ */
+      break;
+      default: break;
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":54
+ *         if c == u':' or c == u']':
+ *             break
+ *         j -= 1             # <<<<<<<<<<<<<<
+ *     if j < 0 or j == end - 3 or s[j] != u':':
+ *         return -1
+ */
+    __pyx_v_j = (__pyx_v_j - 1);
+  }
+  __pyx_L8_break:;
+
+  /* "gensim/corpora/_wikimarkup.pyx":55
+ *             break
+ *         j -= 1
+ *     if j < 0 or j == end - 3 or s[j] != u':':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     colon = j
+ */
+  __pyx_t_2 = ((__pyx_v_j < 0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L10_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_j == (__pyx_v_end - 3)) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L10_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 55, __pyx_L1_error)
+  __pyx_t_2 = ((__pyx_t_4 != 58) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L10_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":56
+ *         j -= 1
+ *     if j < 0 or j == end - 3 or s[j] != u':':
+ *         return -1             # <<<<<<<<<<<<<<
+ *     colon = j
+ *     # language code: [a-z][a-z][\w-]*
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":55
+ *             break
+ *         j -= 1
+ *     if j < 0 or j == end - 3 or s[j] != u':':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     colon = j
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":57
+ *     if j < 0 or j == end - 3 or s[j] != u':':
+ *         return -1
+ *     colon = j             # <<<<<<<<<<<<<<
+ *     # language code: [a-z][a-z][\w-]*
+ *     j -= 1
+ */
+  __pyx_v_colon = __pyx_v_j;
+
+  /* "gensim/corpora/_wikimarkup.pyx":59
+ *     colon = j
+ *     # language code: [a-z][a-z][\w-]*
+ *     j -= 1             # <<<<<<<<<<<<<<
+ *     while j >= 0 and (_is_word(s[j]) or s[j] == u'-'):
+ *         j -= 1
+ */
+  __pyx_v_j = (__pyx_v_j - 1);
+
+  /* "gensim/corpora/_wikimarkup.pyx":60
+ *     # language code: [a-z][a-z][\w-]*
+ *     j -= 1
+ *     while j >= 0 and (_is_word(s[j]) or s[j] == u'-'):             # <<<<<<<<<<<<<<
+ *         j -= 1
+ *     start = j + 1
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_j >= 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L15_bool_binop_done;
+    }
+    __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_2 = (__pyx_f_6gensim_7corpora_11_wikimarkup__is_word(__pyx_t_4) != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L15_bool_binop_done;
+    }
+    __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_2 = ((__pyx_t_4 == 45) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L15_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "gensim/corpora/_wikimarkup.pyx":61
+ *     j -= 1
+ *     while j >= 0 and (_is_word(s[j]) or s[j] == u'-'):
+ *         j -= 1             # <<<<<<<<<<<<<<
+ *     start = j + 1
+ *     if colon - start < 2 or not (u'a' <= s[start] <= u'z') or not (u'a' <= s[start + 1] <= u'z'):
+ */
+    __pyx_v_j = (__pyx_v_j - 1);
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":62
+ *     while j >= 0 and (_is_word(s[j]) or s[j] == u'-'):
+ *         j -= 1
+ *     start = j + 1             # <<<<<<<<<<<<<<
+ *     if colon - start < 2 or not (u'a' <= s[start] <= u'z') or not (u'a' <= s[start + 1] <= u'z'):
+ *         return -1
+ */
+  __pyx_v_start = (__pyx_v_j + 1);
+
+  /* "gensim/corpora/_wikimarkup.pyx":63
+ *         j -= 1
+ *     start = j + 1
+ *     if colon - start < 2 or not (u'a' <= s[start] <= u'z') or not (u'a' <= s[start + 1] <= u'z'):             # <<<<<<<<<<<<<<
+ *         return -1
+ *     if start < 3 or s[start - 1] != u'[' or s[start - 2] != u'[' or s[start - 3] != u'\n':
+ */
+  __pyx_t_2 = (((__pyx_v_colon - __pyx_v_start) < 2) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L19_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_start, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_2 = (97 <= __pyx_t_4);
+  if (__pyx_t_2) {
+    __pyx_t_2 = (__pyx_t_4 <= 0x7A);
+  }
+  __pyx_t_5 = ((!(__pyx_t_2 != 0)) != 0);
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_1 = __pyx_t_5;
+    goto __pyx_L19_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_start + 1);
+  __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_3, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_5 = (97 <= __pyx_t_4);
+  if (__pyx_t_5) {
+    __pyx_t_5 = (__pyx_t_4 <= 0x7A);
+  }
+  __pyx_t_2 = ((!(__pyx_t_5 != 0)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L19_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":64
+ *     start = j + 1
+ *     if colon - start < 2 or not (u'a' <= s[start] <= u'z') or not (u'a' <= s[start + 1] <= u'z'):
+ *         return -1             # <<<<<<<<<<<<<<
+ *     if start < 3 or s[start - 1] != u'[' or s[start - 2] != u'[' or s[start - 3] != u'\n':
+ *         return -1
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":63
+ *         j -= 1
+ *     start = j + 1
+ *     if colon - start < 2 or not (u'a' <= s[start] <= u'z') or not (u'a' <= s[start + 1] <= u'z'):             # <<<<<<<<<<<<<<
+ *         return -1
+ *     if start < 3 or s[start - 1] != u'[' or s[start - 2] != u'[' or s[start - 3] != u'\n':
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":65
+ *     if colon - start < 2 or not (u'a' <= s[start] <= u'z') or not (u'a' <= s[start + 1] <= u'z'):
+ *         return -1
+ *     if start < 3 or s[start - 1] != u'[' or s[start - 2] != u'[' or s[start - 3] != u'\n':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     return start - 3
+ */
+  __pyx_t_2 = ((__pyx_v_start < 3) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L23_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_start - 1);
+  __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_3, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_t_2 = ((__pyx_t_4 != 91) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L23_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_start - 2);
+  __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_3, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_t_2 = ((__pyx_t_4 != 91) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L23_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_start - 3);
+  __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_3, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_t_2 = ((__pyx_t_4 != 10) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L23_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":66
+ *         return -1
+ *     if start < 3 or s[start - 1] != u'[' or s[start - 2] != u'[' or s[start - 3] != u'\n':
+ *         return -1             # <<<<<<<<<<<<<<
+ *     return start - 3
+ * 
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":65
+ *     if colon - start < 2 or not (u'a' <= s[start] <= u'z') or not (u'a' <= s[start + 1] <= u'z'):
+ *         return -1
+ *     if start < 3 or s[start - 1] != u'[' or s[start - 2] != u'[' or s[start - 3] != u'\n':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     return start - 3
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":67
+ *     if start < 3 or s[start - 1] != u'[' or s[start - 2] != u'[' or s[start - 3] != u'\n':
+ *         return -1
+ *     return start - 3             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = (__pyx_v_start - 3);
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":43
+ * 
+ * 
+ * cdef Py_ssize_t _language_link_start(unicode s, Py_ssize_t end):             # <<<<<<<<<<<<<<
+ *     """Start of the language link `\\n[[xx:Title]]` that ends just before `end`, or -1."""
+ *     cdef Py_ssize_t colon, start, j = end - 3
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("gensim.corpora._wikimarkup._language_link_start", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":70
+ * 
+ * 
+ * cdef unicode _remove_language_links(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P2, '', s)`: remove the trailing list of language links."""
+ *     cdef Py_ssize_t n = len(s), end = n, start, first = -1
+ */
+
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_language_links(PyObject *__pyx_v_s) {
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_end;
+  Py_ssize_t __pyx_v_start;
+  Py_ssize_t __pyx_v_first;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  Py_UCS4 __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  __Pyx_RefNannySetupContext("_remove_language_links", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":72
+ * cdef unicode _remove_language_links(unicode s):
+ *     """Same as `re.sub(RE_P2, '', s)`: remove the trailing list of language links."""
+ *     cdef Py_ssize_t n = len(s), end = n, start, first = -1             # <<<<<<<<<<<<<<
+ *     if n > 0 and s[n - 1] == u'\n':
+ *         end = n - 1
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 72, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 72, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_1;
+  __pyx_v_end = __pyx_v_n;
+  __pyx_v_first = -1L;
+
+  /* "gensim/corpora/_wikimarkup.pyx":73
+ *     """Same as `re.sub(RE_P2, '', s)`: remove the trailing list of language links."""
+ *     cdef Py_ssize_t n = len(s), end = n, start, first = -1
+ *     if n > 0 and s[n - 1] == u'\n':             # <<<<<<<<<<<<<<
+ *         end = n - 1
+ *     # the links are chained backwards from the end of the text; each link is found unambiguously
+ */
+  __pyx_t_3 = ((__pyx_v_n > 0) != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_1 = (__pyx_v_n - 1);
+  __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_1, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 73, __pyx_L1_error)
+  __pyx_t_3 = ((__pyx_t_4 == 10) != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":74
+ *     cdef Py_ssize_t n = len(s), end = n, start, first = -1
+ *     if n > 0 and s[n - 1] == u'\n':
+ *         end = n - 1             # <<<<<<<<<<<<<<
+ *     # the links are chained backwards from the end of the text; each link is found unambiguously
+ *     start = _language_link_start(s, end)
+ */
+    __pyx_v_end = (__pyx_v_n - 1);
+
+    /* "gensim/corpora/_wikimarkup.pyx":73
+ *     """Same as `re.sub(RE_P2, '', s)`: remove the trailing list of language links."""
+ *     cdef Py_ssize_t n = len(s), end = n, start, first = -1
+ *     if n > 0 and s[n - 1] == u'\n':             # <<<<<<<<<<<<<<
+ *         end = n - 1
+ *     # the links are chained backwards from the end of the text; each link is found unambiguously
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":76
+ *         end = n - 1
+ *     # the links are chained backwards from the end of the text; each link is found unambiguously
+ *     start = _language_link_start(s, end)             # <<<<<<<<<<<<<<
+ *     while start >= 0:
+ *         first = start
+ */
+  __pyx_v_start = __pyx_f_6gensim_7corpora_11_wikimarkup__language_link_start(__pyx_v_s, __pyx_v_end);
+
+  /* "gensim/corpora/_wikimarkup.pyx":77
+ *     # the links are chained backwards from the end of the text; each link is found unambiguously
+ *     start = _language_link_start(s, end)
+ *     while start >= 0:             # <<<<<<<<<<<<<<
+ *         first = start
+ *         start = _language_link_start(s, start)
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_start >= 0) != 0);
+    if (!__pyx_t_2) break;
+
+    /* "gensim/corpora/_wikimarkup.pyx":78
+ *     start = _language_link_start(s, end)
+ *     while start >= 0:
+ *         first = start             # <<<<<<<<<<<<<<
+ *         start = _language_link_start(s, start)
+ *     if first < 0:
+ */
+    __pyx_v_first = __pyx_v_start;
+
+    /* "gensim/corpora/_wikimarkup.pyx":79
+ *     while start >= 0:
+ *         first = start
+ *         start = _language_link_start(s, start)             # <<<<<<<<<<<<<<
+ *     if first < 0:
+ *         return s
+ */
+    __pyx_v_start = __pyx_f_6gensim_7corpora_11_wikimarkup__language_link_start(__pyx_v_s, __pyx_v_start);
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":80
+ *         first = start
+ *         start = _language_link_start(s, start)
+ *     if first < 0:             # <<<<<<<<<<<<<<
+ *         return s
+ *     return s[:first] + s[end:]
+ */
+  __pyx_t_2 = ((__pyx_v_first < 0) != 0);
+  if (__pyx_t_2) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":81
+ *         start = _language_link_start(s, start)
+ *     if first < 0:
+ *         return s             # <<<<<<<<<<<<<<
+ *     return s[:first] + s[end:]
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_s);
+    __pyx_r = __pyx_v_s;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":80
+ *         first = start
+ *         start = _language_link_start(s, start)
+ *     if first < 0:             # <<<<<<<<<<<<<<
+ *         return s
+ *     return s[:first] + s[end:]
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":82
+ *     if first < 0:
+ *         return s
+ *     return s[:first] + s[end:]             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 82, __pyx_L1_error)
+  }
+  __pyx_t_5 = __Pyx_PyUnicode_Substring(__pyx_v_s, 0, __pyx_v_first); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 82, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 82, __pyx_L1_error)
+  }
+  __pyx_t_6 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_end, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 82, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyUnicode_Concat(__pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 82, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_r = ((PyObject*)__pyx_t_7);
+  __pyx_t_7 = 0;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":70
+ * 
+ * 
+ * cdef unicode _remove_language_links(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P2, '', s)`: remove the trailing list of language links."""
+ *     cdef Py_ssize_t n = len(s), end = n, start, first = -1
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup._remove_language_links", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":85
+ * 
+ * 
+ * def remove_template(unicode s):             # <<<<<<<<<<<<<<
+ *     """Remove template wikimedia markup, same as :func:`gensim.corpora.wikicorpus.remove_template`.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_7corpora_11_wikimarkup_1remove_template(PyObject *__pyx_self, PyObject *__pyx_v_s); /*proto*/
+static char __pyx_doc_6gensim_7corpora_11_wikimarkup_remove_template[] = "remove_template(unicode s)\nRemove template wikimedia markup, same as :func:`gensim.corpora.wikicorpus.remove_template`.\n\n    Parameters\n    ----------\n    s : str\n        String containing markup template.\n\n    Returns\n    -------\n    str\n        \320\241opy of `s` with all the templates removed.\n\n    ";
+static PyMethodDef __pyx_mdef_6gensim_7corpora_11_wikimarkup_1remove_template = {"remove_template", (PyCFunction)__pyx_pw_6gensim_7corpora_11_wikimarkup_1remove_template, METH_O, __pyx_doc_6gensim_7corpora_11_wikimarkup_remove_template};
+static PyObject *__pyx_pw_6gensim_7corpora_11_wikimarkup_1remove_template(PyObject *__pyx_self, PyObject *__pyx_v_s) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("remove_template (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_s), (&PyUnicode_Type), 1, "s", 1))) __PYX_ERR(0, 85, __pyx_L1_error)
+  __pyx_r = __pyx_pf_6gensim_7corpora_11_wikimarkup_remove_template(__pyx_self, ((PyObject*)__pyx_v_s));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6gensim_7corpora_11_wikimarkup_remove_template(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_n_open;
+  Py_ssize_t __pyx_v_n_close;
+  Py_ssize_t __pyx_v_last;
+  int __pyx_v_in_template;
+  Py_UCS4 __pyx_v_c;
+  Py_UCS4 __pyx_v_prev_c;
+  PyObject *__pyx_v_pieces = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  Py_UCS4 __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  __Pyx_RefNannySetupContext("remove_template", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":99
+ * 
+ *     """
+ *     cdef Py_ssize_t i, n = len(s), n_open = 0, n_close = 0, last = 0             # <<<<<<<<<<<<<<
+ *     cdef bint in_template = False
+ *     cdef Py_UCS4 c, prev_c = 0
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 99, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_1;
+  __pyx_v_n_open = 0;
+  __pyx_v_n_close = 0;
+  __pyx_v_last = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":100
+ *     """
+ *     cdef Py_ssize_t i, n = len(s), n_open = 0, n_close = 0, last = 0
+ *     cdef bint in_template = False             # <<<<<<<<<<<<<<
+ *     cdef Py_UCS4 c, prev_c = 0
+ *     cdef list pieces = []
+ */
+  __pyx_v_in_template = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":101
+ *     cdef Py_ssize_t i, n = len(s), n_open = 0, n_close = 0, last = 0
+ *     cdef bint in_template = False
+ *     cdef Py_UCS4 c, prev_c = 0             # <<<<<<<<<<<<<<
+ *     cdef list pieces = []
+ *     if s.find(u'{{') < 0:
+ */
+  __pyx_v_prev_c = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":102
+ *     cdef bint in_template = False
+ *     cdef Py_UCS4 c, prev_c = 0
+ *     cdef list pieces = []             # <<<<<<<<<<<<<<
+ *     if s.find(u'{{') < 0:
+ *         return s
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_pieces = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":103
+ *     cdef Py_UCS4 c, prev_c = 0
+ *     cdef list pieces = []
+ *     if s.find(u'{{') < 0:             # <<<<<<<<<<<<<<
+ *         return s
+ *     for i in range(n):
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+    __PYX_ERR(0, 103, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__2, 0, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-2))) __PYX_ERR(0, 103, __pyx_L1_error)
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_2, __pyx_int_0, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_4) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":104
+ *     cdef list pieces = []
+ *     if s.find(u'{{') < 0:
+ *         return s             # <<<<<<<<<<<<<<
+ *     for i in range(n):
+ *         c = s[i]
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_s);
+    __pyx_r = __pyx_v_s;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":103
+ *     cdef Py_UCS4 c, prev_c = 0
+ *     cdef list pieces = []
+ *     if s.find(u'{{') < 0:             # <<<<<<<<<<<<<<
+ *         return s
+ *     for i in range(n):
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":105
+ *     if s.find(u'{{') < 0:
+ *         return s
+ *     for i in range(n):             # <<<<<<<<<<<<<<
+ *         c = s[i]
+ *         if not in_template and c == u'{' and prev_c == u'{':
+ */
+  __pyx_t_1 = __pyx_v_n;
+  __pyx_t_5 = __pyx_t_1;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_i = __pyx_t_6;
+
+    /* "gensim/corpora/_wikimarkup.pyx":106
+ *         return s
+ *     for i in range(n):
+ *         c = s[i]             # <<<<<<<<<<<<<<
+ *         if not in_template and c == u'{' and prev_c == u'{':
+ *             pieces.append(s[last:i - 1])
+ */
+    __pyx_t_7 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_7 == (Py_UCS4)-1)) __PYX_ERR(0, 106, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_7;
+
+    /* "gensim/corpora/_wikimarkup.pyx":107
+ *     for i in range(n):
+ *         c = s[i]
+ *         if not in_template and c == u'{' and prev_c == u'{':             # <<<<<<<<<<<<<<
+ *             pieces.append(s[last:i - 1])
+ *             in_template = True
+ */
+    __pyx_t_8 = ((!(__pyx_v_in_template != 0)) != 0);
+    if (__pyx_t_8) {
+    } else {
+      __pyx_t_4 = __pyx_t_8;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_8 = ((__pyx_v_c == 0x7B) != 0);
+    if (__pyx_t_8) {
+    } else {
+      __pyx_t_4 = __pyx_t_8;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_8 = ((__pyx_v_prev_c == 0x7B) != 0);
+    __pyx_t_4 = __pyx_t_8;
+    __pyx_L7_bool_binop_done:;
+    if (__pyx_t_4) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":108
+ *         c = s[i]
+ *         if not in_template and c == u'{' and prev_c == u'{':
+ *             pieces.append(s[last:i - 1])             # <<<<<<<<<<<<<<
+ *             in_template = True
+ *             n_open = 1
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 108, __pyx_L1_error)
+      }
+      __pyx_t_3 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_last, (__pyx_v_i - 1)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 108, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_3); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 108, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+      /* "gensim/corpora/_wikimarkup.pyx":109
+ *         if not in_template and c == u'{' and prev_c == u'{':
+ *             pieces.append(s[last:i - 1])
+ *             in_template = True             # <<<<<<<<<<<<<<
+ *             n_open = 1
+ *         if in_template:
+ */
+      __pyx_v_in_template = 1;
+
+      /* "gensim/corpora/_wikimarkup.pyx":110
+ *             pieces.append(s[last:i - 1])
+ *             in_template = True
+ *             n_open = 1             # <<<<<<<<<<<<<<
+ *         if in_template:
+ *             if c == u'{':
+ */
+      __pyx_v_n_open = 1;
+
+      /* "gensim/corpora/_wikimarkup.pyx":107
+ *     for i in range(n):
+ *         c = s[i]
+ *         if not in_template and c == u'{' and prev_c == u'{':             # <<<<<<<<<<<<<<
+ *             pieces.append(s[last:i - 1])
+ *             in_template = True
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":111
+ *             in_template = True
+ *             n_open = 1
+ *         if in_template:             # <<<<<<<<<<<<<<
+ *             if c == u'{':
+ *                 n_open += 1
+ */
+    __pyx_t_4 = (__pyx_v_in_template != 0);
+    if (__pyx_t_4) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":112
+ *             n_open = 1
+ *         if in_template:
+ *             if c == u'{':             # <<<<<<<<<<<<<<
+ *                 n_open += 1
+ *             elif c == u'}':
+ */
+      switch (__pyx_v_c) {
+        case 0x7B:
+
+        /* "gensim/corpora/_wikimarkup.pyx":113
+ *         if in_template:
+ *             if c == u'{':
+ *                 n_open += 1             # <<<<<<<<<<<<<<
+ *             elif c == u'}':
+ *                 n_close += 1
+ */
+        __pyx_v_n_open = (__pyx_v_n_open + 1);
+
+        /* "gensim/corpora/_wikimarkup.pyx":112
+ *             n_open = 1
+ *         if in_template:
+ *             if c == u'{':             # <<<<<<<<<<<<<<
+ *                 n_open += 1
+ *             elif c == u'}':
+ */
+        break;
+        case 0x7D:
+
+        /* "gensim/corpora/_wikimarkup.pyx":115
+ *                 n_open += 1
+ *             elif c == u'}':
+ *                 n_close += 1             # <<<<<<<<<<<<<<
+ *             if n_open == n_close:
+ *                 last = i + 1
+ */
+        __pyx_v_n_close = (__pyx_v_n_close + 1);
+
+        /* "gensim/corpora/_wikimarkup.pyx":114
+ *             if c == u'{':
+ *                 n_open += 1
+ *             elif c == u'}':             # <<<<<<<<<<<<<<
+ *                 n_close += 1
+ *             if n_open == n_close:
+ */
+        break;
+        default: break;
+      }
+
+      /* "gensim/corpora/_wikimarkup.pyx":116
+ *             elif c == u'}':
+ *                 n_close += 1
+ *             if n_open == n_close:             # <<<<<<<<<<<<<<
+ *                 last = i + 1
+ *                 in_template = False
+ */
+      __pyx_t_4 = ((__pyx_v_n_open == __pyx_v_n_close) != 0);
+      if (__pyx_t_4) {
+
+        /* "gensim/corpora/_wikimarkup.pyx":117
+ *                 n_close += 1
+ *             if n_open == n_close:
+ *                 last = i + 1             # <<<<<<<<<<<<<<
+ *                 in_template = False
+ *                 n_open, n_close = 0, 0
+ */
+        __pyx_v_last = (__pyx_v_i + 1);
+
+        /* "gensim/corpora/_wikimarkup.pyx":118
+ *             if n_open == n_close:
+ *                 last = i + 1
+ *                 in_template = False             # <<<<<<<<<<<<<<
+ *                 n_open, n_close = 0, 0
+ *         prev_c = c
+ */
+        __pyx_v_in_template = 0;
+
+        /* "gensim/corpora/_wikimarkup.pyx":119
+ *                 last = i + 1
+ *                 in_template = False
+ *                 n_open, n_close = 0, 0             # <<<<<<<<<<<<<<
+ *         prev_c = c
+ *     if in_template:
+ */
+        __pyx_t_10 = 0;
+        __pyx_t_11 = 0;
+        __pyx_v_n_open = __pyx_t_10;
+        __pyx_v_n_close = __pyx_t_11;
+
+        /* "gensim/corpora/_wikimarkup.pyx":116
+ *             elif c == u'}':
+ *                 n_close += 1
+ *             if n_open == n_close:             # <<<<<<<<<<<<<<
+ *                 last = i + 1
+ *                 in_template = False
+ */
+      }
+
+      /* "gensim/corpora/_wikimarkup.pyx":111
+ *             in_template = True
+ *             n_open = 1
+ *         if in_template:             # <<<<<<<<<<<<<<
+ *             if c == u'{':
+ *                 n_open += 1
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":120
+ *                 in_template = False
+ *                 n_open, n_close = 0, 0
+ *         prev_c = c             # <<<<<<<<<<<<<<
+ *     if in_template:
+ *         # an unclosed template swallows the rest of the text
+ */
+    __pyx_v_prev_c = __pyx_v_c;
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":121
+ *                 n_open, n_close = 0, 0
+ *         prev_c = c
+ *     if in_template:             # <<<<<<<<<<<<<<
+ *         # an unclosed template swallows the rest of the text
+ *         return u''.join(pieces)
+ */
+  __pyx_t_4 = (__pyx_v_in_template != 0);
+  if (__pyx_t_4) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":123
+ *     if in_template:
+ *         # an unclosed template swallows the rest of the text
+ *         return u''.join(pieces)             # <<<<<<<<<<<<<<
+ *     return _finish(pieces, s, last)
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = PyUnicode_Join(__pyx_kp_u_, __pyx_v_pieces); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 123, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":121
+ *                 n_open, n_close = 0, 0
+ *         prev_c = c
+ *     if in_template:             # <<<<<<<<<<<<<<
+ *         # an unclosed template swallows the rest of the text
+ *         return u''.join(pieces)
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":124
+ *         # an unclosed template swallows the rest of the text
+ *         return u''.join(pieces)
+ *     return _finish(pieces, s, last)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = __pyx_f_6gensim_7corpora_11_wikimarkup__finish(__pyx_v_pieces, __pyx_v_s, __pyx_v_last); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":85
+ * 
+ * 
+ * def remove_template(unicode s):             # <<<<<<<<<<<<<<
+ *     """Remove template wikimedia markup, same as :func:`gensim.corpora.wikicorpus.remove_template`.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup.remove_template", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_pieces);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":127
+ * 
+ * 
+ * def remove_file(unicode s):             # <<<<<<<<<<<<<<
+ *     """Remove the 'File:' and 'Image:' markup, keeping the file caption, same as
+ *     :func:`gensim.corpora.wikicorpus.remove_file`.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_7corpora_11_wikimarkup_3remove_file(PyObject *__pyx_self, PyObject *__pyx_v_s); /*proto*/
+static char __pyx_doc_6gensim_7corpora_11_wikimarkup_2remove_file[] = "remove_file(unicode s)\nRemove the 'File:' and 'Image:' markup, keeping the file caption, same as\n    :func:`gensim.corpora.wikicorpus.remove_file`.\n\n    Parameters\n    ----------\n    s : str\n        String containing 'File:' and 'Image:' markup.\n\n    Returns\n    -------\n    str\n        \320\241opy of `s` with all the 'File:' and 'Image:' markup replaced by their captions.\n\n    ";
+static PyMethodDef __pyx_mdef_6gensim_7corpora_11_wikimarkup_3remove_file = {"remove_file", (PyCFunction)__pyx_pw_6gensim_7corpora_11_wikimarkup_3remove_file, METH_O, __pyx_doc_6gensim_7corpora_11_wikimarkup_2remove_file};
+static PyObject *__pyx_pw_6gensim_7corpora_11_wikimarkup_3remove_file(PyObject *__pyx_self, PyObject *__pyx_v_s) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("remove_file (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_s), (&PyUnicode_Type), 1, "s", 1))) __PYX_ERR(0, 127, __pyx_L1_error)
+  __pyx_r = __pyx_pf_6gensim_7corpora_11_wikimarkup_2remove_file(__pyx_self, ((PyObject*)__pyx_v_s));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6gensim_7corpora_11_wikimarkup_2remove_file(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s) {
+  Py_ssize_t __pyx_v_pos;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_bar;
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_last;
+  Py_UCS4 __pyx_v_c;
+  PyObject *__pyx_v_pieces = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  Py_UCS4 __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  __Pyx_RefNannySetupContext("remove_file", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":142
+ * 
+ *     """
+ *     cdef Py_ssize_t pos, j, bar, n = len(s), last = 0             # <<<<<<<<<<<<<<
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 142, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_1;
+  __pyx_v_last = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":144
+ *     cdef Py_ssize_t pos, j, bar, n = len(s), last = 0
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []             # <<<<<<<<<<<<<<
+ *     pos = s.find(u'[[')
+ *     while pos >= 0:
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 144, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_pieces = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":145
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []
+ *     pos = s.find(u'[[')             # <<<<<<<<<<<<<<
+ *     while pos >= 0:
+ *         # \[\[([fF]ile:|[iI]mage)[^]]*(\]\])
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+    __PYX_ERR(0, 145, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__3, 0, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-2))) __PYX_ERR(0, 145, __pyx_L1_error)
+  __pyx_v_pos = __pyx_t_1;
+
+  /* "gensim/corpora/_wikimarkup.pyx":146
+ *     cdef list pieces = []
+ *     pos = s.find(u'[[')
+ *     while pos >= 0:             # <<<<<<<<<<<<<<
+ *         # \[\[([fF]ile:|[iI]mage)[^]]*(\]\])
+ *         if _at(s, n, pos + 3, u'ile:') and (s[pos + 2] == u'f' or s[pos + 2] == u'F'):
+ */
+  while (1) {
+    __pyx_t_3 = ((__pyx_v_pos >= 0) != 0);
+    if (!__pyx_t_3) break;
+
+    /* "gensim/corpora/_wikimarkup.pyx":148
+ *     while pos >= 0:
+ *         # \[\[([fF]ile:|[iI]mage)[^]]*(\]\])
+ *         if _at(s, n, pos + 3, u'ile:') and (s[pos + 2] == u'f' or s[pos + 2] == u'F'):             # <<<<<<<<<<<<<<
+ *             j = pos + 7
+ *         elif _at(s, n, pos + 3, u'mage') and (s[pos + 2] == u'i' or s[pos + 2] == u'I'):
+ */
+    __pyx_t_4 = (__pyx_f_6gensim_7corpora_11_wikimarkup__at(__pyx_v_s, __pyx_v_n, (__pyx_v_pos + 3), __pyx_kp_u_ile) != 0);
+    if (__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_1 = (__pyx_v_pos + 2);
+    __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_1, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __pyx_t_4 = ((__pyx_t_5 == 0x66) != 0);
+    if (!__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_1 = (__pyx_v_pos + 2);
+    __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_1, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __pyx_t_4 = ((__pyx_t_5 == 70) != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L6_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":149
+ *         # \[\[([fF]ile:|[iI]mage)[^]]*(\]\])
+ *         if _at(s, n, pos + 3, u'ile:') and (s[pos + 2] == u'f' or s[pos + 2] == u'F'):
+ *             j = pos + 7             # <<<<<<<<<<<<<<
+ *         elif _at(s, n, pos + 3, u'mage') and (s[pos + 2] == u'i' or s[pos + 2] == u'I'):
+ *             j = pos + 7
+ */
+      __pyx_v_j = (__pyx_v_pos + 7);
+
+      /* "gensim/corpora/_wikimarkup.pyx":148
+ *     while pos >= 0:
+ *         # \[\[([fF]ile:|[iI]mage)[^]]*(\]\])
+ *         if _at(s, n, pos + 3, u'ile:') and (s[pos + 2] == u'f' or s[pos + 2] == u'F'):             # <<<<<<<<<<<<<<
+ *             j = pos + 7
+ *         elif _at(s, n, pos + 3, u'mage') and (s[pos + 2] == u'i' or s[pos + 2] == u'I'):
+ */
+      goto __pyx_L5;
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":150
+ *         if _at(s, n, pos + 3, u'ile:') and (s[pos + 2] == u'f' or s[pos + 2] == u'F'):
+ *             j = pos + 7
+ *         elif _at(s, n, pos + 3, u'mage') and (s[pos + 2] == u'i' or s[pos + 2] == u'I'):             # <<<<<<<<<<<<<<
+ *             j = pos + 7
+ *         else:
+ */
+    __pyx_t_4 = (__pyx_f_6gensim_7corpora_11_wikimarkup__at(__pyx_v_s, __pyx_v_n, (__pyx_v_pos + 3), __pyx_n_u_mage) != 0);
+    if (__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L9_bool_binop_done;
+    }
+    __pyx_t_1 = (__pyx_v_pos + 2);
+    __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_1, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 150, __pyx_L1_error)
+    __pyx_t_4 = ((__pyx_t_5 == 0x69) != 0);
+    if (!__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L9_bool_binop_done;
+    }
+    __pyx_t_1 = (__pyx_v_pos + 2);
+    __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_1, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 150, __pyx_L1_error)
+    __pyx_t_4 = ((__pyx_t_5 == 73) != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L9_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":151
+ *             j = pos + 7
+ *         elif _at(s, n, pos + 3, u'mage') and (s[pos + 2] == u'i' or s[pos + 2] == u'I'):
+ *             j = pos + 7             # <<<<<<<<<<<<<<
+ *         else:
+ *             pos = s.find(u'[[', pos + 1)
+ */
+      __pyx_v_j = (__pyx_v_pos + 7);
+
+      /* "gensim/corpora/_wikimarkup.pyx":150
+ *         if _at(s, n, pos + 3, u'ile:') and (s[pos + 2] == u'f' or s[pos + 2] == u'F'):
+ *             j = pos + 7
+ *         elif _at(s, n, pos + 3, u'mage') and (s[pos + 2] == u'i' or s[pos + 2] == u'I'):             # <<<<<<<<<<<<<<
+ *             j = pos + 7
+ *         else:
+ */
+      goto __pyx_L5;
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":153
+ *             j = pos + 7
+ *         else:
+ *             pos = s.find(u'[[', pos + 1)             # <<<<<<<<<<<<<<
+ *             continue
+ *         bar = -1
+ */
+    /*else*/ {
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+        __PYX_ERR(0, 153, __pyx_L1_error)
+      }
+      __pyx_t_2 = PyInt_FromSsize_t((__pyx_v_pos + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 153, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 153, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_6 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__3, __pyx_t_1, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-2))) __PYX_ERR(0, 153, __pyx_L1_error)
+      __pyx_v_pos = __pyx_t_6;
+
+      /* "gensim/corpora/_wikimarkup.pyx":154
+ *         else:
+ *             pos = s.find(u'[[', pos + 1)
+ *             continue             # <<<<<<<<<<<<<<
+ *         bar = -1
+ *         while j < n:
+ */
+      goto __pyx_L3_continue;
+    }
+    __pyx_L5:;
+
+    /* "gensim/corpora/_wikimarkup.pyx":155
+ *             pos = s.find(u'[[', pos + 1)
+ *             continue
+ *         bar = -1             # <<<<<<<<<<<<<<
+ *         while j < n:
+ *             c = s[j]
+ */
+    __pyx_v_bar = -1L;
+
+    /* "gensim/corpora/_wikimarkup.pyx":156
+ *             continue
+ *         bar = -1
+ *         while j < n:             # <<<<<<<<<<<<<<
+ *             c = s[j]
+ *             if c == u']':
+ */
+    while (1) {
+      __pyx_t_3 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (!__pyx_t_3) break;
+
+      /* "gensim/corpora/_wikimarkup.pyx":157
+ *         bar = -1
+ *         while j < n:
+ *             c = s[j]             # <<<<<<<<<<<<<<
+ *             if c == u']':
+ *                 break
+ */
+      __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 157, __pyx_L1_error)
+      __pyx_v_c = __pyx_t_5;
+
+      /* "gensim/corpora/_wikimarkup.pyx":158
+ *         while j < n:
+ *             c = s[j]
+ *             if c == u']':             # <<<<<<<<<<<<<<
+ *                 break
+ *             if c == u'|':
+ */
+      __pyx_t_3 = ((__pyx_v_c == 93) != 0);
+      if (__pyx_t_3) {
+
+        /* "gensim/corpora/_wikimarkup.pyx":159
+ *             c = s[j]
+ *             if c == u']':
+ *                 break             # <<<<<<<<<<<<<<
+ *             if c == u'|':
+ *                 bar = j
+ */
+        goto __pyx_L13_break;
+
+        /* "gensim/corpora/_wikimarkup.pyx":158
+ *         while j < n:
+ *             c = s[j]
+ *             if c == u']':             # <<<<<<<<<<<<<<
+ *                 break
+ *             if c == u'|':
+ */
+      }
+
+      /* "gensim/corpora/_wikimarkup.pyx":160
+ *             if c == u']':
+ *                 break
+ *             if c == u'|':             # <<<<<<<<<<<<<<
+ *                 bar = j
+ *             j += 1
+ */
+      __pyx_t_3 = ((__pyx_v_c == 0x7C) != 0);
+      if (__pyx_t_3) {
+
+        /* "gensim/corpora/_wikimarkup.pyx":161
+ *                 break
+ *             if c == u'|':
+ *                 bar = j             # <<<<<<<<<<<<<<
+ *             j += 1
+ *         if j + 1 < n and s[j + 1] == u']':
+ */
+        __pyx_v_bar = __pyx_v_j;
+
+        /* "gensim/corpora/_wikimarkup.pyx":160
+ *             if c == u']':
+ *                 break
+ *             if c == u'|':             # <<<<<<<<<<<<<<
+ *                 bar = j
+ *             j += 1
+ */
+      }
+
+      /* "gensim/corpora/_wikimarkup.pyx":162
+ *             if c == u'|':
+ *                 bar = j
+ *             j += 1             # <<<<<<<<<<<<<<
+ *         if j + 1 < n and s[j + 1] == u']':
+ *             pieces.append(s[last:pos])
+ */
+      __pyx_v_j = (__pyx_v_j + 1);
+    }
+    __pyx_L13_break:;
+
+    /* "gensim/corpora/_wikimarkup.pyx":163
+ *                 bar = j
+ *             j += 1
+ *         if j + 1 < n and s[j + 1] == u']':             # <<<<<<<<<<<<<<
+ *             pieces.append(s[last:pos])
+ *             # the caption is the last |-separated field, or the whole markup if there is no caption
+ */
+    __pyx_t_4 = (((__pyx_v_j + 1) < __pyx_v_n) != 0);
+    if (__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L17_bool_binop_done;
+    }
+    __pyx_t_6 = (__pyx_v_j + 1);
+    __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_6, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 163, __pyx_L1_error)
+    __pyx_t_4 = ((__pyx_t_5 == 93) != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L17_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":164
+ *             j += 1
+ *         if j + 1 < n and s[j + 1] == u']':
+ *             pieces.append(s[last:pos])             # <<<<<<<<<<<<<<
+ *             # the caption is the last |-separated field, or the whole markup if there is no caption
+ *             pieces.append(s[bar + 1:j] if bar >= 0 else s[pos:j])
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 164, __pyx_L1_error)
+      }
+      __pyx_t_2 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_last, __pyx_v_pos); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 164, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_7 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_2); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 164, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+      /* "gensim/corpora/_wikimarkup.pyx":166
+ *             pieces.append(s[last:pos])
+ *             # the caption is the last |-separated field, or the whole markup if there is no caption
+ *             pieces.append(s[bar + 1:j] if bar >= 0 else s[pos:j])             # <<<<<<<<<<<<<<
+ *             last = j + 2
+ *             pos = s.find(u'[[', last)
+ */
+      if (((__pyx_v_bar >= 0) != 0)) {
+        if (unlikely(__pyx_v_s == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+          __PYX_ERR(0, 166, __pyx_L1_error)
+        }
+        __pyx_t_8 = __Pyx_PyUnicode_Substring(__pyx_v_s, (__pyx_v_bar + 1), __pyx_v_j); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 166, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_2 = __pyx_t_8;
+        __pyx_t_8 = 0;
+      } else {
+        if (unlikely(__pyx_v_s == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+          __PYX_ERR(0, 166, __pyx_L1_error)
+        }
+        __pyx_t_8 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_pos, __pyx_v_j); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 166, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_2 = __pyx_t_8;
+        __pyx_t_8 = 0;
+      }
+      __pyx_t_7 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_2); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 166, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+      /* "gensim/corpora/_wikimarkup.pyx":167
+ *             # the caption is the last |-separated field, or the whole markup if there is no caption
+ *             pieces.append(s[bar + 1:j] if bar >= 0 else s[pos:j])
+ *             last = j + 2             # <<<<<<<<<<<<<<
+ *             pos = s.find(u'[[', last)
+ *         else:
+ */
+      __pyx_v_last = (__pyx_v_j + 2);
+
+      /* "gensim/corpora/_wikimarkup.pyx":168
+ *             pieces.append(s[bar + 1:j] if bar >= 0 else s[pos:j])
+ *             last = j + 2
+ *             pos = s.find(u'[[', last)             # <<<<<<<<<<<<<<
+ *         else:
+ *             pos = s.find(u'[[', pos + 1)
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+        __PYX_ERR(0, 168, __pyx_L1_error)
+      }
+      __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_6 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_6 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 168, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_1 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__3, __pyx_t_6, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-2))) __PYX_ERR(0, 168, __pyx_L1_error)
+      __pyx_v_pos = __pyx_t_1;
+
+      /* "gensim/corpora/_wikimarkup.pyx":163
+ *                 bar = j
+ *             j += 1
+ *         if j + 1 < n and s[j + 1] == u']':             # <<<<<<<<<<<<<<
+ *             pieces.append(s[last:pos])
+ *             # the caption is the last |-separated field, or the whole markup if there is no caption
+ */
+      goto __pyx_L16;
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":170
+ *             pos = s.find(u'[[', last)
+ *         else:
+ *             pos = s.find(u'[[', pos + 1)             # <<<<<<<<<<<<<<
+ *     return _finish(pieces, s, last)
+ * 
+ */
+    /*else*/ {
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+        __PYX_ERR(0, 170, __pyx_L1_error)
+      }
+      __pyx_t_2 = PyInt_FromSsize_t((__pyx_v_pos + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 170, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 170, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_6 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__3, __pyx_t_1, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-2))) __PYX_ERR(0, 170, __pyx_L1_error)
+      __pyx_v_pos = __pyx_t_6;
+    }
+    __pyx_L16:;
+    __pyx_L3_continue:;
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":171
+ *         else:
+ *             pos = s.find(u'[[', pos + 1)
+ *     return _finish(pieces, s, last)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_6gensim_7corpora_11_wikimarkup__finish(__pyx_v_pieces, __pyx_v_s, __pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 171, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":127
+ * 
+ * 
+ * def remove_file(unicode s):             # <<<<<<<<<<<<<<
+ *     """Remove the 'File:' and 'Image:' markup, keeping the file caption, same as
+ *     :func:`gensim.corpora.wikicorpus.remove_file`.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup.remove_file", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_pieces);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":174
+ * 
+ * 
+ * cdef unicode _remove_delimited(unicode s, unicode opening, unicode closing):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(opening + '.*?' + closing, '', s, flags=re.DOTALL)`, for literal delimiters."""
+ *     cdef Py_ssize_t pos, end, last = 0
+ */
+
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_delimited(PyObject *__pyx_v_s, PyObject *__pyx_v_opening, PyObject *__pyx_v_closing) {
+  Py_ssize_t __pyx_v_pos;
+  Py_ssize_t __pyx_v_end;
+  Py_ssize_t __pyx_v_last;
+  PyObject *__pyx_v_pieces = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  __Pyx_RefNannySetupContext("_remove_delimited", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":176
+ * cdef unicode _remove_delimited(unicode s, unicode opening, unicode closing):
+ *     """Same as `re.sub(opening + '.*?' + closing, '', s, flags=re.DOTALL)`, for literal delimiters."""
+ *     cdef Py_ssize_t pos, end, last = 0             # <<<<<<<<<<<<<<
+ *     cdef list pieces = []
+ *     pos = s.find(opening)
+ */
+  __pyx_v_last = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":177
+ *     """Same as `re.sub(opening + '.*?' + closing, '', s, flags=re.DOTALL)`, for literal delimiters."""
+ *     cdef Py_ssize_t pos, end, last = 0
+ *     cdef list pieces = []             # <<<<<<<<<<<<<<
+ *     pos = s.find(opening)
+ *     while pos >= 0:
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 177, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_pieces = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":178
+ *     cdef Py_ssize_t pos, end, last = 0
+ *     cdef list pieces = []
+ *     pos = s.find(opening)             # <<<<<<<<<<<<<<
+ *     while pos >= 0:
+ *         end = s.find(closing, pos + len(opening))
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+    __PYX_ERR(0, 178, __pyx_L1_error)
+  }
+  __pyx_t_2 = PyUnicode_Find(__pyx_v_s, __pyx_v_opening, 0, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-2))) __PYX_ERR(0, 178, __pyx_L1_error)
+  __pyx_v_pos = __pyx_t_2;
+
+  /* "gensim/corpora/_wikimarkup.pyx":179
+ *     cdef list pieces = []
+ *     pos = s.find(opening)
+ *     while pos >= 0:             # <<<<<<<<<<<<<<
+ *         end = s.find(closing, pos + len(opening))
+ *         if end < 0:
+ */
+  while (1) {
+    __pyx_t_3 = ((__pyx_v_pos >= 0) != 0);
+    if (!__pyx_t_3) break;
+
+    /* "gensim/corpora/_wikimarkup.pyx":180
+ *     pos = s.find(opening)
+ *     while pos >= 0:
+ *         end = s.find(closing, pos + len(opening))             # <<<<<<<<<<<<<<
+ *         if end < 0:
+ *             break  # no later opening can be closed either
+ */
+    if (unlikely(__pyx_v_s == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+      __PYX_ERR(0, 180, __pyx_L1_error)
+    }
+    if (unlikely(__pyx_v_opening == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 180, __pyx_L1_error)
+    }
+    __pyx_t_2 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_opening); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 180, __pyx_L1_error)
+    __pyx_t_1 = PyInt_FromSsize_t((__pyx_v_pos + __pyx_t_2)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 180, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __Pyx_PyIndex_AsSsize_t(__pyx_t_1); if (unlikely((__pyx_t_2 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 180, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_4 = PyUnicode_Find(__pyx_v_s, __pyx_v_closing, __pyx_t_2, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-2))) __PYX_ERR(0, 180, __pyx_L1_error)
+    __pyx_v_end = __pyx_t_4;
+
+    /* "gensim/corpora/_wikimarkup.pyx":181
+ *     while pos >= 0:
+ *         end = s.find(closing, pos + len(opening))
+ *         if end < 0:             # <<<<<<<<<<<<<<
+ *             break  # no later opening can be closed either
+ *         pieces.append(s[last:pos])
+ */
+    __pyx_t_3 = ((__pyx_v_end < 0) != 0);
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":182
+ *         end = s.find(closing, pos + len(opening))
+ *         if end < 0:
+ *             break  # no later opening can be closed either             # <<<<<<<<<<<<<<
+ *         pieces.append(s[last:pos])
+ *         last = end + len(closing)
+ */
+      goto __pyx_L4_break;
+
+      /* "gensim/corpora/_wikimarkup.pyx":181
+ *     while pos >= 0:
+ *         end = s.find(closing, pos + len(opening))
+ *         if end < 0:             # <<<<<<<<<<<<<<
+ *             break  # no later opening can be closed either
+ *         pieces.append(s[last:pos])
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":183
+ *         if end < 0:
+ *             break  # no later opening can be closed either
+ *         pieces.append(s[last:pos])             # <<<<<<<<<<<<<<
+ *         last = end + len(closing)
+ *         pos = s.find(opening, last)
+ */
+    if (unlikely(__pyx_v_s == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 183, __pyx_L1_error)
+    }
+    __pyx_t_1 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_last, __pyx_v_pos); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 183, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_1); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 183, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":184
+ *             break  # no later opening can be closed either
+ *         pieces.append(s[last:pos])
+ *         last = end + len(closing)             # <<<<<<<<<<<<<<
+ *         pos = s.find(opening, last)
+ *     return _finish(pieces, s, last)
+ */
+    if (unlikely(__pyx_v_closing == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 184, __pyx_L1_error)
+    }
+    __pyx_t_4 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_closing); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 184, __pyx_L1_error)
+    __pyx_v_last = (__pyx_v_end + __pyx_t_4);
+
+    /* "gensim/corpora/_wikimarkup.pyx":185
+ *         pieces.append(s[last:pos])
+ *         last = end + len(closing)
+ *         pos = s.find(opening, last)             # <<<<<<<<<<<<<<
+ *     return _finish(pieces, s, last)
+ * 
+ */
+    if (unlikely(__pyx_v_s == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+      __PYX_ERR(0, 185, __pyx_L1_error)
+    }
+    __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_last); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_4 = __Pyx_PyIndex_AsSsize_t(__pyx_t_1); if (unlikely((__pyx_t_4 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 185, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_2 = PyUnicode_Find(__pyx_v_s, __pyx_v_opening, __pyx_t_4, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-2))) __PYX_ERR(0, 185, __pyx_L1_error)
+    __pyx_v_pos = __pyx_t_2;
+  }
+  __pyx_L4_break:;
+
+  /* "gensim/corpora/_wikimarkup.pyx":186
+ *         last = end + len(closing)
+ *         pos = s.find(opening, last)
+ *     return _finish(pieces, s, last)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_6gensim_7corpora_11_wikimarkup__finish(__pyx_v_pieces, __pyx_v_s, __pyx_v_last); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":174
+ * 
+ * 
+ * cdef unicode _remove_delimited(unicode s, unicode opening, unicode closing):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(opening + '.*?' + closing, '', s, flags=re.DOTALL)`, for literal delimiters."""
+ *     cdef Py_ssize_t pos, end, last = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup._remove_delimited", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_pieces);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":189
+ * 
+ * 
+ * cdef unicode _remove_element(unicode s, unicode name):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(r'<name([> ].*?)(</name>|/>)', '', s, flags=re.DOTALL)`."""
+ *     cdef unicode opening = u'<' + name, closing = u'</' + name + u'>'
+ */
+
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_element(PyObject *__pyx_v_s, PyObject *__pyx_v_name) {
+  PyObject *__pyx_v_opening = 0;
+  PyObject *__pyx_v_closing = 0;
+  Py_ssize_t __pyx_v_pos;
+  Py_ssize_t __pyx_v_start;
+  Py_ssize_t __pyx_v_end_tag;
+  Py_ssize_t __pyx_v_end_empty;
+  Py_ssize_t __pyx_v_end;
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_last;
+  Py_ssize_t __pyx_v_m;
+  Py_UCS4 __pyx_v_c;
+  PyObject *__pyx_v_pieces = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  Py_UCS4 __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  __Pyx_RefNannySetupContext("_remove_element", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":191
+ * cdef unicode _remove_element(unicode s, unicode name):
+ *     """Same as `re.sub(r'<name([> ].*?)(</name>|/>)', '', s, flags=re.DOTALL)`."""
+ *     cdef unicode opening = u'<' + name, closing = u'</' + name + u'>'             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t pos, start, end_tag, end_empty, end, n = len(s), last = 0
+ *     cdef Py_ssize_t m = len(opening)
+ */
+  __pyx_t_1 = __Pyx_PyUnicode_ConcatSafe(__pyx_kp_u__4, __pyx_v_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 191, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_opening = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyUnicode_ConcatSafe(__pyx_kp_u__5, __pyx_v_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 191, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyUnicode_Concat(__pyx_t_1, __pyx_kp_u__6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 191, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_closing = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":192
+ *     """Same as `re.sub(r'<name([> ].*?)(</name>|/>)', '', s, flags=re.DOTALL)`."""
+ *     cdef unicode opening = u'<' + name, closing = u'</' + name + u'>'
+ *     cdef Py_ssize_t pos, start, end_tag, end_empty, end, n = len(s), last = 0             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t m = len(opening)
+ *     cdef Py_UCS4 c
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 192, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 192, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_3;
+  __pyx_v_last = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":193
+ *     cdef unicode opening = u'<' + name, closing = u'</' + name + u'>'
+ *     cdef Py_ssize_t pos, start, end_tag, end_empty, end, n = len(s), last = 0
+ *     cdef Py_ssize_t m = len(opening)             # <<<<<<<<<<<<<<
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []
+ */
+  __pyx_t_3 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_opening); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 193, __pyx_L1_error)
+  __pyx_v_m = __pyx_t_3;
+
+  /* "gensim/corpora/_wikimarkup.pyx":195
+ *     cdef Py_ssize_t m = len(opening)
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []             # <<<<<<<<<<<<<<
+ *     pos = s.find(opening)
+ *     while pos >= 0:
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_pieces = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":196
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []
+ *     pos = s.find(opening)             # <<<<<<<<<<<<<<
+ *     while pos >= 0:
+ *         start = pos + m
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+    __PYX_ERR(0, 196, __pyx_L1_error)
+  }
+  __pyx_t_3 = PyUnicode_Find(__pyx_v_s, __pyx_v_opening, 0, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-2))) __PYX_ERR(0, 196, __pyx_L1_error)
+  __pyx_v_pos = __pyx_t_3;
+
+  /* "gensim/corpora/_wikimarkup.pyx":197
+ *     cdef list pieces = []
+ *     pos = s.find(opening)
+ *     while pos >= 0:             # <<<<<<<<<<<<<<
+ *         start = pos + m
+ *         if start >= n:
+ */
+  while (1) {
+    __pyx_t_4 = ((__pyx_v_pos >= 0) != 0);
+    if (!__pyx_t_4) break;
+
+    /* "gensim/corpora/_wikimarkup.pyx":198
+ *     pos = s.find(opening)
+ *     while pos >= 0:
+ *         start = pos + m             # <<<<<<<<<<<<<<
+ *         if start >= n:
+ *             break
+ */
+    __pyx_v_start = (__pyx_v_pos + __pyx_v_m);
+
+    /* "gensim/corpora/_wikimarkup.pyx":199
+ *     while pos >= 0:
+ *         start = pos + m
+ *         if start >= n:             # <<<<<<<<<<<<<<
+ *             break
+ *         c = s[start]
+ */
+    __pyx_t_4 = ((__pyx_v_start >= __pyx_v_n) != 0);
+    if (__pyx_t_4) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":200
+ *         start = pos + m
+ *         if start >= n:
+ *             break             # <<<<<<<<<<<<<<
+ *         c = s[start]
+ *         if c != u'>' and c != u' ':
+ */
+      goto __pyx_L4_break;
+
+      /* "gensim/corpora/_wikimarkup.pyx":199
+ *     while pos >= 0:
+ *         start = pos + m
+ *         if start >= n:             # <<<<<<<<<<<<<<
+ *             break
+ *         c = s[start]
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":201
+ *         if start >= n:
+ *             break
+ *         c = s[start]             # <<<<<<<<<<<<<<
+ *         if c != u'>' and c != u' ':
+ *             pos = s.find(opening, pos + 1)
+ */
+    __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_start, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 201, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_5;
+
+    /* "gensim/corpora/_wikimarkup.pyx":202
+ *             break
+ *         c = s[start]
+ *         if c != u'>' and c != u' ':             # <<<<<<<<<<<<<<
+ *             pos = s.find(opening, pos + 1)
+ *             continue
+ */
+    switch (__pyx_v_c) {
+      case 62:
+      case 32:
+      __pyx_t_4 = 0;
+      break;
+      default:
+      __pyx_t_4 = 1;
+      break;
+    }
+    if (__pyx_t_4) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":203
+ *         c = s[start]
+ *         if c != u'>' and c != u' ':
+ *             pos = s.find(opening, pos + 1)             # <<<<<<<<<<<<<<
+ *             continue
+ *         end_tag = s.find(closing, start + 1)
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+        __PYX_ERR(0, 203, __pyx_L1_error)
+      }
+      __pyx_t_2 = PyInt_FromSsize_t((__pyx_v_pos + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 203, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_3 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_3 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 203, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_6 = PyUnicode_Find(__pyx_v_s, __pyx_v_opening, __pyx_t_3, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-2))) __PYX_ERR(0, 203, __pyx_L1_error)
+      __pyx_v_pos = __pyx_t_6;
+
+      /* "gensim/corpora/_wikimarkup.pyx":204
+ *         if c != u'>' and c != u' ':
+ *             pos = s.find(opening, pos + 1)
+ *             continue             # <<<<<<<<<<<<<<
+ *         end_tag = s.find(closing, start + 1)
+ *         end_empty = s.find(u'/>', start + 1)
+ */
+      goto __pyx_L3_continue;
+
+      /* "gensim/corpora/_wikimarkup.pyx":202
+ *             break
+ *         c = s[start]
+ *         if c != u'>' and c != u' ':             # <<<<<<<<<<<<<<
+ *             pos = s.find(opening, pos + 1)
+ *             continue
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":205
+ *             pos = s.find(opening, pos + 1)
+ *             continue
+ *         end_tag = s.find(closing, start + 1)             # <<<<<<<<<<<<<<
+ *         end_empty = s.find(u'/>', start + 1)
+ *         if end_tag < 0 and end_empty < 0:
+ */
+    if (unlikely(__pyx_v_s == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+      __PYX_ERR(0, 205, __pyx_L1_error)
+    }
+    __pyx_t_2 = PyInt_FromSsize_t((__pyx_v_start + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 205, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_6 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_6 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 205, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_3 = PyUnicode_Find(__pyx_v_s, __pyx_v_closing, __pyx_t_6, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-2))) __PYX_ERR(0, 205, __pyx_L1_error)
+    __pyx_v_end_tag = __pyx_t_3;
+
+    /* "gensim/corpora/_wikimarkup.pyx":206
+ *             continue
+ *         end_tag = s.find(closing, start + 1)
+ *         end_empty = s.find(u'/>', start + 1)             # <<<<<<<<<<<<<<
+ *         if end_tag < 0 and end_empty < 0:
+ *             break
+ */
+    if (unlikely(__pyx_v_s == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+      __PYX_ERR(0, 206, __pyx_L1_error)
+    }
+    __pyx_t_2 = PyInt_FromSsize_t((__pyx_v_start + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 206, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_3 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 206, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_6 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__7, __pyx_t_3, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-2))) __PYX_ERR(0, 206, __pyx_L1_error)
+    __pyx_v_end_empty = __pyx_t_6;
+
+    /* "gensim/corpora/_wikimarkup.pyx":207
+ *         end_tag = s.find(closing, start + 1)
+ *         end_empty = s.find(u'/>', start + 1)
+ *         if end_tag < 0 and end_empty < 0:             # <<<<<<<<<<<<<<
+ *             break
+ *         if end_empty < 0 or 0 <= end_tag < end_empty:
+ */
+    __pyx_t_7 = ((__pyx_v_end_tag < 0) != 0);
+    if (__pyx_t_7) {
+    } else {
+      __pyx_t_4 = __pyx_t_7;
+      goto __pyx_L8_bool_binop_done;
+    }
+    __pyx_t_7 = ((__pyx_v_end_empty < 0) != 0);
+    __pyx_t_4 = __pyx_t_7;
+    __pyx_L8_bool_binop_done:;
+    if (__pyx_t_4) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":208
+ *         end_empty = s.find(u'/>', start + 1)
+ *         if end_tag < 0 and end_empty < 0:
+ *             break             # <<<<<<<<<<<<<<
+ *         if end_empty < 0 or 0 <= end_tag < end_empty:
+ *             end = end_tag + len(closing)
+ */
+      goto __pyx_L4_break;
+
+      /* "gensim/corpora/_wikimarkup.pyx":207
+ *         end_tag = s.find(closing, start + 1)
+ *         end_empty = s.find(u'/>', start + 1)
+ *         if end_tag < 0 and end_empty < 0:             # <<<<<<<<<<<<<<
+ *             break
+ *         if end_empty < 0 or 0 <= end_tag < end_empty:
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":209
+ *         if end_tag < 0 and end_empty < 0:
+ *             break
+ *         if end_empty < 0 or 0 <= end_tag < end_empty:             # <<<<<<<<<<<<<<
+ *             end = end_tag + len(closing)
+ *         else:
+ */
+    __pyx_t_7 = ((__pyx_v_end_empty < 0) != 0);
+    if (!__pyx_t_7) {
+    } else {
+      __pyx_t_4 = __pyx_t_7;
+      goto __pyx_L11_bool_binop_done;
+    }
+    __pyx_t_7 = (0 <= __pyx_v_end_tag);
+    if (__pyx_t_7) {
+      __pyx_t_7 = (__pyx_v_end_tag < __pyx_v_end_empty);
+    }
+    __pyx_t_8 = (__pyx_t_7 != 0);
+    __pyx_t_4 = __pyx_t_8;
+    __pyx_L11_bool_binop_done:;
+    if (__pyx_t_4) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":210
+ *             break
+ *         if end_empty < 0 or 0 <= end_tag < end_empty:
+ *             end = end_tag + len(closing)             # <<<<<<<<<<<<<<
+ *         else:
+ *             end = end_empty + 2
+ */
+      __pyx_t_6 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_closing); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 210, __pyx_L1_error)
+      __pyx_v_end = (__pyx_v_end_tag + __pyx_t_6);
+
+      /* "gensim/corpora/_wikimarkup.pyx":209
+ *         if end_tag < 0 and end_empty < 0:
+ *             break
+ *         if end_empty < 0 or 0 <= end_tag < end_empty:             # <<<<<<<<<<<<<<
+ *             end = end_tag + len(closing)
+ *         else:
+ */
+      goto __pyx_L10;
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":212
+ *             end = end_tag + len(closing)
+ *         else:
+ *             end = end_empty + 2             # <<<<<<<<<<<<<<
+ *         pieces.append(s[last:pos])
+ *         last = end
+ */
+    /*else*/ {
+      __pyx_v_end = (__pyx_v_end_empty + 2);
+    }
+    __pyx_L10:;
+
+    /* "gensim/corpora/_wikimarkup.pyx":213
+ *         else:
+ *             end = end_empty + 2
+ *         pieces.append(s[last:pos])             # <<<<<<<<<<<<<<
+ *         last = end
+ *         pos = s.find(opening, last)
+ */
+    if (unlikely(__pyx_v_s == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 213, __pyx_L1_error)
+    }
+    __pyx_t_2 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_last, __pyx_v_pos); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 213, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_2); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 213, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":214
+ *             end = end_empty + 2
+ *         pieces.append(s[last:pos])
+ *         last = end             # <<<<<<<<<<<<<<
+ *         pos = s.find(opening, last)
+ *     return _finish(pieces, s, last)
+ */
+    __pyx_v_last = __pyx_v_end;
+
+    /* "gensim/corpora/_wikimarkup.pyx":215
+ *         pieces.append(s[last:pos])
+ *         last = end
+ *         pos = s.find(opening, last)             # <<<<<<<<<<<<<<
+ *     return _finish(pieces, s, last)
+ * 
+ */
+    if (unlikely(__pyx_v_s == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+      __PYX_ERR(0, 215, __pyx_L1_error)
+    }
+    __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_6 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_6 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 215, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_3 = PyUnicode_Find(__pyx_v_s, __pyx_v_opening, __pyx_t_6, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-2))) __PYX_ERR(0, 215, __pyx_L1_error)
+    __pyx_v_pos = __pyx_t_3;
+    __pyx_L3_continue:;
+  }
+  __pyx_L4_break:;
+
+  /* "gensim/corpora/_wikimarkup.pyx":216
+ *         last = end
+ *         pos = s.find(opening, last)
+ *     return _finish(pieces, s, last)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_6gensim_7corpora_11_wikimarkup__finish(__pyx_v_pieces, __pyx_v_s, __pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":189
+ * 
+ * 
+ * cdef unicode _remove_element(unicode s, unicode name):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(r'<name([> ].*?)(</name>|/>)', '', s, flags=re.DOTALL)`."""
+ *     cdef unicode opening = u'<' + name, closing = u'</' + name + u'>'
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup._remove_element", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_opening);
+  __Pyx_XDECREF(__pyx_v_closing);
+  __Pyx_XDECREF(__pyx_v_pieces);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":219
+ * 
+ * 
+ * cdef unicode _remove_categories(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P14, '', s)`."""
+ *     cdef Py_ssize_t pos, j, n = len(s), last = 0
+ */
+
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_categories(PyObject *__pyx_v_s) {
+  Py_ssize_t __pyx_v_pos;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_last;
+  Py_UCS4 __pyx_v_c;
+  PyObject *__pyx_v_pieces = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  Py_UCS4 __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  __Pyx_RefNannySetupContext("_remove_categories", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":221
+ * cdef unicode _remove_categories(unicode s):
+ *     """Same as `re.sub(RE_P14, '', s)`."""
+ *     cdef Py_ssize_t pos, j, n = len(s), last = 0             # <<<<<<<<<<<<<<
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 221, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 221, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_1;
+  __pyx_v_last = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":223
+ *     cdef Py_ssize_t pos, j, n = len(s), last = 0
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []             # <<<<<<<<<<<<<<
+ *     pos = s.find(u'[[Category:')
+ *     while pos >= 0:
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_pieces = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":224
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []
+ *     pos = s.find(u'[[Category:')             # <<<<<<<<<<<<<<
+ *     while pos >= 0:
+ *         j = pos + 11
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+    __PYX_ERR(0, 224, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u_Category, 0, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-2))) __PYX_ERR(0, 224, __pyx_L1_error)
+  __pyx_v_pos = __pyx_t_1;
+
+  /* "gensim/corpora/_wikimarkup.pyx":225
+ *     cdef list pieces = []
+ *     pos = s.find(u'[[Category:')
+ *     while pos >= 0:             # <<<<<<<<<<<<<<
+ *         j = pos + 11
+ *         while j < n:
+ */
+  while (1) {
+    __pyx_t_3 = ((__pyx_v_pos >= 0) != 0);
+    if (!__pyx_t_3) break;
+
+    /* "gensim/corpora/_wikimarkup.pyx":226
+ *     pos = s.find(u'[[Category:')
+ *     while pos >= 0:
+ *         j = pos + 11             # <<<<<<<<<<<<<<
+ *         while j < n:
+ *             c = s[j]
+ */
+    __pyx_v_j = (__pyx_v_pos + 11);
+
+    /* "gensim/corpora/_wikimarkup.pyx":227
+ *     while pos >= 0:
+ *         j = pos + 11
+ *         while j < n:             # <<<<<<<<<<<<<<
+ *             c = s[j]
+ *             if c == u'[' or c == u']':
+ */
+    while (1) {
+      __pyx_t_3 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (!__pyx_t_3) break;
+
+      /* "gensim/corpora/_wikimarkup.pyx":228
+ *         j = pos + 11
+ *         while j < n:
+ *             c = s[j]             # <<<<<<<<<<<<<<
+ *             if c == u'[' or c == u']':
+ *                 break
+ */
+      __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 228, __pyx_L1_error)
+      __pyx_v_c = __pyx_t_4;
+
+      /* "gensim/corpora/_wikimarkup.pyx":229
+ *         while j < n:
+ *             c = s[j]
+ *             if c == u'[' or c == u']':             # <<<<<<<<<<<<<<
+ *                 break
+ *             j += 1
+ */
+      switch (__pyx_v_c) {
+        case 91:
+        case 93:
+
+        /* "gensim/corpora/_wikimarkup.pyx":230
+ *             c = s[j]
+ *             if c == u'[' or c == u']':
+ *                 break             # <<<<<<<<<<<<<<
+ *             j += 1
+ *         if j + 1 < n and s[j] == u']' and s[j + 1] == u']':
+ */
+        goto __pyx_L6_break;
+
+        /* "gensim/corpora/_wikimarkup.pyx":229
+ *         while j < n:
+ *             c = s[j]
+ *             if c == u'[' or c == u']':             # <<<<<<<<<<<<<<
+ *                 break
+ *             j += 1
+ */
+        break;
+        default: break;
+      }
+
+      /* "gensim/corpora/_wikimarkup.pyx":231
+ *             if c == u'[' or c == u']':
+ *                 break
+ *             j += 1             # <<<<<<<<<<<<<<
+ *         if j + 1 < n and s[j] == u']' and s[j + 1] == u']':
+ *             pieces.append(s[last:pos])
+ */
+      __pyx_v_j = (__pyx_v_j + 1);
+    }
+    __pyx_L6_break:;
+
+    /* "gensim/corpora/_wikimarkup.pyx":232
+ *                 break
+ *             j += 1
+ *         if j + 1 < n and s[j] == u']' and s[j + 1] == u']':             # <<<<<<<<<<<<<<
+ *             pieces.append(s[last:pos])
+ *             last = j + 2
+ */
+    __pyx_t_5 = (((__pyx_v_j + 1) < __pyx_v_n) != 0);
+    if (__pyx_t_5) {
+    } else {
+      __pyx_t_3 = __pyx_t_5;
+      goto __pyx_L8_bool_binop_done;
+    }
+    __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 232, __pyx_L1_error)
+    __pyx_t_5 = ((__pyx_t_4 == 93) != 0);
+    if (__pyx_t_5) {
+    } else {
+      __pyx_t_3 = __pyx_t_5;
+      goto __pyx_L8_bool_binop_done;
+    }
+    __pyx_t_1 = (__pyx_v_j + 1);
+    __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_1, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 232, __pyx_L1_error)
+    __pyx_t_5 = ((__pyx_t_4 == 93) != 0);
+    __pyx_t_3 = __pyx_t_5;
+    __pyx_L8_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":233
+ *             j += 1
+ *         if j + 1 < n and s[j] == u']' and s[j + 1] == u']':
+ *             pieces.append(s[last:pos])             # <<<<<<<<<<<<<<
+ *             last = j + 2
+ *             pos = s.find(u'[[Category:', last)
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 233, __pyx_L1_error)
+      }
+      __pyx_t_2 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_last, __pyx_v_pos); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 233, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_2); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 233, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+      /* "gensim/corpora/_wikimarkup.pyx":234
+ *         if j + 1 < n and s[j] == u']' and s[j + 1] == u']':
+ *             pieces.append(s[last:pos])
+ *             last = j + 2             # <<<<<<<<<<<<<<
+ *             pos = s.find(u'[[Category:', last)
+ *         else:
+ */
+      __pyx_v_last = (__pyx_v_j + 2);
+
+      /* "gensim/corpora/_wikimarkup.pyx":235
+ *             pieces.append(s[last:pos])
+ *             last = j + 2
+ *             pos = s.find(u'[[Category:', last)             # <<<<<<<<<<<<<<
+ *         else:
+ *             pos = s.find(u'[[Category:', pos + 1)
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+        __PYX_ERR(0, 235, __pyx_L1_error)
+      }
+      __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 235, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 235, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_7 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u_Category, __pyx_t_1, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-2))) __PYX_ERR(0, 235, __pyx_L1_error)
+      __pyx_v_pos = __pyx_t_7;
+
+      /* "gensim/corpora/_wikimarkup.pyx":232
+ *                 break
+ *             j += 1
+ *         if j + 1 < n and s[j] == u']' and s[j + 1] == u']':             # <<<<<<<<<<<<<<
+ *             pieces.append(s[last:pos])
+ *             last = j + 2
+ */
+      goto __pyx_L7;
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":237
+ *             pos = s.find(u'[[Category:', last)
+ *         else:
+ *             pos = s.find(u'[[Category:', pos + 1)             # <<<<<<<<<<<<<<
+ *     return _finish(pieces, s, last)
+ * 
+ */
+    /*else*/ {
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+        __PYX_ERR(0, 237, __pyx_L1_error)
+      }
+      __pyx_t_2 = PyInt_FromSsize_t((__pyx_v_pos + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 237, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 237, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_1 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u_Category, __pyx_t_7, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-2))) __PYX_ERR(0, 237, __pyx_L1_error)
+      __pyx_v_pos = __pyx_t_1;
+    }
+    __pyx_L7:;
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":238
+ *         else:
+ *             pos = s.find(u'[[Category:', pos + 1)
+ *     return _finish(pieces, s, last)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_6gensim_7corpora_11_wikimarkup__finish(__pyx_v_pieces, __pyx_v_s, __pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":219
+ * 
+ * 
+ * cdef unicode _remove_categories(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P14, '', s)`."""
+ *     cdef Py_ssize_t pos, j, n = len(s), last = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup._remove_categories", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_pieces);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":241
+ * 
+ * 
+ * cdef unicode _replace_urls(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P5, '\\\\3', s)`: replace external links by their description."""
+ *     cdef Py_ssize_t pos, j, space, n = len(s), last = 0
+ */
+
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__replace_urls(PyObject *__pyx_v_s) {
+  Py_ssize_t __pyx_v_pos;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_space;
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_last;
+  Py_UCS4 __pyx_v_c;
+  PyObject *__pyx_v_pieces = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  Py_UCS4 __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  int __pyx_t_7;
+  __Pyx_RefNannySetupContext("_replace_urls", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":243
+ * cdef unicode _replace_urls(unicode s):
+ *     """Same as `re.sub(RE_P5, '\\\\3', s)`: replace external links by their description."""
+ *     cdef Py_ssize_t pos, j, space, n = len(s), last = 0             # <<<<<<<<<<<<<<
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 243, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 243, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_1;
+  __pyx_v_last = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":245
+ *     cdef Py_ssize_t pos, j, space, n = len(s), last = 0
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []             # <<<<<<<<<<<<<<
+ *     pos = s.find(u'[')
+ *     while pos >= 0:
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 245, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_pieces = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":246
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []
+ *     pos = s.find(u'[')             # <<<<<<<<<<<<<<
+ *     while pos >= 0:
+ *         # \[(\w+):\/\/
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+    __PYX_ERR(0, 246, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__8, 0, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-2))) __PYX_ERR(0, 246, __pyx_L1_error)
+  __pyx_v_pos = __pyx_t_1;
+
+  /* "gensim/corpora/_wikimarkup.pyx":247
+ *     cdef list pieces = []
+ *     pos = s.find(u'[')
+ *     while pos >= 0:             # <<<<<<<<<<<<<<
+ *         # \[(\w+):\/\/
+ *         j = pos + 1
+ */
+  while (1) {
+    __pyx_t_3 = ((__pyx_v_pos >= 0) != 0);
+    if (!__pyx_t_3) break;
+
+    /* "gensim/corpora/_wikimarkup.pyx":249
+ *     while pos >= 0:
+ *         # \[(\w+):\/\/
+ *         j = pos + 1             # <<<<<<<<<<<<<<
+ *         while j < n and _is_word(s[j]):
+ *             j += 1
+ */
+    __pyx_v_j = (__pyx_v_pos + 1);
+
+    /* "gensim/corpora/_wikimarkup.pyx":250
+ *         # \[(\w+):\/\/
+ *         j = pos + 1
+ *         while j < n and _is_word(s[j]):             # <<<<<<<<<<<<<<
+ *             j += 1
+ *         if j == pos + 1 or not _at(s, n, j, u'://'):
+ */
+    while (1) {
+      __pyx_t_4 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (__pyx_t_4) {
+      } else {
+        __pyx_t_3 = __pyx_t_4;
+        goto __pyx_L7_bool_binop_done;
+      }
+      __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 250, __pyx_L1_error)
+      __pyx_t_4 = (__pyx_f_6gensim_7corpora_11_wikimarkup__is_word(__pyx_t_5) != 0);
+      __pyx_t_3 = __pyx_t_4;
+      __pyx_L7_bool_binop_done:;
+      if (!__pyx_t_3) break;
+
+      /* "gensim/corpora/_wikimarkup.pyx":251
+ *         j = pos + 1
+ *         while j < n and _is_word(s[j]):
+ *             j += 1             # <<<<<<<<<<<<<<
+ *         if j == pos + 1 or not _at(s, n, j, u'://'):
+ *             pos = s.find(u'[', pos + 1)
+ */
+      __pyx_v_j = (__pyx_v_j + 1);
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":252
+ *         while j < n and _is_word(s[j]):
+ *             j += 1
+ *         if j == pos + 1 or not _at(s, n, j, u'://'):             # <<<<<<<<<<<<<<
+ *             pos = s.find(u'[', pos + 1)
+ *             continue
+ */
+    __pyx_t_4 = ((__pyx_v_j == (__pyx_v_pos + 1)) != 0);
+    if (!__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_4 = ((!(__pyx_f_6gensim_7corpora_11_wikimarkup__at(__pyx_v_s, __pyx_v_n, __pyx_v_j, __pyx_kp_u__9) != 0)) != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L10_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":253
+ *             j += 1
+ *         if j == pos + 1 or not _at(s, n, j, u'://'):
+ *             pos = s.find(u'[', pos + 1)             # <<<<<<<<<<<<<<
+ *             continue
+ *         # (.*?)(( (.*?))|())\] -- up to the first space or bracket, then up to the first bracket after a space
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+        __PYX_ERR(0, 253, __pyx_L1_error)
+      }
+      __pyx_t_2 = PyInt_FromSsize_t((__pyx_v_pos + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 253, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 253, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_6 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__8, __pyx_t_1, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-2))) __PYX_ERR(0, 253, __pyx_L1_error)
+      __pyx_v_pos = __pyx_t_6;
+
+      /* "gensim/corpora/_wikimarkup.pyx":254
+ *         if j == pos + 1 or not _at(s, n, j, u'://'):
+ *             pos = s.find(u'[', pos + 1)
+ *             continue             # <<<<<<<<<<<<<<
+ *         # (.*?)(( (.*?))|())\] -- up to the first space or bracket, then up to the first bracket after a space
+ *         j += 3
+ */
+      goto __pyx_L3_continue;
+
+      /* "gensim/corpora/_wikimarkup.pyx":252
+ *         while j < n and _is_word(s[j]):
+ *             j += 1
+ *         if j == pos + 1 or not _at(s, n, j, u'://'):             # <<<<<<<<<<<<<<
+ *             pos = s.find(u'[', pos + 1)
+ *             continue
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":256
+ *             continue
+ *         # (.*?)(( (.*?))|())\] -- up to the first space or bracket, then up to the first bracket after a space
+ *         j += 3             # <<<<<<<<<<<<<<
+ *         while j < n:
+ *             c = s[j]
+ */
+    __pyx_v_j = (__pyx_v_j + 3);
+
+    /* "gensim/corpora/_wikimarkup.pyx":257
+ *         # (.*?)(( (.*?))|())\] -- up to the first space or bracket, then up to the first bracket after a space
+ *         j += 3
+ *         while j < n:             # <<<<<<<<<<<<<<
+ *             c = s[j]
+ *             if c == u' ' or c == u']' or c == u'\n':
+ */
+    while (1) {
+      __pyx_t_3 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (!__pyx_t_3) break;
+
+      /* "gensim/corpora/_wikimarkup.pyx":258
+ *         j += 3
+ *         while j < n:
+ *             c = s[j]             # <<<<<<<<<<<<<<
+ *             if c == u' ' or c == u']' or c == u'\n':
+ *                 break
+ */
+      __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 258, __pyx_L1_error)
+      __pyx_v_c = __pyx_t_5;
+
+      /* "gensim/corpora/_wikimarkup.pyx":259
+ *         while j < n:
+ *             c = s[j]
+ *             if c == u' ' or c == u']' or c == u'\n':             # <<<<<<<<<<<<<<
+ *                 break
+ *             j += 1
+ */
+      switch (__pyx_v_c) {
+        case 32:
+        case 93:
+        case 10:
+
+        /* "gensim/corpora/_wikimarkup.pyx":260
+ *             c = s[j]
+ *             if c == u' ' or c == u']' or c == u'\n':
+ *                 break             # <<<<<<<<<<<<<<
+ *             j += 1
+ *         if j < n and s[j] == u' ':
+ */
+        goto __pyx_L13_break;
+
+        /* "gensim/corpora/_wikimarkup.pyx":259
+ *         while j < n:
+ *             c = s[j]
+ *             if c == u' ' or c == u']' or c == u'\n':             # <<<<<<<<<<<<<<
+ *                 break
+ *             j += 1
+ */
+        break;
+        default: break;
+      }
+
+      /* "gensim/corpora/_wikimarkup.pyx":261
+ *             if c == u' ' or c == u']' or c == u'\n':
+ *                 break
+ *             j += 1             # <<<<<<<<<<<<<<
+ *         if j < n and s[j] == u' ':
+ *             space = j
+ */
+      __pyx_v_j = (__pyx_v_j + 1);
+    }
+    __pyx_L13_break:;
+
+    /* "gensim/corpora/_wikimarkup.pyx":262
+ *                 break
+ *             j += 1
+ *         if j < n and s[j] == u' ':             # <<<<<<<<<<<<<<
+ *             space = j
+ *             j += 1
+ */
+    __pyx_t_4 = ((__pyx_v_j < __pyx_v_n) != 0);
+    if (__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L15_bool_binop_done;
+    }
+    __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 262, __pyx_L1_error)
+    __pyx_t_4 = ((__pyx_t_5 == 32) != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L15_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":263
+ *             j += 1
+ *         if j < n and s[j] == u' ':
+ *             space = j             # <<<<<<<<<<<<<<
+ *             j += 1
+ *             while j < n:
+ */
+      __pyx_v_space = __pyx_v_j;
+
+      /* "gensim/corpora/_wikimarkup.pyx":264
+ *         if j < n and s[j] == u' ':
+ *             space = j
+ *             j += 1             # <<<<<<<<<<<<<<
+ *             while j < n:
+ *                 c = s[j]
+ */
+      __pyx_v_j = (__pyx_v_j + 1);
+
+      /* "gensim/corpora/_wikimarkup.pyx":265
+ *             space = j
+ *             j += 1
+ *             while j < n:             # <<<<<<<<<<<<<<
+ *                 c = s[j]
+ *                 if c == u']' or c == u'\n':
+ */
+      while (1) {
+        __pyx_t_3 = ((__pyx_v_j < __pyx_v_n) != 0);
+        if (!__pyx_t_3) break;
+
+        /* "gensim/corpora/_wikimarkup.pyx":266
+ *             j += 1
+ *             while j < n:
+ *                 c = s[j]             # <<<<<<<<<<<<<<
+ *                 if c == u']' or c == u'\n':
+ *                     break
+ */
+        __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 266, __pyx_L1_error)
+        __pyx_v_c = __pyx_t_5;
+
+        /* "gensim/corpora/_wikimarkup.pyx":267
+ *             while j < n:
+ *                 c = s[j]
+ *                 if c == u']' or c == u'\n':             # <<<<<<<<<<<<<<
+ *                     break
+ *                 j += 1
+ */
+        switch (__pyx_v_c) {
+          case 93:
+          case 10:
+
+          /* "gensim/corpora/_wikimarkup.pyx":268
+ *                 c = s[j]
+ *                 if c == u']' or c == u'\n':
+ *                     break             # <<<<<<<<<<<<<<
+ *                 j += 1
+ *         else:
+ */
+          goto __pyx_L18_break;
+
+          /* "gensim/corpora/_wikimarkup.pyx":267
+ *             while j < n:
+ *                 c = s[j]
+ *                 if c == u']' or c == u'\n':             # <<<<<<<<<<<<<<
+ *                     break
+ *                 j += 1
+ */
+          break;
+          default: break;
+        }
+
+        /* "gensim/corpora/_wikimarkup.pyx":269
+ *                 if c == u']' or c == u'\n':
+ *                     break
+ *                 j += 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             space = -1
+ */
+        __pyx_v_j = (__pyx_v_j + 1);
+      }
+      __pyx_L18_break:;
+
+      /* "gensim/corpora/_wikimarkup.pyx":262
+ *                 break
+ *             j += 1
+ *         if j < n and s[j] == u' ':             # <<<<<<<<<<<<<<
+ *             space = j
+ *             j += 1
+ */
+      goto __pyx_L14;
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":271
+ *                 j += 1
+ *         else:
+ *             space = -1             # <<<<<<<<<<<<<<
+ *         if j < n and s[j] == u']':
+ *             pieces.append(s[last:pos])
+ */
+    /*else*/ {
+      __pyx_v_space = -1L;
+    }
+    __pyx_L14:;
+
+    /* "gensim/corpora/_wikimarkup.pyx":272
+ *         else:
+ *             space = -1
+ *         if j < n and s[j] == u']':             # <<<<<<<<<<<<<<
+ *             pieces.append(s[last:pos])
+ *             if space >= 0:
+ */
+    __pyx_t_4 = ((__pyx_v_j < __pyx_v_n) != 0);
+    if (__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L20_bool_binop_done;
+    }
+    __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 272, __pyx_L1_error)
+    __pyx_t_4 = ((__pyx_t_5 == 93) != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L20_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":273
+ *             space = -1
+ *         if j < n and s[j] == u']':
+ *             pieces.append(s[last:pos])             # <<<<<<<<<<<<<<
+ *             if space >= 0:
+ *                 pieces.append(s[space:j])
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 273, __pyx_L1_error)
+      }
+      __pyx_t_2 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_last, __pyx_v_pos); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 273, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_7 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_2); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 273, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+      /* "gensim/corpora/_wikimarkup.pyx":274
+ *         if j < n and s[j] == u']':
+ *             pieces.append(s[last:pos])
+ *             if space >= 0:             # <<<<<<<<<<<<<<
+ *                 pieces.append(s[space:j])
+ *             last = j + 1
+ */
+      __pyx_t_3 = ((__pyx_v_space >= 0) != 0);
+      if (__pyx_t_3) {
+
+        /* "gensim/corpora/_wikimarkup.pyx":275
+ *             pieces.append(s[last:pos])
+ *             if space >= 0:
+ *                 pieces.append(s[space:j])             # <<<<<<<<<<<<<<
+ *             last = j + 1
+ *             pos = s.find(u'[', last)
+ */
+        if (unlikely(__pyx_v_s == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+          __PYX_ERR(0, 275, __pyx_L1_error)
+        }
+        __pyx_t_2 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_space, __pyx_v_j); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 275, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_t_7 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_2); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 275, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+        /* "gensim/corpora/_wikimarkup.pyx":274
+ *         if j < n and s[j] == u']':
+ *             pieces.append(s[last:pos])
+ *             if space >= 0:             # <<<<<<<<<<<<<<
+ *                 pieces.append(s[space:j])
+ *             last = j + 1
+ */
+      }
+
+      /* "gensim/corpora/_wikimarkup.pyx":276
+ *             if space >= 0:
+ *                 pieces.append(s[space:j])
+ *             last = j + 1             # <<<<<<<<<<<<<<
+ *             pos = s.find(u'[', last)
+ *         else:
+ */
+      __pyx_v_last = (__pyx_v_j + 1);
+
+      /* "gensim/corpora/_wikimarkup.pyx":277
+ *                 pieces.append(s[space:j])
+ *             last = j + 1
+ *             pos = s.find(u'[', last)             # <<<<<<<<<<<<<<
+ *         else:
+ *             pos = s.find(u'[', pos + 1)
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+        __PYX_ERR(0, 277, __pyx_L1_error)
+      }
+      __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 277, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_6 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_6 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 277, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_1 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__8, __pyx_t_6, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-2))) __PYX_ERR(0, 277, __pyx_L1_error)
+      __pyx_v_pos = __pyx_t_1;
+
+      /* "gensim/corpora/_wikimarkup.pyx":272
+ *         else:
+ *             space = -1
+ *         if j < n and s[j] == u']':             # <<<<<<<<<<<<<<
+ *             pieces.append(s[last:pos])
+ *             if space >= 0:
+ */
+      goto __pyx_L19;
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":279
+ *             pos = s.find(u'[', last)
+ *         else:
+ *             pos = s.find(u'[', pos + 1)             # <<<<<<<<<<<<<<
+ *     return _finish(pieces, s, last)
+ * 
+ */
+    /*else*/ {
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+        __PYX_ERR(0, 279, __pyx_L1_error)
+      }
+      __pyx_t_2 = PyInt_FromSsize_t((__pyx_v_pos + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 279, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 279, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_6 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__8, __pyx_t_1, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-2))) __PYX_ERR(0, 279, __pyx_L1_error)
+      __pyx_v_pos = __pyx_t_6;
+    }
+    __pyx_L19:;
+    __pyx_L3_continue:;
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":280
+ *         else:
+ *             pos = s.find(u'[', pos + 1)
+ *     return _finish(pieces, s, last)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_6gensim_7corpora_11_wikimarkup__finish(__pyx_v_pieces, __pyx_v_s, __pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":241
+ * 
+ * 
+ * cdef unicode _replace_urls(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P5, '\\\\3', s)`: replace external links by their description."""
+ *     cdef Py_ssize_t pos, j, space, n = len(s), last = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup._replace_urls", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_pieces);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":283
+ * 
+ * 
+ * cdef unicode _simplify_links(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P6, '\\\\2', s)`: replace `[target|description]` by its description."""
+ *     cdef Py_ssize_t pos, j, bar, n = len(s), last = 0
+ */
+
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__simplify_links(PyObject *__pyx_v_s) {
+  Py_ssize_t __pyx_v_pos;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_bar;
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_last;
+  Py_UCS4 __pyx_v_c;
+  PyObject *__pyx_v_pieces = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  Py_UCS4 __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  __Pyx_RefNannySetupContext("_simplify_links", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":285
+ * cdef unicode _simplify_links(unicode s):
+ *     """Same as `re.sub(RE_P6, '\\\\2', s)`: replace `[target|description]` by its description."""
+ *     cdef Py_ssize_t pos, j, bar, n = len(s), last = 0             # <<<<<<<<<<<<<<
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 285, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 285, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_1;
+  __pyx_v_last = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":287
+ *     cdef Py_ssize_t pos, j, bar, n = len(s), last = 0
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []             # <<<<<<<<<<<<<<
+ *     pos = s.find(u'[')
+ *     while pos >= 0:
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_pieces = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":288
+ *     cdef Py_UCS4 c
+ *     cdef list pieces = []
+ *     pos = s.find(u'[')             # <<<<<<<<<<<<<<
+ *     while pos >= 0:
+ *         bar = -1
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+    __PYX_ERR(0, 288, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__8, 0, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-2))) __PYX_ERR(0, 288, __pyx_L1_error)
+  __pyx_v_pos = __pyx_t_1;
+
+  /* "gensim/corpora/_wikimarkup.pyx":289
+ *     cdef list pieces = []
+ *     pos = s.find(u'[')
+ *     while pos >= 0:             # <<<<<<<<<<<<<<
+ *         bar = -1
+ *         j = pos + 1
+ */
+  while (1) {
+    __pyx_t_3 = ((__pyx_v_pos >= 0) != 0);
+    if (!__pyx_t_3) break;
+
+    /* "gensim/corpora/_wikimarkup.pyx":290
+ *     pos = s.find(u'[')
+ *     while pos >= 0:
+ *         bar = -1             # <<<<<<<<<<<<<<
+ *         j = pos + 1
+ *         while j < n:
+ */
+    __pyx_v_bar = -1L;
+
+    /* "gensim/corpora/_wikimarkup.pyx":291
+ *     while pos >= 0:
+ *         bar = -1
+ *         j = pos + 1             # <<<<<<<<<<<<<<
+ *         while j < n:
+ *             c = s[j]
+ */
+    __pyx_v_j = (__pyx_v_pos + 1);
+
+    /* "gensim/corpora/_wikimarkup.pyx":292
+ *         bar = -1
+ *         j = pos + 1
+ *         while j < n:             # <<<<<<<<<<<<<<
+ *             c = s[j]
+ *             if c == u'[' or c == u']':
+ */
+    while (1) {
+      __pyx_t_3 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (!__pyx_t_3) break;
+
+      /* "gensim/corpora/_wikimarkup.pyx":293
+ *         j = pos + 1
+ *         while j < n:
+ *             c = s[j]             # <<<<<<<<<<<<<<
+ *             if c == u'[' or c == u']':
+ *                 break
+ */
+      __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 293, __pyx_L1_error)
+      __pyx_v_c = __pyx_t_4;
+
+      /* "gensim/corpora/_wikimarkup.pyx":294
+ *         while j < n:
+ *             c = s[j]
+ *             if c == u'[' or c == u']':             # <<<<<<<<<<<<<<
+ *                 break
+ *             if c == u'|':
+ */
+      switch (__pyx_v_c) {
+        case 91:
+        case 93:
+
+        /* "gensim/corpora/_wikimarkup.pyx":295
+ *             c = s[j]
+ *             if c == u'[' or c == u']':
+ *                 break             # <<<<<<<<<<<<<<
+ *             if c == u'|':
+ *                 bar = j
+ */
+        goto __pyx_L6_break;
+
+        /* "gensim/corpora/_wikimarkup.pyx":294
+ *         while j < n:
+ *             c = s[j]
+ *             if c == u'[' or c == u']':             # <<<<<<<<<<<<<<
+ *                 break
+ *             if c == u'|':
+ */
+        break;
+        default: break;
+      }
+
+      /* "gensim/corpora/_wikimarkup.pyx":296
+ *             if c == u'[' or c == u']':
+ *                 break
+ *             if c == u'|':             # <<<<<<<<<<<<<<
+ *                 bar = j
+ *             j += 1
+ */
+      __pyx_t_3 = ((__pyx_v_c == 0x7C) != 0);
+      if (__pyx_t_3) {
+
+        /* "gensim/corpora/_wikimarkup.pyx":297
+ *                 break
+ *             if c == u'|':
+ *                 bar = j             # <<<<<<<<<<<<<<
+ *             j += 1
+ *         if j < n and s[j] == u']' and bar >= 0:
+ */
+        __pyx_v_bar = __pyx_v_j;
+
+        /* "gensim/corpora/_wikimarkup.pyx":296
+ *             if c == u'[' or c == u']':
+ *                 break
+ *             if c == u'|':             # <<<<<<<<<<<<<<
+ *                 bar = j
+ *             j += 1
+ */
+      }
+
+      /* "gensim/corpora/_wikimarkup.pyx":298
+ *             if c == u'|':
+ *                 bar = j
+ *             j += 1             # <<<<<<<<<<<<<<
+ *         if j < n and s[j] == u']' and bar >= 0:
+ *             pieces.append(s[last:pos])
+ */
+      __pyx_v_j = (__pyx_v_j + 1);
+    }
+    __pyx_L6_break:;
+
+    /* "gensim/corpora/_wikimarkup.pyx":299
+ *                 bar = j
+ *             j += 1
+ *         if j < n and s[j] == u']' and bar >= 0:             # <<<<<<<<<<<<<<
+ *             pieces.append(s[last:pos])
+ *             pieces.append(s[bar + 1:j])
+ */
+    __pyx_t_5 = ((__pyx_v_j < __pyx_v_n) != 0);
+    if (__pyx_t_5) {
+    } else {
+      __pyx_t_3 = __pyx_t_5;
+      goto __pyx_L9_bool_binop_done;
+    }
+    __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 299, __pyx_L1_error)
+    __pyx_t_5 = ((__pyx_t_4 == 93) != 0);
+    if (__pyx_t_5) {
+    } else {
+      __pyx_t_3 = __pyx_t_5;
+      goto __pyx_L9_bool_binop_done;
+    }
+    __pyx_t_5 = ((__pyx_v_bar >= 0) != 0);
+    __pyx_t_3 = __pyx_t_5;
+    __pyx_L9_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":300
+ *             j += 1
+ *         if j < n and s[j] == u']' and bar >= 0:
+ *             pieces.append(s[last:pos])             # <<<<<<<<<<<<<<
+ *             pieces.append(s[bar + 1:j])
+ *             last = j + 1
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 300, __pyx_L1_error)
+      }
+      __pyx_t_2 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_last, __pyx_v_pos); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 300, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_2); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 300, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+      /* "gensim/corpora/_wikimarkup.pyx":301
+ *         if j < n and s[j] == u']' and bar >= 0:
+ *             pieces.append(s[last:pos])
+ *             pieces.append(s[bar + 1:j])             # <<<<<<<<<<<<<<
+ *             last = j + 1
+ *             pos = s.find(u'[', last)
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 301, __pyx_L1_error)
+      }
+      __pyx_t_2 = __Pyx_PyUnicode_Substring(__pyx_v_s, (__pyx_v_bar + 1), __pyx_v_j); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 301, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_2); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 301, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+      /* "gensim/corpora/_wikimarkup.pyx":302
+ *             pieces.append(s[last:pos])
+ *             pieces.append(s[bar + 1:j])
+ *             last = j + 1             # <<<<<<<<<<<<<<
+ *             pos = s.find(u'[', last)
+ *         else:
+ */
+      __pyx_v_last = (__pyx_v_j + 1);
+
+      /* "gensim/corpora/_wikimarkup.pyx":303
+ *             pieces.append(s[bar + 1:j])
+ *             last = j + 1
+ *             pos = s.find(u'[', last)             # <<<<<<<<<<<<<<
+ *         else:
+ *             # no bracket between pos and j, so the next candidate is at j
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+        __PYX_ERR(0, 303, __pyx_L1_error)
+      }
+      __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 303, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 303, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_7 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__8, __pyx_t_1, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-2))) __PYX_ERR(0, 303, __pyx_L1_error)
+      __pyx_v_pos = __pyx_t_7;
+
+      /* "gensim/corpora/_wikimarkup.pyx":299
+ *                 bar = j
+ *             j += 1
+ *         if j < n and s[j] == u']' and bar >= 0:             # <<<<<<<<<<<<<<
+ *             pieces.append(s[last:pos])
+ *             pieces.append(s[bar + 1:j])
+ */
+      goto __pyx_L8;
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":306
+ *         else:
+ *             # no bracket between pos and j, so the next candidate is at j
+ *             pos = j if j < n and s[j] == u'[' else s.find(u'[', j)             # <<<<<<<<<<<<<<
+ *     return _finish(pieces, s, last)
+ * 
+ */
+    /*else*/ {
+      __pyx_t_5 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (__pyx_t_5) {
+      } else {
+        __pyx_t_3 = __pyx_t_5;
+        goto __pyx_L12_bool_binop_done;
+      }
+      __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 306, __pyx_L1_error)
+      __pyx_t_5 = ((__pyx_t_4 == 91) != 0);
+      __pyx_t_3 = __pyx_t_5;
+      __pyx_L12_bool_binop_done:;
+      if (__pyx_t_3) {
+        __pyx_t_7 = __pyx_v_j;
+      } else {
+        if (unlikely(__pyx_v_s == Py_None)) {
+          PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+          __PYX_ERR(0, 306, __pyx_L1_error)
+        }
+        __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_j); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 306, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 306, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_t_8 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__8, __pyx_t_1, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_8 == ((Py_ssize_t)-2))) __PYX_ERR(0, 306, __pyx_L1_error)
+        __pyx_t_7 = __pyx_t_8;
+      }
+      __pyx_v_pos = __pyx_t_7;
+    }
+    __pyx_L8:;
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":307
+ *             # no bracket between pos and j, so the next candidate is at j
+ *             pos = j if j < n and s[j] == u'[' else s.find(u'[', j)
+ *     return _finish(pieces, s, last)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_6gensim_7corpora_11_wikimarkup__finish(__pyx_v_pieces, __pyx_v_s, __pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":283
+ * 
+ * 
+ * cdef unicode _simplify_links(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P6, '\\\\2', s)`: replace `[target|description]` by its description."""
+ *     cdef Py_ssize_t pos, j, bar, n = len(s), last = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup._simplify_links", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_pieces);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":310
+ * 
+ * 
+ * cdef unicode _remove_table_lines(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P12, '\\n', s)`: remove table formatting up to the end of the line."""
+ *     cdef Py_ssize_t i, end, n = len(s), last = 0
+ */
+
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_table_lines(PyObject *__pyx_v_s) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_end;
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_last;
+  Py_UCS4 __pyx_v_c;
+  Py_UCS4 __pyx_v_d;
+  int __pyx_v_found;
+  PyObject *__pyx_v_pieces = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  Py_UCS4 __pyx_t_4;
+  Py_UCS4 __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  int __pyx_t_9;
+  __Pyx_RefNannySetupContext("_remove_table_lines", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":312
+ * cdef unicode _remove_table_lines(unicode s):
+ *     """Same as `re.sub(RE_P12, '\\n', s)`: remove table formatting up to the end of the line."""
+ *     cdef Py_ssize_t i, end, n = len(s), last = 0             # <<<<<<<<<<<<<<
+ *     cdef Py_UCS4 c, d
+ *     cdef bint found
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 312, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 312, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_1;
+  __pyx_v_last = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":315
+ *     cdef Py_UCS4 c, d
+ *     cdef bint found
+ *     cdef list pieces = []             # <<<<<<<<<<<<<<
+ *     i = 0
+ *     while i + 1 < n:
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_pieces = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":316
+ *     cdef bint found
+ *     cdef list pieces = []
+ *     i = 0             # <<<<<<<<<<<<<<
+ *     while i + 1 < n:
+ *         c, d = s[i], s[i + 1]
+ */
+  __pyx_v_i = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":317
+ *     cdef list pieces = []
+ *     i = 0
+ *     while i + 1 < n:             # <<<<<<<<<<<<<<
+ *         c, d = s[i], s[i + 1]
+ *         found = (c == u'{' and d == u'|') or (c == u'|' and d == u'}') or \
+ */
+  while (1) {
+    __pyx_t_3 = (((__pyx_v_i + 1) < __pyx_v_n) != 0);
+    if (!__pyx_t_3) break;
+
+    /* "gensim/corpora/_wikimarkup.pyx":318
+ *     i = 0
+ *     while i + 1 < n:
+ *         c, d = s[i], s[i + 1]             # <<<<<<<<<<<<<<
+ *         found = (c == u'{' and d == u'|') or (c == u'|' and d == u'}') or \
+ *             (c == u'|' and d == u'-' and not (i + 2 < n and s[i + 2].isdecimal()))
+ */
+    __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 318, __pyx_L1_error)
+    __pyx_t_1 = (__pyx_v_i + 1);
+    __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_1, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 318, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_4;
+    __pyx_v_d = __pyx_t_5;
+
+    /* "gensim/corpora/_wikimarkup.pyx":319
+ *     while i + 1 < n:
+ *         c, d = s[i], s[i + 1]
+ *         found = (c == u'{' and d == u'|') or (c == u'|' and d == u'}') or \             # <<<<<<<<<<<<<<
+ *             (c == u'|' and d == u'-' and not (i + 2 < n and s[i + 2].isdecimal()))
+ *         if not found:
+ */
+    __pyx_t_6 = ((__pyx_v_c == 0x7B) != 0);
+    if (!__pyx_t_6) {
+      goto __pyx_L6_next_or;
+    } else {
+    }
+    __pyx_t_6 = ((__pyx_v_d == 0x7C) != 0);
+    if (!__pyx_t_6) {
+    } else {
+      __pyx_t_3 = __pyx_t_6;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_L6_next_or:;
+    __pyx_t_6 = ((__pyx_v_c == 0x7C) != 0);
+    if (!__pyx_t_6) {
+      goto __pyx_L8_next_or;
+    } else {
+    }
+    __pyx_t_6 = ((__pyx_v_d == 0x7D) != 0);
+    if (!__pyx_t_6) {
+    } else {
+      __pyx_t_3 = __pyx_t_6;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_L8_next_or:;
+
+    /* "gensim/corpora/_wikimarkup.pyx":320
+ *         c, d = s[i], s[i + 1]
+ *         found = (c == u'{' and d == u'|') or (c == u'|' and d == u'}') or \
+ *             (c == u'|' and d == u'-' and not (i + 2 < n and s[i + 2].isdecimal()))             # <<<<<<<<<<<<<<
+ *         if not found:
+ *             i += 1
+ */
+    __pyx_t_6 = ((__pyx_v_c == 0x7C) != 0);
+    if (__pyx_t_6) {
+    } else {
+      __pyx_t_3 = __pyx_t_6;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_6 = ((__pyx_v_d == 45) != 0);
+    if (__pyx_t_6) {
+    } else {
+      __pyx_t_3 = __pyx_t_6;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_7 = (((__pyx_v_i + 2) < __pyx_v_n) != 0);
+    if (__pyx_t_7) {
+    } else {
+      __pyx_t_6 = __pyx_t_7;
+      goto __pyx_L12_bool_binop_done;
+    }
+    __pyx_t_1 = (__pyx_v_i + 2);
+    __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_1, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 320, __pyx_L1_error)
+    __pyx_t_7 = Py_UNICODE_ISDECIMAL(__pyx_t_5); 
+    __pyx_t_6 = (__pyx_t_7 != 0);
+    __pyx_L12_bool_binop_done:;
+    __pyx_t_7 = ((!__pyx_t_6) != 0);
+    __pyx_t_3 = __pyx_t_7;
+    __pyx_L5_bool_binop_done:;
+    __pyx_v_found = __pyx_t_3;
+
+    /* "gensim/corpora/_wikimarkup.pyx":321
+ *         found = (c == u'{' and d == u'|') or (c == u'|' and d == u'}') or \
+ *             (c == u'|' and d == u'-' and not (i + 2 < n and s[i + 2].isdecimal()))
+ *         if not found:             # <<<<<<<<<<<<<<
+ *             i += 1
+ *             continue
+ */
+    __pyx_t_3 = ((!(__pyx_v_found != 0)) != 0);
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":322
+ *             (c == u'|' and d == u'-' and not (i + 2 < n and s[i + 2].isdecimal()))
+ *         if not found:
+ *             i += 1             # <<<<<<<<<<<<<<
+ *             continue
+ *         end = s.find(u'\n', i + 2)
+ */
+      __pyx_v_i = (__pyx_v_i + 1);
+
+      /* "gensim/corpora/_wikimarkup.pyx":323
+ *         if not found:
+ *             i += 1
+ *             continue             # <<<<<<<<<<<<<<
+ *         end = s.find(u'\n', i + 2)
+ *         if end < 0:
+ */
+      goto __pyx_L3_continue;
+
+      /* "gensim/corpora/_wikimarkup.pyx":321
+ *         found = (c == u'{' and d == u'|') or (c == u'|' and d == u'}') or \
+ *             (c == u'|' and d == u'-' and not (i + 2 < n and s[i + 2].isdecimal()))
+ *         if not found:             # <<<<<<<<<<<<<<
+ *             i += 1
+ *             continue
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":324
+ *             i += 1
+ *             continue
+ *         end = s.find(u'\n', i + 2)             # <<<<<<<<<<<<<<
+ *         if end < 0:
+ *             break
+ */
+    if (unlikely(__pyx_v_s == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+      __PYX_ERR(0, 324, __pyx_L1_error)
+    }
+    __pyx_t_2 = PyInt_FromSsize_t((__pyx_v_i + 2)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 324, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 324, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_8 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__10, __pyx_t_1, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_8 == ((Py_ssize_t)-2))) __PYX_ERR(0, 324, __pyx_L1_error)
+    __pyx_v_end = __pyx_t_8;
+
+    /* "gensim/corpora/_wikimarkup.pyx":325
+ *             continue
+ *         end = s.find(u'\n', i + 2)
+ *         if end < 0:             # <<<<<<<<<<<<<<
+ *             break
+ *         pieces.append(s[last:i])
+ */
+    __pyx_t_3 = ((__pyx_v_end < 0) != 0);
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":326
+ *         end = s.find(u'\n', i + 2)
+ *         if end < 0:
+ *             break             # <<<<<<<<<<<<<<
+ *         pieces.append(s[last:i])
+ *         pieces.append(u'\n')
+ */
+      goto __pyx_L4_break;
+
+      /* "gensim/corpora/_wikimarkup.pyx":325
+ *             continue
+ *         end = s.find(u'\n', i + 2)
+ *         if end < 0:             # <<<<<<<<<<<<<<
+ *             break
+ *         pieces.append(s[last:i])
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":327
+ *         if end < 0:
+ *             break
+ *         pieces.append(s[last:i])             # <<<<<<<<<<<<<<
+ *         pieces.append(u'\n')
+ *         last = i = end
+ */
+    if (unlikely(__pyx_v_s == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 327, __pyx_L1_error)
+    }
+    __pyx_t_2 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_last, __pyx_v_i); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 327, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_2); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 327, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":328
+ *             break
+ *         pieces.append(s[last:i])
+ *         pieces.append(u'\n')             # <<<<<<<<<<<<<<
+ *         last = i = end
+ *     return _finish(pieces, s, last)
+ */
+    __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_kp_u__10); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 328, __pyx_L1_error)
+
+    /* "gensim/corpora/_wikimarkup.pyx":329
+ *         pieces.append(s[last:i])
+ *         pieces.append(u'\n')
+ *         last = i = end             # <<<<<<<<<<<<<<
+ *     return _finish(pieces, s, last)
+ * 
+ */
+    __pyx_v_last = __pyx_v_end;
+    __pyx_v_i = __pyx_v_end;
+    __pyx_L3_continue:;
+  }
+  __pyx_L4_break:;
+
+  /* "gensim/corpora/_wikimarkup.pyx":330
+ *         pieces.append(u'\n')
+ *         last = i = end
+ *     return _finish(pieces, s, last)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_6gensim_7corpora_11_wikimarkup__finish(__pyx_v_pieces, __pyx_v_s, __pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":310
+ * 
+ * 
+ * cdef unicode _remove_table_lines(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P12, '\\n', s)`: remove table formatting up to the end of the line."""
+ *     cdef Py_ssize_t i, end, n = len(s), last = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup._remove_table_lines", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_pieces);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":333
+ * 
+ * 
+ * cdef unicode _remove_table_cells(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P13, '\\n', s)`: keep only the content of table cells."""
+ *     cdef Py_ssize_t p, j, end, n = len(s), last = 0
+ */
+
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_table_cells(PyObject *__pyx_v_s) {
+  Py_ssize_t __pyx_v_p;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_end;
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_last;
+  Py_UCS4 __pyx_v_c;
+  Py_UCS4 __pyx_v_before;
+  Py_UCS4 __pyx_v_before2;
+  PyObject *__pyx_v_pieces = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  Py_UCS4 __pyx_t_4;
+  Py_UCS4 __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  __Pyx_RefNannySetupContext("_remove_table_cells", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":335
+ * cdef unicode _remove_table_cells(unicode s):
+ *     """Same as `re.sub(RE_P13, '\\n', s)`: keep only the content of table cells."""
+ *     cdef Py_ssize_t p, j, end, n = len(s), last = 0             # <<<<<<<<<<<<<<
+ *     cdef Py_UCS4 c, before, before2
+ *     cdef list pieces = []
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 335, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 335, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_1;
+  __pyx_v_last = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":337
+ *     cdef Py_ssize_t p, j, end, n = len(s), last = 0
+ *     cdef Py_UCS4 c, before, before2
+ *     cdef list pieces = []             # <<<<<<<<<<<<<<
+ *     p = 2
+ *     while p < n:
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 337, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_pieces = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":338
+ *     cdef Py_UCS4 c, before, before2
+ *     cdef list pieces = []
+ *     p = 2             # <<<<<<<<<<<<<<
+ *     while p < n:
+ *         c = s[p]
+ */
+  __pyx_v_p = 2;
+
+  /* "gensim/corpora/_wikimarkup.pyx":339
+ *     cdef list pieces = []
+ *     p = 2
+ *     while p < n:             # <<<<<<<<<<<<<<
+ *         c = s[p]
+ *         if c != u'|' and c != u'!':
+ */
+  while (1) {
+    __pyx_t_3 = ((__pyx_v_p < __pyx_v_n) != 0);
+    if (!__pyx_t_3) break;
+
+    /* "gensim/corpora/_wikimarkup.pyx":340
+ *     p = 2
+ *     while p < n:
+ *         c = s[p]             # <<<<<<<<<<<<<<
+ *         if c != u'|' and c != u'!':
+ *             p += 1
+ */
+    __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_p, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 340, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_4;
+
+    /* "gensim/corpora/_wikimarkup.pyx":341
+ *     while p < n:
+ *         c = s[p]
+ *         if c != u'|' and c != u'!':             # <<<<<<<<<<<<<<
+ *             p += 1
+ *             continue
+ */
+    switch (__pyx_v_c) {
+      case 0x7C:
+      case 33:
+      __pyx_t_3 = 0;
+      break;
+      default:
+      __pyx_t_3 = 1;
+      break;
+    }
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":342
+ *         c = s[p]
+ *         if c != u'|' and c != u'!':
+ *             p += 1             # <<<<<<<<<<<<<<
+ *             continue
+ *         # (?<=(\n[ ])|(\n\n)|([ ]{2})|(.\n)|(.\t))
+ */
+      __pyx_v_p = (__pyx_v_p + 1);
+
+      /* "gensim/corpora/_wikimarkup.pyx":343
+ *         if c != u'|' and c != u'!':
+ *             p += 1
+ *             continue             # <<<<<<<<<<<<<<
+ *         # (?<=(\n[ ])|(\n\n)|([ ]{2})|(.\n)|(.\t))
+ *         before, before2 = s[p - 1], s[p - 2]
+ */
+      goto __pyx_L3_continue;
+
+      /* "gensim/corpora/_wikimarkup.pyx":341
+ *     while p < n:
+ *         c = s[p]
+ *         if c != u'|' and c != u'!':             # <<<<<<<<<<<<<<
+ *             p += 1
+ *             continue
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":345
+ *             continue
+ *         # (?<=(\n[ ])|(\n\n)|([ ]{2})|(.\n)|(.\t))
+ *         before, before2 = s[p - 1], s[p - 2]             # <<<<<<<<<<<<<<
+ *         if not (before == u'\n' or (before == u' ' and (before2 == u'\n' or before2 == u' ')) or
+ *                 (before == u'\t' and before2 != u'\n')):
+ */
+    __pyx_t_1 = (__pyx_v_p - 1);
+    __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_1, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 345, __pyx_L1_error)
+    __pyx_t_1 = (__pyx_v_p - 2);
+    __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_1, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 345, __pyx_L1_error)
+    __pyx_v_before = __pyx_t_4;
+    __pyx_v_before2 = __pyx_t_5;
+
+    /* "gensim/corpora/_wikimarkup.pyx":346
+ *         # (?<=(\n[ ])|(\n\n)|([ ]{2})|(.\n)|(.\t))
+ *         before, before2 = s[p - 1], s[p - 2]
+ *         if not (before == u'\n' or (before == u' ' and (before2 == u'\n' or before2 == u' ')) or             # <<<<<<<<<<<<<<
+ *                 (before == u'\t' and before2 != u'\n')):
+ *             p += 1
+ */
+    __pyx_t_6 = ((__pyx_v_before == 10) != 0);
+    if (!__pyx_t_6) {
+    } else {
+      __pyx_t_3 = __pyx_t_6;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_6 = ((__pyx_v_before == 32) != 0);
+    if (!__pyx_t_6) {
+      goto __pyx_L9_next_or;
+    } else {
+    }
+    switch (__pyx_v_before2) {
+      case 10:
+      case 32:
+      __pyx_t_6 = 1;
+      break;
+      default:
+      __pyx_t_6 = 0;
+      break;
+    }
+    if (!__pyx_t_6) {
+    } else {
+      __pyx_t_3 = __pyx_t_6;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_L9_next_or:;
+
+    /* "gensim/corpora/_wikimarkup.pyx":347
+ *         before, before2 = s[p - 1], s[p - 2]
+ *         if not (before == u'\n' or (before == u' ' and (before2 == u'\n' or before2 == u' ')) or
+ *                 (before == u'\t' and before2 != u'\n')):             # <<<<<<<<<<<<<<
+ *             p += 1
+ *             continue
+ */
+    __pyx_t_6 = ((__pyx_v_before == 9) != 0);
+    if (__pyx_t_6) {
+    } else {
+      __pyx_t_3 = __pyx_t_6;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_6 = ((__pyx_v_before2 != 10) != 0);
+    __pyx_t_3 = __pyx_t_6;
+    __pyx_L7_bool_binop_done:;
+
+    /* "gensim/corpora/_wikimarkup.pyx":346
+ *         # (?<=(\n[ ])|(\n\n)|([ ]{2})|(.\n)|(.\t))
+ *         before, before2 = s[p - 1], s[p - 2]
+ *         if not (before == u'\n' or (before == u' ' and (before2 == u'\n' or before2 == u' ')) or             # <<<<<<<<<<<<<<
+ *                 (before == u'\t' and before2 != u'\n')):
+ *             p += 1
+ */
+    __pyx_t_6 = ((!__pyx_t_3) != 0);
+    if (__pyx_t_6) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":348
+ *         if not (before == u'\n' or (before == u' ' and (before2 == u'\n' or before2 == u' ')) or
+ *                 (before == u'\t' and before2 != u'\n')):
+ *             p += 1             # <<<<<<<<<<<<<<
+ *             continue
+ *         # (\||\!)([^[\]\n]*?\|)* -- up to the last | before a bracket or line break
+ */
+      __pyx_v_p = (__pyx_v_p + 1);
+
+      /* "gensim/corpora/_wikimarkup.pyx":349
+ *                 (before == u'\t' and before2 != u'\n')):
+ *             p += 1
+ *             continue             # <<<<<<<<<<<<<<
+ *         # (\||\!)([^[\]\n]*?\|)* -- up to the last | before a bracket or line break
+ *         end = p + 1
+ */
+      goto __pyx_L3_continue;
+
+      /* "gensim/corpora/_wikimarkup.pyx":346
+ *         # (?<=(\n[ ])|(\n\n)|([ ]{2})|(.\n)|(.\t))
+ *         before, before2 = s[p - 1], s[p - 2]
+ *         if not (before == u'\n' or (before == u' ' and (before2 == u'\n' or before2 == u' ')) or             # <<<<<<<<<<<<<<
+ *                 (before == u'\t' and before2 != u'\n')):
+ *             p += 1
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":351
+ *             continue
+ *         # (\||\!)([^[\]\n]*?\|)* -- up to the last | before a bracket or line break
+ *         end = p + 1             # <<<<<<<<<<<<<<
+ *         j = p + 1
+ *         while j < n:
+ */
+    __pyx_v_end = (__pyx_v_p + 1);
+
+    /* "gensim/corpora/_wikimarkup.pyx":352
+ *         # (\||\!)([^[\]\n]*?\|)* -- up to the last | before a bracket or line break
+ *         end = p + 1
+ *         j = p + 1             # <<<<<<<<<<<<<<
+ *         while j < n:
+ *             c = s[j]
+ */
+    __pyx_v_j = (__pyx_v_p + 1);
+
+    /* "gensim/corpora/_wikimarkup.pyx":353
+ *         end = p + 1
+ *         j = p + 1
+ *         while j < n:             # <<<<<<<<<<<<<<
+ *             c = s[j]
+ *             if c == u'[' or c == u']' or c == u'\n':
+ */
+    while (1) {
+      __pyx_t_6 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (!__pyx_t_6) break;
+
+      /* "gensim/corpora/_wikimarkup.pyx":354
+ *         j = p + 1
+ *         while j < n:
+ *             c = s[j]             # <<<<<<<<<<<<<<
+ *             if c == u'[' or c == u']' or c == u'\n':
+ *                 break
+ */
+      __pyx_t_5 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_j, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_5 == (Py_UCS4)-1)) __PYX_ERR(0, 354, __pyx_L1_error)
+      __pyx_v_c = __pyx_t_5;
+
+      /* "gensim/corpora/_wikimarkup.pyx":355
+ *         while j < n:
+ *             c = s[j]
+ *             if c == u'[' or c == u']' or c == u'\n':             # <<<<<<<<<<<<<<
+ *                 break
+ *             if c == u'|':
+ */
+      switch (__pyx_v_c) {
+        case 91:
+        case 93:
+        case 10:
+
+        /* "gensim/corpora/_wikimarkup.pyx":356
+ *             c = s[j]
+ *             if c == u'[' or c == u']' or c == u'\n':
+ *                 break             # <<<<<<<<<<<<<<
+ *             if c == u'|':
+ *                 end = j + 1
+ */
+        goto __pyx_L13_break;
+
+        /* "gensim/corpora/_wikimarkup.pyx":355
+ *         while j < n:
+ *             c = s[j]
+ *             if c == u'[' or c == u']' or c == u'\n':             # <<<<<<<<<<<<<<
+ *                 break
+ *             if c == u'|':
+ */
+        break;
+        default: break;
+      }
+
+      /* "gensim/corpora/_wikimarkup.pyx":357
+ *             if c == u'[' or c == u']' or c == u'\n':
+ *                 break
+ *             if c == u'|':             # <<<<<<<<<<<<<<
+ *                 end = j + 1
+ *             j += 1
+ */
+      __pyx_t_6 = ((__pyx_v_c == 0x7C) != 0);
+      if (__pyx_t_6) {
+
+        /* "gensim/corpora/_wikimarkup.pyx":358
+ *                 break
+ *             if c == u'|':
+ *                 end = j + 1             # <<<<<<<<<<<<<<
+ *             j += 1
+ *         pieces.append(s[last:p])
+ */
+        __pyx_v_end = (__pyx_v_j + 1);
+
+        /* "gensim/corpora/_wikimarkup.pyx":357
+ *             if c == u'[' or c == u']' or c == u'\n':
+ *                 break
+ *             if c == u'|':             # <<<<<<<<<<<<<<
+ *                 end = j + 1
+ *             j += 1
+ */
+      }
+
+      /* "gensim/corpora/_wikimarkup.pyx":359
+ *             if c == u'|':
+ *                 end = j + 1
+ *             j += 1             # <<<<<<<<<<<<<<
+ *         pieces.append(s[last:p])
+ *         pieces.append(u'\n')
+ */
+      __pyx_v_j = (__pyx_v_j + 1);
+    }
+    __pyx_L13_break:;
+
+    /* "gensim/corpora/_wikimarkup.pyx":360
+ *                 end = j + 1
+ *             j += 1
+ *         pieces.append(s[last:p])             # <<<<<<<<<<<<<<
+ *         pieces.append(u'\n')
+ *         last = p = end
+ */
+    if (unlikely(__pyx_v_s == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 360, __pyx_L1_error)
+    }
+    __pyx_t_2 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_last, __pyx_v_p); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 360, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_7 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_2); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 360, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":361
+ *             j += 1
+ *         pieces.append(s[last:p])
+ *         pieces.append(u'\n')             # <<<<<<<<<<<<<<
+ *         last = p = end
+ *     return _finish(pieces, s, last)
+ */
+    __pyx_t_7 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_kp_u__10); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 361, __pyx_L1_error)
+
+    /* "gensim/corpora/_wikimarkup.pyx":362
+ *         pieces.append(s[last:p])
+ *         pieces.append(u'\n')
+ *         last = p = end             # <<<<<<<<<<<<<<
+ *     return _finish(pieces, s, last)
+ * 
+ */
+    __pyx_v_last = __pyx_v_end;
+    __pyx_v_p = __pyx_v_end;
+    __pyx_L3_continue:;
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":363
+ *         pieces.append(u'\n')
+ *         last = p = end
+ *     return _finish(pieces, s, last)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_6gensim_7corpora_11_wikimarkup__finish(__pyx_v_pieces, __pyx_v_s, __pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 363, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":333
+ * 
+ * 
+ * cdef unicode _remove_table_cells(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P13, '\\n', s)`: keep only the content of table cells."""
+ *     cdef Py_ssize_t p, j, end, n = len(s), last = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup._remove_table_cells", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_pieces);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":366
+ * 
+ * 
+ * cdef bint _table_attribute_at(unicode s, Py_ssize_t n, Py_ssize_t q, bint scope):             # <<<<<<<<<<<<<<
+ *     """Does a table attribute of RE_P17 start at `q`?"""
+ *     cdef Py_UCS4 c
+ */
+
+static int __pyx_f_6gensim_7corpora_11_wikimarkup__table_attribute_at(PyObject *__pyx_v_s, Py_ssize_t __pyx_v_n, Py_ssize_t __pyx_v_q, int __pyx_v_scope) {
+  Py_UCS4 __pyx_v_c;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_UCS4 __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  __Pyx_RefNannySetupContext("_table_attribute_at", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":369
+ *     """Does a table attribute of RE_P17 start at `q`?"""
+ *     cdef Py_UCS4 c
+ *     if _at(s, n, q, u'bgcolor') or _at(s, n, q, u'colspan') or _at(s, n, q, u'rowspan') or \             # <<<<<<<<<<<<<<
+ *             _at(s, n, q, u'style=') or _at(s, n, q, u'class=') or _at(s, n, q, u'align='):
+ *         return True
+ */
+  __pyx_t_2 = (__pyx_f_6gensim_7corpora_11_wikimarkup__at(__pyx_v_s, __pyx_v_n, __pyx_v_q, __pyx_n_u_bgcolor) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_f_6gensim_7corpora_11_wikimarkup__at(__pyx_v_s, __pyx_v_n, __pyx_v_q, __pyx_n_u_colspan) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_f_6gensim_7corpora_11_wikimarkup__at(__pyx_v_s, __pyx_v_n, __pyx_v_q, __pyx_n_u_rowspan) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":370
+ *     cdef Py_UCS4 c
+ *     if _at(s, n, q, u'bgcolor') or _at(s, n, q, u'colspan') or _at(s, n, q, u'rowspan') or \
+ *             _at(s, n, q, u'style=') or _at(s, n, q, u'class=') or _at(s, n, q, u'align='):             # <<<<<<<<<<<<<<
+ *         return True
+ *     if scope and _at(s, n, q, u'scope='):
+ */
+  __pyx_t_2 = (__pyx_f_6gensim_7corpora_11_wikimarkup__at(__pyx_v_s, __pyx_v_n, __pyx_v_q, __pyx_kp_u_style) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_f_6gensim_7corpora_11_wikimarkup__at(__pyx_v_s, __pyx_v_n, __pyx_v_q, __pyx_kp_u_class) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_f_6gensim_7corpora_11_wikimarkup__at(__pyx_v_s, __pyx_v_n, __pyx_v_q, __pyx_kp_u_align) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "gensim/corpora/_wikimarkup.pyx":369
+ *     """Does a table attribute of RE_P17 start at `q`?"""
+ *     cdef Py_UCS4 c
+ *     if _at(s, n, q, u'bgcolor') or _at(s, n, q, u'colspan') or _at(s, n, q, u'rowspan') or \             # <<<<<<<<<<<<<<
+ *             _at(s, n, q, u'style=') or _at(s, n, q, u'class=') or _at(s, n, q, u'align='):
+ *         return True
+ */
+  if (__pyx_t_1) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":371
+ *     if _at(s, n, q, u'bgcolor') or _at(s, n, q, u'colspan') or _at(s, n, q, u'rowspan') or \
+ *             _at(s, n, q, u'style=') or _at(s, n, q, u'class=') or _at(s, n, q, u'align='):
+ *         return True             # <<<<<<<<<<<<<<
+ *     if scope and _at(s, n, q, u'scope='):
+ *         return True
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":369
+ *     """Does a table attribute of RE_P17 start at `q`?"""
+ *     cdef Py_UCS4 c
+ *     if _at(s, n, q, u'bgcolor') or _at(s, n, q, u'colspan') or _at(s, n, q, u'rowspan') or \             # <<<<<<<<<<<<<<
+ *             _at(s, n, q, u'style=') or _at(s, n, q, u'class=') or _at(s, n, q, u'align='):
+ *         return True
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":372
+ *             _at(s, n, q, u'style=') or _at(s, n, q, u'class=') or _at(s, n, q, u'align='):
+ *         return True
+ *     if scope and _at(s, n, q, u'scope='):             # <<<<<<<<<<<<<<
+ *         return True
+ *     if q >= n:
+ */
+  __pyx_t_2 = (__pyx_v_scope != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L11_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_f_6gensim_7corpora_11_wikimarkup__at(__pyx_v_s, __pyx_v_n, __pyx_v_q, __pyx_kp_u_scope) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L11_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":373
+ *         return True
+ *     if scope and _at(s, n, q, u'scope='):
+ *         return True             # <<<<<<<<<<<<<<
+ *     if q >= n:
+ *         return False
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":372
+ *             _at(s, n, q, u'style=') or _at(s, n, q, u'class=') or _at(s, n, q, u'align='):
+ *         return True
+ *     if scope and _at(s, n, q, u'scope='):             # <<<<<<<<<<<<<<
+ *         return True
+ *     if q >= n:
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":374
+ *     if scope and _at(s, n, q, u'scope='):
+ *         return True
+ *     if q >= n:             # <<<<<<<<<<<<<<
+ *         return False
+ *     # \d{0,1}[ ]?colspan
+ */
+  __pyx_t_1 = ((__pyx_v_q >= __pyx_v_n) != 0);
+  if (__pyx_t_1) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":375
+ *         return True
+ *     if q >= n:
+ *         return False             # <<<<<<<<<<<<<<
+ *     # \d{0,1}[ ]?colspan
+ *     c = s[q]
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":374
+ *     if scope and _at(s, n, q, u'scope='):
+ *         return True
+ *     if q >= n:             # <<<<<<<<<<<<<<
+ *         return False
+ *     # \d{0,1}[ ]?colspan
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":377
+ *         return False
+ *     # \d{0,1}[ ]?colspan
+ *     c = s[q]             # <<<<<<<<<<<<<<
+ *     if (c == u' ' or c.isdecimal()) and _at(s, n, q + 1, u'colspan'):
+ *         return True
+ */
+  __pyx_t_3 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_v_q, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_3 == (Py_UCS4)-1)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __pyx_v_c = __pyx_t_3;
+
+  /* "gensim/corpora/_wikimarkup.pyx":378
+ *     # \d{0,1}[ ]?colspan
+ *     c = s[q]
+ *     if (c == u' ' or c.isdecimal()) and _at(s, n, q + 1, u'colspan'):             # <<<<<<<<<<<<<<
+ *         return True
+ *     return c.isdecimal() and q + 1 < n and s[q + 1] == u' ' and _at(s, n, q + 2, u'colspan')
+ */
+  __pyx_t_2 = ((__pyx_v_c == 32) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    goto __pyx_L16_next_and;
+  }
+  __pyx_t_2 = Py_UNICODE_ISDECIMAL(__pyx_v_c); 
+  if ((__pyx_t_2 != 0)) {
+  } else {
+    __pyx_t_1 = (__pyx_t_2 != 0);
+    goto __pyx_L15_bool_binop_done;
+  }
+  __pyx_L16_next_and:;
+  __pyx_t_2 = (__pyx_f_6gensim_7corpora_11_wikimarkup__at(__pyx_v_s, __pyx_v_n, (__pyx_v_q + 1), __pyx_n_u_colspan) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L15_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":379
+ *     c = s[q]
+ *     if (c == u' ' or c.isdecimal()) and _at(s, n, q + 1, u'colspan'):
+ *         return True             # <<<<<<<<<<<<<<
+ *     return c.isdecimal() and q + 1 < n and s[q + 1] == u' ' and _at(s, n, q + 2, u'colspan')
+ * 
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":378
+ *     # \d{0,1}[ ]?colspan
+ *     c = s[q]
+ *     if (c == u' ' or c.isdecimal()) and _at(s, n, q + 1, u'colspan'):             # <<<<<<<<<<<<<<
+ *         return True
+ *     return c.isdecimal() and q + 1 < n and s[q + 1] == u' ' and _at(s, n, q + 2, u'colspan')
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":380
+ *     if (c == u' ' or c.isdecimal()) and _at(s, n, q + 1, u'colspan'):
+ *         return True
+ *     return c.isdecimal() and q + 1 < n and s[q + 1] == u' ' and _at(s, n, q + 2, u'colspan')             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = Py_UNICODE_ISDECIMAL(__pyx_v_c); 
+  if ((__pyx_t_2 != 0)) {
+  } else {
+    __pyx_t_1 = (__pyx_t_2 != 0);
+    goto __pyx_L18_bool_binop_done;
+  }
+  __pyx_t_2 = (((__pyx_v_q + 1) < __pyx_v_n) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L18_bool_binop_done;
+  }
+  __pyx_t_4 = (__pyx_v_q + 1);
+  __pyx_t_3 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_4, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_3 == (Py_UCS4)-1)) __PYX_ERR(0, 380, __pyx_L1_error)
+  __pyx_t_2 = ((__pyx_t_3 == 32) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L18_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_f_6gensim_7corpora_11_wikimarkup__at(__pyx_v_s, __pyx_v_n, (__pyx_v_q + 2), __pyx_n_u_colspan) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L18_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":366
+ * 
+ * 
+ * cdef bint _table_attribute_at(unicode s, Py_ssize_t n, Py_ssize_t q, bint scope):             # <<<<<<<<<<<<<<
+ *     """Does a table attribute of RE_P17 start at `q`?"""
+ *     cdef Py_UCS4 c
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("gensim.corpora._wikimarkup._table_attribute_at", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":383
+ * 
+ * 
+ * cdef bint _table_attribute_line(unicode s, Py_ssize_t n, Py_ssize_t start, Py_ssize_t max_skip, bint scope):             # <<<<<<<<<<<<<<
+ *     """Does a table attribute start within `max_skip` characters of `start`, on the same line?"""
+ *     cdef Py_ssize_t k
+ */
+
+static int __pyx_f_6gensim_7corpora_11_wikimarkup__table_attribute_line(PyObject *__pyx_v_s, Py_ssize_t __pyx_v_n, Py_ssize_t __pyx_v_start, Py_ssize_t __pyx_v_max_skip, int __pyx_v_scope) {
+  Py_ssize_t __pyx_v_k;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  Py_UCS4 __pyx_t_7;
+  __Pyx_RefNannySetupContext("_table_attribute_line", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":386
+ *     """Does a table attribute start within `max_skip` characters of `start`, on the same line?"""
+ *     cdef Py_ssize_t k
+ *     for k in range(max_skip + 1):             # <<<<<<<<<<<<<<
+ *         if k > 0 and (start + k - 1 >= n or s[start + k - 1] == u'\n'):
+ *             return False
+ */
+  __pyx_t_1 = (__pyx_v_max_skip + 1);
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_k = __pyx_t_3;
+
+    /* "gensim/corpora/_wikimarkup.pyx":387
+ *     cdef Py_ssize_t k
+ *     for k in range(max_skip + 1):
+ *         if k > 0 and (start + k - 1 >= n or s[start + k - 1] == u'\n'):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if _table_attribute_at(s, n, start + k, scope):
+ */
+    __pyx_t_5 = ((__pyx_v_k > 0) != 0);
+    if (__pyx_t_5) {
+    } else {
+      __pyx_t_4 = __pyx_t_5;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_5 = ((((__pyx_v_start + __pyx_v_k) - 1) >= __pyx_v_n) != 0);
+    if (!__pyx_t_5) {
+    } else {
+      __pyx_t_4 = __pyx_t_5;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_6 = ((__pyx_v_start + __pyx_v_k) - 1);
+    __pyx_t_7 = __Pyx_GetItemInt_Unicode(__pyx_v_s, __pyx_t_6, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(__pyx_t_7 == (Py_UCS4)-1)) __PYX_ERR(0, 387, __pyx_L1_error)
+    __pyx_t_5 = ((__pyx_t_7 == 10) != 0);
+    __pyx_t_4 = __pyx_t_5;
+    __pyx_L6_bool_binop_done:;
+    if (__pyx_t_4) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":388
+ *     for k in range(max_skip + 1):
+ *         if k > 0 and (start + k - 1 >= n or s[start + k - 1] == u'\n'):
+ *             return False             # <<<<<<<<<<<<<<
+ *         if _table_attribute_at(s, n, start + k, scope):
+ *             return True
+ */
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "gensim/corpora/_wikimarkup.pyx":387
+ *     cdef Py_ssize_t k
+ *     for k in range(max_skip + 1):
+ *         if k > 0 and (start + k - 1 >= n or s[start + k - 1] == u'\n'):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if _table_attribute_at(s, n, start + k, scope):
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":389
+ *         if k > 0 and (start + k - 1 >= n or s[start + k - 1] == u'\n'):
+ *             return False
+ *         if _table_attribute_at(s, n, start + k, scope):             # <<<<<<<<<<<<<<
+ *             return True
+ *     return False
+ */
+    __pyx_t_4 = (__pyx_f_6gensim_7corpora_11_wikimarkup__table_attribute_at(__pyx_v_s, __pyx_v_n, (__pyx_v_start + __pyx_v_k), __pyx_v_scope) != 0);
+    if (__pyx_t_4) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":390
+ *             return False
+ *         if _table_attribute_at(s, n, start + k, scope):
+ *             return True             # <<<<<<<<<<<<<<
+ *     return False
+ * 
+ */
+      __pyx_r = 1;
+      goto __pyx_L0;
+
+      /* "gensim/corpora/_wikimarkup.pyx":389
+ *         if k > 0 and (start + k - 1 >= n or s[start + k - 1] == u'\n'):
+ *             return False
+ *         if _table_attribute_at(s, n, start + k, scope):             # <<<<<<<<<<<<<<
+ *             return True
+ *     return False
+ */
+    }
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":391
+ *         if _table_attribute_at(s, n, start + k, scope):
+ *             return True
+ *     return False             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":383
+ * 
+ * 
+ * cdef bint _table_attribute_line(unicode s, Py_ssize_t n, Py_ssize_t start, Py_ssize_t max_skip, bint scope):             # <<<<<<<<<<<<<<
+ *     """Does a table attribute start within `max_skip` characters of `start`, on the same line?"""
+ *     cdef Py_ssize_t k
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("gensim.corpora._wikimarkup._table_attribute_line", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":394
+ * 
+ * 
+ * cdef unicode _remove_table_attributes(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P17, '\\n', s)`: remove lines of table attributes."""
+ *     cdef Py_ssize_t pos, end, n = len(s), last = 0
+ */
+
+static PyObject *__pyx_f_6gensim_7corpora_11_wikimarkup__remove_table_attributes(PyObject *__pyx_v_s) {
+  Py_ssize_t __pyx_v_pos;
+  Py_ssize_t __pyx_v_end;
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_last;
+  PyObject *__pyx_v_pieces = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  Py_UCS4 __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  __Pyx_RefNannySetupContext("_remove_table_attributes", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":396
+ * cdef unicode _remove_table_attributes(unicode s):
+ *     """Same as `re.sub(RE_P17, '\\n', s)`: remove lines of table attributes."""
+ *     cdef Py_ssize_t pos, end, n = len(s), last = 0             # <<<<<<<<<<<<<<
+ *     cdef list pieces = []
+ *     if n == 0:
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 396, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 396, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_1;
+  __pyx_v_last = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":397
+ *     """Same as `re.sub(RE_P17, '\\n', s)`: remove lines of table attributes."""
+ *     cdef Py_ssize_t pos, end, n = len(s), last = 0
+ *     cdef list pieces = []             # <<<<<<<<<<<<<<
+ *     if n == 0:
+ *         return s
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 397, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_pieces = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":398
+ *     cdef Py_ssize_t pos, end, n = len(s), last = 0
+ *     cdef list pieces = []
+ *     if n == 0:             # <<<<<<<<<<<<<<
+ *         return s
+ *     if s[0] != u'\n' or not _table_attribute_line(s, n, 1, 4, True):
+ */
+  __pyx_t_3 = ((__pyx_v_n == 0) != 0);
+  if (__pyx_t_3) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":399
+ *     cdef list pieces = []
+ *     if n == 0:
+ *         return s             # <<<<<<<<<<<<<<
+ *     if s[0] != u'\n' or not _table_attribute_line(s, n, 1, 4, True):
+ *         # ^.{0,2}(attribute)(.*)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_s);
+    __pyx_r = __pyx_v_s;
+    goto __pyx_L0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":398
+ *     cdef Py_ssize_t pos, end, n = len(s), last = 0
+ *     cdef list pieces = []
+ *     if n == 0:             # <<<<<<<<<<<<<<
+ *         return s
+ *     if s[0] != u'\n' or not _table_attribute_line(s, n, 1, 4, True):
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":400
+ *     if n == 0:
+ *         return s
+ *     if s[0] != u'\n' or not _table_attribute_line(s, n, 1, 4, True):             # <<<<<<<<<<<<<<
+ *         # ^.{0,2}(attribute)(.*)
+ *         if _table_attribute_line(s, n, 0, 2, False):
+ */
+  __pyx_t_4 = __Pyx_GetItemInt_Unicode(__pyx_v_s, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 0); if (unlikely(__pyx_t_4 == (Py_UCS4)-1)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __pyx_t_5 = ((__pyx_t_4 != 10) != 0);
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_3 = __pyx_t_5;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_5 = ((!(__pyx_f_6gensim_7corpora_11_wikimarkup__table_attribute_line(__pyx_v_s, __pyx_v_n, 1, 4, 1) != 0)) != 0);
+  __pyx_t_3 = __pyx_t_5;
+  __pyx_L5_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":402
+ *     if s[0] != u'\n' or not _table_attribute_line(s, n, 1, 4, True):
+ *         # ^.{0,2}(attribute)(.*)
+ *         if _table_attribute_line(s, n, 0, 2, False):             # <<<<<<<<<<<<<<
+ *             end = s.find(u'\n')
+ *             last = n if end < 0 else end
+ */
+    __pyx_t_3 = (__pyx_f_6gensim_7corpora_11_wikimarkup__table_attribute_line(__pyx_v_s, __pyx_v_n, 0, 2, 0) != 0);
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":403
+ *         # ^.{0,2}(attribute)(.*)
+ *         if _table_attribute_line(s, n, 0, 2, False):
+ *             end = s.find(u'\n')             # <<<<<<<<<<<<<<
+ *             last = n if end < 0 else end
+ *             pieces.append(u'\n')
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+        __PYX_ERR(0, 403, __pyx_L1_error)
+      }
+      __pyx_t_1 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__10, 0, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-2))) __PYX_ERR(0, 403, __pyx_L1_error)
+      __pyx_v_end = __pyx_t_1;
+
+      /* "gensim/corpora/_wikimarkup.pyx":404
+ *         if _table_attribute_line(s, n, 0, 2, False):
+ *             end = s.find(u'\n')
+ *             last = n if end < 0 else end             # <<<<<<<<<<<<<<
+ *             pieces.append(u'\n')
+ *     pos = s.find(u'\n', last)
+ */
+      if (((__pyx_v_end < 0) != 0)) {
+        __pyx_t_1 = __pyx_v_n;
+      } else {
+        __pyx_t_1 = __pyx_v_end;
+      }
+      __pyx_v_last = __pyx_t_1;
+
+      /* "gensim/corpora/_wikimarkup.pyx":405
+ *             end = s.find(u'\n')
+ *             last = n if end < 0 else end
+ *             pieces.append(u'\n')             # <<<<<<<<<<<<<<
+ *     pos = s.find(u'\n', last)
+ *     while pos >= 0:
+ */
+      __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_kp_u__10); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 405, __pyx_L1_error)
+
+      /* "gensim/corpora/_wikimarkup.pyx":402
+ *     if s[0] != u'\n' or not _table_attribute_line(s, n, 1, 4, True):
+ *         # ^.{0,2}(attribute)(.*)
+ *         if _table_attribute_line(s, n, 0, 2, False):             # <<<<<<<<<<<<<<
+ *             end = s.find(u'\n')
+ *             last = n if end < 0 else end
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":400
+ *     if n == 0:
+ *         return s
+ *     if s[0] != u'\n' or not _table_attribute_line(s, n, 1, 4, True):             # <<<<<<<<<<<<<<
+ *         # ^.{0,2}(attribute)(.*)
+ *         if _table_attribute_line(s, n, 0, 2, False):
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":406
+ *             last = n if end < 0 else end
+ *             pieces.append(u'\n')
+ *     pos = s.find(u'\n', last)             # <<<<<<<<<<<<<<
+ *     while pos >= 0:
+ *         # \n.{0,4}(attribute)(.*)
+ */
+  if (unlikely(__pyx_v_s == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+    __PYX_ERR(0, 406, __pyx_L1_error)
+  }
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 406, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 406, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_7 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__10, __pyx_t_1, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-2))) __PYX_ERR(0, 406, __pyx_L1_error)
+  __pyx_v_pos = __pyx_t_7;
+
+  /* "gensim/corpora/_wikimarkup.pyx":407
+ *             pieces.append(u'\n')
+ *     pos = s.find(u'\n', last)
+ *     while pos >= 0:             # <<<<<<<<<<<<<<
+ *         # \n.{0,4}(attribute)(.*)
+ *         if _table_attribute_line(s, n, pos + 1, 4, True):
+ */
+  while (1) {
+    __pyx_t_3 = ((__pyx_v_pos >= 0) != 0);
+    if (!__pyx_t_3) break;
+
+    /* "gensim/corpora/_wikimarkup.pyx":409
+ *     while pos >= 0:
+ *         # \n.{0,4}(attribute)(.*)
+ *         if _table_attribute_line(s, n, pos + 1, 4, True):             # <<<<<<<<<<<<<<
+ *             end = s.find(u'\n', pos + 1)
+ *             if end < 0:
+ */
+    __pyx_t_3 = (__pyx_f_6gensim_7corpora_11_wikimarkup__table_attribute_line(__pyx_v_s, __pyx_v_n, (__pyx_v_pos + 1), 4, 1) != 0);
+    if (__pyx_t_3) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":410
+ *         # \n.{0,4}(attribute)(.*)
+ *         if _table_attribute_line(s, n, pos + 1, 4, True):
+ *             end = s.find(u'\n', pos + 1)             # <<<<<<<<<<<<<<
+ *             if end < 0:
+ *                 end = n
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+        __PYX_ERR(0, 410, __pyx_L1_error)
+      }
+      __pyx_t_2 = PyInt_FromSsize_t((__pyx_v_pos + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 410, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 410, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_1 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__10, __pyx_t_7, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-2))) __PYX_ERR(0, 410, __pyx_L1_error)
+      __pyx_v_end = __pyx_t_1;
+
+      /* "gensim/corpora/_wikimarkup.pyx":411
+ *         if _table_attribute_line(s, n, pos + 1, 4, True):
+ *             end = s.find(u'\n', pos + 1)
+ *             if end < 0:             # <<<<<<<<<<<<<<
+ *                 end = n
+ *             pieces.append(s[last:pos])
+ */
+      __pyx_t_3 = ((__pyx_v_end < 0) != 0);
+      if (__pyx_t_3) {
+
+        /* "gensim/corpora/_wikimarkup.pyx":412
+ *             end = s.find(u'\n', pos + 1)
+ *             if end < 0:
+ *                 end = n             # <<<<<<<<<<<<<<
+ *             pieces.append(s[last:pos])
+ *             pieces.append(u'\n')
+ */
+        __pyx_v_end = __pyx_v_n;
+
+        /* "gensim/corpora/_wikimarkup.pyx":411
+ *         if _table_attribute_line(s, n, pos + 1, 4, True):
+ *             end = s.find(u'\n', pos + 1)
+ *             if end < 0:             # <<<<<<<<<<<<<<
+ *                 end = n
+ *             pieces.append(s[last:pos])
+ */
+      }
+
+      /* "gensim/corpora/_wikimarkup.pyx":413
+ *             if end < 0:
+ *                 end = n
+ *             pieces.append(s[last:pos])             # <<<<<<<<<<<<<<
+ *             pieces.append(u'\n')
+ *             last = pos = end
+ */
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 413, __pyx_L1_error)
+      }
+      __pyx_t_2 = __Pyx_PyUnicode_Substring(__pyx_v_s, __pyx_v_last, __pyx_v_pos); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 413, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_t_2); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 413, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+      /* "gensim/corpora/_wikimarkup.pyx":414
+ *                 end = n
+ *             pieces.append(s[last:pos])
+ *             pieces.append(u'\n')             # <<<<<<<<<<<<<<
+ *             last = pos = end
+ *             if end == n:
+ */
+      __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_pieces, __pyx_kp_u__10); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 414, __pyx_L1_error)
+
+      /* "gensim/corpora/_wikimarkup.pyx":415
+ *             pieces.append(s[last:pos])
+ *             pieces.append(u'\n')
+ *             last = pos = end             # <<<<<<<<<<<<<<
+ *             if end == n:
+ *                 break
+ */
+      __pyx_v_last = __pyx_v_end;
+      __pyx_v_pos = __pyx_v_end;
+
+      /* "gensim/corpora/_wikimarkup.pyx":416
+ *             pieces.append(u'\n')
+ *             last = pos = end
+ *             if end == n:             # <<<<<<<<<<<<<<
+ *                 break
+ *         else:
+ */
+      __pyx_t_3 = ((__pyx_v_end == __pyx_v_n) != 0);
+      if (__pyx_t_3) {
+
+        /* "gensim/corpora/_wikimarkup.pyx":417
+ *             last = pos = end
+ *             if end == n:
+ *                 break             # <<<<<<<<<<<<<<
+ *         else:
+ *             pos = s.find(u'\n', pos + 1)
+ */
+        goto __pyx_L9_break;
+
+        /* "gensim/corpora/_wikimarkup.pyx":416
+ *             pieces.append(u'\n')
+ *             last = pos = end
+ *             if end == n:             # <<<<<<<<<<<<<<
+ *                 break
+ *         else:
+ */
+      }
+
+      /* "gensim/corpora/_wikimarkup.pyx":409
+ *     while pos >= 0:
+ *         # \n.{0,4}(attribute)(.*)
+ *         if _table_attribute_line(s, n, pos + 1, 4, True):             # <<<<<<<<<<<<<<
+ *             end = s.find(u'\n', pos + 1)
+ *             if end < 0:
+ */
+      goto __pyx_L10;
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":419
+ *                 break
+ *         else:
+ *             pos = s.find(u'\n', pos + 1)             # <<<<<<<<<<<<<<
+ *     return _finish(pieces, s, last)
+ * 
+ */
+    /*else*/ {
+      if (unlikely(__pyx_v_s == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "find");
+        __PYX_ERR(0, 419, __pyx_L1_error)
+      }
+      __pyx_t_2 = PyInt_FromSsize_t((__pyx_v_pos + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 419, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 419, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_7 = PyUnicode_Find(__pyx_v_s, __pyx_kp_u__10, __pyx_t_1, PY_SSIZE_T_MAX, 1); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-2))) __PYX_ERR(0, 419, __pyx_L1_error)
+      __pyx_v_pos = __pyx_t_7;
+    }
+    __pyx_L10:;
+  }
+  __pyx_L9_break:;
+
+  /* "gensim/corpora/_wikimarkup.pyx":420
+ *         else:
+ *             pos = s.find(u'\n', pos + 1)
+ *     return _finish(pieces, s, last)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_6gensim_7corpora_11_wikimarkup__finish(__pyx_v_pieces, __pyx_v_s, __pyx_v_last); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 420, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":394
+ * 
+ * 
+ * cdef unicode _remove_table_attributes(unicode s):             # <<<<<<<<<<<<<<
+ *     """Same as `re.sub(RE_P17, '\\n', s)`: remove lines of table attributes."""
+ *     cdef Py_ssize_t pos, end, n = len(s), last = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup._remove_table_attributes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_pieces);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/corpora/_wikimarkup.pyx":423
+ * 
+ * 
+ * def remove_markup(unicode text, promote_remaining=True, simplify_links=True):             # <<<<<<<<<<<<<<
+ *     """Filter out wiki markup from `text`, same as :func:`gensim.corpora.wikicorpus.remove_markup`.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_7corpora_11_wikimarkup_5remove_markup(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6gensim_7corpora_11_wikimarkup_4remove_markup[] = "remove_markup(unicode text, promote_remaining=True, simplify_links=True)\nFilter out wiki markup from `text`, same as :func:`gensim.corpora.wikicorpus.remove_markup`.\n\n    Parameters\n    ----------\n    text : str\n        String containing markup.\n    promote_remaining : bool\n        Whether uncaught markup should be promoted to plain text.\n    simplify_links : bool\n        Whether links should be simplified keeping only their description text.\n\n    Returns\n    -------\n    str\n        `text` without markup.\n\n    ";
+static PyMethodDef __pyx_mdef_6gensim_7corpora_11_wikimarkup_5remove_markup = {"remove_markup", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_6gensim_7corpora_11_wikimarkup_5remove_markup, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6gensim_7corpora_11_wikimarkup_4remove_markup};
+static PyObject *__pyx_pw_6gensim_7corpora_11_wikimarkup_5remove_markup(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_text = 0;
+  PyObject *__pyx_v_promote_remaining = 0;
+  PyObject *__pyx_v_simplify_links = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("remove_markup (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_text,&__pyx_n_s_promote_remaining,&__pyx_n_s_simplify_links,0};
+    PyObject* values[3] = {0,0,0};
+    values[1] = ((PyObject *)Py_True);
+    values[2] = ((PyObject *)Py_True);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_text)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_promote_remaining);
+          if (value) { values[1] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_simplify_links);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "remove_markup") < 0)) __PYX_ERR(0, 423, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_text = ((PyObject*)values[0]);
+    __pyx_v_promote_remaining = values[1];
+    __pyx_v_simplify_links = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("remove_markup", 0, 1, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 423, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup.remove_markup", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_text), (&PyUnicode_Type), 1, "text", 1))) __PYX_ERR(0, 423, __pyx_L1_error)
+  __pyx_r = __pyx_pf_6gensim_7corpora_11_wikimarkup_4remove_markup(__pyx_self, __pyx_v_text, __pyx_v_promote_remaining, __pyx_v_simplify_links);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6gensim_7corpora_11_wikimarkup_4remove_markup(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_text, PyObject *__pyx_v_promote_remaining, PyObject *__pyx_v_simplify_links) {
+  PyObject *__pyx_v_old = 0;
+  int __pyx_v_iters;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  long __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  __Pyx_RefNannySetupContext("remove_markup", 0);
+  __Pyx_INCREF(__pyx_v_text);
+
+  /* "gensim/corpora/_wikimarkup.pyx":442
+ *     """
+ *     cdef unicode old
+ *     cdef int iters = 0             # <<<<<<<<<<<<<<
+ *     text = _remove_language_links(text)
+ *     text = remove_template(text)
+ */
+  __pyx_v_iters = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":443
+ *     cdef unicode old
+ *     cdef int iters = 0
+ *     text = _remove_language_links(text)             # <<<<<<<<<<<<<<
+ *     text = remove_template(text)
+ *     text = remove_file(text)
+ */
+  __pyx_t_1 = __pyx_f_6gensim_7corpora_11_wikimarkup__remove_language_links(__pyx_v_text); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+  __pyx_t_1 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":444
+ *     cdef int iters = 0
+ *     text = _remove_language_links(text)
+ *     text = remove_template(text)             # <<<<<<<<<<<<<<
+ *     text = remove_file(text)
+ *     while True:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_remove_template); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_text) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_text);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+  __pyx_t_1 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":445
+ *     text = _remove_language_links(text)
+ *     text = remove_template(text)
+ *     text = remove_file(text)             # <<<<<<<<<<<<<<
+ *     while True:
+ *         old, iters = text, iters + 1
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_remove_file); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_text) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_text);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+  __pyx_t_1 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":446
+ *     text = remove_template(text)
+ *     text = remove_file(text)
+ *     while True:             # <<<<<<<<<<<<<<
+ *         old, iters = text, iters + 1
+ *         text = _remove_delimited(text, u'<!--', u'-->')
+ */
+  while (1) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":447
+ *     text = remove_file(text)
+ *     while True:
+ *         old, iters = text, iters + 1             # <<<<<<<<<<<<<<
+ *         text = _remove_delimited(text, u'<!--', u'-->')
+ *         text = _remove_element(text, u'ref')
+ */
+    __pyx_t_1 = __pyx_v_text;
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_t_4 = (__pyx_v_iters + 1);
+    __Pyx_XDECREF_SET(__pyx_v_old, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+    __pyx_v_iters = __pyx_t_4;
+
+    /* "gensim/corpora/_wikimarkup.pyx":448
+ *     while True:
+ *         old, iters = text, iters + 1
+ *         text = _remove_delimited(text, u'<!--', u'-->')             # <<<<<<<<<<<<<<
+ *         text = _remove_element(text, u'ref')
+ *         text = _remove_element(text, u'nowiki')
+ */
+    __pyx_t_1 = __pyx_f_6gensim_7corpora_11_wikimarkup__remove_delimited(__pyx_v_text, __pyx_kp_u__11, __pyx_kp_u__12); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 448, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":449
+ *         old, iters = text, iters + 1
+ *         text = _remove_delimited(text, u'<!--', u'-->')
+ *         text = _remove_element(text, u'ref')             # <<<<<<<<<<<<<<
+ *         text = _remove_element(text, u'nowiki')
+ *         text = _remove_element(text, u'math')
+ */
+    __pyx_t_1 = __pyx_f_6gensim_7corpora_11_wikimarkup__remove_element(__pyx_v_text, __pyx_n_u_ref); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 449, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":450
+ *         text = _remove_delimited(text, u'<!--', u'-->')
+ *         text = _remove_element(text, u'ref')
+ *         text = _remove_element(text, u'nowiki')             # <<<<<<<<<<<<<<
+ *         text = _remove_element(text, u'math')
+ *         text = _remove_delimited(text, u'<', u'>')
+ */
+    __pyx_t_1 = __pyx_f_6gensim_7corpora_11_wikimarkup__remove_element(__pyx_v_text, __pyx_n_u_nowiki); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 450, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":451
+ *         text = _remove_element(text, u'ref')
+ *         text = _remove_element(text, u'nowiki')
+ *         text = _remove_element(text, u'math')             # <<<<<<<<<<<<<<
+ *         text = _remove_delimited(text, u'<', u'>')
+ *         text = _remove_categories(text)
+ */
+    __pyx_t_1 = __pyx_f_6gensim_7corpora_11_wikimarkup__remove_element(__pyx_v_text, __pyx_n_u_math); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 451, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":452
+ *         text = _remove_element(text, u'nowiki')
+ *         text = _remove_element(text, u'math')
+ *         text = _remove_delimited(text, u'<', u'>')             # <<<<<<<<<<<<<<
+ *         text = _remove_categories(text)
+ *         text = _replace_urls(text)
+ */
+    __pyx_t_1 = __pyx_f_6gensim_7corpora_11_wikimarkup__remove_delimited(__pyx_v_text, __pyx_kp_u__4, __pyx_kp_u__6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 452, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":453
+ *         text = _remove_element(text, u'math')
+ *         text = _remove_delimited(text, u'<', u'>')
+ *         text = _remove_categories(text)             # <<<<<<<<<<<<<<
+ *         text = _replace_urls(text)
+ *         if simplify_links:
+ */
+    __pyx_t_1 = __pyx_f_6gensim_7corpora_11_wikimarkup__remove_categories(__pyx_v_text); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 453, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":454
+ *         text = _remove_delimited(text, u'<', u'>')
+ *         text = _remove_categories(text)
+ *         text = _replace_urls(text)             # <<<<<<<<<<<<<<
+ *         if simplify_links:
+ *             text = _simplify_links(text)
+ */
+    __pyx_t_1 = __pyx_f_6gensim_7corpora_11_wikimarkup__replace_urls(__pyx_v_text); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 454, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":455
+ *         text = _remove_categories(text)
+ *         text = _replace_urls(text)
+ *         if simplify_links:             # <<<<<<<<<<<<<<
+ *             text = _simplify_links(text)
+ *         text = text.replace(u'!!', u'\n|')
+ */
+    __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_simplify_links); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(0, 455, __pyx_L1_error)
+    if (__pyx_t_5) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":456
+ *         text = _replace_urls(text)
+ *         if simplify_links:
+ *             text = _simplify_links(text)             # <<<<<<<<<<<<<<
+ *         text = text.replace(u'!!', u'\n|')
+ *         text = text.replace(u'|-||', u'\n|')
+ */
+      __pyx_t_1 = __pyx_f_6gensim_7corpora_11_wikimarkup__simplify_links(__pyx_v_text); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 456, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+      __pyx_t_1 = 0;
+
+      /* "gensim/corpora/_wikimarkup.pyx":455
+ *         text = _remove_categories(text)
+ *         text = _replace_urls(text)
+ *         if simplify_links:             # <<<<<<<<<<<<<<
+ *             text = _simplify_links(text)
+ *         text = text.replace(u'!!', u'\n|')
+ */
+    }
+
+    /* "gensim/corpora/_wikimarkup.pyx":457
+ *         if simplify_links:
+ *             text = _simplify_links(text)
+ *         text = text.replace(u'!!', u'\n|')             # <<<<<<<<<<<<<<
+ *         text = text.replace(u'|-||', u'\n|')
+ *         text = _remove_table_lines(text)
+ */
+    if (unlikely(__pyx_v_text == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "replace");
+      __PYX_ERR(0, 457, __pyx_L1_error)
+    }
+    __pyx_t_1 = PyUnicode_Replace(__pyx_v_text, __pyx_kp_u__13, __pyx_kp_u__14, -1L); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 457, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":458
+ *             text = _simplify_links(text)
+ *         text = text.replace(u'!!', u'\n|')
+ *         text = text.replace(u'|-||', u'\n|')             # <<<<<<<<<<<<<<
+ *         text = _remove_table_lines(text)
+ *         text = text.replace(u'|||', u'|\n|')
+ */
+    if (unlikely(__pyx_v_text == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "replace");
+      __PYX_ERR(0, 458, __pyx_L1_error)
+    }
+    __pyx_t_1 = PyUnicode_Replace(__pyx_v_text, __pyx_kp_u__15, __pyx_kp_u__14, -1L); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 458, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":459
+ *         text = text.replace(u'!!', u'\n|')
+ *         text = text.replace(u'|-||', u'\n|')
+ *         text = _remove_table_lines(text)             # <<<<<<<<<<<<<<
+ *         text = text.replace(u'|||', u'|\n|')
+ *         text = text.replace(u'||', u'\n|')
+ */
+    __pyx_t_1 = __pyx_f_6gensim_7corpora_11_wikimarkup__remove_table_lines(__pyx_v_text); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 459, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":460
+ *         text = text.replace(u'|-||', u'\n|')
+ *         text = _remove_table_lines(text)
+ *         text = text.replace(u'|||', u'|\n|')             # <<<<<<<<<<<<<<
+ *         text = text.replace(u'||', u'\n|')
+ *         text = _remove_table_cells(text)
+ */
+    if (unlikely(__pyx_v_text == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "replace");
+      __PYX_ERR(0, 460, __pyx_L1_error)
+    }
+    __pyx_t_1 = PyUnicode_Replace(__pyx_v_text, __pyx_kp_u__16, __pyx_kp_u__17, -1L); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 460, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":461
+ *         text = _remove_table_lines(text)
+ *         text = text.replace(u'|||', u'|\n|')
+ *         text = text.replace(u'||', u'\n|')             # <<<<<<<<<<<<<<
+ *         text = _remove_table_cells(text)
+ *         text = _remove_table_attributes(text)
+ */
+    if (unlikely(__pyx_v_text == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "replace");
+      __PYX_ERR(0, 461, __pyx_L1_error)
+    }
+    __pyx_t_1 = PyUnicode_Replace(__pyx_v_text, __pyx_kp_u__18, __pyx_kp_u__14, -1L); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 461, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":462
+ *         text = text.replace(u'|||', u'|\n|')
+ *         text = text.replace(u'||', u'\n|')
+ *         text = _remove_table_cells(text)             # <<<<<<<<<<<<<<
+ *         text = _remove_table_attributes(text)
+ *         text = text.replace(u'[]', u'')
+ */
+    __pyx_t_1 = __pyx_f_6gensim_7corpora_11_wikimarkup__remove_table_cells(__pyx_v_text); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 462, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":463
+ *         text = text.replace(u'||', u'\n|')
+ *         text = _remove_table_cells(text)
+ *         text = _remove_table_attributes(text)             # <<<<<<<<<<<<<<
+ *         text = text.replace(u'[]', u'')
+ *         if old == text or iters > 2:
+ */
+    __pyx_t_1 = __pyx_f_6gensim_7corpora_11_wikimarkup__remove_table_attributes(__pyx_v_text); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 463, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":464
+ *         text = _remove_table_cells(text)
+ *         text = _remove_table_attributes(text)
+ *         text = text.replace(u'[]', u'')             # <<<<<<<<<<<<<<
+ *         if old == text or iters > 2:
+ *             break
+ */
+    if (unlikely(__pyx_v_text == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "replace");
+      __PYX_ERR(0, 464, __pyx_L1_error)
+    }
+    __pyx_t_1 = PyUnicode_Replace(__pyx_v_text, __pyx_kp_u__19, __pyx_kp_u_, -1L); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 464, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":465
+ *         text = _remove_table_attributes(text)
+ *         text = text.replace(u'[]', u'')
+ *         if old == text or iters > 2:             # <<<<<<<<<<<<<<
+ *             break
+ * 
+ */
+    __pyx_t_6 = (__Pyx_PyUnicode_Equals(__pyx_v_old, __pyx_v_text, Py_EQ)); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 465, __pyx_L1_error)
+    __pyx_t_7 = (__pyx_t_6 != 0);
+    if (!__pyx_t_7) {
+    } else {
+      __pyx_t_5 = __pyx_t_7;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_7 = ((__pyx_v_iters > 2) != 0);
+    __pyx_t_5 = __pyx_t_7;
+    __pyx_L7_bool_binop_done:;
+    if (__pyx_t_5) {
+
+      /* "gensim/corpora/_wikimarkup.pyx":466
+ *         text = text.replace(u'[]', u'')
+ *         if old == text or iters > 2:
+ *             break             # <<<<<<<<<<<<<<
+ * 
+ *     if promote_remaining:
+ */
+      goto __pyx_L4_break;
+
+      /* "gensim/corpora/_wikimarkup.pyx":465
+ *         text = _remove_table_attributes(text)
+ *         text = text.replace(u'[]', u'')
+ *         if old == text or iters > 2:             # <<<<<<<<<<<<<<
+ *             break
+ * 
+ */
+    }
+  }
+  __pyx_L4_break:;
+
+  /* "gensim/corpora/_wikimarkup.pyx":468
+ *             break
+ * 
+ *     if promote_remaining:             # <<<<<<<<<<<<<<
+ *         text = text.replace(u'[', u'').replace(u']', u'')
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_promote_remaining); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(0, 468, __pyx_L1_error)
+  if (__pyx_t_5) {
+
+    /* "gensim/corpora/_wikimarkup.pyx":469
+ * 
+ *     if promote_remaining:
+ *         text = text.replace(u'[', u'').replace(u']', u'')             # <<<<<<<<<<<<<<
+ * 
+ *     return text
+ */
+    if (unlikely(__pyx_v_text == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "replace");
+      __PYX_ERR(0, 469, __pyx_L1_error)
+    }
+    __pyx_t_1 = PyUnicode_Replace(__pyx_v_text, __pyx_kp_u__8, __pyx_kp_u_, -1L); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 469, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyUnicode_Replace(((PyObject*)__pyx_t_1), __pyx_kp_u__20, __pyx_kp_u_, -1L); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 469, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_text, ((PyObject*)__pyx_t_2));
+    __pyx_t_2 = 0;
+
+    /* "gensim/corpora/_wikimarkup.pyx":468
+ *             break
+ * 
+ *     if promote_remaining:             # <<<<<<<<<<<<<<
+ *         text = text.replace(u'[', u'').replace(u']', u'')
+ * 
+ */
+  }
+
+  /* "gensim/corpora/_wikimarkup.pyx":471
+ *         text = text.replace(u'[', u'').replace(u']', u'')
+ * 
+ *     return text             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_text);
+  __pyx_r = __pyx_v_text;
+  goto __pyx_L0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":423
+ * 
+ * 
+ * def remove_markup(unicode text, promote_remaining=True, simplify_links=True):             # <<<<<<<<<<<<<<
+ *     """Filter out wiki markup from `text`, same as :func:`gensim.corpora.wikicorpus.remove_markup`.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("gensim.corpora._wikimarkup.remove_markup", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_old);
+  __Pyx_XDECREF(__pyx_v_text);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec__wikimarkup(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec__wikimarkup},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_wikimarkup",
+    __pyx_k_Wiki_markup_stripping_for_mod_ge, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_u_, __pyx_k_, sizeof(__pyx_k_), 0, 1, 0, 0},
+  {&__pyx_kp_u_Category, __pyx_k_Category, sizeof(__pyx_k_Category), 0, 1, 0, 0},
+  {&__pyx_kp_u__10, __pyx_k__10, sizeof(__pyx_k__10), 0, 1, 0, 0},
+  {&__pyx_kp_u__11, __pyx_k__11, sizeof(__pyx_k__11), 0, 1, 0, 0},
+  {&__pyx_kp_u__12, __pyx_k__12, sizeof(__pyx_k__12), 0, 1, 0, 0},
+  {&__pyx_kp_u__13, __pyx_k__13, sizeof(__pyx_k__13), 0, 1, 0, 0},
+  {&__pyx_kp_u__14, __pyx_k__14, sizeof(__pyx_k__14), 0, 1, 0, 0},
+  {&__pyx_kp_u__15, __pyx_k__15, sizeof(__pyx_k__15), 0, 1, 0, 0},
+  {&__pyx_kp_u__16, __pyx_k__16, sizeof(__pyx_k__16), 0, 1, 0, 0},
+  {&__pyx_kp_u__17, __pyx_k__17, sizeof(__pyx_k__17), 0, 1, 0, 0},
+  {&__pyx_kp_u__18, __pyx_k__18, sizeof(__pyx_k__18), 0, 1, 0, 0},
+  {&__pyx_kp_u__19, __pyx_k__19, sizeof(__pyx_k__19), 0, 1, 0, 0},
+  {&__pyx_kp_u__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 1, 0, 0},
+  {&__pyx_kp_u__20, __pyx_k__20, sizeof(__pyx_k__20), 0, 1, 0, 0},
+  {&__pyx_kp_u__3, __pyx_k__3, sizeof(__pyx_k__3), 0, 1, 0, 0},
+  {&__pyx_kp_u__4, __pyx_k__4, sizeof(__pyx_k__4), 0, 1, 0, 0},
+  {&__pyx_kp_u__5, __pyx_k__5, sizeof(__pyx_k__5), 0, 1, 0, 0},
+  {&__pyx_kp_u__6, __pyx_k__6, sizeof(__pyx_k__6), 0, 1, 0, 0},
+  {&__pyx_kp_u__7, __pyx_k__7, sizeof(__pyx_k__7), 0, 1, 0, 0},
+  {&__pyx_kp_u__8, __pyx_k__8, sizeof(__pyx_k__8), 0, 1, 0, 0},
+  {&__pyx_kp_u__9, __pyx_k__9, sizeof(__pyx_k__9), 0, 1, 0, 0},
+  {&__pyx_kp_u_align, __pyx_k_align, sizeof(__pyx_k_align), 0, 1, 0, 0},
+  {&__pyx_n_s_bar, __pyx_k_bar, sizeof(__pyx_k_bar), 0, 0, 1, 1},
+  {&__pyx_n_u_bgcolor, __pyx_k_bgcolor, sizeof(__pyx_k_bgcolor), 0, 1, 0, 1},
+  {&__pyx_n_s_c, __pyx_k_c, sizeof(__pyx_k_c), 0, 0, 1, 1},
+  {&__pyx_kp_u_class, __pyx_k_class, sizeof(__pyx_k_class), 0, 1, 0, 0},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_u_colspan, __pyx_k_colspan, sizeof(__pyx_k_colspan), 0, 1, 0, 1},
+  {&__pyx_n_s_gensim_corpora__wikimarkup, __pyx_k_gensim_corpora__wikimarkup, sizeof(__pyx_k_gensim_corpora__wikimarkup), 0, 0, 1, 1},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+  {&__pyx_kp_u_ile, __pyx_k_ile, sizeof(__pyx_k_ile), 0, 1, 0, 0},
+  {&__pyx_n_s_in_template, __pyx_k_in_template, sizeof(__pyx_k_in_template), 0, 0, 1, 1},
+  {&__pyx_n_s_iters, __pyx_k_iters, sizeof(__pyx_k_iters), 0, 0, 1, 1},
+  {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
+  {&__pyx_n_s_last, __pyx_k_last, sizeof(__pyx_k_last), 0, 0, 1, 1},
+  {&__pyx_n_u_mage, __pyx_k_mage, sizeof(__pyx_k_mage), 0, 1, 0, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_u_math, __pyx_k_math, sizeof(__pyx_k_math), 0, 1, 0, 1},
+  {&__pyx_n_s_n, __pyx_k_n, sizeof(__pyx_k_n), 0, 0, 1, 1},
+  {&__pyx_n_s_n_close, __pyx_k_n_close, sizeof(__pyx_k_n_close), 0, 0, 1, 1},
+  {&__pyx_n_s_n_open, __pyx_k_n_open, sizeof(__pyx_k_n_open), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_u_nowiki, __pyx_k_nowiki, sizeof(__pyx_k_nowiki), 0, 1, 0, 1},
+  {&__pyx_n_s_old, __pyx_k_old, sizeof(__pyx_k_old), 0, 0, 1, 1},
+  {&__pyx_n_s_pieces, __pyx_k_pieces, sizeof(__pyx_k_pieces), 0, 0, 1, 1},
+  {&__pyx_n_s_pos, __pyx_k_pos, sizeof(__pyx_k_pos), 0, 0, 1, 1},
+  {&__pyx_n_s_prev_c, __pyx_k_prev_c, sizeof(__pyx_k_prev_c), 0, 0, 1, 1},
+  {&__pyx_n_s_promote_remaining, __pyx_k_promote_remaining, sizeof(__pyx_k_promote_remaining), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_u_ref, __pyx_k_ref, sizeof(__pyx_k_ref), 0, 1, 0, 1},
+  {&__pyx_n_s_remove_file, __pyx_k_remove_file, sizeof(__pyx_k_remove_file), 0, 0, 1, 1},
+  {&__pyx_n_s_remove_markup, __pyx_k_remove_markup, sizeof(__pyx_k_remove_markup), 0, 0, 1, 1},
+  {&__pyx_n_s_remove_template, __pyx_k_remove_template, sizeof(__pyx_k_remove_template), 0, 0, 1, 1},
+  {&__pyx_n_u_rowspan, __pyx_k_rowspan, sizeof(__pyx_k_rowspan), 0, 1, 0, 1},
+  {&__pyx_n_s_s, __pyx_k_s, sizeof(__pyx_k_s), 0, 0, 1, 1},
+  {&__pyx_kp_u_scope, __pyx_k_scope, sizeof(__pyx_k_scope), 0, 1, 0, 0},
+  {&__pyx_n_s_simplify_links, __pyx_k_simplify_links, sizeof(__pyx_k_simplify_links), 0, 0, 1, 1},
+  {&__pyx_kp_u_style, __pyx_k_style, sizeof(__pyx_k_style), 0, 1, 0, 0},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_text, __pyx_k_text, sizeof(__pyx_k_text), 0, 0, 1, 1},
+  {&__pyx_kp_s_wikimarkup_pyx, __pyx_k_wikimarkup_pyx, sizeof(__pyx_k_wikimarkup_pyx), 0, 0, 1, 0},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 37, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "gensim/corpora/_wikimarkup.pyx":85
+ * 
+ * 
+ * def remove_template(unicode s):             # <<<<<<<<<<<<<<
+ *     """Remove template wikimedia markup, same as :func:`gensim.corpora.wikicorpus.remove_template`.
+ * 
+ */
+  __pyx_tuple__21 = PyTuple_Pack(10, __pyx_n_s_s, __pyx_n_s_i, __pyx_n_s_n, __pyx_n_s_n_open, __pyx_n_s_n_close, __pyx_n_s_last, __pyx_n_s_in_template, __pyx_n_s_c, __pyx_n_s_prev_c, __pyx_n_s_pieces); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
+  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(1, 0, 10, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_wikimarkup_pyx, __pyx_n_s_remove_template, 85, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 85, __pyx_L1_error)
+
+  /* "gensim/corpora/_wikimarkup.pyx":127
+ * 
+ * 
+ * def remove_file(unicode s):             # <<<<<<<<<<<<<<
+ *     """Remove the 'File:' and 'Image:' markup, keeping the file caption, same as
+ *     :func:`gensim.corpora.wikicorpus.remove_file`.
+ */
+  __pyx_tuple__23 = PyTuple_Pack(8, __pyx_n_s_s, __pyx_n_s_pos, __pyx_n_s_j, __pyx_n_s_bar, __pyx_n_s_n, __pyx_n_s_last, __pyx_n_s_c, __pyx_n_s_pieces); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
+  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(1, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_wikimarkup_pyx, __pyx_n_s_remove_file, 127, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 127, __pyx_L1_error)
+
+  /* "gensim/corpora/_wikimarkup.pyx":423
+ * 
+ * 
+ * def remove_markup(unicode text, promote_remaining=True, simplify_links=True):             # <<<<<<<<<<<<<<
+ *     """Filter out wiki markup from `text`, same as :func:`gensim.corpora.wikicorpus.remove_markup`.
+ * 
+ */
+  __pyx_tuple__25 = PyTuple_Pack(5, __pyx_n_s_text, __pyx_n_s_promote_remaining, __pyx_n_s_simplify_links, __pyx_n_s_old, __pyx_n_s_iters); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 423, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_wikimarkup_pyx, __pyx_n_s_remove_markup, 423, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 423, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#if PY_MAJOR_VERSION < 3
+#ifdef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC void
+#else
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#endif
+#else
+#ifdef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC init_wikimarkup(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC init_wikimarkup(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit__wikimarkup(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit__wikimarkup(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__wikimarkup(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_wikimarkup' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__wikimarkup(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  #ifdef WITH_THREAD /* Python build with threading support? */
+  PyEval_InitThreads();
+  #endif
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("_wikimarkup", __pyx_methods, __pyx_k_Wiki_markup_stripping_for_mod_ge, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if CYTHON_COMPILING_IN_PYPY
+  Py_INCREF(__pyx_b);
+  #endif
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_gensim__corpora___wikimarkup) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "gensim.corpora._wikimarkup")) {
+      if (unlikely(PyDict_SetItemString(modules, "gensim.corpora._wikimarkup", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  (void)__Pyx_modinit_type_init_code();
+  (void)__Pyx_modinit_type_import_code();
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "gensim/corpora/_wikimarkup.pyx":85
+ * 
+ * 
+ * def remove_template(unicode s):             # <<<<<<<<<<<<<<
+ *     """Remove template wikimedia markup, same as :func:`gensim.corpora.wikicorpus.remove_template`.
+ * 
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_7corpora_11_wikimarkup_1remove_template, NULL, __pyx_n_s_gensim_corpora__wikimarkup); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_remove_template, __pyx_t_1) < 0) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":127
+ * 
+ * 
+ * def remove_file(unicode s):             # <<<<<<<<<<<<<<
+ *     """Remove the 'File:' and 'Image:' markup, keeping the file caption, same as
+ *     :func:`gensim.corpora.wikicorpus.remove_file`.
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_7corpora_11_wikimarkup_3remove_file, NULL, __pyx_n_s_gensim_corpora__wikimarkup); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_remove_file, __pyx_t_1) < 0) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":423
+ * 
+ * 
+ * def remove_markup(unicode text, promote_remaining=True, simplify_links=True):             # <<<<<<<<<<<<<<
+ *     """Filter out wiki markup from `text`, same as :func:`gensim.corpora.wikicorpus.remove_markup`.
+ * 
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_7corpora_11_wikimarkup_5remove_markup, NULL, __pyx_n_s_gensim_corpora__wikimarkup); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 423, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_remove_markup, __pyx_t_1) < 0) __PYX_ERR(0, 423, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gensim/corpora/_wikimarkup.pyx":1
+ * #!/usr/bin/env cython             # <<<<<<<<<<<<<<
+ * # coding: utf-8
+ * # cython: boundscheck=False
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init gensim.corpora._wikimarkup", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init gensim.corpora._wikimarkup");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* PyUnicode_Substring */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_Substring(
+            PyObject* text, Py_ssize_t start, Py_ssize_t stop) {
+    Py_ssize_t length;
+    if (unlikely(__Pyx_PyUnicode_READY(text) == -1)) return NULL;
+    length = __Pyx_PyUnicode_GET_LENGTH(text);
+    if (start < 0) {
+        start += length;
+        if (start < 0)
+            start = 0;
+    }
+    if (stop < 0)
+        stop += length;
+    else if (stop > length)
+        stop = length;
+    length = stop - start;
+    if (length <= 0)
+        return PyUnicode_FromUnicode(NULL, 0);
+#if CYTHON_PEP393_ENABLED
+    return PyUnicode_FromKindAndData(PyUnicode_KIND(text),
+        PyUnicode_1BYTE_DATA(text) + start*PyUnicode_KIND(text), stop-start);
+#else
+    return PyUnicode_FromUnicode(PyUnicode_AS_UNICODE(text)+start, stop-start);
+#endif
+}
+
+/* GetItemIntUnicode */
+static CYTHON_INLINE Py_UCS4 __Pyx_GetItemInt_Unicode_Fast(PyObject* ustring, Py_ssize_t i,
+                                                           int wraparound, int boundscheck) {
+    Py_ssize_t length;
+    if (unlikely(__Pyx_PyUnicode_READY(ustring) < 0)) return (Py_UCS4)-1;
+    if (wraparound | boundscheck) {
+        length = __Pyx_PyUnicode_GET_LENGTH(ustring);
+        if (wraparound & unlikely(i < 0)) i += length;
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(i, length))) {
+            return __Pyx_PyUnicode_READ_CHAR(ustring, i);
+        } else {
+            PyErr_SetString(PyExc_IndexError, "string index out of range");
+            return (Py_UCS4)-1;
+        }
+    } else {
+        return __Pyx_PyUnicode_READ_CHAR(ustring, i);
+    }
+}
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+#ifdef _MSC_VER
+    else state = (PyGILState_STATE)-1;
+#endif
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_CheckExact(key)) || likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (PyUnicode_GET_SIZE(**name) != PyUnicode_GET_SIZE(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (PyUnicode_GET_SIZE(**argname) != PyUnicode_GET_SIZE(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = func->ob_type->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (PyCFunction_GET_FLAGS(func) & METH_FASTCALL) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* BytesEquals */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
+}
+
+/* UnicodeEquals */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
+    }
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+        #if CYTHON_PEP393_ENABLED
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+        #else
+            hash1 = ((PyUnicodeObject*)s1)->hash;
+            hash2 = ((PyUnicodeObject*)s2)->hash;
+        #endif
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
+            }
+        }
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(owned_ref);
+        #endif
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
+#endif
+}
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, (size_t)new_max*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyObject *py_srcfile = 0;
+    PyObject *py_funcname = 0;
+    #if PY_MAJOR_VERSION < 3
+    py_srcfile = PyString_FromString(filename);
+    #else
+    py_srcfile = PyUnicode_FromString(filename);
+    #endif
+    if (!py_srcfile) goto bad;
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        #else
+        py_funcname = PyUnicode_FromString(funcname);
+        #endif
+    }
+    if (!py_funcname) goto bad;
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    Py_DECREF(py_funcname);
+    return py_code;
+bad:
+    Py_XDECREF(py_srcfile);
+    Py_XDECREF(py_funcname);
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) goto bad;
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+    const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+    const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+    const int neg_one = (int) ((int) 0 - (int) 1), const_zero = (int) 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[4], rtversion[4];
+    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
+    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
+        char message[200];
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
@@ -0,0 +1,471 @@
+#!/usr/bin/env cython
+# coding: utf-8
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: embedsignature=True
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Wiki markup stripping for :mod:`gensim.corpora.wikicorpus` (fast Cython version).
+
+Each regular expression pass of :func:`gensim.corpora.wikicorpus.remove_markup` is replaced by a hand-written scanner
+that walks the text once, in C, and copies the unchanged parts between matches. The scanners reproduce the matching
+rules of the regular expressions exactly (including lazy and greedy repetitions and lookarounds), so the output is
+the same as that of the pure Python functions.
+
+"""
+
+
+cdef unicode _finish(list pieces, unicode s, Py_ssize_t last):
+    """Append the tail of `s` after `last` to `pieces` and join them; return `s` itself if nothing was replaced."""
+    if not pieces:
+        return s
+    pieces.append(s[last:])
+    return u''.join(pieces)
+
+
+cdef inline bint _is_word(Py_UCS4 c):
+    """Same as `\\w` in a unicode regular expression."""
+    return c.isalnum() or c == u'_'
+
+
+cdef inline bint _at(unicode s, Py_ssize_t n, Py_ssize_t pos, unicode literal):
+    """Does `literal` occur in `s` (of length `n`) at `pos`?"""
+    cdef Py_ssize_t k, m = len(literal)
+    if pos < 0 or pos + m > n:
+        return False
+    for k in range(m):
+        if s[pos + k] != literal[k]:
+            return False
+    return True
+
+
+cdef Py_ssize_t _language_link_start(unicode s, Py_ssize_t end):
+    """Start of the language link `\\n[[xx:Title]]` that ends just before `end`, or -1."""
+    cdef Py_ssize_t colon, start, j = end - 3
+    cdef Py_UCS4 c
+    if j < 0 or s[end - 1] != u']' or s[end - 2] != u']':
+        return -1
+    # title: [^:\]]+
+    while j >= 0:
+        c = s[j]
+        if c == u':' or c == u']':
+            break
+        j -= 1
+    if j < 0 or j == end - 3 or s[j] != u':':
+        return -1
+    colon = j
+    # language code: [a-z][a-z][\w-]*
+    j -= 1
+    while j >= 0 and (_is_word(s[j]) or s[j] == u'-'):
+        j -= 1
+    start = j + 1
+    if colon - start < 2 or not (u'a' <= s[start] <= u'z') or not (u'a' <= s[start + 1] <= u'z'):
+        return -1
+    if start < 3 or s[start - 1] != u'[' or s[start - 2] != u'[' or s[start - 3] != u'\n':
+        return -1
+    return start - 3
+
+
+cdef unicode _remove_language_links(unicode s):
+    """Same as `re.sub(RE_P2, '', s)`: remove the trailing list of language links."""
+    cdef Py_ssize_t n = len(s), end = n, start, first = -1
+    if n > 0 and s[n - 1] == u'\n':
+        end = n - 1
+    # the links are chained backwards from the end of the text; each link is found unambiguously
+    start = _language_link_start(s, end)
+    while start >= 0:
+        first = start
+        start = _language_link_start(s, start)
+    if first < 0:
+        return s
+    return s[:first] + s[end:]
+
+
+def remove_template(unicode s):
+    """Remove template wikimedia markup, same as :func:`gensim.corpora.wikicorpus.remove_template`.
+
+    Parameters
+    ----------
+    s : str
+        String containing markup template.
+
+    Returns
+    -------
+    str
+        Сopy of `s` with all the templates removed.
+
+    """
+    cdef Py_ssize_t i, n = len(s), n_open = 0, n_close = 0, last = 0
+    cdef bint in_template = False
+    cdef Py_UCS4 c, prev_c = 0
+    cdef list pieces = []
+    if s.find(u'{{') < 0:
+        return s
+    for i in range(n):
+        c = s[i]
+        if not in_template and c == u'{' and prev_c == u'{':
+            pieces.append(s[last:i - 1])
+            in_template = True
+            n_open = 1
+        if in_template:
+            if c == u'{':
+                n_open += 1
+            elif c == u'}':
+                n_close += 1
+            if n_open == n_close:
+                last = i + 1
+                in_template = False
+                n_open, n_close = 0, 0
+        prev_c = c
+    if in_template:
+        # an unclosed template swallows the rest of the text
+        return u''.join(pieces)
+    return _finish(pieces, s, last)
+
+
+def remove_file(unicode s):
+    """Remove the 'File:' and 'Image:' markup, keeping the file caption, same as
+    :func:`gensim.corpora.wikicorpus.remove_file`.
+
+    Parameters
+    ----------
+    s : str
+        String containing 'File:' and 'Image:' markup.
+
+    Returns
+    -------
+    str
+        Сopy of `s` with all the 'File:' and 'Image:' markup replaced by their captions.
+
+    """
+    cdef Py_ssize_t pos, j, bar, n = len(s), last = 0
+    cdef Py_UCS4 c
+    cdef list pieces = []
+    pos = s.find(u'[[')
+    while pos >= 0:
+        # \[\[([fF]ile:|[iI]mage)[^]]*(\]\])
+        if _at(s, n, pos + 3, u'ile:') and (s[pos + 2] == u'f' or s[pos + 2] == u'F'):
+            j = pos + 7
+        elif _at(s, n, pos + 3, u'mage') and (s[pos + 2] == u'i' or s[pos + 2] == u'I'):
+            j = pos + 7
+        else:
+            pos = s.find(u'[[', pos + 1)
+            continue
+        bar = -1
+        while j < n:
+            c = s[j]
+            if c == u']':
+                break
+            if c == u'|':
+                bar = j
+            j += 1
+        if j + 1 < n and s[j + 1] == u']':
+            pieces.append(s[last:pos])
+            # the caption is the last |-separated field, or the whole markup if there is no caption
+            pieces.append(s[bar + 1:j] if bar >= 0 else s[pos:j])
+            last = j + 2
+            pos = s.find(u'[[', last)
+        else:
+            pos = s.find(u'[[', pos + 1)
+    return _finish(pieces, s, last)
+
+
+cdef unicode _remove_delimited(unicode s, unicode opening, unicode closing):
+    """Same as `re.sub(opening + '.*?' + closing, '', s, flags=re.DOTALL)`, for literal delimiters."""
+    cdef Py_ssize_t pos, end, last = 0
+    cdef list pieces = []
+    pos = s.find(opening)
+    while pos >= 0:
+        end = s.find(closing, pos + len(opening))
+        if end < 0:
+            break  # no later opening can be closed either
+        pieces.append(s[last:pos])
+        last = end + len(closing)
+        pos = s.find(opening, last)
+    return _finish(pieces, s, last)
+
+
+cdef unicode _remove_element(unicode s, unicode name):
+    """Same as `re.sub(r'<name([> ].*?)(</name>|/>)', '', s, flags=re.DOTALL)`."""
+    cdef unicode opening = u'<' + name, closing = u'</' + name + u'>'
+    cdef Py_ssize_t pos, start, end_tag, end_empty, end, n = len(s), last = 0
+    cdef Py_ssize_t m = len(opening)
+    cdef Py_UCS4 c
+    cdef list pieces = []
+    pos = s.find(opening)
+    while pos >= 0:
+        start = pos + m
+        if start >= n:
+            break
+        c = s[start]
+        if c != u'>' and c != u' ':
+            pos = s.find(opening, pos + 1)
+            continue
+        end_tag = s.find(closing, start + 1)
+        end_empty = s.find(u'/>', start + 1)
+        if end_tag < 0 and end_empty < 0:
+            break
+        if end_empty < 0 or 0 <= end_tag < end_empty:
+            end = end_tag + len(closing)
+        else:
+            end = end_empty + 2
+        pieces.append(s[last:pos])
+        last = end
+        pos = s.find(opening, last)
+    return _finish(pieces, s, last)
+
+
+cdef unicode _remove_categories(unicode s):
+    """Same as `re.sub(RE_P14, '', s)`."""
+    cdef Py_ssize_t pos, j, n = len(s), last = 0
+    cdef Py_UCS4 c
+    cdef list pieces = []
+    pos = s.find(u'[[Category:')
+    while pos >= 0:
+        j = pos + 11
+        while j < n:
+            c = s[j]
+            if c == u'[' or c == u']':
+                break
+            j += 1
+        if j + 1 < n and s[j] == u']' and s[j + 1] == u']':
+            pieces.append(s[last:pos])
+            last = j + 2
+            pos = s.find(u'[[Category:', last)
+        else:
+            pos = s.find(u'[[Category:', pos + 1)
+    return _finish(pieces, s, last)
+
+
+cdef unicode _replace_urls(unicode s):
+    """Same as `re.sub(RE_P5, '\\\\3', s)`: replace external links by their description."""
+    cdef Py_ssize_t pos, j, space, n = len(s), last = 0
+    cdef Py_UCS4 c
+    cdef list pieces = []
+    pos = s.find(u'[')
+    while pos >= 0:
+        # \[(\w+):\/\/
+        j = pos + 1
+        while j < n and _is_word(s[j]):
+            j += 1
+        if j == pos + 1 or not _at(s, n, j, u'://'):
+            pos = s.find(u'[', pos + 1)
+            continue
+        # (.*?)(( (.*?))|())\] -- up to the first space or bracket, then up to the first bracket after a space
+        j += 3
+        while j < n:
+            c = s[j]
+            if c == u' ' or c == u']' or c == u'\n':
+                break
+            j += 1
+        if j < n and s[j] == u' ':
+            space = j
+            j += 1
+            while j < n:
+                c = s[j]
+                if c == u']' or c == u'\n':
+                    break
+                j += 1
+        else:
+            space = -1
+        if j < n and s[j] == u']':
+            pieces.append(s[last:pos])
+            if space >= 0:
+                pieces.append(s[space:j])
+            last = j + 1
+            pos = s.find(u'[', last)
+        else:
+            pos = s.find(u'[', pos + 1)
+    return _finish(pieces, s, last)
+
+
+cdef unicode _simplify_links(unicode s):
+    """Same as `re.sub(RE_P6, '\\\\2', s)`: replace `[target|description]` by its description."""
+    cdef Py_ssize_t pos, j, bar, n = len(s), last = 0
+    cdef Py_UCS4 c
+    cdef list pieces = []
+    pos = s.find(u'[')
+    while pos >= 0:
+        bar = -1
+        j = pos + 1
+        while j < n:
+            c = s[j]
+            if c == u'[' or c == u']':
+                break
+            if c == u'|':
+                bar = j
+            j += 1
+        if j < n and s[j] == u']' and bar >= 0:
+            pieces.append(s[last:pos])
+            pieces.append(s[bar + 1:j])
+            last = j + 1
+            pos = s.find(u'[', last)
+        else:
+            # no bracket between pos and j, so the next candidate is at j
+            pos = j if j < n and s[j] == u'[' else s.find(u'[', j)
+    return _finish(pieces, s, last)
+
+
+cdef unicode _remove_table_lines(unicode s):
+    """Same as `re.sub(RE_P12, '\\n', s)`: remove table formatting up to the end of the line."""
+    cdef Py_ssize_t i, end, n = len(s), last = 0
+    cdef Py_UCS4 c, d
+    cdef bint found
+    cdef list pieces = []
+    i = 0
+    while i + 1 < n:
+        c, d = s[i], s[i + 1]
+        found = (c == u'{' and d == u'|') or (c == u'|' and d == u'}') or \
+            (c == u'|' and d == u'-' and not (i + 2 < n and s[i + 2].isdecimal()))
+        if not found:
+            i += 1
+            continue
+        end = s.find(u'\n', i + 2)
+        if end < 0:
+            break
+        pieces.append(s[last:i])
+        pieces.append(u'\n')
+        last = i = end
+    return _finish(pieces, s, last)
+
+
+cdef unicode _remove_table_cells(unicode s):
+    """Same as `re.sub(RE_P13, '\\n', s)`: keep only the content of table cells."""
+    cdef Py_ssize_t p, j, end, n = len(s), last = 0
+    cdef Py_UCS4 c, before, before2
+    cdef list pieces = []
+    p = 2
+    while p < n:
+        c = s[p]
+        if c != u'|' and c != u'!':
+            p += 1
+            continue
+        # (?<=(\n[ ])|(\n\n)|([ ]{2})|(.\n)|(.\t))
+        before, before2 = s[p - 1], s[p - 2]
+        if not (before == u'\n' or (before == u' ' and (before2 == u'\n' or before2 == u' ')) or
+                (before == u'\t' and before2 != u'\n')):
+            p += 1
+            continue
+        # (\||\!)([^[\]\n]*?\|)* -- up to the last | before a bracket or line break
+        end = p + 1
+        j = p + 1
+        while j < n:
+            c = s[j]
+            if c == u'[' or c == u']' or c == u'\n':
+                break
+            if c == u'|':
+                end = j + 1
+            j += 1
+        pieces.append(s[last:p])
+        pieces.append(u'\n')
+        last = p = end
+    return _finish(pieces, s, last)
+
+
+cdef bint _table_attribute_at(unicode s, Py_ssize_t n, Py_ssize_t q, bint scope):
+    """Does a table attribute of RE_P17 start at `q`?"""
+    cdef Py_UCS4 c
+    if _at(s, n, q, u'bgcolor') or _at(s, n, q, u'colspan') or _at(s, n, q, u'rowspan') or \
+            _at(s, n, q, u'style=') or _at(s, n, q, u'class=') or _at(s, n, q, u'align='):
+        return True
+    if scope and _at(s, n, q, u'scope='):
+        return True
+    if q >= n:
+        return False
+    # \d{0,1}[ ]?colspan
+    c = s[q]
+    if (c == u' ' or c.isdecimal()) and _at(s, n, q + 1, u'colspan'):
+        return True
+    return c.isdecimal() and q + 1 < n and s[q + 1] == u' ' and _at(s, n, q + 2, u'colspan')
+
+
+cdef bint _table_attribute_line(unicode s, Py_ssize_t n, Py_ssize_t start, Py_ssize_t max_skip, bint scope):
+    """Does a table attribute start within `max_skip` characters of `start`, on the same line?"""
+    cdef Py_ssize_t k
+    for k in range(max_skip + 1):
+        if k > 0 and (start + k - 1 >= n or s[start + k - 1] == u'\n'):
+            return False
+        if _table_attribute_at(s, n, start + k, scope):
+            return True
+    return False
+
+
+cdef unicode _remove_table_attributes(unicode s):
+    """Same as `re.sub(RE_P17, '\\n', s)`: remove lines of table attributes."""
+    cdef Py_ssize_t pos, end, n = len(s), last = 0
+    cdef list pieces = []
+    if n == 0:
+        return s
+    if s[0] != u'\n' or not _table_attribute_line(s, n, 1, 4, True):
+        # ^.{0,2}(attribute)(.*)
+        if _table_attribute_line(s, n, 0, 2, False):
+            end = s.find(u'\n')
+            last = n if end < 0 else end
+            pieces.append(u'\n')
+    pos = s.find(u'\n', last)
+    while pos >= 0:
+        # \n.{0,4}(attribute)(.*)
+        if _table_attribute_line(s, n, pos + 1, 4, True):
+            end = s.find(u'\n', pos + 1)
+            if end < 0:
+                end = n
+            pieces.append(s[last:pos])
+            pieces.append(u'\n')
+            last = pos = end
+            if end == n:
+                break
+        else:
+            pos = s.find(u'\n', pos + 1)
+    return _finish(pieces, s, last)
+
+
+def remove_markup(unicode text, promote_remaining=True, simplify_links=True):
+    """Filter out wiki markup from `text`, same as :func:`gensim.corpora.wikicorpus.remove_markup`.
+
+    Parameters
+    ----------
+    text : str
+        String containing markup.
+    promote_remaining : bool
+        Whether uncaught markup should be promoted to plain text.
+    simplify_links : bool
+        Whether links should be simplified keeping only their description text.
+
+    Returns
+    -------
+    str
+        `text` without markup.
+
+    """
+    cdef unicode old
+    cdef int iters = 0
+    text = _remove_language_links(text)
+    text = remove_template(text)
+    text = remove_file(text)
+    while True:
+        old, iters = text, iters + 1
+        text = _remove_delimited(text, u'<!--', u'-->')
+        text = _remove_element(text, u'ref')
+        text = _remove_element(text, u'nowiki')
+        text = _remove_element(text, u'math')
+        text = _remove_delimited(text, u'<', u'>')
+        text = _remove_categories(text)
+        text = _replace_urls(text)
+        if simplify_links:
+            text = _simplify_links(text)
+        text = text.replace(u'!!', u'\n|')
+        text = text.replace(u'|-||', u'\n|')
+        text = _remove_table_lines(text)
+        text = text.replace(u'|||', u'|\n|')
+        text = text.replace(u'||', u'\n|')
+        text = _remove_table_cells(text)
+        text = _remove_table_attributes(text)
+        text = text.replace(u'[]', u'')
+        if old == text or iters > 2:
+            break
+
+    if promote_remaining:
+        text = text.replace(u'[', u'').replace(u']', u'')
+
+    return text
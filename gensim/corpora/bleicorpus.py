@@ -10,8 +10,12 @@
 from __future__ import with_statement
 
 from os import path
+import itertools
 import logging
 
+import numpy as np
+import scipy.sparse
+
 from gensim import utils
 from gensim.corpora import IndexedCorpus
 from six.moves import range
@@ -93,6 +97,49 @@ class BleiCorpus(IndexedCorpus):
                 yield self.line2doc(line)
         self.length = lineno + 1
 
+    def iter_csc_chunks(self, chunksize=2000, num_terms=None, dtype=np.float64):
+        """Iterate over the corpus in chunks of documents, each as one sparse matrix.
+
+        The `id:count` pairs of all lines in a chunk are parsed at once with numpy, without creating the
+        `(int, float)` tuples of each document.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of documents in each chunk (only the last chunk may be smaller).
+        num_terms : int, optional
+            Number of terms = number of rows of each chunk, the size of the vocabulary by default.
+        dtype : data-type, optional
+            Data type of the output matrices.
+
+        Yields
+        ------
+        scipy.sparse.csc_matrix
+            Chunk of shape (`num_terms`, number of documents in the chunk), documents as columns.
+
+        """
+        if num_terms is None:
+            num_terms = len(self.id2word)
+        with utils.smart_open(self.fname) as fin:
+            while True:
+                lines = list(itertools.islice(fin, chunksize))
+                if not lines:
+                    break
+                parts = [line.split(None, 1) for line in lines]
+                fields = [part[1] if len(part) > 1 else b'' for part in parts]
+                lengths = np.array([field.count(b':') for field in fields], dtype=np.int64)
+                pairs = np.fromstring(b' '.join(fields).replace(b':', b' '), dtype=np.float64, sep=' ')
+                if len(pairs) != 2 * lengths.sum() or any(
+                        not part or int(part[0]) != length for part, length in zip(parts, lengths.tolist())):
+                    raise ValueError("invalid format in %s" % self.fname)
+                pairs = pairs.reshape(-1, 2)
+                indptr = np.zeros(len(lines) + 1, dtype=np.int64)
+                np.cumsum(lengths, out=indptr[1:])
+                yield scipy.sparse.csc_matrix(
+                    (pairs[:, 1].astype(dtype), pairs[:, 0].astype(np.int64), indptr),
+                    shape=(num_terms, len(lines)), dtype=dtype
+                )
+
     def line2doc(self, line):
         """Convert line in Blei LDA-C format to document (BoW representation).
 
@@ -0,0 +1,485 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Memory-lean counterpart of :class:`~gensim.corpora.dictionary.Dictionary`.
+
+Notes
+-----
+A :class:`~gensim.corpora.dictionary.Dictionary` keeps every token as a separate Python object, plus several
+Python dicts keyed by token ids. For vocabularies of millions of tokens, these take gigabytes of RAM and pickle slowly.
+
+:class:`~gensim.corpora.compactdictionary.CompactDictionary` stores the same information in a handful of numpy arrays:
+
+* all tokens concatenated in a single UTF-8 byte buffer, plus an array of offsets into that buffer,
+* document and collection frequencies as integer arrays indexed by token id,
+* an open-addressing hash table (CRC32 of the UTF-8 token, linear probing) for the token -> id direction.
+
+The arrays are saved as separate `.npy` files by :meth:`~gensim.utils.SaveLoad.save`, so a large dictionary
+can be loaded back with `mmap='r'` in (almost) no time, and shared between processes.
+
+Examples
+--------
+.. sourcecode:: pycon
+
+    >>> from gensim.corpora import Dictionary, CompactDictionary
+    >>> from gensim.test.utils import common_texts
+    >>>
+    >>> dct = CompactDictionary.from_dictionary(Dictionary(common_texts))
+    >>> dct.doc2bow(["human", "computer", "computer", "unknown"])
+    [(0, 2), (2, 1)]
+    >>> dct[2]
+    'human'
+
+"""
+
+from __future__ import with_statement
+
+from collections import Mapping
+import itertools
+import logging
+import sys
+import zlib
+
+import numpy as np
+
+from gensim import utils
+from gensim.corpora.dictionary import Dictionary, extremes_positions, ids2bow_matrix, ids_mask
+
+from six import PY3, string_types
+from six.moves import map, range
+
+if sys.version_info[0] >= 3:
+    unicode = str
+
+
+logger = logging.getLogger(__name__)
+
+
+def _token_hash(token_bytes):
+    """Hash function used by the token index, stable across processes and Python versions."""
+    return zlib.crc32(token_bytes) & 0xffffffff
+
+
+class TokenIndex(Mapping):
+    """Read-only token -> id view of a :class:`~gensim.corpora.compactdictionary.CompactDictionary`.
+
+    Exposed as `CompactDictionary.token2id`, so that code written for the `token2id` dict of
+    :class:`~gensim.corpora.dictionary.Dictionary` keeps working.
+
+    """
+    def __init__(self, dictionary):
+        """
+
+        Parameters
+        ----------
+        dictionary : :class:`~gensim.corpora.compactdictionary.CompactDictionary`
+            Dictionary to look the tokens up in.
+
+        """
+        self.dictionary = dictionary
+
+    def __getitem__(self, token):
+        tokenid = self.dictionary.token_id(token)
+        if tokenid < 0:
+            raise KeyError(token)
+        return tokenid
+
+    def __iter__(self):
+        dictionary = self.dictionary
+        return (dictionary[tokenid] for tokenid in range(len(dictionary)))
+
+    def __len__(self):
+        return len(self.dictionary)
+
+
+class CompactDictionary(utils.SaveLoad, Mapping):
+    """Mapping between tokens and their integer ids, backed by numpy arrays instead of Python dicts.
+
+    New tokens cannot be added; build a :class:`~gensim.corpora.dictionary.Dictionary` first (or pass `documents`
+    to the constructor, which does that for you) and convert it with
+    :meth:`~gensim.corpora.compactdictionary.CompactDictionary.from_dictionary`. Tokens can be removed with
+    the vectorized `filter_*` methods.
+
+    Behaves as a `Mapping` of token id -> token, so it can be passed as `id2word` to models such as
+    :class:`~gensim.models.ldamodel.LdaModel` or :class:`~gensim.models.tfidfmodel.TfidfModel`.
+
+    Attributes
+    ----------
+    token_bytes : numpy.ndarray of uint8
+        UTF-8 encoded tokens, concatenated in the order of their ids.
+    token_offsets : numpy.ndarray of int64
+        Token `i` is stored in `token_bytes[token_offsets[i]:token_offsets[i + 1]]`.
+    token_hashes : numpy.ndarray of uint32
+        CRC32 of each token, kept so that the hash table can be rebuilt without rehashing the tokens.
+    hash_table : numpy.ndarray
+        Open-addressing hash table of token ids (-1 marks an empty slot), size is a power of two.
+    dfs : numpy.ndarray of int64
+        Document frequencies: `dfs[token_id]` = how many documents contain this token.
+    cfs : numpy.ndarray of int64
+        Collection frequencies: `cfs[token_id]` = how many instances of this token are contained in the documents.
+    num_docs : int
+        Number of documents processed.
+    num_pos : int
+        Total number of corpus positions (number of processed words).
+    num_nnz : int
+        Total number of non-zeroes in the BOW matrix.
+
+    """
+    def __init__(self, documents=None, prune_at=2000000):
+        """
+
+        Parameters
+        ----------
+        documents : iterable of iterable of str, optional
+            Documents to be used to initialize the mapping and collect corpus statistics.
+            The documents are first collected into a regular :class:`~gensim.corpora.dictionary.Dictionary`.
+        prune_at : int, optional
+            Passed to :class:`~gensim.corpora.dictionary.Dictionary` when building from `documents`.
+
+        """
+        self.num_docs = 0
+        self.num_pos = 0
+        self.num_nnz = 0
+        self._set_tokens([], np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+        if documents is not None:
+            dictionary = Dictionary(documents, prune_at=prune_at)
+            self._set_dictionary(dictionary)
+
+    @classmethod
+    def from_dictionary(cls, dictionary):
+        """Create a :class:`~gensim.corpora.compactdictionary.CompactDictionary` from an existing dictionary.
+
+        Parameters
+        ----------
+        dictionary : :class:`~gensim.corpora.dictionary.Dictionary`
+            Source dictionary. Its token ids must be contiguous, `0..len(dictionary) - 1`
+            (call :meth:`~gensim.corpora.dictionary.Dictionary.compactify` first if they are not).
+
+        Returns
+        -------
+        :class:`~gensim.corpora.compactdictionary.CompactDictionary`
+            Dictionary with the same token ids and statistics as `dictionary`.
+
+        """
+        result = cls()
+        result._set_dictionary(dictionary)
+        return result
+
+    def _set_dictionary(self, dictionary):
+        """Copy the tokens and statistics of a :class:`~gensim.corpora.dictionary.Dictionary` into self."""
+        num_terms = len(dictionary.token2id)
+        tokens = [None] * num_terms
+        for token, tokenid in dictionary.token2id.items():
+            if not 0 <= tokenid < num_terms:
+                raise ValueError("token ids must be contiguous; call compactify() on the source dictionary first")
+            tokens[tokenid] = token
+        cfs = getattr(dictionary, 'cfs', {})
+        self._set_tokens(
+            tokens,
+            np.fromiter((dictionary.dfs.get(i, 0) for i in range(num_terms)), dtype=np.int64, count=num_terms),
+            np.fromiter((cfs.get(i, 0) for i in range(num_terms)), dtype=np.int64, count=num_terms),
+        )
+        self.num_docs = dictionary.num_docs
+        self.num_pos = dictionary.num_pos
+        self.num_nnz = dictionary.num_nnz
+
+    def _set_tokens(self, tokens, dfs, cfs):
+        """Rebuild the string buffer and the hash index from `tokens`, a list of strings ordered by id."""
+        encoded = [utils.to_utf8(token) for token in tokens]
+        self.token_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=self.token_offsets[1:])
+        self.token_bytes = np.frombuffer(b''.join(encoded), dtype=np.uint8).copy()
+        self.dfs, self.cfs = dfs, cfs
+        self.token_hashes = np.fromiter(map(_token_hash, encoded), dtype=np.uint32, count=len(encoded))
+        self.hash_table = self._build_hash_table(self.token_hashes.astype(np.int64))
+
+    @staticmethod
+    def _build_hash_table(hashes):
+        """Insert token ids `0..len(hashes) - 1` into an open-addressing table, vectorized.
+
+        The table is at most half full. Ids colliding on a slot move on to the next slot in rounds,
+        which leaves every id on the linear probing path from its home slot, as sequential insertion would.
+
+        """
+        size = 8
+        while size < 2 * len(hashes):
+            size *= 2
+        mask = size - 1
+        table = np.full(size, -1, dtype=np.int32 if len(hashes) < 2 ** 31 else np.int64)
+        pending = np.arange(len(hashes), dtype=np.int64)
+        slots = hashes & mask
+        while len(pending):
+            free = table[slots] == -1
+            free_slots, first = np.unique(slots[free], return_index=True)
+            table[free_slots] = pending[free][first]
+            placed = np.zeros(len(pending), dtype=bool)
+            placed[np.flatnonzero(free)[first]] = True
+            pending, slots = pending[~placed], (slots[~placed] + 1) & mask
+        return table
+
+    def token_id(self, token, default=-1):
+        """Get the id of `token`.
+
+        Parameters
+        ----------
+        token : str
+            Token to look up (unicode, or utf8 encoded bytestring).
+        default : int, optional
+            Value to return if the token isn't in the dictionary.
+
+        Returns
+        -------
+        int
+            Id of `token`, or `default`.
+
+        """
+        token = utils.to_utf8(token)
+        table, offsets, buf = self.hash_table, self.token_offsets, self.token_bytes
+        mask = len(table) - 1
+        slot = _token_hash(token) & mask
+        while True:
+            tokenid = table[slot]
+            if tokenid < 0:
+                return default
+            if buf[offsets[tokenid]:offsets[tokenid + 1]].tobytes() == token:
+                return int(tokenid)
+            slot = (slot + 1) & mask
+
+    @property
+    def token2id(self):
+        """Read-only token -> id mapping, :class:`~gensim.corpora.compactdictionary.TokenIndex`."""
+        return TokenIndex(self)
+
+    @property
+    def id2token(self):
+        """Id -> token mapping, i.e. the dictionary itself."""
+        return self
+
+    def __getitem__(self, tokenid):
+        """Get the string token that corresponds to `tokenid`.
+
+        Parameters
+        ----------
+        tokenid : int
+            Id of token.
+
+        Returns
+        -------
+        str
+            Token corresponding to `tokenid`.
+
+        Raises
+        ------
+        KeyError
+            If this dictionary doesn't contain such `tokenid`.
+
+        """
+        if not 0 <= tokenid < len(self):
+            raise KeyError(tokenid)
+        start, end = self.token_offsets[tokenid], self.token_offsets[tokenid + 1]
+        return self.token_bytes[start:end].tobytes().decode('utf8')
+
+    def __iter__(self):
+        """Iterate over all token ids."""
+        return iter(range(len(self)))
+
+    if PY3:
+        # restore Py2-style dict API
+        iterkeys = __iter__
+
+        def iteritems(self):
+            return self.items()
+
+        def itervalues(self):
+            return self.values()
+
+    def keys(self):
+        """Get all token ids, `0..len(self) - 1`."""
+        return range(len(self))
+
+    def __len__(self):
+        """Get number of stored tokens."""
+        return len(self.token_offsets) - 1
+
+    def __str__(self):
+        some_tokens = [self[tokenid] for tokenid in range(min(5, len(self)))]
+        return "CompactDictionary(%i unique tokens: %s%s)" % (len(self), some_tokens, '...' if len(self) > 5 else '')
+
+    def doc2bow(self, document):
+        """Convert `document` into the bag-of-words (BoW) format = list of `(token_id, token_count)` tuples.
+
+        Parameters
+        ----------
+        document : list of str
+            Input document.
+
+        Returns
+        -------
+        list of (int, int)
+            BoW representation of `document`, unknown tokens are ignored.
+
+        """
+        bows = self.doc2bow_batch([document])
+        return list(zip(bows.indices.tolist(), bows.data.tolist()))
+
+    def doc2bow_batch(self, documents):
+        """Convert many `documents` into the bag-of-words format at once, as a sparse matrix.
+
+        Parameters
+        ----------
+        documents : iterable of list of str
+            Input documents. The whole batch is held in memory.
+
+        Returns
+        -------
+        scipy.sparse.csc_matrix
+            Matrix of token counts of shape (`len(self)`, `len(documents)`), documents as columns, see
+            :meth:`~gensim.corpora.dictionary.Dictionary.doc2bow_batch`.
+
+        """
+        documents = Dictionary._check_batch(documents, 'doc2bow_batch')
+        ids, lengths = self._lookup_batch(documents, unknown_word_index=-1)
+        return ids2bow_matrix(ids, lengths, len(self))
+
+    def doc2idx(self, document, unknown_word_index=-1):
+        """Convert `document` (a list of words) into a list of token ids.
+
+        Parameters
+        ----------
+        document : list of str
+            Input document.
+        unknown_word_index : int, optional
+            Index to use for words not in the dictionary.
+
+        Returns
+        -------
+        list of int
+            Token ids for tokens in `document`, in the same order.
+
+        """
+        if isinstance(document, string_types):
+            raise TypeError("doc2idx expects an array of unicode tokens on input, not a single string")
+        return [self.token_id(token, unknown_word_index) for token in document]
+
+    def _lookup_batch(self, documents, unknown_word_index):
+        """Look up the ids of all tokens in `documents`, hashing each distinct token of the batch only once."""
+        lengths = np.fromiter((len(document) for document in documents), dtype=np.int64, count=len(documents))
+        tokens = list(itertools.chain.from_iterable(documents))
+        cache = {token: self.token_id(token, unknown_word_index) for token in set(tokens)}
+        ids = np.fromiter(map(cache.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+        return ids, lengths
+
+    def filter_extremes(self, no_below=5, no_above=0.5, keep_n=100000, keep_tokens=None):
+        """Filter out tokens by their document frequency, like
+        :meth:`~gensim.corpora.dictionary.Dictionary.filter_extremes`, in vectorized passes over the arrays.
+
+        Parameters
+        ----------
+        no_below : int, optional
+            Keep tokens which are contained in at least `no_below` documents.
+        no_above : float, optional
+            Keep tokens which are contained in no more than `no_above` documents
+            (fraction of total corpus size, not an absolute number).
+        keep_n : int, optional
+            Keep only the first `keep_n` most frequent tokens.
+        keep_tokens : iterable of str
+            Iterable of tokens that **must** stay in dictionary after filtering.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            Mapping of old token ids to new token ids, -1 for removed tokens.
+
+        """
+        no_above_abs = int(no_above * self.num_docs)
+        forced = None
+        if keep_tokens:
+            forced = ids_mask((self.token_id(token) for token in keep_tokens), len(self))
+        good_ids = extremes_positions(self.dfs, self.num_docs, no_below, no_above_abs, keep_n, forced=forced)
+        logger.info(
+            "keeping %i tokens which were in no less than %i and no more than %i (=%.1f%%) documents",
+            len(good_ids), no_below, no_above_abs, 100.0 * no_above
+        )
+        return self.filter_tokens(good_ids=good_ids)
+
+    def filter_n_most_frequent(self, remove_n):
+        """Filter out the 'remove_n' most frequent tokens that appear in the documents.
+
+        Parameters
+        ----------
+        remove_n : int
+            Number of the most frequent tokens that will be removed.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            Mapping of old token ids to new token ids, -1 for removed tokens.
+
+        """
+        return self.filter_tokens(bad_ids=np.argsort(-self.dfs, kind='mergesort')[:remove_n])
+
+    def filter_tokens(self, bad_ids=None, good_ids=None):
+        """Remove the selected `bad_ids` tokens, or keep only the `good_ids` tokens.
+
+        Remaining tokens are renumbered to `0..N-1`, keeping their relative order.
+
+        Parameters
+        ----------
+        bad_ids : iterable of int, optional
+            Collection of word ids to be removed.
+        good_ids : collection of int, optional
+            Keep selected collection of word ids and remove the rest.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            Mapping of old token ids to new token ids, -1 for removed tokens.
+
+        """
+        keep = np.ones(len(self), dtype=bool)
+        if bad_ids is not None:
+            keep &= ~ids_mask(bad_ids, len(self))
+        if good_ids is not None:
+            keep &= ids_mask(good_ids, len(self))
+
+        old2new = np.cumsum(keep, dtype=np.int64) - 1
+        old2new[~keep] = -1
+        lengths = np.diff(self.token_offsets)
+        self.token_bytes = self.token_bytes[np.repeat(keep, lengths)]
+        self.token_offsets = np.zeros(int(keep.sum()) + 1, dtype=np.int64)
+        np.cumsum(lengths[keep], out=self.token_offsets[1:])
+        self.dfs, self.cfs = self.dfs[keep], self.cfs[keep]
+        self.token_hashes = self.token_hashes[keep]
+        self.hash_table = self._build_hash_table(self.token_hashes.astype(np.int64))
+        logger.info("resulting dictionary: %s", self)
+        return old2new
+
+    def compactify(self):
+        """No-op, token ids of a :class:`~gensim.corpora.compactdictionary.CompactDictionary` never have gaps.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            Identity mapping of old token ids to new token ids.
+
+        """
+        return np.arange(len(self), dtype=np.int64)
+
+    def to_dictionary(self):
+        """Convert back into a regular, updatable :class:`~gensim.corpora.dictionary.Dictionary`.
+
+        Returns
+        -------
+        :class:`~gensim.corpora.dictionary.Dictionary`
+            Dictionary with the same tokens, ids and statistics.
+
+        """
+        result = Dictionary()
+        result.token2id = {self[tokenid]: tokenid for tokenid in range(len(self))}
+        result.dfs = dict(enumerate(self.dfs.tolist()))
+        result.cfs = dict(enumerate(self.cfs.tolist()))
+        result.num_docs, result.num_pos, result.num_nnz = self.num_docs, self.num_pos, self.num_nnz
+        return result
@@ -0,0 +1,547 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Block-compressed container for serialized corpora, with random access to documents.
+
+Notes
+-----
+Corpora serialized to a `.gz` or `.bz2` file cannot be indexed, because `corpus[i]` has to seek to the byte offset
+of document `i`, and a compressed stream can only be read from its start.
+:class:`~gensim.corpora.compressedcorpus.BlockCompressedCorpus` instead stores the output of any indexed corpus
+serializer (:class:`~gensim.corpora.mmcorpus.MmCorpus` by default) compressed in independent blocks of
+`docs_per_block` documents, followed by a table of block positions. The layout of the file is::
+
+    header        magic, codec name, name of the serializer class
+    blocks        compressed blocks, each holding whole documents of the serialized text
+    block table   int64[num_blocks + 1] uncompressed start offsets, int64[num_blocks + 1] file offsets
+    trailer       num_blocks and the position of the block table (little-endian int64)
+
+To read `corpus[i]`, only the block holding document `i` is decompressed. When iterating, the next blocks are
+decompressed in background threads, which run in parallel because the decompressors release the GIL.
+
+Blocks are compressed with `zstd <https://facebook.github.io/zstd/>`_ if the `zstandard` package is installed, or
+with `zlib` otherwise. `lz4` (package `lz4`) is also supported, for the fastest decompression.
+
+Examples
+--------
+.. sourcecode:: pycon
+
+    >>> from gensim.corpora import BlockCompressedCorpus, MmCorpus
+    >>> from gensim.test.utils import datapath, get_tmpfile
+    >>>
+    >>> output_fname = get_tmpfile("corpus.mm.blk")
+    >>> BlockCompressedCorpus.serialize(output_fname, MmCorpus(datapath('testcorpus.mm')), docs_per_block=4)
+    >>>
+    >>> corpus = BlockCompressedCorpus(output_fname)
+    >>> corpus[3]
+    [(1, 1.0), (5, 2.0), (8, 1.0)]
+
+"""
+
+from __future__ import with_statement
+
+import importlib
+import logging
+import os
+import struct
+import zlib
+from collections import deque
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+import six
+
+from gensim import utils
+from gensim.corpora import IndexedCorpus
+
+if six.PY2:
+    from inspect import getargspec
+else:
+    from inspect import getfullargspec as getargspec
+
+logger = logging.getLogger(__name__)
+
+HEADER_FORMAT = '<8s8sq'
+TRAILER_FORMAT = '<qq'
+MAGIC = b'GSMBLK01'
+
+#: Available block codecs, as {name: (compress(data, level), decompress(data))}.
+CODECS = {
+    'zlib': (lambda data, level: zlib.compress(data, 6 if level is None else level), zlib.decompress),
+}
+
+try:
+    import zstandard
+    CODECS['zstd'] = (
+        lambda data, level: zstandard.ZstdCompressor(level=3 if level is None else level).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+except ImportError:
+    pass
+
+try:
+    import lz4.frame
+    CODECS['lz4'] = (
+        lambda data, level: lz4.frame.compress(data, compression_level=0 if level is None else level),
+        lz4.frame.decompress,
+    )
+except ImportError:
+    pass
+
+
+class BlockCompressedCorpus(IndexedCorpus):
+    """Corpus serialized by another corpus class, stored compressed in independently decompressible blocks.
+
+    Attributes
+    ----------
+    serializer : str
+        Full name of the class of the serialized format inside the blocks, such as
+        `'gensim.corpora.mmcorpus.MmCorpus'`, see also `corpus_class`.
+    codec : str
+        Compression codec of the blocks, one of :const:`~gensim.corpora.compressedcorpus.CODECS`.
+    raw_starts : numpy.ndarray of int64
+        Block `i` holds bytes `raw_starts[i]:raw_starts[i + 1]` of the serialized (uncompressed) corpus.
+    block_starts : numpy.ndarray of int64
+        Block `i` is stored in bytes `block_starts[i]:block_starts[i + 1]` of the file.
+
+    """
+    def __init__(self, fname, workers=1, index_fname=None, **kwargs):
+        """
+
+        Parameters
+        ----------
+        fname : str
+            Path to the compressed corpus.
+        workers : int, optional
+            Number of blocks decompressed in parallel while iterating over the corpus.
+        index_fname : str, optional
+            Path to the document index, `fname.index` by default.
+        **kwargs
+            Passed to the constructor of `corpus_class`, such as `id2word` for
+            :class:`~gensim.corpora.lowcorpus.LowCorpus`. The vocabulary file `fname.vocab`, if any, is passed as
+            `fname_vocab` to the classes that accept it.
+
+        """
+        IndexedCorpus.__init__(self, fname, index_fname)
+        self.fname = fname
+        self.workers = workers
+        self.kwargs = kwargs
+        with open(fname, 'rb') as fin:
+            header = fin.read(struct.calcsize(HEADER_FORMAT))
+            magic, codec, name_len = struct.unpack(HEADER_FORMAT, header)
+            if magic != MAGIC:
+                raise ValueError("%s is not a block-compressed corpus" % fname)
+            class_name = utils.to_unicode(fin.read(name_len))
+            fin.seek(-struct.calcsize(TRAILER_FORMAT), os.SEEK_END)
+            num_blocks, table_offset = struct.unpack(TRAILER_FORMAT, fin.read(struct.calcsize(TRAILER_FORMAT)))
+            fin.seek(table_offset)
+            table = np.frombuffer(fin.read(16 * (num_blocks + 1)), dtype='<i8').astype(np.int64)
+        self.codec = utils.to_unicode(codec.rstrip(b'\0'))
+        if self.codec not in CODECS:
+            raise ImportError("%s is compressed with %s, which is not installed" % (fname, self.codec))
+        self.serializer = class_name
+        self.raw_starts, self.block_starts = table[:num_blocks + 1], table[num_blocks + 1:]
+        self._reader = None
+
+        fname_vocab = utils.smart_extension(fname, '.vocab')
+        if 'fname_vocab' in getargspec(self.corpus_class.__init__)[0] and 'fname_vocab' not in kwargs \
+                and os.path.exists(fname_vocab):
+            self.kwargs['fname_vocab'] = fname_vocab
+
+    @property
+    def corpus_class(self):
+        """Class of the serialized format inside the blocks."""
+        module_name, _, name = self.serializer.rpartition('.')
+        return getattr(importlib.import_module(module_name), name)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_reader'] = None
+        return state
+
+    def save(self, *args, **kwargs):
+        """Save the corpus object (not the corpus data!), without the open block reader."""
+        kwargs['ignore'] = frozenset(kwargs.get('ignore', ())) | {'_reader'}
+        super(BlockCompressedCorpus, self).save(*args, **kwargs)
+
+    def __str__(self):
+        return "%s<%i blocks of %s, %s>" % (
+            self.__class__.__name__, len(self.raw_starts) - 1, self.corpus_class.__name__, self.codec
+        )
+
+    def open(self, workers=1):
+        """Open the uncompressed contents of the corpus as a file-like object.
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of blocks decompressed ahead in background threads, when reading sequentially.
+
+        Returns
+        -------
+        :class:`~gensim.corpora.compressedcorpus.BlockFile`
+            Read-only, seekable view of the serialized corpus.
+
+        """
+        return BlockFile(self.fname, self.codec, self.raw_starts, self.block_starts, workers=workers)
+
+    def _open_corpus(self, fileobj):
+        """Instance of `corpus_class` reading from `fileobj`."""
+        return self.corpus_class(fileobj, **self.kwargs)
+
+    def __iter__(self):
+        """Iterate over the corpus, decompressing `self.workers` blocks at a time.
+
+        Yields
+        ------
+        list of (int, number)
+            Document in BoW format.
+
+        """
+        fileobj = self.open(self.workers)
+        try:
+            for doc in self._open_corpus(fileobj):
+                yield doc
+        finally:
+            fileobj.release()
+
+    def __len__(self):
+        if self.index is not None:
+            return len(self.index)
+        if self.length is None:
+            fileobj = self.open(self.workers)
+            try:
+                self.length = len(self._open_corpus(fileobj))
+            finally:
+                fileobj.release()
+        return self.length
+
+    def docbyoffset(self, offset):
+        """Get the document stored at `offset` in the uncompressed serialized corpus.
+
+        Only the block holding the document is decompressed; the most recently used block is kept in memory.
+
+        Parameters
+        ----------
+        offset : int
+            Offset of the document, as stored in `self.index`.
+
+        Returns
+        -------
+        list of (int, number)
+            Document in BoW format.
+
+        """
+        if getattr(self, '_reader', None) is None:
+            self._reader = self._open_corpus(self.open())
+        return self._reader.docbyoffset(offset)
+
+    @staticmethod
+    def save_corpus(fname, corpus, id2word=None, progress_cnt=None, metadata=False, serializer=None, codec=None,
+                    level=None, docs_per_block=1000, workers=1):
+        """Serialize `corpus` with `serializer`, then compress the result in blocks.
+
+        This function is automatically called by
+        :meth:`~gensim.corpora.compressedcorpus.BlockCompressedCorpus.serialize`, don't call it directly,
+        call :meth:`~gensim.corpora.compressedcorpus.BlockCompressedCorpus.serialize` instead.
+
+        Parameters
+        ----------
+        fname : str
+            Path to output file.
+        corpus : iterable of list of (int, number)
+            Input corpus in BoW format.
+        id2word : dict of (str, str), optional
+            Mapping id -> word, passed to `serializer`.
+        progress_cnt : int, optional
+            Log progress every `progress_cnt` documents.
+        metadata : bool, optional
+            Passed to `serializer`.
+        serializer : type, optional
+            Corpus class that writes the serialized text, :class:`~gensim.corpora.mmcorpus.MmCorpus` by default.
+        codec : {'zstd', 'lz4', 'zlib'}, optional
+            Compression codec, zstd if available, zlib otherwise.
+        level : int, optional
+            Compression level, codec default if None.
+        docs_per_block : int, optional
+            Number of documents in each compressed block. Larger blocks compress better, but `corpus[i]` has to
+            decompress a whole block.
+        workers : int, optional
+            Number of blocks compressed in parallel.
+
+        Returns
+        -------
+        list of int
+            Offsets of the documents in the uncompressed serialized corpus.
+
+        """
+        if serializer is None:
+            from gensim.corpora.mmcorpus import MmCorpus
+            serializer = MmCorpus
+        if codec is None:
+            codec = 'zstd' if 'zstd' in CODECS else 'zlib'
+        if codec not in CODECS:
+            raise ValueError("unknown or unavailable codec %r, choose one of %s" % (codec, sorted(CODECS)))
+
+        logger.info("serializing corpus with %s into block-compressed %s", serializer.__name__, fname)
+        kwargs = {'metadata': metadata}
+        if progress_cnt is not None:
+            kwargs['progress_cnt'] = progress_cnt
+        offsets = serializer.save_corpus(fname, corpus, id2word, **kwargs)
+
+        # cut the blocks at document boundaries, so that reading a document decompresses a single block
+        size = os.path.getsize(fname)
+        if offsets is not None:
+            starts = np.unique([offset for offset in offsets if offset >= 0])
+            boundaries = [0] + [int(start) for start in starts[docs_per_block::docs_per_block]] + [size]
+        else:
+            boundaries = list(range(0, size, 4 * 1024 ** 2)) + [size]
+        compress_file(fname, fname + '.blocks', boundaries, serializer, codec=codec, level=level, workers=workers)
+        os.rename(fname + '.blocks', fname)
+        return offsets
+
+    @classmethod
+    def serialize(cls, fname, corpus, id2word=None, index_fname=None, progress_cnt=None, labels=None,
+                  metadata=False, **kwargs):
+        """Serialize `corpus` with a block-compressed corpus serializer, and save its document index.
+
+        Parameters
+        ----------
+        fname : str
+            Path to output file.
+        corpus : iterable of list of (int, number)
+            Input corpus in BoW format.
+        id2word : dict of (str, str), optional
+            Mapping id -> word, passed to the serializer.
+        index_fname : str, optional
+            Where to save the document index, `fname.index` by default.
+        progress_cnt : int, optional
+            Log progress every `progress_cnt` documents.
+        labels : bool, optional
+            Ignored, for compatibility with :meth:`~gensim.corpora.indexedcorpus.IndexedCorpus.serialize`.
+        metadata : bool, optional
+            Passed to the serializer.
+        **kwargs
+            Compression options, see :meth:`~gensim.corpora.compressedcorpus.BlockCompressedCorpus.save_corpus`.
+
+        """
+        if getattr(corpus, 'fname', None) == fname:
+            raise ValueError("identical input vs. output corpus filename, refusing to serialize: %s" % fname)
+        offsets = cls.save_corpus(fname, corpus, id2word, progress_cnt=progress_cnt, metadata=metadata, **kwargs)
+        if offsets is None:
+            logger.warning("serializer doesn't support indexing, %s will be iterable only", fname)
+            return
+        if index_fname is None:
+            index_fname = utils.smart_extension(fname, '.index')
+        logger.info("saving %s index to %s", cls.__name__, index_fname)
+        utils.pickle(offsets, index_fname)
+
+
+def compress_file(fname, output_fname, boundaries, serializer, codec='zlib', level=None, workers=1):
+    """Compress the serialized corpus `fname` into a block-compressed container.
+
+    Parameters
+    ----------
+    fname : str
+        Path to the uncompressed serialized corpus.
+    output_fname : str
+        Path to the output container.
+    boundaries : list of int
+        Block `i` holds bytes `boundaries[i]:boundaries[i + 1]` of `fname`.
+    serializer : type
+        Corpus class that serialized `fname`, which will be used to read the blocks back.
+    codec : str, optional
+        Compression codec, see :const:`~gensim.corpora.compressedcorpus.CODECS`.
+    level : int, optional
+        Compression level, codec default if None.
+    workers : int, optional
+        Number of blocks compressed in parallel.
+
+    """
+    compress = CODECS[codec][0]
+    class_name = ('%s.%s' % (serializer.__module__, serializer.__name__)).encode('utf8')
+
+    def read_blocks():
+        with open(fname, 'rb') as fin:
+            for start, end in zip(boundaries, boundaries[1:]):
+                yield fin.read(end - start)
+
+    pool = ThreadPool(workers) if workers > 1 else None
+    raw_size = boundaries[-1]
+    block_starts = []
+    try:
+        with open(output_fname, 'wb') as fout:
+            fout.write(struct.pack(HEADER_FORMAT, MAGIC, codec.encode('ascii'), len(class_name)))
+            fout.write(class_name)
+            for batch in utils.grouper(read_blocks(), max(1, workers) * 4):
+                compressed = pool.map(lambda data: compress(data, level), batch) if pool \
+                    else [compress(data, level) for data in batch]
+                for block in compressed:
+                    block_starts.append(fout.tell())
+                    fout.write(block)
+            block_starts.append(fout.tell())
+            table_offset = fout.tell()
+            fout.write(np.asarray(boundaries, dtype='<i8').tobytes())
+            fout.write(np.asarray(block_starts, dtype='<i8').tobytes())
+            fout.write(struct.pack(TRAILER_FORMAT, len(boundaries) - 1, table_offset))
+            compressed_size = fout.tell()
+    finally:
+        if pool is not None:
+            pool.terminate()
+    logger.info(
+        "compressed %i bytes into %i blocks of %i bytes with %s (%.1fx)",
+        raw_size, len(boundaries) - 1, compressed_size, codec, raw_size / float(max(1, compressed_size))
+    )
+
+
+class BlockFile(object):
+    """Read-only, seekable file-like object over the uncompressed contents of a block-compressed container.
+
+    Supports `read`, `readline`, line iteration, `seek` and `tell`, which is what the corpus readers need.
+    Calling `close` only rewinds the file, so that corpus readers which close their input after each pass
+    can read it again; use `release` to free the underlying file and threads.
+
+    """
+    def __init__(self, fname, codec, raw_starts, block_starts, workers=1):
+        """
+
+        Parameters
+        ----------
+        fname : str
+            Path to the container.
+        codec : str
+            Compression codec of the blocks.
+        raw_starts : numpy.ndarray of int64
+            Uncompressed start offsets of the blocks, plus the total size.
+        block_starts : numpy.ndarray of int64
+            File offsets of the blocks, plus the end of the last block.
+        workers : int, optional
+            Number of blocks decompressed ahead in background threads, when reading sequentially.
+
+        """
+        self.fname = fname
+        self.decompress = CODECS[codec][1]
+        self.raw_starts, self.block_starts = raw_starts, block_starts
+        self.workers = workers
+        self.fin = open(fname, 'rb')
+        self.pool = ThreadPool(workers) if workers > 1 else None
+        self.pending = {}
+        self.block_no, self.buf, self.buf_start = None, b'', 0
+        self.pos = 0
+        self.size = int(raw_starts[-1])
+        self.lines, self.lines_pos = None, None
+
+    def _read_block(self, block_no):
+        self.fin.seek(self.block_starts[block_no])
+        return self.fin.read(self.block_starts[block_no + 1] - self.block_starts[block_no])
+
+    def _load(self, block_no):
+        """Make block `block_no` the current block, scheduling decompression of the following ones."""
+        if self.pool is None:
+            self.buf = self.decompress(self._read_block(block_no))
+        else:
+            ahead = range(block_no, min(block_no + self.workers, len(self.raw_starts) - 1))
+            self.pending = {no: result for no, result in self.pending.items() if no in ahead}
+            for no in ahead:
+                if no not in self.pending:
+                    self.pending[no] = self.pool.apply_async(self.decompress, (self._read_block(no),))
+            self.buf = self.pending.pop(block_no).get()
+        self.block_no, self.buf_start = block_no, int(self.raw_starts[block_no])
+
+    def _current(self):
+        """Uncompressed data of the current block, positioned at `self.pos`; empty at end of file."""
+        if self.pos >= self.size:
+            return b'', 0
+        if self.block_no is None or not self.buf_start <= self.pos < self.buf_start + len(self.buf):
+            self._load(int(np.searchsorted(self.raw_starts, self.pos, side='right')) - 1)
+        return self.buf, self.pos - self.buf_start
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.size - self.pos
+        pieces = []
+        while size > 0:
+            buf, start = self._current()
+            piece = buf[start:start + size]
+            if not piece:
+                break
+            pieces.append(piece)
+            self.pos += len(piece)
+            size -= len(piece)
+        return b''.join(pieces)
+
+    def readline(self, size=-1):
+        pieces = []
+        while True:
+            buf, start = self._current()
+            if not buf:
+                break
+            end = buf.find(b'\n', start)
+            end = len(buf) if end < 0 else end + 1
+            pieces.append(buf[start:end])
+            self.pos += end - start
+            if end < len(buf) or buf[end - 1:end] == b'\n':
+                break
+        return b''.join(pieces)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        # fast path for line iteration: split the rest of the current block into lines once
+        if not self.lines or self.lines_pos != self.pos:
+            buf, start = self._current()
+            self.lines = deque(buf[start:].splitlines(True))
+        if not self.lines:
+            raise StopIteration
+        line = self.lines.popleft()
+        self.pos += len(line)
+        self.lines_pos = self.pos
+        if not line.endswith(b'\n'):
+            line += self.readline()  # the line continues in the next block
+        return line
+
+    next = __next__  # python 2
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self.pos
+        elif whence == os.SEEK_END:
+            offset += self.size
+        self.pos = max(0, int(offset))
+        return self.pos
+
+    def tell(self):
+        return self.pos
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        """Rewind to the start, keeping the file open (see the class docstring)."""
+        self.seek(0)
+
+    def release(self):
+        """Close the underlying file and stop the decompression threads."""
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool = None
+        self.pending = {}
+        self.fin.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.release()
+        except Exception:
+            pass
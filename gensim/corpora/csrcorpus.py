@@ -0,0 +1,398 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Corpus stored as binary CSR arrays in a single memory-mapped file.
+
+Notes
+-----
+Text formats such as :class:`~gensim.corpora.mmcorpus.MmCorpus` have to parse every number again on each pass
+over the corpus. :class:`~gensim.corpora.csrcorpus.CsrCorpus` stores the document-term matrix in its binary
+`CSR <https://docs.scipy.org/doc/scipy/reference/generated/scipy.sparse.csr_matrix.html>`_ form instead,
+documents as rows. The file layout is::
+
+    header        64 bytes: magic, num_docs, num_terms, num_nnz (little-endian int64)
+    indices       int32[num_nnz], term ids
+    data          float32[num_nnz], term weights
+    indptr        int64[num_docs + 1], document i is stored in positions indptr[i]:indptr[i + 1]
+
+The file is memory-mapped on load, so opening a corpus is instant regardless of its size, `corpus[i]` is O(1)
+without any separate index file, and consecutive documents can be retrieved as a `scipy.sparse.csr_matrix`
+without copying with :meth:`~gensim.corpora.csrcorpus.CsrCorpus.csr`.
+
+Weights are stored as float32, so float64 weights lose precision.
+
+Examples
+--------
+.. sourcecode:: pycon
+
+    >>> from gensim.corpora import CsrCorpus, MmCorpus
+    >>> from gensim.test.utils import datapath, get_tmpfile
+    >>>
+    >>> output_fname = get_tmpfile("corpus.csr")
+    >>> CsrCorpus.serialize(output_fname, MmCorpus(datapath('testcorpus.mm')))
+    >>>
+    >>> corpus = CsrCorpus(output_fname)
+    >>> corpus[3]
+    [(1, 1.0), (5, 2.0), (8, 1.0)]
+    >>> corpus.csr(2, 4).shape
+    (2, 12)
+
+"""
+
+from __future__ import with_statement
+
+import logging
+import shutil
+import struct
+import tempfile
+
+import numpy as np
+import scipy.sparse
+import six
+
+from gensim import matutils, utils
+from gensim.corpora import IndexedCorpus
+
+logger = logging.getLogger(__name__)
+
+HEADER_FORMAT = '<8sqqq'
+HEADER_SIZE = 64
+MAGIC = b'GSMCSR01'
+
+
+class CsrCorpus(IndexedCorpus):
+    """Corpus stored as binary CSR arrays (int64 `indptr`, int32 `indices`, float32 `data`) in one file.
+
+    Attributes
+    ----------
+    num_docs : int
+        Number of documents.
+    num_terms : int
+        Number of features (terms, topics).
+    num_nnz : int
+        Number of non-zero elements.
+    indptr : numpy.memmap of int64
+        Document `i` is stored in positions `indptr[i]:indptr[i + 1]` of `indices` and `data`.
+    indices : numpy.memmap of int32
+        Term ids of all documents, concatenated.
+    data : numpy.memmap of float32
+        Term weights of all documents, concatenated.
+
+    """
+    def __init__(self, fname):
+        """
+
+        Parameters
+        ----------
+        fname : str
+            Path to a file created by :meth:`~gensim.corpora.csrcorpus.CsrCorpus.serialize`.
+
+        """
+        logger.info("loading corpus from %s", fname)
+        self.fname = fname
+        self.length = None
+        self._open()
+
+    @property
+    def index(self):
+        """numpy.ndarray of int: Document numbers, which serve as document offsets in this format."""
+        return np.arange(self.num_docs)
+
+    @index.setter
+    def index(self, value):
+        # the index is implicit in `indptr` and cannot be replaced
+        pass
+
+    def _open(self):
+        """Memory-map the arrays stored in `self.fname`."""
+        with open(self.fname, 'rb') as fin:
+            header = fin.read(struct.calcsize(HEADER_FORMAT))
+        if not header:
+            # empty file = empty corpus
+            header = struct.pack(HEADER_FORMAT, MAGIC, 0, 0, 0)
+        if len(header) < struct.calcsize(HEADER_FORMAT):
+            raise ValueError("%s is not a CsrCorpus file" % self.fname)
+        magic, self.num_docs, self.num_terms, self.num_nnz = struct.unpack(HEADER_FORMAT, header)
+        if magic != MAGIC:
+            raise ValueError("%s is not a CsrCorpus file" % self.fname)
+        self.indices, self.data, self.indptr = _map_arrays(self.fname, self.num_docs, self.num_nnz)
+
+    def __getstate__(self):
+        # don't pickle the memory-mapped arrays (would copy them into the pickle), map the file again instead
+        state = self.__dict__.copy()
+        for attr in ('indices', 'data', 'indptr'):
+            state.pop(attr, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._open()
+
+    def __len__(self):
+        """Get the number of documents."""
+        return self.num_docs
+
+    def __str__(self):
+        return "CsrCorpus(%i documents, %i features, %i non-zero entries)" % (
+            self.num_docs, self.num_terms, self.num_nnz
+        )
+
+    def __iter__(self):
+        """Iterate through all documents.
+
+        Yields
+        ------
+        list of (int, float)
+            Document in BoW format.
+
+        """
+        indptr, indices, data = self.indptr, self.indices, self.data
+        # convert in blocks, to amortize the numpy -> python conversion over many documents
+        for start in range(0, self.num_docs, 10000):
+            stop = min(start + 10000, self.num_docs)
+            bounds = (indptr[start:stop + 1] - indptr[start]).tolist()
+            block_indices = indices[indptr[start]:indptr[stop]].tolist()
+            block_data = data[indptr[start]:indptr[stop]].tolist()
+            for docstart, docend in zip(bounds[:-1], bounds[1:]):
+                yield list(zip(block_indices[docstart:docend], block_data[docstart:docend]))
+
+    def docbyoffset(self, docno):
+        """Get the document number `docno`.
+
+        Parameters
+        ----------
+        docno : int
+            Position of the document in the corpus; no separate offsets are needed in this format.
+
+        Returns
+        -------
+        list of (int, float)
+            Document in BoW format.
+
+        """
+        start, end = self.indptr[docno], self.indptr[docno + 1]
+        return list(zip(self.indices[start:end].tolist(), self.data[start:end].tolist()))
+
+    def __getitem__(self, docno):
+        """Get document by `docno` index, in O(1).
+
+        Parameters
+        ----------
+        docno : {int, slice, iterable of int}
+            Document number or numbers.
+
+        Returns
+        -------
+        list of (int, float)
+            If `docno` is int - return document in BoW format.
+
+        :class:`~gensim.utils.SlicedCorpus`
+            If `docno` is a slice or iterable of int - return several documents in BoW format
+            wrapped to :class:`~gensim.utils.SlicedCorpus`. For a sparse matrix, use
+            :meth:`~gensim.corpora.csrcorpus.CsrCorpus.csr` instead.
+
+        """
+        if isinstance(docno, (slice, list, np.ndarray)):
+            return utils.SlicedCorpus(self, docno)
+        elif isinstance(docno, six.integer_types + (np.integer,)):
+            if docno < 0:
+                docno += self.num_docs
+            if not 0 <= docno < self.num_docs:
+                raise IndexError("document %i out of range for corpus of %i documents" % (docno, self.num_docs))
+            return self.docbyoffset(docno)
+        else:
+            raise ValueError('Unrecognised value for docno, use either a single integer, a slice or a numpy.ndarray')
+
+    def csr(self, start=None, stop=None):
+        """Get the documents `start:stop` as a sparse matrix, without copying their terms and weights.
+
+        Parameters
+        ----------
+        start : int, optional
+            First document, 0 by default.
+        stop : int, optional
+            One past the last document, `len(self)` by default.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Matrix of shape (`stop - start`, `num_terms`), documents as rows, backed by the memory-mapped file.
+
+        """
+        start, stop, _ = slice(start, stop).indices(self.num_docs)
+        stop = max(start, stop)
+        indptr = self.indptr[start:stop + 1]
+        begin, end = indptr[0], indptr[-1]
+        return scipy.sparse.csr_matrix(
+            (self.data[begin:end], self.indices[begin:end], indptr - begin),
+            shape=(stop - start, self.num_terms), copy=False
+        )
+
+    def iter_csc_chunks(self, chunksize=2000, num_terms=None, dtype=np.float64):
+        """Iterate over the corpus in chunks of documents, each as one sparse matrix.
+
+        The chunks are transposed views of :meth:`~gensim.corpora.csrcorpus.CsrCorpus.csr`, so only a change of
+        `dtype` copies the stored weights.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of documents in each chunk (only the last chunk may be smaller).
+        num_terms : int, optional
+            Number of terms = number of rows of each chunk, `self.num_terms` by default.
+        dtype : data-type, optional
+            Data type of the output matrices.
+
+        Yields
+        ------
+        scipy.sparse.csc_matrix
+            Chunk of shape (`num_terms`, number of documents in the chunk), documents as columns.
+
+        """
+        if num_terms is None:
+            num_terms = self.num_terms
+        for start in range(0, self.num_docs, chunksize):
+            rows = self.csr(start, start + chunksize)
+            yield scipy.sparse.csc_matrix(
+                (rows.data.astype(dtype, copy=False), rows.indices, rows.indptr),
+                shape=(num_terms, rows.shape[0]), copy=False
+            )
+
+    @classmethod
+    def serialize(serializer, fname, corpus, id2word=None, index_fname=None,
+                  progress_cnt=None, labels=None, metadata=False):
+        """Store `corpus` in the binary CSR format.
+
+        Unlike the other :class:`~gensim.corpora.indexedcorpus.IndexedCorpus` formats,
+        no separate index file is created: the `indptr` array stored in the file already is the index.
+
+        Parameters
+        ----------
+        fname : str
+            Path to output file.
+        corpus : {iterable of iterable of (int, float), scipy.sparse.csc}
+            Corpus in BoW format, or a sparse matrix of shape (`num_terms`, `num_documents`).
+            Sparse matrices, :class:`~gensim.matutils.Sparse2Corpus` and other
+            :class:`~gensim.corpora.csrcorpus.CsrCorpus` are stored directly, without iterating over documents.
+        id2word : dict of (int, str), optional
+            Mapping id -> word, used to determine the number of features.
+            Otherwise, it's taken from `corpus.num_terms` or the highest feature id in `corpus`.
+        index_fname : str, optional
+            Ignored, the format needs no index.
+        progress_cnt : int, optional
+            Number of documents after which progress info is logged.
+        labels : optional
+            Ignored, here for compatibility with :meth:`~gensim.corpora.indexedcorpus.IndexedCorpus.serialize`.
+        metadata : bool, optional
+            Ignored, here for compatibility with :meth:`~gensim.corpora.indexedcorpus.IndexedCorpus.serialize`.
+
+        """
+        if getattr(corpus, 'fname', None) == fname:
+            raise ValueError("identical input vs. output corpus filename, refusing to serialize: %s" % fname)
+        kwargs = {}
+        if progress_cnt is not None:
+            kwargs['progress_cnt'] = progress_cnt
+        serializer.save_corpus(fname, corpus, id2word=id2word, **kwargs)
+
+    @staticmethod
+    def save_corpus(fname, corpus, id2word=None, progress_cnt=10000, metadata=False, chunksize=10000):
+        """Save a corpus in the binary CSR format.
+
+        Warnings
+        --------
+        This function is automatically called by :meth:`~gensim.corpora.csrcorpus.CsrCorpus.serialize`,
+        don't call it directly, call :meth:`~gensim.corpora.csrcorpus.CsrCorpus.serialize` instead.
+
+        Parameters
+        ----------
+        fname : str
+            Path to output file.
+        corpus : {iterable of iterable of (int, float), scipy.sparse.csc}
+            Input corpus.
+        id2word : dict of (int, str), optional
+            Mapping id -> word, used to determine the number of features.
+        progress_cnt : int, optional
+            Number of documents after which progress info is logged.
+        metadata : bool, optional
+            Ignored.
+        chunksize : int, optional
+            Number of documents converted to arrays at once, when streaming a BoW corpus.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            Position of the first term of each document in the stored arrays.
+
+        """
+        logger.info("storing corpus in binary CSR format to %s", fname)
+        num_terms = len(id2word) if id2word is not None else getattr(corpus, 'num_terms', None)
+        if isinstance(corpus, CsrCorpus):
+            corpus = corpus.csr().T
+        elif isinstance(corpus, matutils.Sparse2Corpus):
+            corpus = corpus.sparse
+        if scipy.sparse.issparse(corpus):
+            # documents are columns => the CSC arrays of `corpus` are the CSR arrays of its transpose
+            corpus = corpus.tocsc()
+            corpus.sort_indices()
+            num_terms = max(num_terms or 0, corpus.shape[0])
+            return _write_arrays(fname, corpus.indptr, corpus.indices, corpus.data, num_terms)
+
+        indptr = [0]
+        max_id = -1
+        # spool the data next to the output file, to be appended behind the indices at the end
+        with open(fname, 'wb') as fout, tempfile.TemporaryFile() as fdata:
+            fout.write(b'\0' * HEADER_SIZE)
+            for chunkno, chunk in enumerate(utils.grouper(corpus, chunksize)):
+                if chunkno * chunksize % progress_cnt < chunksize:
+                    logger.info("PROGRESS: saving document #%i", chunkno * chunksize)
+                lengths = np.fromiter(map(len, chunk), dtype=np.int64, count=len(chunk))
+                num_nnz = int(lengths.sum())
+                ids = np.fromiter(
+                    (termid for doc in chunk for termid, _ in doc), dtype=np.int64, count=num_nnz
+                )
+                weights = np.fromiter(
+                    (weight for doc in chunk for _, weight in doc), dtype=np.float32, count=num_nnz
+                )
+                # store each document with its ids in ascending order, like all gensim BoW vectors
+                docnos = np.repeat(np.arange(len(chunk)), lengths)
+                order = np.lexsort((ids, docnos))
+                ids, weights = ids[order], weights[order]
+                if num_nnz:
+                    max_id = max(max_id, int(ids.max()))
+                fout.write(ids.astype(np.int32).tobytes())
+                fdata.write(weights.tobytes())
+                indptr.extend((np.cumsum(lengths) + indptr[-1]).tolist())
+            fdata.seek(0)
+            shutil.copyfileobj(fdata, fout)
+            indptr = np.array(indptr, dtype=np.int64)
+            fout.write(indptr.tobytes())
+            num_terms = max(num_terms or 0, max_id + 1)
+            fout.seek(0)
+            fout.write(struct.pack(HEADER_FORMAT, MAGIC, len(indptr) - 1, num_terms, indptr[-1]))
+        logger.info("saved %ix%i matrix with %i non-zero entries", len(indptr) - 1, num_terms, indptr[-1])
+        return indptr[:-1]
+
+
+def _map_arrays(fname, num_docs, num_nnz):
+    """Memory-map the `indices`, `data` and `indptr` arrays of a CSR corpus file."""
+    if not num_docs:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32), np.zeros(1, dtype=np.int64)
+    indices = np.memmap(fname, dtype=np.int32, mode='r', offset=HEADER_SIZE, shape=(num_nnz,))
+    data = np.memmap(fname, dtype=np.float32, mode='r', offset=HEADER_SIZE + 4 * num_nnz, shape=(num_nnz,))
+    indptr = np.memmap(fname, dtype=np.int64, mode='r', offset=HEADER_SIZE + 8 * num_nnz, shape=(num_docs + 1,))
+    return indices, data, indptr
+
+
+def _write_arrays(fname, indptr, indices, data, num_terms):
+    """Store complete CSR arrays in the CSR corpus format."""
+    indptr = np.asarray(indptr, dtype=np.int64)
+    num_docs, num_nnz = len(indptr) - 1, int(indptr[-1])
+    with open(fname, 'wb') as fout:
+        fout.write(struct.pack(HEADER_FORMAT, MAGIC, num_docs, num_terms, num_nnz).ljust(HEADER_SIZE, b'\0'))
+        fout.write(np.asarray(indices[:num_nnz], dtype=np.int32).tobytes())
+        fout.write(np.asarray(data[:num_nnz], dtype=np.float32).tobytes())
+        fout.write(indptr.tobytes())
+    logger.info("saved %ix%i matrix with %i non-zero entries", num_docs, num_terms, num_nnz)
+    return indptr[:-1]
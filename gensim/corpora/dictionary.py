@@ -13,10 +13,13 @@ import sys
 import logging
 import itertools
 
+import numpy as np
+import scipy.sparse
+
 from gensim import utils
 
 from six import PY3, iteritems, iterkeys, itervalues, string_types
-from six.moves import zip, range
+from six.moves import zip, range, map
 
 if sys.version_info[0] >= 3:
     unicode = str
@@ -38,6 +41,8 @@ class Dictionary(utils.SaveLoad, Mapping):
         Reverse mapping for token2id, initialized in a lazy manner to save memory (not created until needed).
     dfs : dict of (int, int)
         Document frequencies: token_id -> how many documents contain this token.
+    cfs : dict of (int, int)
+        Collection frequencies: token_id -> how many instances of this token are contained in the documents.
     num_docs : int
         Number of documents processed.
     num_pos : int
@@ -75,6 +80,7 @@ class Dictionary(utils.SaveLoad, Mapping):
         self.token2id = {}
         self.id2token = {}
         self.dfs = {}
+        self.cfs = {}
 
         self.num_docs = 0
         self.num_pos = 0
@@ -194,15 +200,14 @@ class Dictionary(utils.SaveLoad, Mapping):
             10
 
         """
-        for docno, document in enumerate(documents):
+        for chunk_no, chunk in enumerate(utils.grouper(documents, 10000)):
             # log progress & run a regular check for pruning, once every 10k docs
-            if docno % 10000 == 0:
-                if prune_at is not None and len(self) > prune_at:
-                    self.filter_extremes(no_below=0, no_above=1.0, keep_n=prune_at)
-                logger.info("adding document #%i to %s", docno, self)
+            if prune_at is not None and len(self) > prune_at:
+                self.filter_extremes(no_below=0, no_above=1.0, keep_n=prune_at)
+            logger.info("adding document #%i to %s", chunk_no * 10000, self)
 
-            # update Dictionary with the document
-            self.doc2bow(document, allow_update=True)  # ignore the result, here we only care about updating token ids
+            # update Dictionary with the whole chunk at once; ignore the result, we only care about updating token ids
+            self.doc2bow_batch(chunk, allow_update=True)
 
         logger.info(
             "built %s from %i documents (total %i corpus positions)",
@@ -264,9 +269,10 @@ class Dictionary(utils.SaveLoad, Mapping):
             self.num_pos += sum(itervalues(counter))
             self.num_nnz += len(result)
             # increase document count for each unique token that appeared in the document
-            dfs = self.dfs
-            for tokenid in iterkeys(result):
+            dfs, cfs = self.dfs, self.cfs
+            for tokenid, freq in iteritems(result):
                 dfs[tokenid] = dfs.get(tokenid, 0) + 1
+                cfs[tokenid] = cfs.get(tokenid, 0) + freq
 
         # return tokenids, in ascending id order
         result = sorted(iteritems(result))
@@ -275,6 +281,68 @@ class Dictionary(utils.SaveLoad, Mapping):
         else:
             return result
 
+    def doc2bow_batch(self, documents, allow_update=False):
+        """Convert many `documents` into the bag-of-words format at once, as a sparse matrix.
+
+        Equivalent to calling :meth:`~gensim.corpora.dictionary.Dictionary.doc2bow` on each document in turn,
+        but the per-document counting and sorting is done by vectorized numpy operations over the whole batch,
+        instead of building a Python dict and a list of tuples for every document.
+
+        Parameters
+        ----------
+        documents : iterable of list of str
+            Input documents. The whole batch is held in memory.
+        allow_update : bool, optional
+            Update self, by adding new tokens from `documents` and updating internal corpus statistics.
+
+        Returns
+        -------
+        scipy.sparse.csc_matrix
+            Matrix of token counts of shape (`len(self)`, `len(documents)`), documents as columns (the same layout
+            as :func:`~gensim.matutils.corpus2csc`). Its `indptr`, `indices` and `data` arrays hold the document
+            boundaries, the token ids (ascending within each document) and the token counts, respectively.
+            The matrix can be passed directly to :meth:`~gensim.interfaces.CorpusABC.serialize` and to models
+            that accept a `scipy.sparse` corpus, or wrapped with :class:`~gensim.matutils.Sparse2Corpus`.
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.corpora import Dictionary
+            >>> dct = Dictionary(["máma mele maso".split(), "ema má máma".split()])
+            >>> bows = dct.doc2bow_batch([["máma", "máma", "maso"], ["ema", "this"]])
+            >>> bows.indptr, bows.indices, bows.data
+            (array([0, 2, 3], dtype=int32), array([0, 2, 3], dtype=int32), array([1, 2, 1]))
+
+        """
+        documents = self._check_batch(documents, 'doc2bow_batch')
+
+        if allow_update:
+            token2id = self.token2id
+            documents = [[w if isinstance(w, unicode) else unicode(w, 'utf-8') for w in doc] for doc in documents]
+            for document in documents:
+                # new ids are assigned per document in sorted token order, exactly like in `doc2bow`
+                missing = sorted(set(w for w in document if w not in token2id))
+                for w in missing:
+                    token2id[w] = len(token2id)
+
+        ids, lengths = self._lookup_batch(documents, unknown_word_index=-1)
+        bows = ids2bow_matrix(ids, lengths, len(self.token2id))
+
+        if allow_update:
+            ids, counts = bows.indices, bows.data
+            self.num_docs += len(documents)
+            self.num_pos += int(lengths.sum())
+            self.num_nnz += len(ids)
+            dfs, cfs = self.dfs, self.cfs
+            tokenids, docfreqs = np.unique(ids, return_counts=True)
+            colfreqs = np.bincount(ids, weights=counts)[tokenids].astype(np.int64)
+            for tokenid, docfreq, colfreq in zip(tokenids.tolist(), docfreqs.tolist(), colfreqs.tolist()):
+                dfs[tokenid] = dfs.get(tokenid, 0) + docfreq
+                cfs[tokenid] = cfs.get(tokenid, 0) + colfreq
+
+        return bows
+
     def doc2idx(self, document, unknown_word_index=-1):
         """Convert `document` (a list of words) into a list of indexes = list of `token_id`.
         Replace all unknown words i.e, words not in the dictionary with the index as set via `unknown_word_index`.
@@ -309,6 +377,71 @@ class Dictionary(utils.SaveLoad, Mapping):
         document = [word if isinstance(word, unicode) else unicode(word, 'utf-8') for word in document]
         return [self.token2id.get(word, unknown_word_index) for word in document]
 
+    def doc2idx_batch(self, documents, unknown_word_index=-1):
+        """Convert many `documents` into token ids at once, see :meth:`~gensim.corpora.dictionary.Dictionary.doc2idx`.
+
+        Parameters
+        ----------
+        documents : iterable of list of str
+            Input documents. The whole batch is held in memory.
+        unknown_word_index : int, optional
+            Index to use for words not in the dictionary.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            Document boundaries `indptr` and the concatenated token ids `ids`, so that the ids of document `i`
+            are `ids[indptr[i]:indptr[i + 1]]`, in the same order as the tokens of that document.
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.corpora import Dictionary
+            >>>
+            >>> dct = Dictionary([["a", "a", "b"], ["a", "c"]])
+            >>> dct.doc2idx_batch([["a", "a", "c"], ["not_in_dictionary", "c"]])
+            (array([0, 3, 5]), array([ 0,  0,  2, -1,  2]))
+
+        """
+        documents = self._check_batch(documents, 'doc2idx_batch')
+        ids, lengths = self._lookup_batch(documents, unknown_word_index=unknown_word_index)
+        indptr = np.zeros(len(documents) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        return indptr, ids
+
+    @staticmethod
+    def _check_batch(documents, method):
+        """Materialize `documents` for the batch conversion methods, rejecting plain strings."""
+        documents = list(documents)
+        for document in documents:
+            if isinstance(document, string_types):
+                raise TypeError("%s expects an array of unicode tokens on input, not a single string" % method)
+        return documents
+
+    def _lookup_batch(self, documents, unknown_word_index):
+        """Look up the ids of all tokens in `documents` in one pass.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            Concatenated token ids of all documents and the length of each document.
+
+        """
+        lengths = np.fromiter((len(document) for document in documents), dtype=np.int64, count=len(documents))
+        tokens = list(itertools.chain.from_iterable(documents))
+        ids = np.fromiter(
+            map(self.token2id.get, tokens, itertools.repeat(-1)), dtype=np.int64, count=len(tokens)
+        )
+        # only tokens that were not found can be utf8 bytestrings that need decoding => retry just those
+        get = self.token2id.get
+        for pos in np.flatnonzero(ids < 0).tolist():
+            if not isinstance(tokens[pos], unicode):
+                ids[pos] = get(unicode(tokens[pos], 'utf-8'), -1)
+        if unknown_word_index != -1:
+            ids[ids < 0] = unknown_word_index
+        return ids, lengths
+
     def filter_extremes(self, no_below=5, no_above=0.5, keep_n=100000, keep_tokens=None):
         """Filter out tokens in the dictionary by their frequency.
 
@@ -324,6 +457,12 @@ class Dictionary(utils.SaveLoad, Mapping):
         keep_tokens : iterable of str
             Iterable of tokens that **must** stay in dictionary after filtering.
 
+        Returns
+        -------
+        numpy.ndarray of int64
+            Mapping of old token ids to new token ids, -1 for removed tokens,
+            see :meth:`~gensim.corpora.dictionary.Dictionary.compactify`.
+
         Notes
         -----
         This removes all tokens in the dictionary that are:
@@ -334,7 +473,7 @@ class Dictionary(utils.SaveLoad, Mapping):
 
         After the pruning, resulting gaps in word ids are shrunk.
         Due to this gap shrinking, **the same word may have a different word id before and after the call
-        to this function!**
+        to this function!** Use the returned array to translate existing bag-of-words corpora to the new ids.
 
         Examples
         --------
@@ -346,7 +485,7 @@ class Dictionary(utils.SaveLoad, Mapping):
             >>> dct = Dictionary(corpus)
             >>> len(dct)
             5
-            >>> dct.filter_extremes(no_below=1, no_above=0.5, keep_n=1)
+            >>> old2new = dct.filter_extremes(no_below=1, no_above=0.5, keep_n=1)
             >>> len(dct)
             1
 
@@ -354,31 +493,27 @@ class Dictionary(utils.SaveLoad, Mapping):
         no_above_abs = int(no_above * self.num_docs)  # convert fractional threshold to absolute threshold
 
         # determine which tokens to keep
+        tokens, ids = self._token_arrays()
+        size = self._id_space(ids)
+        dfs = self._freq_array(self.dfs, size)[ids]
+        forced = None
         if keep_tokens:
-            keep_ids = {self.token2id[v] for v in keep_tokens if v in self.token2id}
-            good_ids = [
-                v for v in itervalues(self.token2id)
-                if no_below <= self.dfs.get(v, 0) <= no_above_abs or v in keep_ids
-            ]
-            good_ids.sort(key=lambda x: self.num_docs if x in keep_ids else self.dfs.get(x, 0), reverse=True)
-        else:
-            good_ids = [
-                v for v in itervalues(self.token2id)
-                if no_below <= self.dfs.get(v, 0) <= no_above_abs
-            ]
-            good_ids.sort(key=self.dfs.get, reverse=True)
-        if keep_n is not None:
-            good_ids = good_ids[:keep_n]
-        bad_words = [(self[idx], self.dfs.get(idx, 0)) for idx in set(self).difference(good_ids)]
-        logger.info("discarding %i tokens: %s...", len(self) - len(good_ids), bad_words[:10])
+            forced = ids_mask((self.token2id[v] for v in keep_tokens if v in self.token2id), size)[ids]
+        good = extremes_positions(dfs, self.num_docs, no_below, no_above_abs, keep_n, forced=forced)
+
+        discarded = np.ones(len(ids), dtype=bool)
+        discarded[good] = False
+        bad_words = [(tokens[pos], int(dfs[pos])) for pos in np.flatnonzero(discarded)[:10].tolist()]
+        logger.info("discarding %i tokens: %s...", len(self) - len(good), bad_words)
         logger.info(
             "keeping %i tokens which were in no less than %i and no more than %i (=%.1f%%) documents",
-            len(good_ids), no_below, no_above_abs, 100.0 * no_above
+            len(good), no_below, no_above_abs, 100.0 * no_above
         )
 
         # do the actual filtering, then rebuild dictionary to remove gaps in ids
-        self.filter_tokens(good_ids=good_ids)
+        old2new = self._filter(tokens, ids, size, good_ids=ids[good])
         logger.info("resulting dictionary: %s", self)
+        return old2new
 
     def filter_n_most_frequent(self, remove_n):
         """Filter out the 'remove_n' most frequent tokens that appear in the documents.
@@ -388,6 +523,12 @@ class Dictionary(utils.SaveLoad, Mapping):
         remove_n : int
             Number of the most frequent tokens that will be removed.
 
+        Returns
+        -------
+        numpy.ndarray of int64
+            Mapping of old token ids to new token ids, -1 for removed tokens,
+            see :meth:`~gensim.corpora.dictionary.Dictionary.compactify`.
+
         Examples
         --------
         .. sourcecode:: pycon
@@ -398,21 +539,23 @@ class Dictionary(utils.SaveLoad, Mapping):
             >>> dct = Dictionary(corpus)
             >>> len(dct)
             5
-            >>> dct.filter_n_most_frequent(2)
+            >>> old2new = dct.filter_n_most_frequent(2)
             >>> len(dct)
             3
 
         """
         # determine which tokens to keep
-        most_frequent_ids = (v for v in itervalues(self.token2id))
-        most_frequent_ids = sorted(most_frequent_ids, key=self.dfs.get, reverse=True)
-        most_frequent_ids = most_frequent_ids[:remove_n]
+        tokens, ids = self._token_arrays()
+        size = self._id_space(ids)
+        dfs = self._freq_array(self.dfs, size)[ids]
+        most_frequent = np.argsort(-dfs, kind='mergesort')[:remove_n]
         # do the actual filtering, then rebuild dictionary to remove gaps in ids
-        most_frequent_words = [(self[idx], self.dfs.get(idx, 0)) for idx in most_frequent_ids]
-        logger.info("discarding %i tokens: %s...", len(most_frequent_ids), most_frequent_words[:10])
+        most_frequent_words = [(tokens[pos], int(dfs[pos])) for pos in most_frequent[:10].tolist()]
+        logger.info("discarding %i tokens: %s...", len(most_frequent), most_frequent_words)
 
-        self.filter_tokens(bad_ids=most_frequent_ids)
+        old2new = self._filter(tokens, ids, size, bad_ids=ids[most_frequent])
         logger.info("resulting dictionary: %s", self)
+        return old2new
 
     def filter_tokens(self, bad_ids=None, good_ids=None):
         """Remove the selected `bad_ids` tokens from :class:`~gensim.corpora.dictionary.Dictionary`.
@@ -426,6 +569,12 @@ class Dictionary(utils.SaveLoad, Mapping):
         good_ids : collection of int, optional
             Keep selected collection of word ids and remove the rest.
 
+        Returns
+        -------
+        numpy.ndarray of int64
+            Mapping of old token ids to new token ids, -1 for removed tokens,
+            see :meth:`~gensim.corpora.dictionary.Dictionary.compactify`.
+
         Examples
         --------
         .. sourcecode:: pycon
@@ -436,37 +585,104 @@ class Dictionary(utils.SaveLoad, Mapping):
             >>> dct = Dictionary(corpus)
             >>> 'ema' in dct.token2id
             True
-            >>> dct.filter_tokens(bad_ids=[dct.token2id['ema']])
+            >>> old2new = dct.filter_tokens(bad_ids=[dct.token2id['ema']])
             >>> 'ema' in dct.token2id
             False
             >>> len(dct)
             4
-            >>> dct.filter_tokens(good_ids=[dct.token2id['maso']])
+            >>> old2new = dct.filter_tokens(good_ids=[dct.token2id['maso']])
             >>> len(dct)
             1
 
         """
-        if bad_ids is not None:
-            bad_ids = set(bad_ids)
-            self.token2id = {token: tokenid for token, tokenid in iteritems(self.token2id) if tokenid not in bad_ids}
-            self.dfs = {tokenid: freq for tokenid, freq in iteritems(self.dfs) if tokenid not in bad_ids}
-        if good_ids is not None:
-            good_ids = set(good_ids)
-            self.token2id = {token: tokenid for token, tokenid in iteritems(self.token2id) if tokenid in good_ids}
-            self.dfs = {tokenid: freq for tokenid, freq in iteritems(self.dfs) if tokenid in good_ids}
-        self.compactify()
+        tokens, ids = self._token_arrays()
+        return self._filter(tokens, ids, self._id_space(ids), bad_ids=bad_ids, good_ids=good_ids)
 
     def compactify(self):
-        """Assign new word ids to all words, shrinking any gaps."""
+        """Assign new word ids to all words, shrinking any gaps.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            Mapping of old token ids to new token ids: `old2new[old_id]` is the new id of the token,
+            or -1 if no token had id `old_id`. Pass it to :func:`~gensim.corpora.dictionary.remap_bow`
+            to translate documents converted before the call.
+
+        """
         logger.debug("rebuilding dictionary, shrinking gaps")
+        tokens, ids = self._token_arrays()
+        return self._filter(tokens, ids, self._id_space(ids))
+
+    def _token_arrays(self):
+        """Get all tokens and their ids, both in the iteration order of `token2id`."""
+        tokens = list(iterkeys(self.token2id))
+        ids = np.fromiter(itervalues(self.token2id), dtype=np.int64, count=len(tokens))
+        return tokens, ids
+
+    def _id_space(self, ids):
+        """Get the number of token ids in use, including any gaps: 1 + the largest id."""
+        return 1 + max(
+            int(ids.max()) if len(ids) else -1,
+            max(iterkeys(self.dfs)) if self.dfs else -1,
+            max(iterkeys(self.cfs)) if self.cfs else -1,
+        )
+
+    @staticmethod
+    def _freq_array(freqs, size):
+        """Convert a `{token_id: frequency}` dict into a dense array of length `size`."""
+        result = np.zeros(size, dtype=np.int64)
+        if freqs:
+            result[np.fromiter(iterkeys(freqs), dtype=np.int64, count=len(freqs))] = \
+                np.fromiter(itervalues(freqs), dtype=np.int64, count=len(freqs))
+        return result
 
-        # build mapping from old id -> new id
-        idmap = dict(zip(sorted(itervalues(self.token2id)), range(len(self.token2id))))
+    @staticmethod
+    def _remap_freqs(freqs, old2new):
+        """Translate the keys of a `{token_id: frequency}` dict by `old2new`, dropping removed ids."""
+        if not freqs:
+            return {}
+        new_ids = old2new[np.fromiter(iterkeys(freqs), dtype=np.int64, count=len(freqs))]
+        values = np.fromiter(itervalues(freqs), dtype=np.int64, count=len(freqs))
+        kept = new_ids >= 0
+        return dict(zip(new_ids[kept].tolist(), values[kept].tolist()))
+
+    def _filter(self, tokens, ids, size, bad_ids=None, good_ids=None):
+        """Remove `bad_ids` / keep `good_ids`, renumbering the remaining ids to 0..N-1 in their original order.
+
+        Parameters
+        ----------
+        tokens : list of str
+            All tokens, as returned by `_token_arrays`.
+        ids : numpy.ndarray
+            Ids of `tokens`.
+        size : int
+            Number of token ids in use, as returned by `_id_space`.
+        bad_ids : iterable of int, optional
+            Ids to remove.
+        good_ids : iterable of int, optional
+            Ids to keep.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            The old -> new id mapping.
 
-        # reassign mappings to new ids
-        self.token2id = {token: idmap[tokenid] for token, tokenid in iteritems(self.token2id)}
+        """
+        keep = np.zeros(size, dtype=bool)
+        keep[ids] = True
+        if bad_ids is not None:
+            keep &= ~ids_mask(bad_ids, size)
+        if good_ids is not None:
+            keep &= ids_mask(good_ids, size)
+        old2new = np.cumsum(keep, dtype=np.int64) - 1
+        old2new[~keep] = -1
+        new_ids = old2new[ids]
+        kept = new_ids >= 0
+        self.token2id = dict(zip(itertools.compress(tokens, kept), new_ids[kept].tolist()))
         self.id2token = {}
-        self.dfs = {idmap[tokenid]: freq for tokenid, freq in iteritems(self.dfs)}
+        self.dfs = self._remap_freqs(self.dfs, old2new)
+        self.cfs = self._remap_freqs(self.cfs, old2new)
+        return old2new
 
     def save_as_text(self, fname, sort_by_word=True):
         """Save :class:`~gensim.corpora.dictionary.Dictionary` to a text file.
@@ -576,6 +792,7 @@ class Dictionary(utils.SaveLoad, Mapping):
             old2new[other_id] = new_id
             try:
                 self.dfs[new_id] += other.dfs[other_id]
+                self.cfs[new_id] = self.cfs.get(new_id, 0) + other.cfs.get(other_id, 0)
             except Exception:
                 # `other` isn't a Dictionary (probably just a dict) => ignore dfs, keep going
                 pass
@@ -635,6 +852,30 @@ class Dictionary(utils.SaveLoad, Mapping):
                                        len(possible_ids) > 0 else len(self.token2id) - 1
         self.id2token = {}  # Make sure that id2token is updated according to special tokens.
 
+    @classmethod
+    def load(cls, fname, *args, **kwargs):
+        """Load a previously saved :class:`~gensim.corpora.dictionary.Dictionary`.
+
+        Overrides :meth:`~gensim.utils.SaveLoad.load` to stay compatible with dictionaries stored by older versions,
+        which didn't collect collection frequencies.
+
+        Parameters
+        ----------
+        fname : str
+            Path to the saved dictionary.
+
+        Returns
+        -------
+        :class:`~gensim.corpora.dictionary.Dictionary`
+            Loaded dictionary.
+
+        """
+        result = super(Dictionary, cls).load(fname, *args, **kwargs)
+        if not hasattr(result, 'cfs'):
+            logger.info("collection frequencies not stored in %s, leaving them empty", fname)
+            result.cfs = {}
+        return result
+
     @staticmethod
     def load_from_text(fname):
         """Load a previously stored :class:`~gensim.corpora.dictionary.Dictionary` from a text file.
@@ -738,6 +979,7 @@ class Dictionary(utils.SaveLoad, Mapping):
                 max_id = max(wordid, max_id)
                 result.num_pos += word_freq
                 result.dfs[wordid] = result.dfs.get(wordid, 0) + 1
+                result.cfs[wordid] = result.cfs.get(wordid, 0) + word_freq
 
         if id2word is None:
             # make sure length(result) == get_max_id(corpus) + 1
@@ -754,3 +996,162 @@ class Dictionary(utils.SaveLoad, Mapping):
             result, result.num_docs, result.num_pos
         )
         return result
+
+
+def ids2bow_matrix(ids, lengths, num_terms):
+    """Count token ids of a batch of documents into a sparse bag-of-words matrix.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray
+        Token ids of all documents, concatenated. Negative ids (unknown tokens) are ignored.
+    lengths : numpy.ndarray
+        Number of tokens in each document.
+    num_terms : int
+        Number of rows of the resulting matrix (vocabulary size).
+
+    Returns
+    -------
+    scipy.sparse.csc_matrix
+        Token counts of shape (`num_terms`, `len(lengths)`), documents as columns, ids sorted within each document.
+
+    """
+    num_docs = len(lengths)
+    docnos = np.repeat(np.arange(num_docs, dtype=np.int64), lengths)
+    known = ids >= 0
+    # a single sort over (docno, tokenid) keys both counts the tokens and orders them by id
+    keys, counts = np.unique(docnos[known] * num_terms + ids[known], return_counts=True)
+    docnos, ids = np.divmod(keys, num_terms)
+    indptr = np.zeros(num_docs + 1, dtype=np.int64)
+    np.cumsum(np.bincount(docnos, minlength=num_docs), out=indptr[1:])
+    return scipy.sparse.csc_matrix((counts, ids, indptr), shape=(num_terms, num_docs))
+
+
+def ids_mask(ids, size):
+    """Get a boolean mask of length `size`, True at positions `ids`.
+
+    Parameters
+    ----------
+    ids : iterable of int
+        Token ids, ids outside of `0..size - 1` are ignored.
+    size : int
+        Length of the mask.
+
+    Returns
+    -------
+    numpy.ndarray of bool
+        The mask.
+
+    """
+    if not isinstance(ids, np.ndarray):
+        ids = np.fromiter(ids, dtype=np.int64)
+    ids = ids[(ids >= 0) & (ids < size)]
+    mask = np.zeros(size, dtype=bool)
+    mask[ids] = True
+    return mask
+
+
+def extremes_positions(dfs, num_docs, no_below, no_above_abs, keep_n, forced=None):
+    """Select the tokens that survive :meth:`~gensim.corpora.dictionary.Dictionary.filter_extremes`.
+
+    Parameters
+    ----------
+    dfs : numpy.ndarray
+        Document frequency of each candidate token.
+    num_docs : int
+        Number of documents, the sort priority of `forced` tokens.
+    no_below : int
+        Keep tokens which are contained in at least `no_below` documents.
+    no_above_abs : int
+        Keep tokens which are contained in no more than `no_above_abs` documents.
+    keep_n : int or None
+        Keep only the first `keep_n` most frequent tokens.
+    forced : numpy.ndarray of bool, optional
+        Candidates that must be kept regardless of their frequency, aligned with `dfs`.
+
+    Returns
+    -------
+    numpy.ndarray of int64
+        Positions of the kept tokens in `dfs`, most frequent first. Ties keep their order in `dfs`.
+
+    """
+    keep = (no_below <= dfs) & (dfs <= no_above_abs)
+    priority = dfs
+    if forced is not None:
+        keep |= forced
+        priority = np.where(forced, num_docs, dfs)
+    good = np.flatnonzero(keep)
+    # stable sort => same tie breaking as `sorted(..., reverse=True)`
+    good = good[np.argsort(-priority[good], kind='mergesort')]
+    if keep_n is not None:
+        good = good[:keep_n]
+    return good
+
+
+def old2new_array(old2new):
+    """Convert an old -> new token id mapping into the array form returned by the `filter_*` methods.
+
+    Parameters
+    ----------
+    old2new : {numpy.ndarray, dict of (int, int)}
+        Mapping of old ids to new ids. In the array form, removed ids are marked with -1;
+        in the dict form, removed ids are simply missing.
+
+    Returns
+    -------
+    numpy.ndarray of int64
+        `old2new[old_id]` is the new id, or -1 for removed ids.
+
+    """
+    if isinstance(old2new, np.ndarray):
+        return old2new.astype(np.int64, copy=False)
+    result = np.full(1 + max(iterkeys(old2new)) if old2new else 0, -1, dtype=np.int64)
+    if old2new:
+        result[np.fromiter(iterkeys(old2new), dtype=np.int64, count=len(old2new))] = \
+            np.fromiter(itervalues(old2new), dtype=np.int64, count=len(old2new))
+    return result
+
+
+def is_monotonic(old2new):
+    """Does the old -> new id mapping `old2new` (array form) keep the relative order of the remaining ids?"""
+    new_ids = old2new[old2new >= 0]
+    return bool(np.all(new_ids[1:] > new_ids[:-1]))
+
+
+def remap_bow(document, old2new):
+    """Translate the token ids of a bag-of-words document after the dictionary was filtered or compactified.
+
+    Parameters
+    ----------
+    document : list of (int, number)
+        Document in BoW format, with token ids from before the filtering.
+    old2new : numpy.ndarray
+        Mapping returned by :meth:`~gensim.corpora.dictionary.Dictionary.compactify`
+        or one of the `filter_*` methods.
+
+    Returns
+    -------
+    list of (int, number)
+        The document with new ids, sorted by id. Removed tokens are dropped.
+
+    Examples
+    --------
+    .. sourcecode:: pycon
+
+        >>> from gensim.corpora.dictionary import Dictionary, remap_bow
+        >>>
+        >>> dct = Dictionary([["máma", "mele", "maso"], ["ema", "má", "máma"]])
+        >>> bow = dct.doc2bow(["máma", "maso"])
+        >>> old2new = dct.filter_tokens(bad_ids=[dct.token2id["maso"]])
+        >>> remap_bow(bow, old2new) == dct.doc2bow(["máma", "maso"])
+        True
+
+    """
+    size = len(old2new)
+    result = []
+    for tokenid, weight in document:
+        new_id = old2new[tokenid] if tokenid < size else -1
+        if new_id >= 0:
+            result.append((int(new_id), weight))
+    result.sort()  # no-op for mappings from `compactify` and the `filter_*` methods, which keep the order
+    return result
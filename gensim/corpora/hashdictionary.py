@@ -33,8 +33,19 @@ import logging
 import itertools
 import zlib
 
+import numpy as np
+
 from gensim import utils
-from six import iteritems, iterkeys
+from gensim.corpora.dictionary import Dictionary, ids2bow_matrix
+from six import PY3, iteritems, iterkeys
+from six.moves import map, zip
+
+try:
+    from gensim.corpora._hashdictionary import adler32_batch
+except ImportError:
+    FAST_VERSION = -1
+else:
+    FAST_VERSION = 1
 
 
 logger = logging.getLogger(__name__)
@@ -61,7 +72,7 @@ class HashDictionary(utils.SaveLoad, dict):
         [(10608, 1), (12466, 1), (31002, 1)]
 
     """
-    def __init__(self, documents=None, id_range=32000, myhash=zlib.adler32, debug=True):
+    def __init__(self, documents=None, id_range=32000, myhash=zlib.adler32, debug=True, debug_max_tokens=None):
         """
 
         Parameters
@@ -77,12 +88,17 @@ class HashDictionary(utils.SaveLoad, dict):
         debug : bool, optional
             Store which tokens have mapped to a given id? **Will use a lot of RAM**.
             If you find yourself running out of memory (or not sure that you really need raw tokens),
-            keep `debug=False`.
+            keep `debug=False`, or cap the memory with `debug_max_tokens`.
+        debug_max_tokens : int, optional
+            If set, the debug mappings only track the first `debug_max_tokens` distinct tokens seen,
+            so that their memory stays bounded no matter how much text is hashed. Tokens seen later
+            are still hashed and counted in `dfs`, just not recorded by string.
 
         """
         self.myhash = myhash  # hash fnc: string->integer
         self.id_range = id_range  # hash range: id = myhash(key) % id_range
         self.debug = debug
+        self.debug_max_tokens = debug_max_tokens
 
         # the following (potentially massive!) dictionaries are only formed if `debug` is True
         self.token2id = {}
@@ -135,11 +151,15 @@ class HashDictionary(utils.SaveLoad, dict):
 
         """
         h = self.myhash(utils.to_utf8(token)) % self.id_range
-        if self.debug:
+        if self.debug and self._track_debug(token):
             self.token2id[token] = h
             self.id2token.setdefault(h, set()).add(token)
         return h
 
+    def _track_debug(self, token):
+        """Should `token` be recorded in the debug mappings, given the `debug_max_tokens` cap?"""
+        return self.debug_max_tokens is None or token in self.token2id or len(self.token2id) < self.debug_max_tokens
+
     def __len__(self):
         """Get the number of distinct ids = the entire dictionary size."""
         return self.id_range
@@ -187,10 +207,9 @@ class HashDictionary(utils.SaveLoad, dict):
             True
 
         """
-        for docno, document in enumerate(documents):
-            if docno % 10000 == 0:
-                logger.info("adding document #%i to %s", docno, self)
-            self.doc2bow(document, allow_update=True)  # ignore the result, here we only care about updating token ids
+        for chunk_no, chunk in enumerate(utils.grouper(documents, 10000)):
+            logger.info("adding document #%i to %s", chunk_no * 10000, self)
+            self.doc2bow_batch(chunk, allow_update=True)  # ignore the result, here we only care about updating stats
         logger.info(
             "built %s from %i documents (total %i corpus positions)",
             self, self.num_docs, self.num_pos
@@ -241,7 +260,7 @@ class HashDictionary(utils.SaveLoad, dict):
             frequency = len(list(group))  # how many times does this word appear in the input document
             tokenid = self.restricted_hash(word_norm)
             result[tokenid] = result.get(tokenid, 0) + frequency
-            if self.debug:
+            if self.debug and word_norm in self.token2id:
                 # increment document count for each unique token that appeared in the document
                 self.dfs_debug[word_norm] = self.dfs_debug.get(word_norm, 0) + 1
 
@@ -262,6 +281,94 @@ class HashDictionary(utils.SaveLoad, dict):
         else:
             return result
 
+    def doc2bow_batch(self, documents, allow_update=False):
+        """Convert many `documents` into the bag-of-words format at once, as a sparse matrix.
+
+        Each distinct token of the batch is hashed only once. With the default `myhash=zlib.adler32`,
+        the hashes are computed by compiled code over a single buffer of all distinct tokens.
+
+        Parameters
+        ----------
+        documents : iterable of list of str
+            Input documents. The whole batch is held in memory.
+        allow_update : bool, optional
+            Update corpus statistics and if `debug=True`, also the reverse id=>word mapping?
+
+        Returns
+        -------
+        scipy.sparse.csc_matrix
+            Matrix of token counts of shape (`id_range`, `len(documents)`), documents as columns: column `i`
+            equals `doc2bow(documents[i])`. Its transpose is the CSR matrix with documents as rows.
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.corpora import HashDictionary
+            >>>
+            >>> dct = HashDictionary(debug=False)
+            >>> bows = dct.doc2bow_batch([["this", "is", "máma"], ["máma"]])
+            >>> bows.shape
+            (32000, 2)
+            >>> bows.indices
+            array([ 1721,  5280, 22493, 22493], dtype=int32)
+
+        """
+        documents = Dictionary._check_batch(documents, 'doc2bow_batch')
+        lengths = np.fromiter((len(document) for document in documents), dtype=np.int64, count=len(documents))
+        tokens = list(itertools.chain.from_iterable(documents))
+        distinct = list(dict.fromkeys(tokens))
+        token_hashes = dict(zip(distinct, self.hash_batch(distinct).tolist()))
+        ids = np.fromiter(map(token_hashes.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+        bows = ids2bow_matrix(ids, lengths, self.id_range)
+
+        if self.debug:
+            for token, tokenid in iteritems(token_hashes):
+                if self._track_debug(token):
+                    self.token2id[token] = tokenid
+                    self.id2token.setdefault(tokenid, set()).add(token)
+            for document in documents:
+                for token in set(document):
+                    if token in self.token2id:
+                        self.dfs_debug[token] = self.dfs_debug.get(token, 0) + 1
+
+        if allow_update or self.allow_update:
+            self.num_docs += len(documents)
+            self.num_pos += len(tokens)
+            self.num_nnz += bows.nnz
+            if self.debug:
+                # increment document count for each unique tokenid that appeared in the document
+                tokenids, docfreqs = np.unique(bows.indices, return_counts=True)
+                for tokenid, docfreq in zip(tokenids.tolist(), docfreqs.tolist()):
+                    self.dfs[tokenid] = self.dfs.get(tokenid, 0) + docfreq
+        return bows
+
+    def hash_batch(self, tokens):
+        """Get the ids of many tokens at once, without updating the debug mappings.
+
+        Parameters
+        ----------
+        tokens : list of str
+            Input tokens.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            `myhash(token) %% id_range` for each token.
+
+        """
+        encoded = [utils.to_utf8(token) for token in tokens]
+        if FAST_VERSION >= 0 and self.myhash is zlib.adler32:
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+            hashes = adler32_batch(np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets).astype(np.int64)
+            if not PY3:
+                # zlib.adler32 returns signed ints in Python 2 => the same token maps to a different id
+                hashes[hashes >= 2 ** 31] -= 2 ** 32
+        else:
+            hashes = np.fromiter(map(self.myhash, encoded), dtype=np.int64, count=len(encoded))
+        return np.mod(hashes, self.id_range)
+
     def filter_extremes(self, no_below=5, no_above=0.5, keep_n=100000):
         """Filter tokens in the debug dictionary by their frequency.
 
@@ -310,6 +417,26 @@ class HashDictionary(utils.SaveLoad, dict):
             no_below, no_above_abs, 100.0 * no_above
         )
 
+    @classmethod
+    def load(cls, fname, *args, **kwargs):
+        """Load a previously saved :class:`~gensim.corpora.hashdictionary.HashDictionary`.
+
+        Parameters
+        ----------
+        fname : str
+            Path to file that contains the dictionary.
+
+        Returns
+        -------
+        :class:`~gensim.corpora.hashdictionary.HashDictionary`
+            Loaded dictionary.
+
+        """
+        result = super(HashDictionary, cls).load(fname, *args, **kwargs)
+        if not hasattr(result, 'debug_max_tokens'):
+            result.debug_max_tokens = None
+        return result
+
     def save_as_text(self, fname):
         """Save the debug token=>id mapping to a text file.
 
@@ -11,8 +11,10 @@ import logging
 import six
 
 import numpy
+import scipy.sparse
 
-from gensim import interfaces, utils
+from gensim import interfaces, matutils, utils
+from gensim.corpora.dictionary import old2new_array, remap_bow
 
 logger = logging.getLogger(__name__)
 
@@ -78,8 +80,9 @@ class IndexedCorpus(interfaces.CorpusABC):
         ----------
         fname : str
             Path to output file.
-        corpus : iterable of iterable of (int, float)
-            Corpus in BoW format.
+        corpus : {iterable of iterable of (int, float), scipy.sparse.csc}
+            Corpus in BoW format, or a sparse matrix of shape (`num_terms`, `num_documents`), such as the one returned
+            by :meth:`~gensim.corpora.dictionary.Dictionary.doc2bow_batch`.
         id2word : dict of (str, str), optional
             Mapping id -> word.
         index_fname : str, optional
@@ -109,6 +112,8 @@ class IndexedCorpus(interfaces.CorpusABC):
         """
         if getattr(corpus, 'fname', None) == fname:
             raise ValueError("identical input vs. output corpus filename, refusing to serialize: %s" % fname)
+        if scipy.sparse.issparse(corpus):
+            corpus = matutils.Sparse2Corpus(corpus)
 
         if index_fname is None:
             index_fname = utils.smart_extension(fname, '.index')
@@ -135,6 +140,53 @@ class IndexedCorpus(interfaces.CorpusABC):
         logger.info("saving %s index to %s", serializer.__name__, index_fname)
         utils.pickle(offsets, index_fname)
 
+    def remap_ids(self, fname, old2new, index_fname=None, workers=1, **kwargs):
+        """Write a copy of this corpus with token ids translated by `old2new`, dropping removed ids.
+
+        Use this after :meth:`~gensim.corpora.dictionary.Dictionary.filter_extremes` or
+        :meth:`~gensim.corpora.dictionary.Dictionary.compactify` to bring an already serialized corpus
+        in line with the filtered dictionary, without converting the original texts again.
+
+        Parameters
+        ----------
+        fname : str
+            Path to the output corpus, stored in the same format as this corpus.
+        old2new : {numpy.ndarray, dict of (int, int)}
+            Mapping of old ids to new ids, as returned by the `filter_*` methods of
+            :class:`~gensim.corpora.dictionary.Dictionary`, or a dict `{old_id: new_id}`.
+        index_fname : str, optional
+            Where to save the offsets index of the output, `fname.index` by default.
+        workers : int, optional
+            Number of processes to use, for formats that support parallel rewriting
+            (see :meth:`~gensim.corpora.mmcorpus.MmCorpus.remap_ids`). Ignored otherwise.
+        **kwargs
+            Passed to :meth:`~gensim.corpora.indexedcorpus.IndexedCorpus.serialize`.
+
+        Returns
+        -------
+        :class:`~gensim.corpora.indexedcorpus.IndexedCorpus`
+            The output corpus, of the same class as this corpus.
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.corpora import Dictionary, MmCorpus
+            >>> from gensim.test.utils import common_texts, get_tmpfile
+            >>>
+            >>> dct = Dictionary(common_texts)
+            >>> MmCorpus.serialize(get_tmpfile("full.mm"), [dct.doc2bow(text) for text in common_texts])
+            >>> old2new = dct.filter_extremes(no_below=2)
+            >>>
+            >>> corpus = MmCorpus(get_tmpfile("full.mm")).remap_ids(get_tmpfile("filtered.mm"), old2new)
+            >>> corpus[0] == dct.doc2bow(common_texts[0])
+            True
+
+        """
+        corpus = RemappedCorpus(self, old2new)
+        self.__class__.serialize(fname, corpus, index_fname=index_fname, **kwargs)
+        return self.__class__(fname)
+
     def __len__(self):
         """Get the index length.
 
@@ -187,3 +239,31 @@ class IndexedCorpus(interfaces.CorpusABC):
             # TODO: no `docbyoffset` method, should be defined in this class
         else:
             raise ValueError('Unrecognised value for docno, use either a single integer, a slice or a numpy.ndarray')
+
+
+class RemappedCorpus(interfaces.CorpusABC):
+    """Stream documents of another corpus with their token ids translated by an old -> new id mapping.
+
+    Used by :meth:`~gensim.corpora.indexedcorpus.IndexedCorpus.remap_ids`.
+
+    """
+    def __init__(self, corpus, old2new):
+        """
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, number)
+            Input corpus in BoW format.
+        old2new : {numpy.ndarray, dict of (int, int)}
+            Mapping of old ids to new ids, see :func:`~gensim.corpora.dictionary.old2new_array`.
+
+        """
+        self.corpus = corpus
+        self.old2new = old2new_array(old2new)
+
+    def __iter__(self):
+        for document in self.corpus:
+            yield remap_bow(document, self.old2new)
+
+    def __len__(self):
+        return len(self.corpus)
@@ -7,13 +7,80 @@
 """Corpus in the `Matrix Market format <https://math.nist.gov/MatrixMarket/formats.html>`_."""
 
 import logging
+import multiprocessing
+import os
+import shutil
+import threading
 
-from gensim import matutils
+import numpy as np
+import scipy.sparse
+
+from six import string_types
+from six.moves import queue
+
+from gensim import matutils, utils
 from gensim.corpora import IndexedCorpus
+from gensim.corpora.dictionary import is_monotonic, old2new_array
 
 
 logger = logging.getLogger(__name__)
 
+try:
+    # try to load fast, cythonized code if possible
+    from gensim.corpora._mmreader import mm_documents, parse_mm_block
+except ImportError:
+    def parse_mm_block(block, transposed=True):
+        """Parse complete `docid termid value` lines of an MM file (slow numpy version).
+
+        Parameters
+        ----------
+        block : numpy.ndarray of int8
+            Complete lines from the data section of an MM file.
+        transposed : bool, optional
+            Do lines represent `doc_id, term_id, value`, instead of `term_id, doc_id, value`?
+
+        Returns
+        -------
+        (numpy.ndarray of int64, numpy.ndarray of int64, numpy.ndarray of float64)
+            0-based document ids, 0-based term ids and values of all lines in `block`.
+
+        """
+        lines = [line.split() for line in block.tobytes().splitlines()]
+        lines = [fields for fields in lines if fields]
+        for fields in lines:
+            if len(fields) != 3:
+                raise ValueError("unable to parse line: {}".format(b' '.join(fields)))
+        fields = np.array(lines, dtype=np.float64).reshape(-1, 3)
+        docids, termids = fields[:, 0].astype(np.int64) - 1, fields[:, 1].astype(np.int64) - 1
+        if not transposed:
+            docids, termids = termids, docids
+        return docids, termids, fields[:, 2]
+
+    def mm_documents(docids, termids, vals):
+        """Group parsed `docid termid value` lines into documents (slow numpy version).
+
+        Parameters
+        ----------
+        docids : numpy.ndarray of int64
+            0-based document ids, in ascending order.
+        termids : numpy.ndarray of int64
+            0-based term ids.
+        vals : numpy.ndarray of float64
+            Values.
+
+        Returns
+        -------
+        list of (int, list of (int, float))
+            Document number and document in BoW format, for each document stored in the lines.
+
+        """
+        if np.any(docids[1:] < docids[:-1]):
+            raise ValueError("matrix columns must come in ascending order")
+        splits = (np.flatnonzero(docids[1:] != docids[:-1]) + 1).tolist()
+        starts, ends = [0] + splits, splits + [len(docids)]
+        pairs = list(zip(termids.tolist(), vals.tolist()))
+        return [(docid, pairs[start:end]) for docid, start, end in zip(docids[starts].tolist(), starts, ends)]
+
 
 class MmCorpus(matutils.MmReader, IndexedCorpus):
     """Corpus serialized using the `sparse coordinate Matrix Market format
@@ -50,8 +117,16 @@ class MmCorpus(matutils.MmReader, IndexedCorpus):
         >>> for document in corpus:
         ...     pass
 
+    Large uncompressed files can be parsed by several threads at once:
+
+    .. sourcecode:: pycon
+
+        >>> corpus = MmCorpus(datapath('test_mmcorpus_with_index.mm'), workers=4)
+        >>> for document in corpus:  # same documents, in the same order
+        ...     pass
+
     """
-    def __init__(self, fname):
+    def __init__(self, fname, workers=1):
         """
 
         Parameters
@@ -59,11 +134,15 @@ class MmCorpus(matutils.MmReader, IndexedCorpus):
         fname : {str, file-like object}
             Path to file in MM format or a file-like object that supports `seek()`
             (e.g. a compressed file opened by `smart_open <https://github.com/RaRe-Technologies/smart_open>`_).
+        workers : int, optional
+            Number of threads parsing the file during iteration, see
+            :meth:`~gensim.corpora.mmcorpus.MmCorpus.iter_parallel`.
 
         """
         # avoid calling super(), too confusing
         IndexedCorpus.__init__(self, fname)
         matutils.MmReader.__init__(self, fname)
+        self.workers = workers
 
     def __iter__(self):
         """Iterate through all documents.
@@ -80,9 +159,235 @@ class MmCorpus(matutils.MmReader, IndexedCorpus):
         (sparse) Matrix Market file.
 
         """
-        for doc_id, doc in super(MmCorpus, self).__iter__():
+        if getattr(self, 'workers', 1) > 1:
+            docs = self.iter_parallel(workers=self.workers)
+        else:
+            docs = super(MmCorpus, self).__iter__()
+        for doc_id, doc in docs:
             yield doc  # get rid of doc id, return the sparse vector only
 
+    def iter_parallel(self, workers=None, ordered=True, blocksize=4 * 1024 * 1024, prefetch=4):
+        """Iterate through all documents, parsing the file in several threads at once.
+
+        The data section of the file is split into byte ranges that start at a document boundary, using the offsets
+        index when available. Each range is read in blocks by a worker thread; the blocks are parsed without holding
+        the GIL, so the threads run in parallel when the compiled extension is available.
+
+        Compressed files and file-like objects are read sequentially.
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of worker threads, defaults to the number of CPUs.
+        ordered : bool, optional
+            Yield the documents in the order of the file? Otherwise, documents are yielded as soon as any worker
+            parses them, which avoids waiting for slow ranges. Empty documents come last in that case.
+        blocksize : int, optional
+            Approximate number of bytes parsed at once.
+        prefetch : int, optional
+            Number of parsed blocks each worker can keep waiting for the consumer.
+
+        Yields
+        ------
+        (int, list of (int, float))
+            Document number and document in BoW format, for all `num_docs` documents.
+
+        """
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        if not isinstance(self.input, string_types) or self.input.endswith(('.gz', '.bz2')) or not self.transposed:
+            for item in super(MmCorpus, self).__iter__():
+                yield item
+            return
+
+        ranges = mm_doc_ranges(self.input, workers * 4, index=self.index)
+        jobs = queue.Queue()
+        for rangeno, (start, end) in enumerate(ranges):
+            jobs.put((rangeno, start, end))
+        if ordered:
+            outputs = [queue.Queue(maxsize=prefetch) for _ in ranges]
+        else:
+            outputs = [queue.Queue(maxsize=prefetch * workers)] * len(ranges)
+        stop = threading.Event()
+
+        def put(rangeno, item):
+            # give up when the consumer stopped iterating, instead of blocking forever
+            while not stop.is_set():
+                try:
+                    outputs[rangeno].put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def worker():
+            while not stop.is_set():
+                try:
+                    rangeno, start, end = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    for docs in _read_mm_range(self.input, start, end, blocksize, self.transposed):
+                        if not put(rangeno, docs):
+                            return
+                except Exception as err:
+                    put(rangeno, err)
+                    return
+                put(rangeno, None)
+
+        threads = [threading.Thread(target=worker) for _ in range(min(workers, len(ranges)))]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        logger.debug("parsing %s in %i ranges by %i threads", self.input, len(ranges), len(threads))
+
+        try:
+            if ordered:
+                prev_docno = -1
+                for output in outputs:
+                    for docs in iter(output.get, None):
+                        if isinstance(docs, Exception):
+                            raise docs
+                        for docno, doc in docs:
+                            if docno <= prev_docno:
+                                raise ValueError("matrix columns must come in ascending order")
+                            # return implicit (empty) documents between the previous and current document
+                            for prev_docno in range(prev_docno + 1, docno):
+                                yield prev_docno, []
+                            yield docno, doc
+                            prev_docno = docno
+                missing = range(prev_docno + 1, self.num_docs)
+            else:
+                seen = np.zeros(self.num_docs, dtype=bool)
+                finished = 0
+                while finished < len(ranges):
+                    docs = outputs[0].get()
+                    if docs is None:
+                        finished += 1
+                        continue
+                    if isinstance(docs, Exception):
+                        raise docs
+                    for docno, doc in docs:
+                        if docno < self.num_docs:
+                            seen[docno] = True
+                        yield docno, doc
+                missing = np.flatnonzero(~seen).tolist()
+            for docno in missing:
+                yield docno, []
+        finally:
+            stop.set()
+
+    def iter_csc_chunks(self, chunksize=2000, num_terms=None, dtype=np.float64):
+        """Iterate over the corpus in chunks of documents, each as one sparse matrix.
+
+        The data lines of an uncompressed file are parsed in blocks straight into the arrays of the output matrices.
+        Compressed files and file-like objects fall back to
+        :meth:`~gensim.interfaces.CorpusABC.iter_csc_chunks`.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of documents in each chunk (only the last chunk may be smaller).
+        num_terms : int, optional
+            Number of terms = number of rows of each chunk, `self.num_terms` by default.
+        dtype : data-type, optional
+            Data type of the output matrices.
+
+        Yields
+        ------
+        scipy.sparse.csc_matrix
+            Chunk of shape (`num_terms`, number of documents in the chunk), documents as columns.
+
+        """
+        if num_terms is None:
+            num_terms = self.num_terms
+        if not isinstance(self.input, string_types) or self.input.endswith(('.gz', '.bz2')):
+            for chunk in super(MmCorpus, self).iter_csc_chunks(chunksize, num_terms=num_terms, dtype=dtype):
+                yield chunk
+            return
+        (start, end), = mm_byte_ranges(self.input, 1)
+        for chunk in mm_csc_chunks(self.input, start, end, self.num_docs, num_terms, chunksize,
+                                   transposed=self.transposed, dtype=dtype):
+            yield chunk
+
+    def remap_ids(self, fname, old2new, index_fname=None, workers=1, **kwargs):
+        """Write a copy of this corpus with token ids translated by `old2new`, dropping removed ids.
+
+        For an uncompressed input file and a mapping that keeps the order of ids (such as those returned by
+        :meth:`~gensim.corpora.dictionary.Dictionary.filter_extremes` and the other `filter_*` methods), the
+        file is rewritten in blocks of lines, without building the documents: the data section is split into
+        `workers` byte ranges, each rewritten by a separate process into a temporary file. The parts are then
+        concatenated behind the header and the offsets index is assembled from the document starts reported
+        by each part.
+        Otherwise, falls back to :meth:`~gensim.corpora.indexedcorpus.IndexedCorpus.remap_ids`.
+
+        Parameters
+        ----------
+        fname : str
+            Path to the output file in MM format.
+        old2new : {numpy.ndarray, dict of (int, int)}
+            Mapping of old ids to new ids, as returned by the `filter_*` methods of
+            :class:`~gensim.corpora.dictionary.Dictionary`, or a dict `{old_id: new_id}`.
+        index_fname : str, optional
+            Where to save the offsets index of the output, `fname.index` by default.
+        workers : int, optional
+            Number of processes rewriting byte ranges of the file in parallel.
+        **kwargs
+            Passed to :meth:`~gensim.corpora.indexedcorpus.IndexedCorpus.serialize` in the fallback case.
+
+        Returns
+        -------
+        :class:`~gensim.corpora.mmcorpus.MmCorpus`
+            The output corpus.
+
+        """
+        old2new = old2new_array(old2new)
+        if not isinstance(self.input, string_types) or self.input.endswith(('.gz', '.bz2')) \
+                or not is_monotonic(old2new):
+            return super(MmCorpus, self).remap_ids(fname, old2new, index_fname=index_fname, **kwargs)
+        if os.path.abspath(self.input) == os.path.abspath(fname):
+            raise ValueError("identical input vs. output corpus filename, refusing to remap: %s" % fname)
+        if index_fname is None:
+            index_fname = utils.smart_extension(fname, '.index')
+
+        jobs = [
+            (self.input, start, end, old2new, '%s.part%i' % (fname, partno))
+            for partno, (start, end) in enumerate(mm_byte_ranges(self.input, workers))
+        ]
+        logger.info("remapping %s to %s in %i parts", self.input, fname, len(jobs))
+        if workers > 1 and len(jobs) > 1:
+            pool = multiprocessing.Pool(min(workers, len(jobs)))
+            try:
+                results = pool.map(_remap_mm_range, jobs)
+            finally:
+                pool.terminate()
+        else:
+            results = [_remap_mm_range(job) for job in jobs]
+
+        offsets = [-1] * self.num_docs
+        num_nnz = 0
+        writer = matutils.MmWriter(fname)
+        try:
+            writer.write_headers(-1, -1, -1)
+            for part_fname, part_nnz, doc_starts in results:
+                base = writer.fout.tell()
+                for docno, part_offset in doc_starts:
+                    # a document split across two parts starts in the first of them
+                    if offsets[docno] == -1:
+                        offsets[docno] = base + part_offset
+                with open(part_fname, 'rb') as fin:
+                    shutil.copyfileobj(fin, writer.fout)
+                os.remove(part_fname)
+                num_nnz += part_nnz
+            num_terms = int(old2new.max()) + 1 if len(old2new) else 0
+            writer.fake_headers(self.num_docs, num_terms, num_nnz)
+        finally:
+            writer.close()
+
+        logger.info("saving MmCorpus index to %s", index_fname)
+        utils.pickle(offsets, index_fname)
+        return MmCorpus(fname)
+
     @staticmethod
     def save_corpus(fname, corpus, id2word=None, progress_cnt=1000, metadata=False):
         """Save a corpus to disk in the sparse coordinate Matrix Market format.
@@ -124,3 +429,353 @@ class MmCorpus(matutils.MmReader, IndexedCorpus):
         return matutils.MmWriter.write_corpus(
             fname, corpus, num_terms=num_terms, index=True, progress_cnt=progress_cnt, metadata=metadata
         )
+
+
+def mm_byte_ranges(fname, parts):
+    """Split the data section of an (uncompressed) MM file into byte ranges that start on a line boundary.
+
+    Parameters
+    ----------
+    fname : str
+        Path to file in MM format.
+    parts : int
+        Desired number of ranges. Fewer ranges are returned for small files.
+
+    Returns
+    -------
+    list of (int, int)
+        Start and end offset of each range, covering the whole data section.
+
+    """
+    with open(fname, 'rb') as fin:
+        # skip the header line, comments and the "num_docs num_terms num_nnz" line
+        line = fin.readline()
+        while line.startswith(b'%'):
+            line = fin.readline()
+        data_start = fin.tell()
+        size = os.fstat(fin.fileno()).st_size
+        bounds = [data_start]
+        for partno in range(1, max(1, parts)):
+            fin.seek(max(data_start + partno * (size - data_start) // parts - 1, bounds[-1]))
+            fin.readline()  # move to the start of the next line
+            if bounds[-1] < fin.tell() < size:
+                bounds.append(fin.tell())
+        bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def mm_doc_ranges(fname, parts, index=None):
+    """Split the data section of an (uncompressed) MM file into byte ranges that start at a document boundary.
+
+    Parameters
+    ----------
+    fname : str
+        Path to file in MM format, with documents in ascending order.
+    parts : int
+        Desired number of ranges. Fewer ranges are returned for small files.
+    index : list of int, optional
+        Offsets index of the file, as created by :meth:`~gensim.corpora.mmcorpus.MmCorpus.serialize`.
+        Boundaries are taken from the index instead of scanning the file.
+
+    Returns
+    -------
+    list of (int, int)
+        Start and end offset of each range, covering the whole data section.
+
+    """
+    if index is not None and len(index):
+        offsets = np.asarray(index, dtype=np.int64)
+        offsets = offsets[offsets >= 0]  # empty documents are marked by -1
+        if len(offsets):
+            bounds = np.unique(offsets[np.linspace(0, len(offsets), max(1, parts), endpoint=False).astype(int)])
+            bounds = bounds.tolist() + [os.path.getsize(fname)]
+            return list(zip(bounds[:-1], bounds[1:]))
+
+    ranges = mm_byte_ranges(fname, parts)
+    bounds = [ranges[0][0]]
+    with open(fname, 'rb') as fin:
+        for start, _ in ranges[1:]:
+            # move the line-aligned boundary forward, past the rest of the document started before it
+            fin.seek(start)
+            docid, offset = None, start
+            for line in iter(fin.readline, b''):
+                fields = line.split(None, 1)
+                if fields:
+                    if docid is not None and fields[0] != docid:
+                        break
+                    docid = fields[0]
+                offset += len(line)
+            if bounds[-1] < offset < ranges[-1][1]:
+                bounds.append(offset)
+    bounds.append(ranges[-1][1])
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _read_mm_blocks(fname, start, end, blocksize, transposed=True):
+    """Parse one byte range of an MM file, block by block.
+
+    Parameters
+    ----------
+    fname : str
+        Path to file in MM format.
+    start : int
+        Offset of the first line of the range.
+    end : int
+        Offset after the last line of the range.
+    blocksize : int
+        Approximate number of bytes parsed at once.
+    transposed : bool, optional
+        Do lines represent `doc_id, term_id, value`, instead of `term_id, doc_id, value`?
+
+    Yields
+    ------
+    (numpy.ndarray of int64, numpy.ndarray of int64, numpy.ndarray of float64)
+        0-based document ids, 0-based term ids and values of the lines in each non-empty block.
+
+    """
+    with open(fname, 'rb') as fin:
+        fin.seek(start)
+        remaining, tail = end - start, b''
+        while remaining > 0 or tail:
+            chunk = fin.read(min(blocksize, remaining)) if remaining > 0 else b''
+            if not chunk:
+                remaining = 0
+            remaining -= len(chunk)
+            block = tail + chunk
+            cut = block.rfind(b'\n') + 1 if remaining > 0 else len(block)
+            block, tail = block[:cut], block[cut:]
+            if not block:
+                continue
+            if not block.endswith(b'\n'):
+                block += b'\n'
+            docids, termids, vals = parse_mm_block(np.frombuffer(block, dtype=np.int8), transposed)
+            if len(docids):
+                yield docids, termids, vals
+
+
+def _read_mm_range(fname, start, end, blocksize, transposed=True):
+    """Parse one byte range of an MM file into documents, block by block.
+
+    Parameters
+    ----------
+    fname : str
+        Path to file in MM format.
+    start : int
+        Offset of the first line of the range.
+    end : int
+        Offset after the last line of the range.
+    blocksize : int
+        Approximate number of bytes parsed at once.
+    transposed : bool, optional
+        Do lines represent `doc_id, term_id, value`, instead of `term_id, doc_id, value`?
+
+    Yields
+    ------
+    list of (int, list of (int, float))
+        Complete documents of each block, with their document numbers. A document continued in the next block is
+        held back until it is complete.
+
+    """
+    pending = []
+    for docids, termids, vals in _read_mm_blocks(fname, start, end, blocksize, transposed):
+        docs = mm_documents(docids, termids, vals)
+        if pending and pending[-1][0] == docs[0][0]:
+            pending[-1][1].extend(docs[0][1])
+            docs = docs[1:]
+        pending.extend(docs)
+        if len(pending) > 1:
+            yield pending[:-1]
+            pending = pending[-1:]
+    if pending:
+        yield pending
+
+
+def mm_csc_chunks(fname, start, end, num_docs, num_terms, chunksize, transposed=True, dtype=np.float64,
+                  blocksize=4 * 1024 * 1024):
+    """Read the data section of an (uncompressed) MM-like file as sparse matrices of `chunksize` documents.
+
+    Parameters
+    ----------
+    fname : str
+        Path to file with `docid termid value` lines, documents in ascending order.
+    start : int
+        Offset of the first data line.
+    end : int
+        Offset after the last data line.
+    num_docs : int
+        Number of documents, including trailing empty documents not stored in the file.
+    num_terms : int
+        Number of rows of each output matrix.
+    chunksize : int
+        Number of documents in each chunk (only the last chunk may be smaller).
+    transposed : bool, optional
+        Do lines represent `doc_id, term_id, value`, instead of `term_id, doc_id, value`?
+    dtype : data-type, optional
+        Data type of the output matrices.
+    blocksize : int, optional
+        Approximate number of bytes parsed at once.
+
+    Yields
+    ------
+    scipy.sparse.csc_matrix
+        Chunk of shape (`num_terms`, number of documents in the chunk), documents as columns.
+
+    """
+    def make_chunk(parts, first_doc, size):
+        docids, termids, vals = (np.concatenate(arrays) for arrays in zip(*parts)) if parts else (empty, empty, [])
+        indptr = np.searchsorted(docids, np.arange(first_doc, first_doc + size + 1))
+        indptr -= indptr[0]
+        return scipy.sparse.csc_matrix(
+            (np.asarray(vals, dtype=dtype), termids, indptr), shape=(num_terms, size), dtype=dtype
+        )
+
+    empty = np.zeros(0, dtype=np.int64)
+    first_doc, parts, prev_docid = 0, [], -1
+    for docids, termids, vals in _read_mm_blocks(fname, start, end, blocksize, transposed):
+        if docids[0] < prev_docid or np.any(docids[1:] < docids[:-1]):
+            raise ValueError("matrix columns must come in ascending order")
+        prev_docid = docids[-1]
+        # emit all chunks that end before the last document of this block
+        while docids[-1] >= first_doc + chunksize:
+            split = np.searchsorted(docids, first_doc + chunksize)
+            parts.append((docids[:split], termids[:split], vals[:split]))
+            yield make_chunk(parts, first_doc, chunksize)
+            docids, termids, vals = docids[split:], termids[split:], vals[split:]
+            first_doc, parts = first_doc + chunksize, []
+        parts.append((docids, termids, vals))
+    num_docs = max(num_docs, prev_docid + 1)
+    while first_doc < num_docs:
+        size = min(chunksize, num_docs - first_doc)
+        yield make_chunk(parts, first_doc, size)
+        first_doc, parts = first_doc + size, []
+
+
+def _remap_mm_range(job, blocksize=8 * 1024 * 1024):
+    """Rewrite the lines of one byte range of an MM file with translated term ids, into a temporary file.
+
+    Parameters
+    ----------
+    job : (str, int, int, numpy.ndarray, str)
+        Input path, start and end offset of the range, the old -> new id mapping and the output path.
+    blocksize : int, optional
+        Approximate number of bytes processed at once.
+
+    Returns
+    -------
+    (str, int, list of (int, int))
+        The output path, the number of non-zero entries written and `(docno, offset)` of each document
+        start in the output.
+
+    """
+    fname, start, end, old2new, part_fname = job
+    num_nnz, doc_starts, prev_docno = 0, [], -1
+    with open(fname, 'rb') as fin, open(part_fname, 'wb') as fout:
+        fin.seek(start)
+        remaining, tail = end - start, b''
+        while remaining > 0 or tail:
+            chunk = fin.read(min(blocksize, remaining)) if remaining > 0 else b''
+            remaining -= len(chunk)
+            block = tail + chunk
+            cut = block.rfind(b'\n') + 1 if remaining > 0 else len(block)
+            block, tail = block[:cut], block[cut:]
+            if not block:
+                continue
+            out, docnos, line_offsets = _remap_mm_block(block, old2new)
+            base = fout.tell()
+            # record the first line of each document not already started in a previous block
+            is_start = np.ones(len(docnos), dtype=bool)
+            is_start[1:] = docnos[1:] != docnos[:-1]
+            if len(docnos) and docnos[0] == prev_docno:
+                is_start[0] = False
+            doc_starts.extend(zip(docnos[is_start].tolist(), (line_offsets[is_start] + base).tolist()))
+            if len(docnos):
+                prev_docno = docnos[-1]
+            num_nnz += len(docnos)
+            fout.write(out)
+    return part_fname, num_nnz, doc_starts
+
+
+def _remap_mm_block(block, old2new):
+    """Translate the term ids of all `docid termid value` lines in `block`.
+
+    Lines are rewritten with numpy by gathering byte segments, which is possible when the fields are separated by
+    single spaces, as written by :class:`~gensim.matutils.MmWriter`. Other blocks are rewritten line by line.
+
+    Parameters
+    ----------
+    block : bytes
+        Complete lines from the data section of an MM file.
+    old2new : numpy.ndarray
+        Old -> new (0-based) id mapping, -1 for removed ids.
+
+    Returns
+    -------
+    (bytes, numpy.ndarray, numpy.ndarray)
+        The rewritten lines, 0-based document number of each written line and the offset of each written line
+        in the output.
+
+    """
+    buf = np.frombuffer(block, dtype=np.uint8)
+    if buf[-1] != ord('\n'):
+        buf = np.append(buf, np.uint8(ord('\n')))
+    line_ends = np.flatnonzero(buf == ord('\n'))
+    spaces = np.flatnonzero(buf == ord(' '))
+    fields = np.fromstring(buf.tobytes(), dtype=np.float64, sep=' ')
+    num_lines = len(line_ends)
+    if len(spaces) != 2 * num_lines or len(fields) != 3 * num_lines:
+        return _remap_mm_lines(block, old2new)
+
+    line_starts = np.empty(num_lines, dtype=np.int64)
+    line_starts[0], line_starts[1:] = 0, line_ends[:-1] + 1
+    spaces = spaces.reshape(-1, 2)
+    # exactly "docid termid value": two single spaces per line, each followed by a field
+    irregular = (spaces[:, 0] <= line_starts) | (spaces[:, 1] <= spaces[:, 0] + 1) | (spaces[:, 1] + 1 >= line_ends)
+    if np.any(irregular) or np.any((buf == ord('\t')) | (buf == ord('\r'))):
+        return _remap_mm_lines(block, old2new)
+
+    fields = fields.reshape(-1, 3)
+    docnos, termids = fields[:, 0].astype(np.int64) - 1, fields[:, 1].astype(np.int64) - 1
+    new_ids = np.full(num_lines, -1, dtype=np.int64)
+    known = termids < len(old2new)
+    new_ids[known] = old2new[termids[known]]
+    kept = new_ids >= 0
+    docnos, new_ids = docnos[kept], new_ids[kept]
+    line_starts, spaces, line_ends = line_starts[kept], spaces[kept], line_ends[kept]
+    if not len(docnos):
+        return b'', docnos, docnos
+
+    # each output line = "docid " from the input + the new id + " value\n" from the input
+    id_texts = ' '.join(map(str, (new_ids + 1).tolist())).encode('ascii')
+    id_lengths = np.floor(np.log10(new_ids + 1)).astype(np.int64) + 1
+    id_starts = np.zeros(len(new_ids), dtype=np.int64)
+    np.cumsum(id_lengths[:-1] + 1, out=id_starts[1:])
+    source = np.concatenate([buf, np.frombuffer(id_texts, dtype=np.uint8)])
+    seg_starts = np.column_stack([line_starts, id_starts + len(buf), spaces[:, 1]]).ravel()
+    seg_lengths = np.column_stack([spaces[:, 0] + 1 - line_starts, id_lengths, line_ends + 1 - spaces[:, 1]]).ravel()
+    seg_offsets = np.zeros(len(seg_lengths), dtype=np.int64)
+    np.cumsum(seg_lengths[:-1], out=seg_offsets[1:])
+    positions = np.arange(seg_offsets[-1] + seg_lengths[-1], dtype=np.int64)
+    positions += np.repeat(seg_starts - seg_offsets, seg_lengths)
+    return source[positions].tobytes(), docnos, seg_offsets[::3]
+
+
+def _remap_mm_lines(block, old2new):
+    """Slow, line by line variant of :func:`~gensim.corpora.mmcorpus._remap_mm_block` for irregular input."""
+    num_ids = len(old2new)
+    out, docnos, line_offsets, pos = [], [], [], 0
+    for line in block.splitlines():
+        fields = line.split(None, 2)
+        if len(fields) < 3:
+            continue
+        docid, termid, value = fields
+        # -1 because matrix market indexes are 1-based => convert to 0-based
+        termid = int(termid) - 1
+        new_id = old2new[termid] if termid < num_ids else -1
+        if new_id < 0:
+            continue
+        line = b' '.join((docid, str(new_id + 1).encode('ascii'), value.rstrip())) + b'\n'
+        docnos.append(int(docid) - 1)
+        line_offsets.append(pos)
+        out.append(line)
+        pos += len(line)
+    return b''.join(out), np.array(docnos, dtype=np.int64), np.array(line_offsets, dtype=np.int64)
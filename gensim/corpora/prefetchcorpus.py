@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Corpus wrapper that reads and decodes the next few chunks of another corpus in the background.
+
+Notes
+-----
+Models read their training corpus synchronously: while a chunk is being parsed from disk, the model waits, and
+while the model trains on a chunk, the disk is idle. :class:`~gensim.corpora.prefetchcorpus.PrefetchCorpus`
+overlaps the two, by reading chunks in a background thread or process and keeping at most `prefetch` of them
+ready in a bounded queue.
+
+The wrapper is a regular corpus, so it can be passed anywhere a corpus is expected. Models that consume their
+input in chunks through :func:`~gensim.matutils.corpus2csc_chunks` (such as
+:meth:`~gensim.models.ldamodel.LdaModel.update` and :meth:`~gensim.models.lsimodel.LsiModel.add_documents`)
+receive prefetched sparse chunks, while plain iteration (such as in
+:meth:`~gensim.similarities.docsim.Similarity.add_documents`) receives prefetched documents.
+
+With `mode='thread'`, chunks are passed to the consumer as they are. This works best when decoding releases the
+GIL, which is the case for the compiled readers of :class:`~gensim.corpora.mmcorpus.MmCorpus` and for
+memory-mapped formats such as :class:`~gensim.corpora.csrcorpus.CsrCorpus`.
+
+With `mode='process'`, chunks are decoded in a separate process, into a ring of `prefetch` shared-memory buffers
+of `buffer_size` bytes each. Only the array shapes travel through the inter-process queue, so chunks are not
+pickled (chunks too large for a buffer are pickled as a fallback). Pure Python readers, such as
+:class:`~gensim.corpora.textcorpus.TextCorpus`, benefit most from this mode.
+
+After each pass, queue starvation metrics are logged and stored in `stats`, which tell whether reading
+(many starved reads) or training (long producer waits) is the bottleneck.
+
+Examples
+--------
+.. sourcecode:: pycon
+
+    >>> from gensim.corpora import MmCorpus, PrefetchCorpus
+    >>> from gensim.models import LdaModel
+    >>> from gensim.test.utils import datapath, common_dictionary
+    >>>
+    >>> corpus = PrefetchCorpus(MmCorpus(datapath('testcorpus.mm')), prefetch=4)
+    >>> lda = LdaModel(corpus, id2word=common_dictionary, num_topics=2, chunksize=3)
+    >>> corpus.stats['chunks']
+    3
+
+"""
+
+from __future__ import with_statement
+
+import logging
+import multiprocessing
+import threading
+import time
+import traceback
+
+import numpy as np
+import scipy.sparse
+from six.moves import queue
+
+from gensim import interfaces, matutils, utils
+
+logger = logging.getLogger(__name__)
+
+# message types sent from the background reader to the consumer
+_CHUNK, _SHARED, _DONE, _ERROR = 'chunk', 'shared', 'done', 'error'
+
+
+class PrefetchCorpus(interfaces.CorpusABC):
+    """Wrap a corpus so that its next `prefetch` chunks are read in the background.
+
+    Attributes
+    ----------
+    corpus : iterable of list of (int, number)
+        The wrapped corpus.
+    stats : dict of (str, number)
+        Queue metrics of the last pass over the corpus:
+
+        * `chunks`: number of chunks passed to the consumer.
+        * `starved`: how many times the consumer found the queue empty and had to wait (including the very first
+          chunk).
+        * `wait_time`: seconds the consumer spent waiting for chunks.
+        * `producer_wait`: seconds the background reader spent waiting for room in the queue.
+        * `pickled`: number of chunks too large for the shared-memory buffers (`mode='process'` only).
+
+    """
+    def __init__(self, corpus, prefetch=2, chunksize=2000, mode='thread', buffer_size=32 * 1024 ** 2):
+        """
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, number)
+            Input corpus, in BoW format.
+        prefetch : int, optional
+            Maximum number of chunks read ahead.
+        chunksize : int, optional
+            Number of documents in each chunk, when iterating over documents. Chunked consumers choose their own
+            chunk size through :meth:`~gensim.corpora.prefetchcorpus.PrefetchCorpus.iter_csc_chunks`.
+        mode : {'thread', 'process'}, optional
+            Read in a background thread, or in a background process that passes chunks through shared memory.
+            In the latter case, `corpus` must be picklable on platforms that do not fork.
+        buffer_size : int, optional
+            Size of each shared-memory buffer in bytes, for `mode='process'`.
+
+        """
+        if mode not in ('thread', 'process'):
+            raise ValueError("mode must be 'thread' or 'process', not %r" % mode)
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        self.corpus = corpus
+        self.prefetch = int(prefetch)
+        self.chunksize = int(chunksize)
+        self.mode = mode
+        self.buffer_size = int(buffer_size)
+        self.num_terms = getattr(corpus, 'num_terms', None)
+        self.stats = {}
+
+    def __len__(self):
+        return len(self.corpus)
+
+    def __str__(self):
+        return "PrefetchCorpus(%s, prefetch=%i, mode=%s)" % (self.corpus, self.prefetch, self.mode)
+
+    def __iter__(self):
+        """Iterate over the documents of the wrapped corpus.
+
+        Yields
+        ------
+        list of (int, number)
+            Document in BoW format. With `mode='process'`, documents are decoded from sparse chunks, so their
+            term ids come sorted and their weights as floats.
+
+        """
+        if self.mode == 'thread':
+            for chunk in self._prefetch_thread(utils.grouper(self.corpus, self.chunksize)):
+                for doc in chunk:
+                    yield doc
+        else:
+            for chunk in self.iter_csc_chunks(self.chunksize):
+                for docno in range(chunk.shape[1]):
+                    start, end = chunk.indptr[docno], chunk.indptr[docno + 1]
+                    yield list(zip(chunk.indices[start:end].tolist(), chunk.data[start:end].tolist()))
+
+    def iter_csc_chunks(self, chunksize=None, num_terms=None, dtype=np.float64):
+        """Iterate over the wrapped corpus in sparse chunks, read in the background.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of documents in each chunk, defaults to `self.chunksize`.
+        num_terms : int, optional
+            Number of rows of each chunk, see :func:`~gensim.matutils.corpus2csc_chunks`.
+        dtype : data-type, optional
+            Data type of the chunks.
+
+        Yields
+        ------
+        scipy.sparse.csc_matrix
+            Chunk of shape (`num_terms`, number of documents in the chunk).
+
+        """
+        chunksize = self.chunksize if chunksize is None else int(chunksize)
+        if num_terms is None:
+            num_terms = self.num_terms
+        if self.mode == 'thread':
+            chunks = matutils.corpus2csc_chunks(self.corpus, chunksize, num_terms=num_terms, dtype=dtype)
+            for chunk in self._prefetch_thread(chunks):
+                yield chunk
+        else:
+            for chunk in self._prefetch_process(chunksize, num_terms, dtype):
+                yield chunk
+
+    def _start_pass(self):
+        self.stats = {'chunks': 0, 'starved': 0, 'wait_time': 0.0, 'producer_wait': 0.0, 'pickled': 0}
+        return self.stats
+
+    def _get(self, q, stats, producer):
+        """Take the next message from `q`, recording how long the consumer was starved for input."""
+        try:
+            return q.get(block=False)
+        except queue.Empty:
+            pass
+        stats['starved'] += 1
+        start = time.time()
+        while True:
+            try:
+                item = q.get(timeout=1.0)
+                break
+            except queue.Empty:
+                if not producer.is_alive():
+                    raise RuntimeError("background reader of %s exited unexpectedly" % self.corpus)
+        stats['wait_time'] += time.time() - start
+        return item
+
+    def _end_pass(self, stats):
+        logger.info(
+            "prefetched %i chunks: consumer starved %i times for %.2fs, reader blocked on a full queue for %.2fs",
+            stats['chunks'], stats['starved'], stats['wait_time'], stats['producer_wait']
+        )
+        if stats['pickled']:
+            logger.warning(
+                "%i chunks did not fit into the shared buffers and were pickled; consider increasing buffer_size",
+                stats['pickled']
+            )
+
+    def _prefetch_thread(self, chunks):
+        """Read `chunks` in a background thread, yield them in the same order."""
+        stats = self._start_pass()
+        q = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def put(item):
+            start = time.time()
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            stats['producer_wait'] += time.time() - start
+            return not stop.is_set()
+
+        def produce():
+            try:
+                for chunk in chunks:
+                    if not put((_CHUNK, chunk)):
+                        return
+                put((_DONE, None))
+            except Exception as err:
+                put((_ERROR, err))
+
+        producer = threading.Thread(target=produce, name='PrefetchCorpus')
+        producer.daemon = True
+        producer.start()
+        try:
+            while True:
+                kind, payload = self._get(q, stats, producer)
+                if kind == _DONE:
+                    break
+                elif kind == _ERROR:
+                    raise payload
+                stats['chunks'] += 1
+                yield payload
+                del payload
+        finally:
+            stop.set()
+            producer.join()
+            self._end_pass(stats)
+
+    def _prefetch_process(self, chunksize, num_terms, dtype):
+        """Read sparse chunks in a background process, passing them through a ring of shared-memory buffers."""
+        stats = self._start_pass()
+        buffers = [multiprocessing.RawArray('b', self.buffer_size) for _ in range(self.prefetch)]
+        free_slots = multiprocessing.Queue()
+        for slot in range(self.prefetch):
+            free_slots.put(slot)
+        ready = multiprocessing.Queue(maxsize=self.prefetch)
+        producer = multiprocessing.Process(
+            target=_produce_shared, name='PrefetchCorpus',
+            args=(self.corpus, chunksize, num_terms, dtype, buffers, free_slots, ready)
+        )
+        producer.daemon = True
+        producer.start()
+        try:
+            while True:
+                kind, payload = self._get(ready, stats, producer)
+                if kind == _DONE:
+                    stats['producer_wait'] = payload
+                    break
+                elif kind == _ERROR:
+                    raise RuntimeError("background reader of %s failed:\n%s" % (self.corpus, payload))
+                elif kind == _SHARED:
+                    slot, shape, layout = payload
+                    data, indices, indptr = _unpack_arrays(buffers[slot], layout)
+                    free_slots.put(slot)
+                    chunk = scipy.sparse.csc_matrix((data, indices, indptr), shape=shape, copy=False)
+                else:
+                    stats['pickled'] += 1
+                    chunk = payload
+                stats['chunks'] += 1
+                yield chunk
+                del chunk, payload
+        finally:
+            if producer.is_alive():
+                producer.terminate()
+            producer.join()
+            free_slots.cancel_join_thread()
+            self._end_pass(stats)
+
+
+def _pack_arrays(buf, arrays):
+    """Copy `arrays` into the shared buffer `buf`, return their layout or None if they do not fit."""
+    layout, offset = [], 0
+    for array in arrays:
+        layout.append((offset, array.dtype.str, len(array)))
+        offset += -(-array.nbytes // 8) * 8  # keep every array 8-byte aligned
+    if offset > len(buf):
+        return None
+    target = np.frombuffer(buf, dtype=np.uint8)
+    for array, (offset, _, _) in zip(arrays, layout):
+        target[offset:offset + array.nbytes] = np.ascontiguousarray(array).view(np.uint8)
+    return layout
+
+
+def _unpack_arrays(buf, layout):
+    """Copy the arrays described by `layout` out of the shared buffer `buf`, so that it can be reused."""
+    return [
+        np.frombuffer(buf, dtype=dtype, count=length, offset=offset).copy()
+        for offset, dtype, length in layout
+    ]
+
+
+def _produce_shared(corpus, chunksize, num_terms, dtype, buffers, free_slots, ready):
+    """Body of the background process of :class:`~gensim.corpora.prefetchcorpus.PrefetchCorpus`."""
+    waited = 0.0
+    try:
+        for chunk in matutils.corpus2csc_chunks(corpus, chunksize, num_terms=num_terms, dtype=dtype):
+            start = time.time()
+            slot = free_slots.get()
+            waited += time.time() - start
+            layout = _pack_arrays(buffers[slot], (chunk.data, chunk.indices, chunk.indptr))
+            if layout is None:
+                free_slots.put(slot)
+                message = (_CHUNK, chunk)
+            else:
+                message = (_SHARED, (slot, chunk.shape, layout))
+            start = time.time()
+            ready.put(message)
+            waited += time.time() - start
+        ready.put((_DONE, waited))
+    except Exception:
+        ready.put((_ERROR, traceback.format_exc()))
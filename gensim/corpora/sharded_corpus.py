@@ -19,7 +19,9 @@ using SGD, which usually involves heavy matrix multiplication).
 
 from __future__ import print_function
 
+import copy
 import logging
+import multiprocessing
 import os
 import math
 import numpy
@@ -30,6 +32,7 @@ from six.moves import range
 
 import gensim
 from gensim.corpora import IndexedCorpus
+from gensim.corpora.dictionary import old2new_array
 from gensim.interfaces import TransformedCorpus
 
 logger = logging.getLogger(__name__)
@@ -144,6 +147,20 @@ class ShardedCorpus(IndexedCorpus):
 
     The CSR format is used for sparse data throughout.
 
+    By default, each shard is pickled and has to be unpickled whole when it
+    is opened. With the `mmap_shards` flag, each shard is stored as a raw
+    `.npy` file instead (sparse shards as three `.npy` files holding the CSR
+    `indptr`, `indices` and `data` arrays), which is opened with
+    `mmap_mode='r'`. Opening a shard is then instant, only the rows that are
+    actually retrieved are read from disk, and slices that fall within a
+    single shard are returned as read-only views without copying anything.
+
+    .. sourcecode:: pycon
+
+        >>> mmap_prefix = 'mydata.mmap.shdat'
+        >>> corpus = ShardedCorpus(mmap_prefix, corpus, dim=1000, mmap_shards=True)
+        >>> batch = corpus[100:150]
+
     Internally, to retrieve data, the dataset keeps track of which shard is
     currently open and on a `__getitem__` request, either returns an item from
     the current shard, or opens a new one. The shard size is constant, except
@@ -151,7 +168,7 @@ class ShardedCorpus(IndexedCorpus):
     """
     def __init__(self, output_prefix, corpus, dim=None,
                  shardsize=4096, overwrite=False, sparse_serialization=False,
-                 sparse_retrieval=False, gensim=False):
+                 sparse_retrieval=False, gensim=False, mmap_shards=False):
         """Initializes the dataset. If `output_prefix` is not found,
         builds the shards.
 
@@ -222,6 +239,12 @@ class ShardedCorpus(IndexedCorpus):
             sparse vectors (list of tuples (id, value)) to make it behave like
             any other gensim corpus. This **will** slow the dataset down.
 
+        :type mmap_shards: bool
+        :param mmap_shards: If set, will store each shard as raw `.npy`
+            files that are memory-mapped when the shard is opened, instead
+            of pickling it. Like `sparse_serialization`, this is fixed when
+            the dataset is built; an existing dataset keeps its own setting.
+
         """
         self.output_prefix = output_prefix
         self.shardsize = shardsize
@@ -237,6 +260,7 @@ class ShardedCorpus(IndexedCorpus):
         self.sparse_serialization = sparse_serialization
         self.sparse_retrieval = sparse_retrieval
         self.gensim = gensim
+        self.mmap_shards = mmap_shards
 
         # The "state" of the dataset.
         self.current_shard = None    # The current shard itself (numpy ndarray)
@@ -313,6 +337,7 @@ class ShardedCorpus(IndexedCorpus):
         self.n_shards = temp.n_shards
         self.n_docs = temp.n_docs
         self.offsets = temp.offsets
+        self.mmap_shards = temp.mmap_shards
 
         if temp.dim != self.dim:
             if self.dim is None:
@@ -328,8 +353,8 @@ class ShardedCorpus(IndexedCorpus):
 
     def save_shard(self, shard, n=None, filename=None):
         """
-        Pickle the given shard. If `n` is not given, will consider the shard
-        a new one.
+        Pickle the given shard (or save it as `.npy` files, if `mmap_shards`
+        is set). If `n` is not given, will consider the shard a new one.
 
         If `filename` is given, will use that file name instead of generating
         one.
@@ -342,7 +367,7 @@ class ShardedCorpus(IndexedCorpus):
 
         if not filename:
             filename = self._shard_name(n)
-        gensim.utils.pickle(shard, filename)
+        _write_shard(shard, filename, self.mmap_shards)
 
         if new_shard:
             self.offsets.append(self.offsets[-1] + shard.shape[0])
@@ -351,8 +376,8 @@ class ShardedCorpus(IndexedCorpus):
 
     def load_shard(self, n):
         """
-        Load (unpickle) the n-th shard as the "live" part of the dataset
-        into the Dataset object."""
+        Load (unpickle, or memory-map if `mmap_shards` is set) the n-th shard
+        as the "live" part of the dataset into the Dataset object."""
 
         # No-op if the shard is already open.
         if self.current_shard_n == n:
@@ -361,7 +386,7 @@ class ShardedCorpus(IndexedCorpus):
         filename = self._shard_name(n)
         if not os.path.isfile(filename):
             raise ValueError('Attempting to load nonexistent shard no. {0}'.format(n))
-        shard = gensim.utils.unpickle(filename)
+        shard = _read_shard(filename, self.mmap_shards, self.sparse_serialization, self.dim)
 
         self.current_shard = shard
         self.current_shard_n = n
@@ -417,8 +442,13 @@ class ShardedCorpus(IndexedCorpus):
         """
         Re-process the dataset to new shard size. This may take pretty long.
         Also, note that you need some space on disk for this one (we're
-        assuming there is enough disk space for double the size of the dataset
-        and that there is enough memory for old + new shardsize).
+        assuming there is enough disk space for double the size of the dataset).
+
+        The new shards are written one at a time, from row blocks of the old
+        shards. With `mmap_shards`, the rows are streamed from the old
+        memory-mapped shards straight into the new memory-mapped files, so
+        no shard is ever held in memory whole; otherwise, memory for one
+        old and one new shard is needed.
 
         :type shardsize: int
         :param shardsize: The new shard size.
@@ -434,37 +464,33 @@ class ShardedCorpus(IndexedCorpus):
 
         for new_shard_idx in range(n_new_shards):
             new_start = shardsize * new_shard_idx
-            new_stop = new_start + shardsize
-
-            # Last shard?
-            if new_stop > self.n_docs:
-                # Sanity check
-                assert new_shard_idx == n_new_shards - 1, \
-                    'Shard no. {0} that ends at {1} over last document' \
-                    ' ({2}) is not the last projected shard ({3})???' \
-                    ''.format(new_shard_idx, new_stop, self.n_docs, n_new_shards)
-                new_stop = self.n_docs
-
-            new_shard = self[new_start:new_stop]
+            new_stop = min(new_start + shardsize, self.n_docs)
+
             new_shard_name = self._resized_shard_name(new_shard_idx)
             new_shard_names.append(new_shard_name)
 
             try:
-                self.save_shard(new_shard, new_shard_idx, new_shard_name)
+                self._write_blocks(self._iter_blocks(new_start, new_stop), new_shard_name)
             except Exception:
                 # Clean up on unsuccessful resize.
                 for new_shard_name in new_shard_names:
-                    os.remove(new_shard_name)
+                    for fname in self._shard_files(new_shard_name):
+                        if os.path.exists(fname):
+                            os.remove(fname)
                 raise
 
             new_offsets.append(new_stop)
 
+        # Close the current shard, its files are about to be removed.
+        self.reset()
+
         # Move old shard files out, new ones in. Complicated due to possibility
         # of exceptions.
         old_shard_names = [self._shard_name(n) for n in range(self.n_shards)]
         try:
             for old_shard_n, old_shard_name in enumerate(old_shard_names):
-                os.remove(old_shard_name)
+                for fname in self._shard_files(old_shard_name):
+                    os.remove(fname)
         except Exception as e:
             logger.error(
                 'Exception occurred during old shard no. %d removal: %s.\nAttempting to at least move new shards in.',
@@ -475,7 +501,9 @@ class ShardedCorpus(IndexedCorpus):
             # new guys in.
             try:
                 for shard_n, new_shard_name in enumerate(new_shard_names):
-                    os.rename(new_shard_name, self._shard_name(shard_n))
+                    new_files = self._shard_files(new_shard_name)
+                    for new_fname, fname in zip(new_files, self._shard_files(self._shard_name(shard_n))):
+                        os.rename(new_fname, fname)
             # If something happens when we're in this stage, we're screwed.
             except Exception as e:
                 logger.exception(e)
@@ -487,6 +515,106 @@ class ShardedCorpus(IndexedCorpus):
                 self.shardsize = shardsize
                 self.reset()
 
+    def _write_blocks(self, blocks, filename):
+        """
+        Save the row `blocks` (as yielded by `_iter_blocks`) as one shard
+        to `filename`. With `mmap_shards`, the blocks are copied one by one
+        into memory-mapped output files, without building the shard in
+        memory.
+
+        """
+        blocks = list(blocks)
+        if not self.mmap_shards:
+            if self.sparse_serialization:
+                shard = sparse.vstack(blocks, format='csr')
+            else:
+                shard = numpy.concatenate(blocks)
+            _write_shard(shard, filename, False)
+            return
+
+        n_rows = sum(block.shape[0] for block in blocks)
+        if not self.sparse_serialization:
+            out = numpy.lib.format.open_memmap(filename, mode='w+', dtype=blocks[0].dtype, shape=(n_rows, self.dim))
+            row = 0
+            for block in blocks:
+                out[row:row + block.shape[0]] = block
+                row += block.shape[0]
+            out.flush()
+            del out
+            return
+
+        nnz = sum(block.nnz for block in blocks)
+        indptr_dtype = numpy.int64 if nnz > numpy.iinfo(numpy.int32).max else numpy.int32
+        indptr = numpy.lib.format.open_memmap(filename, mode='w+', dtype=indptr_dtype, shape=(n_rows + 1,))
+        indices = numpy.lib.format.open_memmap(filename + '.indices', mode='w+', dtype=indptr_dtype, shape=(nnz,))
+        data = numpy.lib.format.open_memmap(filename + '.data', mode='w+', dtype=blocks[0].dtype, shape=(nnz,))
+        indptr[0] = 0
+        row, pos = 0, 0
+        for block in blocks:
+            indptr[row + 1:row + block.shape[0] + 1] = block.indptr[1:] + pos
+            indices[pos:pos + block.nnz] = block.indices
+            data[pos:pos + block.nnz] = block.data
+            row += block.shape[0]
+            pos += block.nnz
+        for out in (indptr, indices, data):
+            out.flush()
+        del indptr, indices, data
+
+    def remap_ids(self, output_prefix, old2new, index_fname=None, workers=1, **kwargs):
+        """
+        Save a copy of the dataset with the feature columns translated by
+        `old2new` (e.g. as returned by `Dictionary.filter_extremes`), dropping
+        removed features. Each shard is loaded, sliced column-wise and saved
+        under `output_prefix` on its own, in `workers` processes; the sharding
+        and serialization settings are kept.
+
+        :type output_prefix: str
+        :param output_prefix: Prefix of the new dataset, see `__init__`.
+
+        :type old2new: numpy.ndarray or dict
+        :param old2new: Mapping of old feature ids to new feature ids, -1 (or
+            missing dict key) for removed features. The new ids of the kept
+            features must be exactly `0..number of kept features - 1`.
+
+        :type workers: int
+        :param workers: How many shards to process in parallel.
+
+        Ignore the parameters index_fname and kwargs. They are here only to
+        provide a compatible method signature with superclass.
+
+        :rtype: ShardedCorpus
+        :returns: The new dataset.
+        """
+        old2new = old2new_array(old2new)[:self.dim]
+        kept = numpy.flatnonzero(old2new >= 0)
+        if not numpy.array_equal(numpy.sort(old2new[kept]), numpy.arange(len(kept))):
+            raise ValueError(
+                "old2new must map the %i kept features to the distinct new ids 0..%i"
+                % (len(kept), len(kept) - 1)
+            )
+        new2old = numpy.empty(len(kept), dtype=numpy.int64)
+        new2old[old2new[kept]] = kept
+
+        result = copy.copy(self)
+        result.reset()
+        result.output_prefix = output_prefix
+        result.dim = len(new2old)
+
+        layout = (self.mmap_shards, self.sparse_serialization, self.dim)
+        jobs = [(self._shard_name(n), result._shard_name(n), new2old, layout) for n in range(self.n_shards)]
+        if workers > 1 and len(jobs) > 1:
+            pool = multiprocessing.Pool(min(workers, len(jobs)))
+            try:
+                pool.map(_remap_shard, jobs)
+            finally:
+                pool.terminate()
+        else:
+            for job in jobs:
+                _remap_shard(job)
+
+        result.save()
+        return result
+
     def _shard_name(self, n):
         """Generate the name for the n-th shard."""
         return self.output_prefix + '.' + str(n)
@@ -498,6 +626,12 @@ class ShardedCorpus(IndexedCorpus):
         """
         return self.output_prefix + '.resize-temp.' + str(n)
 
+    def _shard_files(self, shard_name):
+        """List all files that make up the shard saved as `shard_name`."""
+        if self.mmap_shards and self.sparse_serialization:
+            return [shard_name, shard_name + '.indices', shard_name + '.data']
+        return [shard_name]
+
     def _guess_n_features(self, corpus):
         """Attempt to guess number of features in `corpus`."""
         n_features = None
@@ -560,111 +694,80 @@ class ShardedCorpus(IndexedCorpus):
     def get_by_offset(self, offset):
         """As opposed to getitem, this one only accepts ints as offsets."""
         self._ensure_shard(offset)
+        if self.sparse_serialization:
+            return _csr_rows(self.current_shard, offset - self.current_offset, offset - self.current_offset + 1)
         result = self.current_shard[offset - self.current_offset]
         return result
 
+    def _iter_blocks(self, start, stop):
+        """
+        Yield the rows `start:stop` of the dataset as consecutive blocks,
+        one block per shard the rows fall into, in the serialized format
+        (ndarray or csr matrix). The blocks are views into the shards where
+        possible.
+
+        """
+        while start < stop:
+            self._ensure_shard(start)
+            shard_stop = min(stop, self.offsets[self.current_shard_n + 1])
+            shard_start, shard_end = start - self.current_offset, shard_stop - self.current_offset
+            if self.sparse_serialization:
+                yield _csr_rows(self.current_shard, shard_start, shard_end)
+            else:
+                yield self.current_shard[shard_start:shard_end]
+            start = shard_stop
+
     def __getitem__(self, offset):
         """
         Retrieve the given row of the dataset. Supports slice notation.
 
+        Slices that fall within a single shard are views into that shard,
+        not copies (with `mmap_shards`, read-only views of the shard files).
+
         """
         if isinstance(offset, list):
-
-            # Handle all serialization & retrieval options.
+            if not offset:
+                return self._getitem_format(self._empty_result())
+
+            # Group the requested rows by shard, so that each shard is
+            # loaded only once, then restore the requested order.
+            offset = numpy.asarray(offset)
+            if offset.min() < 0 or offset.max() >= self.n_docs:
+                raise ValueError('Offsets out of range ({0} docs): {1}'.format(self.n_docs, offset))
+            shard_ids = numpy.searchsorted(self.offsets, offset, side='right') - 1
+            order = numpy.argsort(shard_ids, kind='mergesort')
+            blocks = []
+            for shard_n in numpy.unique(shard_ids):
+                self.load_shard(shard_n)
+                rows = offset[shard_ids == shard_n] - self.current_offset
+                blocks.append(self.current_shard[rows])
             if self.sparse_serialization:
-                l_result = sparse.vstack([self.get_by_offset(i)
-                                          for i in offset])
-                if self.gensim:
-                    l_result = self._getitem_sparse2gensim(l_result)
-                elif not self.sparse_retrieval:
-                    l_result = numpy.array(l_result.todense())
+                l_result = sparse.vstack(blocks, format='csr')
             else:
-                l_result = numpy.array([self.get_by_offset(i) for i in offset])
-                if self.gensim:
-                    l_result = self._getitem_dense2gensim(l_result)
-                elif self.sparse_retrieval:
-                    l_result = sparse.csr_matrix(l_result)
-
-            return l_result
+                l_result = numpy.concatenate(blocks)
+            l_result = l_result[numpy.argsort(order, kind='mergesort')]
+            return self._getitem_format(l_result)
 
         elif isinstance(offset, slice):
-            start = offset.start
-            stop = offset.stop
+            start = 0 if offset.start is None else offset.start
+            stop = self.n_docs if offset.stop is None else offset.stop
             if stop > self.n_docs:
                 raise IndexError('Requested slice offset {0} out of range ({1} docs)'.format(stop, self.n_docs))
+            if start < 0:
+                raise ValueError('Negative offset {0} currently not supported.'.format(start))
+
+            blocks = list(self._iter_blocks(start, stop))
+            if not blocks:
+                s_result = self._empty_result()
+            elif len(blocks) == 1:
+                # The easy case: both in one shard, no copy needed.
+                s_result = blocks[0]
+            elif self.sparse_serialization:
+                s_result = sparse.vstack(blocks, format='csr')
+            else:
+                s_result = numpy.concatenate(blocks)
 
-            # - get range of shards over which to iterate
-            first_shard = self.shard_by_offset(start)
-
-            last_shard = self.n_shards - 1
-            if not stop == self.n_docs:
-                last_shard = self.shard_by_offset(stop)
-                # This fails on one-past
-                # slice indexing; that's why there's a code branch here.
-
-            self.load_shard(first_shard)
-
-            # The easy case: both in one shard.
-            if first_shard == last_shard:
-                s_result = self.current_shard[start - self.current_offset: stop - self.current_offset]
-                # Handle different sparsity settings:
-                s_result = self._getitem_format(s_result)
-
-                return s_result
-
-            # The hard case: the slice is distributed across multiple shards
-            # - initialize numpy.zeros()
-            s_result = numpy.zeros((stop - start, self.dim), dtype=self.current_shard.dtype)
-            if self.sparse_serialization:
-                s_result = sparse.csr_matrix((0, self.dim), dtype=self.current_shard.dtype)
-
-            # - gradually build it up. We will be using three set of start:stop
-            #   indexes:
-            #    - into the dataset (these are the indexes the caller works with)
-            #    - into the current shard
-            #    - into the result
-
-            # Indexes into current result rows. These are always smaller than
-            # the dataset indexes by `start` (as we move over the shards,
-            # we're moving by the same number of rows through the result).
-            result_start = 0
-            result_stop = self.offsets[self.current_shard_n + 1] - start
-
-            # Indexes into current shard. These are trickiest:
-            #  - if in starting shard, these are from (start - current_offset)
-            #    to self.shardsize
-            #  - if in intermediate shard, these are from 0 to self.shardsize
-            #  - if in ending shard, these are from 0
-            #    to (stop - current_offset)
-            shard_start = start - self.current_offset
-            shard_stop = self.offsets[self.current_shard_n + 1] - self.current_offset
-
-            # s_result[result_start:result_stop] = self.current_shard[
-            #                                         shard_start:shard_stop]
-            s_result = self.__add_to_slice(s_result, result_start, result_stop, shard_start, shard_stop)
-
-            # First and last get special treatment, these are in between
-            for shard_n in range(first_shard + 1, last_shard):
-                self.load_shard(shard_n)
-
-                result_start = result_stop
-                result_stop += self.shardsize
-                shard_start = 0
-                shard_stop = self.shardsize
-
-                s_result = self.__add_to_slice(s_result, result_start, result_stop, shard_start, shard_stop)
-
-            # Last shard
-            self.load_shard(last_shard)
-            result_start = result_stop
-            result_stop += stop - self.current_offset
-            shard_start = 0
-            shard_stop = stop - self.current_offset
-
-            s_result = self.__add_to_slice(s_result, result_start, result_stop, shard_start, shard_stop)
-            s_result = self._getitem_format(s_result)
-
-            return s_result
+            return self._getitem_format(s_result)
 
         else:
             s_result = self.get_by_offset(offset)
@@ -672,43 +775,11 @@ class ShardedCorpus(IndexedCorpus):
 
             return s_result
 
-    def __add_to_slice(self, s_result, result_start, result_stop, start, stop):
-        """
-        Add the rows of the current shard from `start` to `stop`
-        into rows `result_start` to `result_stop` of `s_result`.
-
-        Operation is based on the self.sparse_serialize setting. If the shard
-        contents are dense, then s_result is assumed to be an ndarray that
-        already supports row indices `result_start:result_stop`. If the shard
-        contents are sparse, assumes that s_result has `result_start` rows
-        and we should add them up to `result_stop`.
-
-        Returns the resulting s_result.
-        """
-        if (result_stop - result_start) != (stop - start):
-            raise ValueError(
-                'Result start/stop range different than stop/start range (%d - %d vs. %d - %d)'
-                .format(result_start, result_stop, start, stop)
-            )
-
-        # Dense data: just copy using numpy's slice notation
-        if not self.sparse_serialization:
-            s_result[result_start:result_stop] = self.current_shard[start:stop]
-
-            return s_result
-
-        # A bit more difficult, we're using a different structure to build the
-        # result.
-        else:
-            if s_result.shape != (result_start, self.dim):
-                raise ValueError(
-                    'Assuption about sparse s_result shape invalid: {0} expected rows, {1} real rows.'
-                    .format(result_start, s_result.shape[0])
-                )
-
-            tmp_matrix = self.current_shard[start:stop]
-            s_result = sparse.vstack([s_result, tmp_matrix])
-            return s_result
+    def _empty_result(self):
+        """An empty result with no rows, in the serialized format."""
+        if self.sparse_serialization:
+            return sparse.csr_matrix((0, self.dim), dtype=_default_dtype)
+        return numpy.zeros((0, self.dim), dtype=_default_dtype)
 
     def _getitem_format(self, s_result):
         if self.sparse_serialization:
@@ -757,6 +828,40 @@ class ShardedCorpus(IndexedCorpus):
         for i in range(len(self)):
             yield self[i]
 
+    def iter_csc_chunks(self, chunksize=2000, num_terms=None, dtype=numpy.float64):
+        """
+        Yield the dataset in chunks of `chunksize` documents, each a
+        `scipy.sparse.csc_matrix` of shape (`num_terms`, documents in chunk),
+        documents as columns. The chunks are cut directly from the shards,
+        regardless of the `gensim` and `sparse_retrieval` settings.
+
+        :type chunksize: int
+        :param chunksize: Number of documents in each chunk (only the last
+            chunk may be smaller).
+
+        :type num_terms: int
+        :param num_terms: Number of rows of each chunk, at least `self.dim`.
+            Defaults to `self.dim`.
+
+        :type dtype: numpy.dtype
+        :param dtype: Data type of the chunks.
+
+        """
+        if num_terms is None:
+            num_terms = self.dim
+        for start in range(0, self.n_docs, chunksize):
+            blocks = self._iter_blocks(start, min(start + chunksize, self.n_docs))
+            yield self._csc_chunk([sparse.csr_matrix(block) for block in blocks], num_terms, dtype)
+
+    @staticmethod
+    def _csc_chunk(blocks, num_terms, dtype):
+        """Stack csr row blocks into one csc matrix with documents as columns."""
+        rows = sparse.vstack(blocks, format='csr') if len(blocks) > 1 else sparse.csr_matrix(blocks[0])
+        indices = rows.indices if rows.indices.flags.writeable else rows.indices.copy()  # not a read-only mmap
+        return sparse.csc_matrix(
+            (rows.data.astype(dtype), indices, rows.indptr), shape=(num_terms, rows.shape[0]), dtype=dtype
+        )
+
     def save(self, *args, **kwargs):
         """
         Save itself (the wrapper) in clean state (after calling `reset()`)
@@ -777,9 +882,14 @@ class ShardedCorpus(IndexedCorpus):
     @classmethod
     def load(cls, fname, mmap=None):
         """
-        Load itself in clean state. `mmap` has no effect here.
+        Load itself in clean state. `mmap` has no effect here (use the
+        `mmap_shards` option to memory-map the shards themselves).
         """
-        return super(ShardedCorpus, cls).load(fname, mmap)
+        result = super(ShardedCorpus, cls).load(fname, mmap)
+        if not hasattr(result, 'mmap_shards'):
+            # saved by an older version, which always pickled its shards
+            result.mmap_shards = False
+        return result
 
     @staticmethod
     def save_corpus(fname, corpus, id2word=None, progress_cnt=1000, metadata=False, **kwargs):
@@ -819,3 +929,63 @@ class ShardedCorpus(IndexedCorpus):
         and metadata. They currently do nothing and are here only to
         provide a compatible method signature with superclass."""
         serializer.save_corpus(fname, corpus, id2word=id2word, progress_cnt=progress_cnt, metadata=metadata, **kwargs)
+
+
+def _write_shard(shard, filename, mmap_shards):
+    """
+    Save `shard` to `filename`: pickled, or as raw `.npy` files that can be
+    memory-mapped if `mmap_shards` is set. A sparse shard is then saved as
+    its CSR `indptr` in `filename`, with `indices` and `data` in
+    `filename.indices` and `filename.data`.
+    """
+    if not mmap_shards:
+        gensim.utils.pickle(shard, filename)
+        return
+    if sparse.issparse(shard):
+        shard = sparse.csr_matrix(shard)
+        arrays = [(filename, shard.indptr), (filename + '.indices', shard.indices), (filename + '.data', shard.data)]
+    else:
+        arrays = [(filename, numpy.asarray(shard))]
+    for fname, array in arrays:
+        with open(fname, 'wb') as fout:
+            numpy.save(fout, array)
+
+
+def _read_shard(filename, mmap_shards, sparse_serialization, dim):
+    """
+    Load a shard saved by `_write_shard`. With `mmap_shards`, the arrays are
+    memory-mapped read-only rather than read into memory.
+    """
+    if not mmap_shards:
+        return gensim.utils.unpickle(filename)
+    if not sparse_serialization:
+        return numpy.load(filename, mmap_mode='r')
+    indptr = numpy.load(filename, mmap_mode='r')
+    indices = numpy.load(filename + '.indices', mmap_mode='r')
+    data = numpy.load(filename + '.data', mmap_mode='r')
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, dim), copy=False)
+
+
+def _csr_rows(matrix, start, stop):
+    """
+    Rows `start:stop` of the csr `matrix`, sharing its `indices` and `data`
+    (only the small `indptr` array is copied).
+    """
+    lo, hi = matrix.indptr[start], matrix.indptr[stop]
+    # Set the arrays directly: the csr_matrix constructor would copy views
+    # that are much smaller than their base array.
+    rows = sparse.csr_matrix((stop - start, matrix.shape[1]), dtype=matrix.dtype)
+    rows.data = matrix.data[lo:hi]
+    rows.indices = matrix.indices[lo:hi]
+    rows.indptr = matrix.indptr[start:stop + 1] - lo
+    return rows
+
+
+def _remap_shard(job):
+    """
+    Select (and reorder) the columns `new2old` of a saved shard,
+    saving the result to another file.
+    """
+    fname, new_fname, new2old, (mmap_shards, sparse_serialization, dim) = job
+    shard = _read_shard(fname, mmap_shards, sparse_serialization, dim)
+    _write_shard(shard[:, new2old], new_fname, mmap_shards)
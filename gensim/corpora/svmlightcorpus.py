@@ -10,8 +10,12 @@
 
 from __future__ import with_statement
 
+import itertools
 import logging
 
+import numpy as np
+import scipy.sparse
+
 from gensim import utils
 from gensim.corpora import IndexedCorpus
 
@@ -83,6 +87,61 @@ class SvmLightCorpus(IndexedCorpus):
                     yield doc[0]
         self.length = lineno + 1
 
+    def iter_csc_chunks(self, chunksize=2000, num_terms=None, dtype=np.float64):
+        """Iterate over the corpus in chunks of documents, each as one sparse matrix.
+
+        The `<feature>:<value>` pairs of all lines in a chunk are parsed at once with numpy, without creating the
+        `(int, float)` tuples of each document.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of documents in each chunk (only the last chunk may be smaller).
+        num_terms : int, optional
+            Number of terms = number of rows of each chunk. Defaults to the highest feature id in each chunk + 1,
+            so set it explicitly to get chunks of the same shape.
+        dtype : data-type, optional
+            Data type of the output matrices.
+
+        Yields
+        ------
+        scipy.sparse.csc_matrix
+            Chunk of shape (`num_terms`, number of documents in the chunk), documents as columns.
+
+        """
+        self.labels = []
+        with utils.smart_open(self.fname) as fin:
+            # drop comments and empty lines, like `line2doc`
+            lines = (line.split(b'#', 1)[0].strip() for line in fin)
+            lines = (line for line in lines if line)
+            while True:
+                chunk = list(itertools.islice(lines, chunksize))
+                if not chunk:
+                    break
+                parts = [line.split(None, 1) for line in chunk]
+                if self.store_labels:
+                    self.labels.extend(utils.to_unicode(part[0]) for part in parts)
+                fields = [part[1] if len(part) > 1 else b'' for part in parts]
+                # ignore 'qid' features
+                fields = [
+                    b' '.join(pair for pair in field.split() if not pair.startswith(b'qid:'))
+                    if b'qid:' in field else field
+                    for field in fields
+                ]
+                lengths = np.array([field.count(b':') for field in fields], dtype=np.int64)
+                pairs = np.fromstring(b' '.join(fields).replace(b':', b' '), dtype=np.float64, sep=' ')
+                if len(pairs) != 2 * lengths.sum():
+                    raise ValueError('invalid line format in %s' % self.fname)
+                pairs = pairs.reshape(-1, 2)
+                # convert 1-based feature ids to 0-based
+                indices = pairs[:, 0].astype(np.int64) - 1
+                indptr = np.zeros(len(chunk) + 1, dtype=np.int64)
+                np.cumsum(lengths, out=indptr[1:])
+                rows = num_terms if num_terms is not None else (int(indices.max()) + 1 if len(indices) else 0)
+                yield scipy.sparse.csc_matrix(
+                    (pairs[:, 1].astype(dtype), indices, indptr), shape=(rows, len(chunk)), dtype=dtype
+                )
+
     @staticmethod
     def save_corpus(fname, corpus, id2word=None, labels=False, metadata=False):
         """Save a corpus in the SVMlight format.
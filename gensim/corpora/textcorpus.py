@@ -36,11 +36,21 @@ See Also
 
 from __future__ import with_statement
 
+import copy
+import functools
+import hashlib
+import locale
 import logging
+import multiprocessing
 import os
 import random
 import re
 import sys
+from collections import deque
+
+import numpy as np
+from six import PY2, string_types
+from six.moves import cPickle as _pickle
 
 from gensim import interfaces, utils
 from gensim.corpora.dictionary import Dictionary
@@ -184,10 +194,22 @@ class TextCorpus(interfaces.CorpusABC):
     #. :func:`~gensim.corpora.textcorpus.remove_short` - remove words less than 3 characters long
     #. :func:`~gensim.corpora.textcorpus.remove_stopwords` - remove stopwords
 
+    With `workers` > 1, the documents from :meth:`~gensim.corpora.textcorpus.TextCorpus.getstream` are preprocessed
+    in batches in a pool of worker processes, and yielded in their original order. The corpus (without its
+    dictionary) is copied to the workers, so the preprocessing functions must be picklable on platforms that do not
+    fork.
+
+    With `cache_dir`, the first full pass of :meth:`~gensim.corpora.textcorpus.TextCorpus.get_texts` also stores
+    the preprocessed documents in `cache_dir`, and later passes read them from there instead of preprocessing again.
+    The cache file is named after a hash of the input (its path, size and modification time) and of the
+    preprocessing configuration (the corpus class and the names of its filters and tokenizer), so a changed input or
+    pipeline gets a new cache. Preprocessing functions with the same name but different code can't be told apart:
+    clear the cache when they change.
+
     """
 
     def __init__(self, input=None, dictionary=None, metadata=False, character_filters=None,
-                 tokenizer=None, token_filters=None):
+                 tokenizer=None, token_filters=None, workers=1, cache_dir=None):
         """
 
         Parameters
@@ -213,6 +235,10 @@ class TextCorpus(interfaces.CorpusABC):
             These filters can add, remove, or replace tokens, or do nothing at all.
             If None - using :func:`~gensim.corpora.textcorpus.remove_short` and
             :func:`~gensim.corpora.textcorpus.remove_stopwords`.
+        workers : int, optional
+            Number of worker processes that preprocess the documents.
+        cache_dir : str, optional
+            Directory where preprocessed documents are cached. If None - documents are preprocessed on every pass.
 
         Examples
         --------
@@ -256,6 +282,9 @@ class TextCorpus(interfaces.CorpusABC):
         if self.token_filters is None:
             self.token_filters = [remove_short, remove_stopwords]
 
+        self.workers = max(1, int(workers))
+        self.cache_dir = cache_dir
+
         self.length = None
         self.dictionary = None
         self.init_dictionary(dictionary)
@@ -384,13 +413,132 @@ class TextCorpus(interfaces.CorpusABC):
             Document as sequence of tokens (+ lineno if self.metadata)
 
         """
-        lines = self.getstream()
+        cache_fname = self.get_cache_fname()
+        if cache_fname is None:
+            texts = self._iter_preprocessed()
+        else:
+            texts = self._iter_cached(cache_fname)
         if self.metadata:
-            for lineno, line in enumerate(lines):
-                yield self.preprocess_text(line), (lineno,)
+            for lineno, tokens in enumerate(texts):
+                yield tokens, (lineno,)
         else:
-            for line in lines:
+            for tokens in texts:
+                yield tokens
+
+    def get_cache_fname(self):
+        """Get the path of the cache of preprocessed documents.
+
+        Returns
+        -------
+        str or None
+            Path inside `self.cache_dir`, named after a hash of the input and of the preprocessing configuration.
+            None if caching is disabled, or if the input can't be identified (e.g. a file-like object).
+
+        """
+        if getattr(self, 'cache_dir', None) is None:
+            return None
+        signature = self._input_signature()
+        if signature is None:
+            logger.warning("can't identify the input %r, not caching preprocessed documents", self.input)
+            return None
+        config = (
+            '%s.%s' % (type(self).__module__, type(self).__name__), signature,
+            [_callable_signature(f) for f in self.character_filters],
+            _callable_signature(self.tokenizer),
+            [_callable_signature(f) for f in self.token_filters],
+        )
+        key = hashlib.sha1(repr(config).encode('utf8')).hexdigest()
+        return os.path.join(self.cache_dir, 'textcorpus_%s.pkl' % key)
+
+    def _input_signature(self):
+        """Identify the input by its path, size and modification time, or None if it's not a file."""
+        if not isinstance(self.input, string_types) or not os.path.isfile(self.input):
+            return None
+        stat = os.stat(self.input)
+        return os.path.abspath(self.input), stat.st_size, stat.st_mtime
+
+    def _iter_cached(self, cache_fname, batch_size=1000):
+        """Read the preprocessed documents from `cache_fname`, or preprocess them and write the cache.
+
+        The cache is written to a temporary file, which only replaces `cache_fname` after a complete pass.
+
+        """
+        if os.path.exists(cache_fname):
+            logger.info("reading preprocessed documents from %s", cache_fname)
+            num_texts = 0
+            with open(cache_fname, 'rb') as fin:
+                while True:
+                    try:
+                        batch = _pickle.load(fin)
+                    except EOFError:
+                        break
+                    for tokens in batch:
+                        yield tokens
+                    num_texts += len(batch)
+            self.length = num_texts
+            return
+
+        tmp_fname = '%s.%i.tmp' % (cache_fname, os.getpid())
+        complete = False
+        try:
+            with open(tmp_fname, 'wb') as fout:
+                for batch in utils.grouper(self._iter_preprocessed(), batch_size):
+                    _pickle.dump(batch, fout, protocol=2)
+                    for tokens in batch:
+                        yield tokens
+            complete = True
+        finally:
+            if complete:
+                if os.path.exists(cache_fname) and not hasattr(os, 'replace'):
+                    os.remove(cache_fname)  # python 2 on Windows can't rename over an existing file
+                getattr(os, 'replace', os.rename)(tmp_fname, cache_fname)
+                logger.info("cached preprocessed documents in %s", cache_fname)
+            elif os.path.exists(tmp_fname):
+                os.remove(tmp_fname)
+
+    def _iter_preprocessed(self):
+        """Preprocess the documents from :meth:`~gensim.corpora.textcorpus.TextCorpus.getstream`, in
+        `self.workers` processes.
+
+        Yields
+        ------
+        list of str
+            Document as sequence of tokens, in corpus order.
+
+        """
+        if getattr(self, 'workers', 1) == 1:
+            for line in self.getstream():
                 yield self.preprocess_text(line)
+            return
+        jobs = ((_preprocess_texts, batch) for batch in utils.grouper(self.getstream(), 1000))
+        for texts in self._run_jobs(jobs):
+            for tokens in texts:
+                yield tokens
+
+    def _run_jobs(self, jobs):
+        """Run `jobs`, an iterable of (function, argument), in a pool of `self.workers` processes.
+
+        Yields
+        ------
+        object
+            Result of each job, in the order of `jobs`.
+
+        """
+        # the workers only preprocess, they don't need the dictionary
+        corpus = copy.copy(self)
+        corpus.dictionary = None
+        pool = multiprocessing.Pool(self.workers, _init_worker, (corpus,))
+        try:
+            pending = deque()
+            for func, arg in jobs:
+                pending.append(pool.apply_async(func, (arg,)))
+                # keep a bounded number of jobs in flight
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+        finally:
+            pool.terminate()
 
     def sample_texts(self, n, seed=None, length=None):
         """Generate `n` random documents from the corpus without replacement.
@@ -474,10 +622,39 @@ class TextDirectoryCorpus(TextCorpus):
     """Read documents recursively from a directory.
     Each file/line (depends on `lines_are_documents`) is interpreted as a plain text document.
 
+    Notes
+    -----
+    The corpus keeps a manifest of its files: their paths, sizes, modification times and, if `lines_are_documents`,
+    the byte offsets of their lines. The manifest gives the length of the corpus and random access to its documents
+    (`corpus[docno]`, :meth:`~gensim.corpora.textcorpus.TextDirectoryCorpus.get_document`) without reading the
+    whole collection. When `manifest_fname` is given, the manifest is also stored on disk, so that later runs only
+    re-read the files whose size or modification time changed.
+
+    With `workers` > 1, the worker processes read the files themselves, in blocks of files or lines.
+
+    Lines are split at '\\n', '\\r\\n' and '\\r', as when reading the files in text mode.
+
+    Examples
+    --------
+    .. sourcecode:: pycon
+
+        >>> from gensim.corpora.textcorpus import TextDirectoryCorpus
+        >>> from gensim.test.utils import datapath, get_tmpfile
+        >>>
+        >>> corpus = TextDirectoryCorpus(
+        ...     datapath('PathLineSentences'), pattern='.*txt$', lines_are_documents=True,
+        ...     manifest_fname=get_tmpfile('manifest.pkl')
+        ... )
+        >>> len(corpus)
+        7
+        >>> corpus.get_document(3)
+        'from reading this text.'
+        >>> bow = corpus[3]
+
     """
 
     def __init__(self, input, dictionary=None, metadata=False, min_depth=0, max_depth=None,
-                 pattern=None, exclude_pattern=None, lines_are_documents=False, **kwargs):
+                 pattern=None, exclude_pattern=None, lines_are_documents=False, manifest_fname=None, **kwargs):
         """
 
         Parameters
@@ -501,10 +678,17 @@ class TextDirectoryCorpus(TextCorpus):
             Regex to use for file name exclusion, all files matching this pattern will be ignored.
         lines_are_documents : bool, optional
             If True - each line is considered a document, otherwise - each file is one document.
+        manifest_fname : str, optional
+            Path where the manifest of the files is stored. If None - the manifest is kept in memory only.
         kwargs: keyword arguments passed through to the `TextCorpus` constructor.
             See :meth:`gemsim.corpora.textcorpus.TextCorpus.__init__` docstring for more details on these.
 
         """
+        self.manifest_fname = manifest_fname
+        self.manifest = {}
+        if manifest_fname is not None and os.path.exists(manifest_fname):
+            self.manifest = utils.unpickle(manifest_fname)
+        self._files = None
         self._min_depth = min_depth
         self._max_depth = sys.maxsize if max_depth is None else max_depth
         self.pattern = pattern
@@ -519,7 +703,7 @@ class TextDirectoryCorpus(TextCorpus):
     @lines_are_documents.setter
     def lines_are_documents(self, lines_are_documents):
         self._lines_are_documents = lines_are_documents
-        self.length = None
+        self._invalidate()
 
     @property
     def pattern(self):
@@ -528,7 +712,7 @@ class TextDirectoryCorpus(TextCorpus):
     @pattern.setter
     def pattern(self, pattern):
         self._pattern = None if pattern is None else re.compile(pattern)
-        self.length = None
+        self._invalidate()
 
     @property
     def exclude_pattern(self):
@@ -537,7 +721,7 @@ class TextDirectoryCorpus(TextCorpus):
     @exclude_pattern.setter
     def exclude_pattern(self, pattern):
         self._exclude_pattern = None if pattern is None else re.compile(pattern)
-        self.length = None
+        self._invalidate()
 
     @property
     def min_depth(self):
@@ -546,7 +730,7 @@ class TextDirectoryCorpus(TextCorpus):
     @min_depth.setter
     def min_depth(self, min_depth):
         self._min_depth = min_depth
-        self.length = None
+        self._invalidate()
 
     @property
     def max_depth(self):
@@ -555,7 +739,7 @@ class TextDirectoryCorpus(TextCorpus):
     @max_depth.setter
     def max_depth(self, max_depth):
         self._max_depth = max_depth
-        self.length = None
+        self._invalidate()
 
     def iter_filepaths(self):
         """Generate (lazily)  paths to each file in the directory structure within the specified range of depths.
@@ -599,8 +783,33 @@ class TextDirectoryCorpus(TextCorpus):
 
         self.length = num_texts
 
+    def _iter_preprocessed(self):
+        """Preprocess the documents of the corpus, in `self.workers` processes that each read their own files.
+
+        Yields
+        ------
+        list of str
+            Document as sequence of tokens, in corpus order.
+
+        """
+        if self.workers == 1:
+            for tokens in super(TextDirectoryCorpus, self)._iter_preprocessed():
+                yield tokens
+            return
+        num_texts = 0
+        for texts in self._run_jobs((_preprocess_job, job) for job in self._iter_jobs()):
+            for tokens in texts:
+                yield tokens
+            num_texts += len(texts)
+        self.length = num_texts
+
+    def _input_signature(self):
+        """Identify the input by the paths, sizes and modification times of its files."""
+        files = self.refresh_manifest()
+        return self.lines_are_documents, [(path, ) + self.manifest[path][:2] for path in files]
+
     def __len__(self):
-        """Get length of corpus.
+        """Get length of corpus, from the manifest.
 
         Returns
         -------
@@ -613,11 +822,200 @@ class TextDirectoryCorpus(TextCorpus):
         return self.length
 
     def _cache_corpus_length(self):
-        """Calculate length of corpus and cache it to `self.length`."""
+        """Calculate length of corpus from the manifest and cache it to `self.length`."""
+        self.length = int(self._doc_starts()[-1])
+
+    def __getitem__(self, docno):
+        """Get a document in BoW format, without reading the rest of the corpus.
+
+        Parameters
+        ----------
+        docno : int
+            Position of the document in the corpus.
+
+        Returns
+        -------
+        list of (int, int)
+            Document in BoW format (+ metadata if self.metadata).
+
+        """
+        bow = self.dictionary.doc2bow(self.preprocess_text(self.get_document(docno)), allow_update=False)
+        return (bow, (docno,)) if self.metadata else bow
+
+    def get_document(self, docno):
+        """Read the raw text of a document, using the offsets in the manifest.
+
+        Parameters
+        ----------
+        docno : int
+            Position of the document in the corpus.
+
+        Returns
+        -------
+        str
+            Text of the document, same as yielded by :meth:`~gensim.corpora.textcorpus.TextDirectoryCorpus.getstream`.
+
+        Raises
+        ------
+        IndexError
+            If `docno` is out of range.
+
+        """
+        starts = self._doc_starts()
+        if not 0 <= docno < starts[-1]:
+            raise IndexError("document %s out of range for corpus of %i documents" % (docno, starts[-1]))
+        fileno = int(np.searchsorted(starts, docno, side='right')) - 1
+        path = self._files[fileno]
         if not self.lines_are_documents:
-            self.length = sum(1 for _ in self.iter_filepaths())
+            return next(_read_documents(path, None))
+        lineno = docno - starts[fileno]
+        return next(_read_documents(path, self.manifest[path][2][lineno:lineno + 2]))
+
+    def refresh_manifest(self):
+        """Update the manifest with the current files of the corpus, re-reading only new and changed files.
+
+        The manifest is saved to `self.manifest_fname` if anything changed.
+
+        Returns
+        -------
+        list of str
+            Paths of the files in the corpus, in corpus order.
+
+        """
+        files, manifest, changed = [], {}, False
+        for path in self.iter_filepaths():
+            stat = os.stat(path)
+            entry = self.manifest.get(path)
+            if entry is None or entry[:2] != (stat.st_size, stat.st_mtime) or \
+                    (self.lines_are_documents and entry[2] is None):
+                offsets = _line_offsets(path, stat.st_size) if self.lines_are_documents else None
+                entry, changed = (stat.st_size, stat.st_mtime, offsets), True
+            manifest[path] = entry
+            files.append(path)
+        changed = changed or len(manifest) != len(self.manifest)
+        self.manifest, self._files = manifest, files
+        if changed and self.manifest_fname is not None:
+            utils.pickle(self.manifest, self.manifest_fname)
+            logger.info("saved manifest of %i files to %s", len(files), self.manifest_fname)
+        return files
+
+    def _invalidate(self):
+        """Forget the length and the list of files, after a change of the settings that select documents."""
+        self.length = None
+        self._files = None
+
+    def _doc_starts(self):
+        """Position of the first document of each file, plus the total number of documents."""
+        if self._files is None:
+            self.refresh_manifest()
+        if self.lines_are_documents:
+            counts = [len(self.manifest[path][2]) - 1 for path in self._files]
         else:
-            self.length = sum(1 for _ in self.getstream())
+            counts = [1] * len(self._files)
+        return np.concatenate([[0], np.cumsum(counts, dtype=np.int64)])
+
+    def _iter_jobs(self, docs_per_job=1000):
+        """Split the corpus into jobs of roughly `docs_per_job` documents, for the worker processes."""
+        job, size = [], 0
+        for path in self.refresh_manifest():
+            if not self.lines_are_documents:
+                job.append((path, None))
+                size += 1
+            else:
+                offsets = self.manifest[path][2]
+                for start in range(0, len(offsets) - 1, docs_per_job):
+                    job.append((path, offsets[start:start + docs_per_job + 1]))
+                    size += min(docs_per_job, len(offsets) - 1 - start)
+                    if size >= docs_per_job:
+                        yield job
+                        job, size = [], 0
+            if size >= docs_per_job:
+                yield job
+                job, size = [], 0
+        if job:
+            yield job
+
+
+_worker_corpus = None
+"""Corpus whose preprocessing runs in a worker process of :meth:`TextCorpus.get_texts`."""
+
+
+def _init_worker(corpus):
+    global _worker_corpus
+    _worker_corpus = corpus
+
+
+def _preprocess_texts(texts):
+    """Preprocess a batch of documents in a worker process."""
+    return [_worker_corpus.preprocess_text(text) for text in texts]
+
+
+def _callable_signature(func):
+    """Describe a preprocessing function by its name, for the cache key of :meth:`TextCorpus.get_cache_fname`."""
+    if isinstance(func, functools.partial):
+        return _callable_signature(func.func), func.args, sorted((func.keywords or {}).items())
+    name = getattr(func, '__qualname__', None) or getattr(func, '__name__', None) or type(func).__name__
+    return '%s.%s' % (getattr(func, '__module__', None), name)
+
+
+def _preprocess_job(job):
+    """Read and preprocess the documents of `job`, a list of (path, line offsets or None)."""
+    return [
+        _worker_corpus.preprocess_text(text)
+        for path, offsets in job
+        for text in _read_documents(path, offsets)
+    ]
+
+
+def _read_documents(path, offsets):
+    """Read the whole file at `path` as one document, or the lines between consecutive byte `offsets`.
+
+    Yields
+    ------
+    str
+        Documents, stripped of surrounding whitespace.
+
+    """
+    if offsets is None:
+        with open(path, 'rt') as f:
+            yield f.read().strip()
+        return
+    encoding = locale.getpreferredencoding(False)
+    with open(path, 'rb') as f:
+        f.seek(offsets[0])
+        data = f.read(offsets[-1] - offsets[0])
+    for start, end in zip(offsets[:-1] - offsets[0], offsets[1:] - offsets[0]):
+        line = data[start:end]
+        # open(path, 'rt') yields undecoded lines on python 2
+        yield line.strip() if PY2 else line.decode(encoding).strip()
+
+
+def _line_offsets(path, size):
+    """Byte offsets of the starts of the lines of a file, plus its size.
+
+    Lines end at '\\n', '\\r\\n' or '\\r', like when iterating over a file opened in text mode.
+
+    Returns
+    -------
+    numpy.ndarray of int64
+        Line `i` is at bytes `offsets[i]:offsets[i + 1]` of the file.
+
+    """
+    if not size:
+        return np.zeros(1, dtype=np.int64)
+    data = np.memmap(path, dtype=np.uint8, mode='r', shape=(size,))
+    ends = np.flatnonzero(data == 10)
+    carriage_returns = np.flatnonzero(data[:-1] == 13)
+    # a carriage return followed by a newline is part of that line break
+    carriage_returns = carriage_returns[data[carriage_returns + 1] != 10]
+    if data[-1] == 13:
+        carriage_returns = np.append(carriage_returns, size - 1)
+    ends = np.union1d(ends, carriage_returns)
+    del data
+    starts = np.concatenate([[0], ends + 1])
+    if starts[-1] == size:
+        starts = starts[:-1]
+    return np.append(starts, size).astype(np.int64)
 
 
 def walk(top, topdown=True, onerror=None, followlinks=False, depth=0):
@@ -10,13 +10,18 @@
 from __future__ import with_statement
 
 import logging
+import os
 from collections import defaultdict
 
+import numpy as np
+
 from gensim import utils
 from gensim.corpora import Dictionary
 from gensim.corpora import IndexedCorpus
+from gensim.corpora.mmcorpus import mm_csc_chunks
 from gensim.matutils import MmReader
 from gensim.matutils import MmWriter
+from six import string_types
 from six.moves import range
 
 
@@ -206,6 +211,40 @@ class UciCorpus(UciReader, IndexedCorpus):
         for docId, doc in super(UciCorpus, self).__iter__():
             yield doc  # get rid of docId, return the sparse vector only
 
+    def iter_csc_chunks(self, chunksize=2000, num_terms=None, dtype=np.float64):
+        """Iterate over the corpus in chunks of documents, each as one sparse matrix.
+
+        The data lines of an uncompressed file are parsed in blocks straight into the arrays of the output matrices,
+        like in :meth:`~gensim.corpora.mmcorpus.MmCorpus.iter_csc_chunks`.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of documents in each chunk (only the last chunk may be smaller).
+        num_terms : int, optional
+            Number of terms = number of rows of each chunk, `self.num_terms` by default.
+        dtype : data-type, optional
+            Data type of the output matrices.
+
+        Yields
+        ------
+        scipy.sparse.csc_matrix
+            Chunk of shape (`num_terms`, number of documents in the chunk), documents as columns.
+
+        """
+        if num_terms is None:
+            num_terms = self.num_terms
+        if not isinstance(self.input, string_types) or self.input.endswith(('.gz', '.bz2')):
+            for chunk in super(UciCorpus, self).iter_csc_chunks(chunksize, num_terms=num_terms, dtype=dtype):
+                yield chunk
+            return
+        with open(self.input, 'rb') as fin:
+            self.skip_headers(fin)
+            start = fin.tell()
+        end = os.path.getsize(self.input)
+        for chunk in mm_csc_chunks(self.input, start, end, self.num_docs, num_terms, chunksize, dtype=dtype):
+            yield chunk
+
     def create_dictionary(self):
         """Generate :class:`gensim.corpora.dictionary.Dictionary` directly from the corpus and vocabulary data.
 
@@ -20,10 +20,15 @@ See :mod:`gensim.scripts.make_wiki` for a canned (example) command-line script b
 """
 
 import bz2
+import io
+import itertools
 import logging
 import multiprocessing
+import os
 import re
 import signal
+import time
+from collections import deque
 from pickle import PicklingError
 from xml.etree.cElementTree import \
     iterparse  # LXML isn't faster, so let's go with the built-in solution
@@ -34,6 +39,14 @@ from gensim.corpora.dictionary import Dictionary
 from gensim.corpora.textcorpus import TextCorpus
 
 from six import raise_from
+from six.moves import cPickle as _pickle
+
+try:
+    from gensim.corpora import _wikimarkup
+except ImportError:
+    FAST_VERSION = -1
+else:
+    FAST_VERSION = 1
 
 
 logger = logging.getLogger(__name__)
@@ -45,6 +58,9 @@ ARTICLE_MIN_WORDS = 50
 TOKEN_MIN_LEN = 2
 TOKEN_MAX_LEN = 15
 
+CHECKPOINT_INTERVAL = 60
+"""Seconds between checkpoints of the cache of tokenized articles."""
+
 RE_P0 = re.compile(r'<!--.*?-->', re.DOTALL | re.UNICODE)
 """Comments."""
 RE_P1 = re.compile(r'<ref([> ].*?)(</ref>|/>)', re.DOTALL | re.UNICODE)
@@ -201,11 +217,19 @@ def filter_wiki(raw, promote_remaining=True, simplify_links=True):
     str
         `raw` without markup.
 
+    Notes
+    -----
+    If the compiled extension is available (`FAST_VERSION >= 0`), markup is stripped by
+    :func:`gensim.corpora._wikimarkup.remove_markup`, which replaces each regular expression pass of
+    :func:`~gensim.corpora.wikicorpus.remove_markup` by a single linear scan over the text and gives the same output.
+
     """
     # parsing of the wiki markup is not perfect, but sufficient for our purposes
     # contributions to improving this code are welcome :)
     text = utils.to_unicode(raw, 'utf8', errors='ignore')
     text = utils.decode_htmlentities(text)  # '&amp;nbsp;' --> '\xa0'
+    if FAST_VERSION >= 0:
+        return _wikimarkup.remove_markup(text, promote_remaining, simplify_links)
     return remove_markup(text, promote_remaining, simplify_links)
 
 
@@ -455,6 +479,113 @@ def extract_pages(f, filter_namespaces=False, filter_articles=None):
 _extract_pages = extract_pages  # for backward compatibility
 
 
+def multistream_index_fname(fname):
+    """Guess the path of the index of a multistream dump, `...-multistream-index.txt.bz2` for
+    `...-multistream.xml.bz2`.
+
+    Parameters
+    ----------
+    fname : str
+        Path to the dump.
+
+    Returns
+    -------
+    str or None
+        Path to the index, or None if `fname` is not a multistream dump or its index doesn't exist.
+
+    """
+    index_fname = fname.replace('multistream.xml', 'multistream-index.txt')
+    if index_fname != fname and os.path.exists(index_fname):
+        return index_fname
+    return None
+
+
+def multistream_ranges(fname, index_fname):
+    """Get the byte ranges of the bz2 streams of pages in a multistream dump.
+
+    Notes
+    -----
+    Multistream dumps are concatenations of independent bz2 streams: the first one holds the `<siteinfo>` header,
+    each following one holds up to 100 pages, and the last one closes the `<mediawiki>` element. Their index lists
+    `offset:pageid:title` for each page, where `offset` is the position of the stream holding the page.
+
+    Parameters
+    ----------
+    fname : str
+        Path to the multistream dump.
+    index_fname : str
+        Path to its index.
+
+    Returns
+    -------
+    list of (int, int)
+        Start and end offset of each stream of pages, in dump order. The header stream is
+        `(0, ranges[0][0])`, the closing stream is included in the last range.
+
+    """
+    offsets = set()
+    with utils.smart_open(index_fname, 'rb') as fin:
+        for line in fin:
+            offsets.add(int(line.split(b':', 1)[0]))
+    offsets = sorted(offsets) + [os.path.getsize(fname)]
+    return list(zip(offsets, offsets[1:]))
+
+
+def read_streams(fname, start, end):
+    """Read and decompress the bz2 streams stored in bytes `start:end` of `fname`.
+
+    Parameters
+    ----------
+    fname : str
+        Path to a multistream dump.
+    start : int
+        Offset of the first stream.
+    end : int
+        Offset just after the last stream.
+
+    Returns
+    -------
+    bytes
+        Decompressed content of the streams.
+
+    """
+    with open(fname, 'rb') as fin:
+        fin.seek(start)
+        data = fin.read(end - start)
+    decompressed = []
+    while data:
+        # a fresh decompressor for each stream, python2's bz2 stops at the end of the first stream
+        decompressor = bz2.BZ2Decompressor()
+        decompressed.append(decompressor.decompress(data))
+        data = decompressor.unused_data
+    return b''.join(decompressed)
+
+
+def _process_stream(args):
+    """Extract and tokenize the pages of one stream of a multistream dump.
+
+    Parameters
+    ----------
+    args : (str, int, int, str, tuple of str, callable, bool, (function, int, int, bool))
+        Path to the dump, start and end offset of the stream, the MediaWiki namespace of the dump, namespace
+        and article filters, lemmatize flag and tokenization parameters of :func:`~gensim.corpora.wikicorpus.
+        _process_article`.
+
+    Returns
+    -------
+    list of (list of str, str, int)
+        Tokens, title and page id of each page in the stream.
+
+    """
+    fname, start, end, namespace, filter_namespaces, filter_articles, lemmatize, tokenization_params = args
+    pages = read_streams(fname, start, end).replace(b'</mediawiki>', b'')
+    xml = b''.join([b'<mediawiki xmlns="', namespace.encode('utf8'), b'">', pages, b'</mediawiki>'])
+    return [
+        _process_article((text, lemmatize, title, pageid, tokenization_params))
+        for title, text, pageid in extract_pages(io.BytesIO(xml), filter_namespaces, filter_articles)
+    ]
+
+
 def process_article(args, tokenizer_func=tokenize, token_min_len=TOKEN_MIN_LEN,
                     token_max_len=TOKEN_MAX_LEN, lower=True):
     """Parse a Wikipedia article, extract all tokens.
@@ -555,10 +686,15 @@ class WikiCorpus(TextCorpus):
     metadata : bool
         Whether to write articles titles to serialized corpus.
 
-    Warnings
-    --------
-    "Multistream" archives are *not* supported in Python 2 due to `limitations in the core bz2 library
-    <https://docs.python.org/2/library/bz2.html#de-compression-of-files>`_.
+    For "multistream" dumps (<LANG>wiki-<YYYYMMDD>-pages-articles-multistream.xml.bz2) with their index
+    (<LANG>wiki-<YYYYMMDD>-pages-articles-multistream-index.txt.bz2), each worker process decompresses, parses and
+    tokenizes whole streams of 100 pages on its own, instead of all the decompression and XML parsing
+    happening in the main process. The index is found automatically when it sits next to the dump.
+
+    With `cache_fname`, the tokenized articles are also appended to a cache file as they are processed, and
+    progress is checkpointed regularly. Later passes over the corpus read the cache instead of the dump, and a pass
+    that was interrupted (for example, a crashed :mod:`gensim.scripts.make_wikicorpus` run) replays the cache and
+    resumes processing the dump where the last checkpoint stopped.
 
     Examples
     --------
@@ -576,7 +712,8 @@ class WikiCorpus(TextCorpus):
     """
     def __init__(self, fname, processes=None, lemmatize=utils.has_pattern(), dictionary=None,
                  filter_namespaces=('0',), tokenizer_func=tokenize, article_min_tokens=ARTICLE_MIN_WORDS,
-                 token_min_len=TOKEN_MIN_LEN, token_max_len=TOKEN_MAX_LEN, lower=True, filter_articles=None):
+                 token_min_len=TOKEN_MIN_LEN, token_max_len=TOKEN_MAX_LEN, lower=True, filter_articles=None,
+                 index_fname=None, cache_fname=None):
         """Initialize the corpus.
 
         Unless a dictionary is provided, this scans the corpus once,
@@ -612,6 +749,12 @@ class WikiCorpus(TextCorpus):
             If set, each XML article element will be passed to this callable before being processed. Only articles
             where the callable returns an XML element are processed, returning None allows filtering out
             some articles based on customised rules.
+        index_fname : str, optional
+            Path to the index of a multistream dump, to process its streams in parallel. Found automatically if
+            it's named like the dump with `multistream-index.txt` instead of `multistream.xml`.
+        cache_fname : str, optional
+            Path to a cache of tokenized articles, with its checkpoint in `cache_fname.checkpoint`. If set, passes
+            over the corpus read the articles already in the cache and resume processing the dump after them.
 
         Warnings
         --------
@@ -631,6 +774,8 @@ class WikiCorpus(TextCorpus):
         self.token_min_len = token_min_len
         self.token_max_len = token_max_len
         self.lower = lower
+        self.index_fname = multistream_index_fname(fname) if index_fname is None else index_fname
+        self.cache_fname = cache_fname
 
         if dictionary is None:
             self.dictionary = Dictionary(self.get_texts())
@@ -671,30 +816,20 @@ class WikiCorpus(TextCorpus):
         articles, articles_all = 0, 0
         positions, positions_all = 0, 0
 
-        tokenization_params = (self.tokenizer_func, self.token_min_len, self.token_max_len, self.lower)
-        texts = \
-            ((text, self.lemmatize, title, pageid, tokenization_params)
-             for title, text, pageid
-             in extract_pages(bz2.BZ2File(self.fname), self.filter_namespaces, self.filter_articles))
-        pool = multiprocessing.Pool(self.processes, init_to_ignore_interrupt)
-
         try:
-            # process the corpus in smaller chunks of docs, because multiprocessing.Pool
-            # is dumb and would load the entire input into RAM at once...
-            for group in utils.chunkize(texts, chunksize=10 * self.processes, maxsize=1):
-                for tokens, title, pageid in pool.imap(_process_article, group):
-                    articles_all += 1
-                    positions_all += len(tokens)
-                    # article redirects and short stubs are pruned here
-                    if len(tokens) < self.article_min_tokens or \
-                            any(title.startswith(ignore + ':') for ignore in IGNORED_NAMESPACES):
-                        continue
-                    articles += 1
-                    positions += len(tokens)
-                    if self.metadata:
-                        yield (tokens, (pageid, title))
-                    else:
-                        yield tokens
+            for tokens, title, pageid in self._iter_articles():
+                articles_all += 1
+                positions_all += len(tokens)
+                # article redirects and short stubs are pruned here
+                if len(tokens) < self.article_min_tokens or \
+                        any(title.startswith(ignore + ':') for ignore in IGNORED_NAMESPACES):
+                    continue
+                articles += 1
+                positions += len(tokens)
+                if self.metadata:
+                    yield (tokens, (pageid, title))
+                else:
+                    yield tokens
 
         except KeyboardInterrupt:
             logger.warn(
@@ -712,5 +847,117 @@ class WikiCorpus(TextCorpus):
                 articles, positions, articles_all, positions_all, ARTICLE_MIN_WORDS
             )
             self.length = articles  # cache corpus length
+
+    def _article_batches(self, pool, skip_streams=0, skip_pages=0):
+        """Process the dump in worker processes, skipping the streams or pages that were already processed.
+
+        Yields
+        ------
+        (list of (list of str, str, int), int)
+            Tokens, title and page id of each article in a batch of consecutive pages, and the number of
+            multistream streams that the batch completes.
+
+        """
+        tokenization_params = (self.tokenizer_func, self.token_min_len, self.token_max_len, self.lower)
+        if self.index_fname:
+            ranges = multistream_ranges(self.fname, self.index_fname)
+            header = read_streams(self.fname, 0, ranges[0][0]) if ranges else b''
+            namespace = utils.to_unicode(re.search(br'xmlns="([^"]+)"', header).group(1))
+            pending = deque()
+            for start, end in ranges[skip_streams:]:
+                job = (
+                    self.fname, start, end, namespace, self.filter_namespaces, self.filter_articles,
+                    self.lemmatize, tokenization_params
+                )
+                pending.append(pool.apply_async(_process_stream, (job,)))
+                # keep a bounded number of streams in flight, in dump order
+                if len(pending) >= 2 * self.processes:
+                    yield pending.popleft().get(), 1
+            while pending:
+                yield pending.popleft().get(), 1
+        else:
+            texts = \
+                ((text, self.lemmatize, title, pageid, tokenization_params)
+                 for title, text, pageid
+                 in extract_pages(bz2.BZ2File(self.fname), self.filter_namespaces, self.filter_articles))
+            texts = itertools.islice(texts, skip_pages, None)
+            # process the corpus in smaller chunks of docs, because multiprocessing.Pool
+            # is dumb and would load the entire input into RAM at once...
+            for group in utils.chunkize(texts, chunksize=10 * self.processes, maxsize=1):
+                yield list(pool.imap(_process_article, group)), 0
+
+    def _cache_config(self):
+        """Settings that the cached tokens depend on; a cache built with other settings is not reused."""
+        tokenizer = getattr(self.tokenizer_func, '__name__', repr(self.tokenizer_func))
+        return (
+            os.path.basename(self.fname), bool(self.index_fname), self.lemmatize, tokenizer,
+            self.token_min_len, self.token_max_len, self.lower, tuple(self.filter_namespaces or ()),
+        )
+
+    def _iter_articles(self):
+        """Iterate over all pages of the dump, using and extending the cache of tokenized articles if enabled.
+
+        Yields
+        ------
+        (list of str, str, int)
+            Tokens, title and page id of each page, in dump order.
+
+        """
+        checkpoint = {'config': self._cache_config(), 'streams': 0, 'pages': 0, 'size': 0, 'complete': False}
+        checkpoint_fname = '%s.checkpoint' % self.cache_fname
+        if self.cache_fname and os.path.exists(checkpoint_fname) and os.path.exists(self.cache_fname):
+            saved = utils.unpickle(checkpoint_fname)
+            if saved['config'] == checkpoint['config']:
+                checkpoint = saved
+            else:
+                logger.warning("ignoring cache %s, built with different settings", self.cache_fname)
+
+        if checkpoint['size']:
+            logger.info(
+                "reading %i cached pages from %s%s", checkpoint['pages'], self.cache_fname,
+                "" if checkpoint['complete'] else ", then resuming from the dump"
+            )
+            with open(self.cache_fname, 'rb') as fin:
+                while fin.tell() < checkpoint['size']:
+                    for article in _pickle.load(fin):
+                        yield article
+        if checkpoint['complete']:
+            return
+
+        cache = None
+        if self.cache_fname:
+            cache = open(self.cache_fname, 'r+b' if checkpoint['size'] else 'wb')
+            cache.seek(checkpoint['size'])
+            cache.truncate()
+        pool = multiprocessing.Pool(self.processes, init_to_ignore_interrupt)
+        last_checkpoint = time.time()
+        try:
+            for articles, num_streams in self._article_batches(pool, checkpoint['streams'], checkpoint['pages']):
+                if cache is not None:
+                    _pickle.dump(articles, cache, protocol=2)
+                for article in articles:
+                    yield article
+                checkpoint['streams'] += num_streams
+                checkpoint['pages'] += len(articles)
+                if cache is not None and time.time() - last_checkpoint > CHECKPOINT_INTERVAL:
+                    self._save_checkpoint(checkpoint, cache)
+                    last_checkpoint = time.time()
+            if cache is not None:
+                checkpoint['complete'] = True
+                self._save_checkpoint(checkpoint, cache)
         finally:
             pool.terminate()
+            if cache is not None:
+                cache.close()
+
+    def _save_checkpoint(self, checkpoint, cache):
+        """Flush the cache and atomically record how much of it is complete."""
+        cache.flush()
+        os.fsync(cache.fileno())
+        checkpoint['size'] = cache.tell()
+        checkpoint_fname = '%s.checkpoint' % self.cache_fname
+        utils.pickle(checkpoint, checkpoint_fname + '.tmp')
+        if os.path.exists(checkpoint_fname) and not hasattr(os, 'replace'):
+            os.remove(checkpoint_fname)  # python 2 on Windows can't rename over an existing file
+        getattr(os, 'replace', os.rename)(checkpoint_fname + '.tmp', checkpoint_fname)
+        logger.info("checkpoint: %i pages processed, cached in %s", checkpoint['pages'], self.cache_fname)
@@ -18,6 +18,8 @@ from __future__ import with_statement
 
 import logging
 
+import numpy as np
+
 from gensim import utils, matutils
 from six.moves import range
 
@@ -102,6 +104,34 @@ class CorpusABC(utils.SaveLoad):
         """Get the corpus size = the total number of documents in it."""
         raise NotImplementedError("must override __len__() before calling len(corpus)")
 
+    def iter_csc_chunks(self, chunksize=2000, num_terms=None, dtype=np.float64):
+        """Iterate over the corpus in chunks of documents, each as one sparse matrix.
+
+        This default implementation groups the documents with :func:`~gensim.utils.grouper` and converts
+        each group with :func:`~gensim.matutils.corpus2csc`. Serialized formats override it to build the matrices
+        straight from their storage, skipping the per-document `(int, float)` tuples.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of documents in each chunk (only the last chunk may be smaller).
+        num_terms : int, optional
+            Number of terms = number of rows of each chunk. Defaults to `self.num_terms` if the corpus has it,
+            otherwise to the highest feature id in each chunk + 1.
+        dtype : data-type, optional
+            Data type of the output matrices.
+
+        Yields
+        ------
+        scipy.sparse.csc_matrix
+            Chunk of shape (`num_terms`, number of documents in the chunk), documents as columns.
+
+        """
+        if num_terms is None:
+            num_terms = getattr(self, 'num_terms', None)
+        for chunk in utils.grouper(self, chunksize):
+            yield matutils.corpus2csc(chunk, num_terms=num_terms, num_docs=len(chunk), dtype=dtype)
+
     @staticmethod
     def save_corpus(fname, corpus, id2word=None, metadata=False):
         """Save `corpus` to disk.
@@ -170,6 +170,40 @@ def corpus2csc(corpus, num_terms=None, dtype=np.float64, num_docs=None, num_nnz=
     return result
 
 
+def corpus2csc_chunks(corpus, chunksize=2000, num_terms=None, dtype=np.float64):
+    """Iterate over `corpus` in chunks of documents, each converted into one sparse matrix.
+
+    Corpora implementing :meth:`~gensim.interfaces.CorpusABC.iter_csc_chunks` (such as
+    :class:`~gensim.corpora.mmcorpus.MmCorpus`) produce the matrices directly from their storage, without creating
+    the `(int, float)` tuples of each document. Other iterables are grouped with :func:`~gensim.utils.grouper`
+    and converted with :func:`~gensim.matutils.corpus2csc`.
+
+    Parameters
+    ----------
+    corpus : iterable of iterable of (int, number)
+        Input corpus in BoW format.
+    chunksize : int, optional
+        Number of documents in each chunk (only the last chunk may be smaller).
+    num_terms : int, optional
+        Number of terms = number of rows of each chunk. If not set, taken from the corpus, or from the highest
+        feature id in each chunk.
+    dtype : data-type, optional
+        Data type of the output matrices.
+
+    Yields
+    ------
+    scipy.sparse.csc_matrix
+        Chunk of shape (`num_terms`, number of documents in the chunk), documents as columns.
+
+    """
+    if hasattr(corpus, 'iter_csc_chunks'):
+        for chunk in corpus.iter_csc_chunks(chunksize, num_terms=num_terms, dtype=dtype):
+            yield chunk
+    else:
+        for chunk in utils.grouper(corpus, chunksize):
+            yield corpus2csc(chunk, num_terms=num_terms, num_docs=len(chunk), dtype=dtype)
+
+
 def pad(mat, padrow, padcol):
     """Add additional rows/columns to `mat`. The new rows/columns will be initialized with zeros.
 
@@ -6,7 +6,7 @@ bag-of-word counts.
 # bring model classes directly into package namespace, to save some typing
 from .coherencemodel import CoherenceModel  # noqa:F401
 from .hdpmodel import HdpModel  # noqa:F401
-from .ldamodel import LdaModel  # noqa:F401
+from .ldamodel import LdaModel, LdaInferenceModel  # noqa:F401
 from .lsimodel import LsiModel  # noqa:F401
 from .tfidfmodel import TfidfModel  # noqa:F401
 from .rpmodel import RpModel  # noqa:F401
@@ -15,6 +15,7 @@ from .word2vec import Word2Vec  # noqa:F401
 from .doc2vec import Doc2Vec  # noqa:F401
 from .keyedvectors import KeyedVectors, WordEmbeddingSimilarityIndex  # noqa:F401
 from .ldamulticore import LdaMulticore  # noqa:F401
+from .ldagibbs import LdaGibbsModel  # noqa:F401
 from .phrases import Phrases  # noqa:F401
 from .normmodel import NormModel  # noqa:F401
 from .atmodel import AuthorTopicModel  # noqa:F401
@@ -25,7 +26,10 @@ from .translation_matrix import TranslationMatrix, BackMappingTranslationMatrix
 from . import wrappers  # noqa:F401
 from . import deprecated  # noqa:F401
 
+import numpy as np
+
 from gensim import interfaces, utils
+from gensim.corpora.dictionary import remap_bow
 
 
 class VocabTransform(interfaces.TransformationABC):
@@ -46,6 +50,10 @@ class VocabTransform(interfaces.TransformationABC):
         >>> for vec_with_new_ids in vt[corpus_with_old_ids]:
         >>>     pass
 
+    `old2new` can also be the array returned by :meth:`~gensim.corpora.dictionary.Dictionary.filter_extremes`
+    and the other `filter_*` methods, with -1 marking the discarded ids. To store the remapped corpus,
+    :meth:`~gensim.corpora.indexedcorpus.IndexedCorpus.remap_ids` avoids parsing the documents where possible.
+
     """
 
     def __init__(self, old2new, id2token=None):
@@ -61,4 +69,6 @@ class VocabTransform(interfaces.TransformationABC):
         if is_corpus:
             return self._apply(bow)
 
+        if isinstance(self.old2new, np.ndarray):
+            return remap_bow(bow, self.old2new)
         return sorted((self.old2new[oldid], weight) for oldid, weight in bow if oldid in self.old2new)
@@ -1032,6 +1032,26 @@ class AuthorTopicModel(LdaModel):
             'Use the "get_author_topics" method.'
         )
 
+    def transform_corpus(self, corpus, workers=1, output='csr', fname=None, chunksize=None,
+                         minimum_probability=None):
+        """Override :meth:`~gensim.models.basemodel.BaseTopicModel.transform_corpus` and simply raises an exception.
+
+        Warnings
+        --------
+        This method invalid for model, use :meth:`~gensim.models.atmodel.AuthorTopicModel.get_author_topics` or
+        :meth:`~gensim.models.atmodel.AuthorTopicModel.get_new_author_topics` instead.
+
+        Raises
+        ------
+        NotImplementedError
+            Always.
+
+        """
+        raise NotImplementedError(
+            'Method "transform_corpus" is not valid for the author-topic model. '
+            'Use the "get_author_topics" method.'
+        )
+
     def get_new_author_topics(self, corpus, minimum_probability=None):
         """Infers topics for new author.
 
@@ -1,3 +1,12 @@
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+import scipy.sparse
+
+from gensim import matutils, utils
+from gensim.corpora.mmcorpus import MmCorpus
+
+
 class BaseTopicModel(object):
     def print_topic(self, topicno, topn=10):
         """Get a single topic as a formatted string.
@@ -49,3 +58,121 @@ class BaseTopicModel(object):
 
         """
         raise NotImplementedError
+
+    def transform_corpus(self, corpus, workers=1, output='csr', fname=None, chunksize=None,
+                         minimum_probability=None):
+        """Get the topic distributions of all documents of `corpus` at once, as a single document-topic matrix.
+
+        Unlike `model[corpus]`, which lazily transforms one chunk after another in a single thread and returns each
+        document as a list of tuples, the corpus is streamed in chunks of documents transformed by `workers`
+        threads in parallel, and the whole result is returned as one matrix, or written to disk as it is computed.
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, float)
+            Corpus in BoW format.
+        workers : int, optional
+            Number of threads transforming chunks in parallel. The threads only speed up models whose transformation
+            releases the GIL, such as the compiled inference of :class:`~gensim.models.ldamodel.LdaModel` and the
+            BLAS products of :class:`~gensim.models.lsimodel.LsiModel`.
+        output : {'csr', 'dense', 'mmcorpus'}, optional
+            Format of the result:
+
+            * 'csr' - `scipy.sparse.csr_matrix` of shape (number of documents, number of topics).
+            * 'dense' - `numpy.ndarray` of shape (number of documents, number of topics).
+            * 'mmcorpus' - the rows are streamed into a :class:`~gensim.corpora.mmcorpus.MmCorpus` stored
+              in `fname`, without keeping the whole matrix in memory.
+        fname : str, optional
+            Path to the output corpus, required if `output` is 'mmcorpus'.
+        chunksize : int, optional
+            Number of documents transformed at once by each thread, `self.chunksize` of models that have one,
+            otherwise 2000.
+        minimum_probability : float, optional
+            Values below this threshold are dropped from the sparse outputs, 'csr' and 'mmcorpus'.
+            If not set, `self.minimum_probability` of models that have one, otherwise only zeros are dropped.
+
+        Returns
+        -------
+        {scipy.sparse.csr_matrix, numpy.ndarray, :class:`~gensim.corpora.mmcorpus.MmCorpus`}
+            Topic distributions of the documents, one row per document, in the order of `corpus`.
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.test.utils import common_corpus, common_dictionary
+            >>> from gensim.models import LdaModel
+            >>>
+            >>> lda = LdaModel(common_corpus, id2word=common_dictionary, num_topics=2)
+            >>> lda.transform_corpus(common_corpus, workers=2, output='dense').shape
+            (9, 2)
+
+        """
+        if output not in ('csr', 'dense', 'mmcorpus'):
+            raise ValueError("output must be one of 'csr', 'dense' or 'mmcorpus', got %r" % (output,))
+        if output == 'mmcorpus' and fname is None:
+            raise ValueError("fname must be set to stream the output into a corpus")
+        if chunksize is None:
+            chunksize = getattr(self, 'chunksize', 2000)
+        if minimum_probability is None:
+            minimum_probability = getattr(self, 'minimum_probability', 0.0)
+        num_topics = self.num_topics
+
+        chunks = matutils.corpus2csc_chunks(corpus, chunksize)
+        if workers > 1:
+            pool = ThreadPool(workers)
+            # a batch of chunks at a time, so that the corpus is streamed
+            results = (
+                result
+                for batch in utils.grouper(chunks, workers)
+                for result in pool.map(self._transform_chunk, batch)
+            )
+        else:
+            pool = None
+            results = (self._transform_chunk(chunk) for chunk in chunks)
+
+        try:
+            if output == 'dense':
+                return np.vstack([np.zeros((0, num_topics))] + list(results))
+
+            def sparse_results():
+                for result in results:
+                    result[np.abs(result) < minimum_probability] = 0
+                    yield scipy.sparse.csr_matrix(result)
+
+            if output == 'csr':
+                return scipy.sparse.vstack(
+                    [scipy.sparse.csr_matrix((0, num_topics))] + list(sparse_results()), format='csr'
+                )
+
+            def documents():
+                for result in sparse_results():
+                    for start, end in zip(result.indptr, result.indptr[1:]):
+                        yield list(zip(result.indices[start:end].tolist(), result.data[start:end].tolist()))
+
+            MmCorpus.serialize(fname, documents(), id2word=utils.FakeDict(num_topics))
+            return MmCorpus(fname)
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+    def _transform_chunk(self, chunk):
+        """Get the topic distributions of a chunk of documents, for
+        :meth:`~gensim.models.basemodel.BaseTopicModel.transform_corpus`.
+
+        Parameters
+        ----------
+        chunk : scipy.sparse.csc_matrix
+            Chunk of documents as columns. Its number of rows may differ from the vocabulary size of the model.
+
+        Returns
+        -------
+        numpy.ndarray
+            Topic distributions of the documents, shape (number of documents, number of topics).
+
+        Raises
+        ------
+        NotImplementedError
+
+        """
+        raise NotImplementedError
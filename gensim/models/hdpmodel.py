@@ -424,6 +424,31 @@ class HdpModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             gamma[d, :] = gammad
         return gamma
 
+    @property
+    def num_topics(self):
+        """int: Number of topics of the truncated model, `self.m_T`."""
+        return self.m_T
+
+    def _transform_chunk(self, chunk):
+        """Get the normalized topic distributions of a chunk of documents, as in
+        :meth:`~gensim.models.hdpmodel.HdpModel.__getitem__`.
+
+        Parameters
+        ----------
+        chunk : scipy.sparse.csc_matrix
+            Chunk of documents as columns.
+
+        Returns
+        -------
+        numpy.ndarray
+            Topic distributions of the documents, shape (number of documents, `self.m_T`),
+            all zeros for empty documents.
+
+        """
+        gamma = self.inference(matutils.Sparse2Corpus(chunk))
+        totals = gamma.sum(axis=1)[:, None]
+        return np.divide(gamma, totals, out=np.zeros_like(gamma), where=totals != 0)
+
     def __getitem__(self, bow, eps=0.01):
         """Accessor method for generating topic distribution of given document.
 
@@ -63,12 +63,13 @@ import sys
 import logging
 import threading
 import time
+from collections import deque
 from six import iteritems, itervalues
 
 try:
-    from Queue import Queue
+    from Queue import Empty
 except ImportError:
-    from queue import Queue
+    from queue import Empty
 import Pyro4
 from gensim import utils
 from gensim.models.lda_worker import LDA_WORKER_PREFIX
@@ -78,11 +79,23 @@ logger = logging.getLogger("gensim.models.lda_dispatcher")
 
 
 # How many jobs (=chunks of N documents) to keep "pre-fetched" in a queue?
-# A small number is usually enough, unless iteration over the corpus is very very
-# slow (slower than the actual computation of LDA), in which case you can override
-# this value from command line. ie. run "python ./lda_dispatcher.py 100"
+# Only an upper bound on top of MAX_JOBS_MEMORY when passed explicitly,
+# ie. run "python ./lda_dispatcher.py --maxsize 10"
 MAX_JOBS_QUEUE = 10
 
+# How much memory the jobs "pre-fetched" in the queue may take, in bytes. Putting a new job blocks while it
+# would exceed this limit, so that large chunks don't exhaust the dispatcher's memory and small ones
+# still keep all workers busy, unless iteration over the corpus is very very slow.
+MAX_JOBS_MEMORY = 256 * 1024 ** 2
+
+# Approximate memory of one document in bag-of-words format: a list, plus a (int, float) tuple per term.
+BOW_DOCUMENT_BYTES = 72
+BOW_ENTRY_BYTES = 120
+
+# How long a worker may work on a job, in seconds, before the dispatcher considers it lost and gives the job,
+# and those the worker already finished since the last merge, to the other workers.
+LEASE_TIMEOUT = 600
+
 # timeout for the Queue object put/get blocking methods.
 # it should theoretically be infinity, but then keyboard interrupts don't work.
 # so this is really just a hack, see http://bugs.python.org/issue1360
@@ -91,16 +104,41 @@ HUGE_TIMEOUT = 365 * 24 * 60 * 60  # one year
 LDA_DISPATCHER_PREFIX = 'gensim.lda_dispatcher'
 
 
+def job_memory(job):
+    """Estimate the memory taken by a job.
+
+    Parameters
+    ----------
+    job : iterable of {list of (int, float), numpy.ndarray}
+        The corpus chunk in BoW format, or as numpy arrays.
+
+    Returns
+    -------
+    int
+        Approximate size of the job in bytes.
+
+    """
+    size = 0
+    for doc in job:
+        nbytes = getattr(doc, 'nbytes', None)
+        size += BOW_DOCUMENT_BYTES + (nbytes if nbytes is not None else BOW_ENTRY_BYTES * len(doc))
+    return size
+
+
 class Dispatcher(object):
     """Dispatcher object that communicates and coordinates individual workers.
 
+    Each job handed to a worker is leased to it for `lease_timeout` seconds. When a lease expires or a worker
+    stops answering pings, the worker is dropped: its leased job and the jobs it finished since the last merge,
+    whose results would be lost with it, are given back to the remaining workers.
+
     Warnings
     --------
     There should never be more than one dispatcher running at any one time.
 
     """
 
-    def __init__(self, maxsize=MAX_JOBS_QUEUE, ns_conf=None):
+    def __init__(self, maxsize=None, ns_conf=None, maxmem=MAX_JOBS_MEMORY, lease_timeout=LEASE_TIMEOUT):
         """Partly initializes the dispatcher.
 
         A full initialization (including initialization of the workers) requires a call to
@@ -109,14 +147,22 @@ class Dispatcher(object):
         Parameters
         ----------
         maxsize : int, optional
-                Maximum number of jobs to be kept pre-fetched in the queue.
+            Maximum number of jobs to be kept pre-fetched in the queue, no limit besides `maxmem` by default.
         ns_conf : dict of (str, object)
             Sets up the name server configuration for the pyro daemon server of dispatcher.
             This also helps to keep track of your objects in your network by using logical object names
             instead of exact object name(or id) and its location.
+        maxmem : int, optional
+            Maximum memory taken by the jobs pre-fetched in the queue, in bytes, see
+            :func:`~gensim.models.lda_dispatcher.job_memory`. A single job larger than this is still accepted
+            when the queue is empty.
+        lease_timeout : float, optional
+            Seconds a worker may spend on one job before it is considered lost.
 
         """
         self.maxsize = maxsize
+        self.maxmem = maxmem
+        self.lease_timeout = lease_timeout
         self.callback = None
         self.ns_conf = ns_conf if ns_conf is not None else {}
 
@@ -135,10 +181,17 @@ class Dispatcher(object):
             When no workers are found (the :mod:`gensim.models.lda_worker` script must be ran beforehand).
 
         """
-        self.jobs = Queue(maxsize=self.maxsize)
+        self.jobs = deque()  # of (job, size) pairs, re-dispatched jobs go first
+        self.jobs_memory = 0
         self.lock_update = threading.Lock()
+        self.jobs_changed = threading.Condition(self.lock_update)
         self._jobsdone = 0
         self._jobsreceived = 0
+        self._state = None
+        # worker id => deque of (job, size, start time) of the jobs leased to it, finished in FIFO order
+        self.leases = {}
+        self.completed = {}  # worker id => list of (job, size) finished since the last merge
+        self.stats = {}  # worker id => throughput statistics
 
         self.workers = {}
         with utils.getNS(**self.ns_conf) as ns:
@@ -151,6 +204,9 @@ class Dispatcher(object):
                     logger.info("registering worker #%i at %s", workerid, uri)
                     worker.initialize(workerid, dispatcher=self.callback, **model_params)
                     self.workers[workerid] = worker
+                    self.completed[workerid] = []
+                    self.leases[workerid] = deque()
+                    self.stats[workerid] = {'jobs': 0, 'documents': 0, 'busy': 0.0, 'finished_at': 0.0}
                 except Pyro4.errors.PyroError:
                     logger.warning("unresponsive worker at %s,deleting it from the name server", uri)
                     ns.remove(name)
@@ -159,20 +215,42 @@ class Dispatcher(object):
             raise RuntimeError('no workers found; run some lda_worker scripts on your machines first!')
 
     @Pyro4.expose
-    def getworkers(self):
-        """Return pyro URIs of all registered workers.
+    def getworkers(self, stats=False):
+        """Return pyro URIs of all registered workers, or their throughput statistics.
+
+        Parameters
+        ----------
+        stats : bool, optional
+            Whether to return the statistics of each worker instead of its URI.
 
         Returns
         -------
-        list of URIs
-            The pyro URIs for each worker.
+        list of {URI, dict of (str, object)}
+            The pyro URIs for each worker or, if `stats` is set, a dict per worker with its `id`, `uri`,
+            the number of `jobs` and `documents` it finished, the seconds it was `busy` with them,
+            its `documents_per_second` and the number of jobs it is working on (`leased`).
 
         """
-        return [worker._pyroUri for worker in itervalues(self.workers)]
+        if not stats:
+            return [worker._pyroUri for worker in itervalues(self.workers)]
+        with self.lock_update:
+            result = []
+            for workerid, worker in iteritems(self.workers):
+                stat = self.stats[workerid]
+                result.append({
+                    'id': workerid,
+                    'uri': str(worker._pyroUri),
+                    'jobs': stat['jobs'],
+                    'documents': stat['documents'],
+                    'busy': stat['busy'],
+                    'documents_per_second': stat['documents'] / stat['busy'] if stat['busy'] else 0.0,
+                    'leased': len(self.leases[workerid]),
+                })
+            return result
 
     @Pyro4.expose
     def getjob(self, worker_id):
-        """Atomically pop a job from the queue.
+        """Atomically pop a job from the queue and lease it to the worker.
 
         Parameters
         ----------
@@ -184,25 +262,93 @@ class Dispatcher(object):
         iterable of list of (int, float)
             The corpus in BoW format.
 
+        Raises
+        ------
+        queue.Empty
+            When no job arrived within a second.
+        RuntimeError
+            When the worker was dropped by the dispatcher.
+
         """
         logger.info("worker #%i requesting a new job", worker_id)
-        job = self.jobs.get(block=True, timeout=1)
-        logger.info("worker #%i got a new job (%i left)", worker_id, self.jobs.qsize())
+        with self.jobs_changed:
+            if worker_id not in self.workers:
+                raise RuntimeError("worker #%i was dropped by the dispatcher" % worker_id)
+            if not self.jobs:
+                self.jobs_changed.wait(1)
+                if not self.jobs or worker_id not in self.workers:
+                    raise Empty()
+            job, size = self.jobs.popleft()
+            self.jobs_memory -= size
+            self.leases[worker_id].append((job, size, time.time()))
+            self.jobs_changed.notify_all()
+            logger.info("worker #%i got a new job (%i left)", worker_id, len(self.jobs))
         return job
 
     @Pyro4.expose
     def putjob(self, job):
-        """Atomically add a job to the queue.
+        """Atomically add a job to the queue, blocking while the queue is full.
 
         Parameters
         ----------
         job : iterable of list of (int, float)
             The corpus in BoW format.
 
+        Raises
+        ------
+        RuntimeError
+            When there are no workers left.
+
         """
-        self._jobsreceived += 1
-        self.jobs.put(job, block=True, timeout=HUGE_TIMEOUT)
-        logger.info("added a new job (len(queue)=%i items)", self.jobs.qsize())
+        size = job_memory(job)
+        with self.jobs_changed:
+            self._jobsreceived += 1
+            while self.jobs and (
+                    self.jobs_memory + size > self.maxmem or (self.maxsize and len(self.jobs) >= self.maxsize)):
+                if not self.workers:
+                    raise RuntimeError("no workers left")
+                self.jobs_changed.wait(1)
+            self.jobs.append((job, size))
+            self.jobs_memory += size
+            self.jobs_changed.notify_all()
+            logger.info("added a new job (len(queue)=%i items, %i bytes)", len(self.jobs), self.jobs_memory)
+
+    def _drop_worker(self, workerid, reason):
+        """Forget a lost worker and give its leased and completed jobs back to the queue.
+
+        Must be called with :attr:`lock_update` held.
+
+        """
+        if workerid not in self.workers:
+            return
+        del self.workers[workerid]
+        lost = self.completed.pop(workerid)
+        self._jobsdone -= len(lost)
+        lost.extend((job, size) for job, size, _ in self.leases.pop(workerid))
+        for job, size in reversed(lost):
+            self.jobs.appendleft((job, size))
+            self.jobs_memory += size
+        self.jobs_changed.notify_all()
+        logger.warning("dropping worker #%i (%s), re-dispatching its %i jobs", workerid, reason, len(lost))
+
+    def _check_workers(self, ping=False):
+        """Drop the workers whose lease expired or, if `ping` is set, that don't answer a ping."""
+        with self.lock_update:
+            deadline = time.time() - self.lease_timeout
+            for workerid, leases in list(iteritems(self.leases)):
+                if leases and leases[0][2] < deadline:
+                    self._drop_worker(workerid, "lease expired")
+            workers = list(iteritems(self.workers))
+        if ping:
+            for workerid, worker in workers:
+                logger.info("checking aliveness for worker %s", workerid)
+                try:
+                    worker.ping()
+                except Pyro4.errors.PyroError as err:
+                    with self.lock_update:
+                        self._drop_worker(workerid, "ping failed: %s" % err)
+        if not self.workers:
+            raise RuntimeError("all workers were lost")
 
     @Pyro4.expose
     def getstate(self):
@@ -213,28 +359,52 @@ class Dispatcher(object):
         :class:`~gensim.models.ldamodel.LdaState`
             Merged resultant state
 
+        Raises
+        ------
+        RuntimeError
+            When all workers were lost.
+
         """
         logger.info("end of input, assigning all remaining jobs")
         logger.debug("jobs done: %s, jobs received: %s", self._jobsdone, self._jobsreceived)
-        i = 0
-        count = 10
-        while self._jobsdone < self._jobsreceived:
-            time.sleep(0.5)  # check every half a second
-            i += 1
-            if i > count:
-                i = 0
-                for workerid, worker in iteritems(self.workers):
-                    logger.info("checking aliveness for worker %s", workerid)
-                    worker.ping()
-
-        logger.info("merging states from %i workers", len(self.workers))
-        workers = list(self.workers.values())
-        result = workers[0].getstate()
-        for worker in workers[1:]:
-            result.merge(worker.getstate())
-
-        logger.info("sending out merged state")
-        return result
+        result = None
+        while True:
+            i = 0
+            count = 10
+            while self._jobsdone < self._jobsreceived:
+                time.sleep(0.5)  # check every half a second
+                i += 1
+                self._check_workers(ping=i > count)
+                if i > count:
+                    i = 0
+
+            logger.info("merging states from %i workers", len(self.workers))
+            merged = []
+            for workerid, worker in list(iteritems(self.workers)):
+                try:
+                    state = worker.getstate()
+                except Pyro4.errors.PyroError as err:
+                    with self.lock_update:
+                        self._drop_worker(workerid, "getstate failed: %s" % err)
+                    break
+                with self.lock_update:
+                    self.completed[workerid] = []  # merged, no longer lost with the worker
+                merged.append(worker)
+                if result is None:
+                    result = state
+                else:
+                    result.merge(state)
+            else:
+                logger.info("sending out merged state")
+                return result
+
+            # a worker was lost while merging: restart the already merged workers, which stopped asking for jobs,
+            # so that they redo its jobs, then merge the new states into the result
+            if not self.workers:
+                raise RuntimeError("all workers were lost")
+            for worker in merged:
+                worker.reset(self._state)
+                worker.requestjob()
 
     @Pyro4.expose
     def reset(self, state):
@@ -246,12 +416,20 @@ class Dispatcher(object):
             State of :class:`~gensim.models.lda.LdaModel`.
 
         """
-        for workerid, worker in iteritems(self.workers):
+        for workerid, worker in list(iteritems(self.workers)):
             logger.info("resetting worker %s", workerid)
-            worker.reset(state)
-            worker.requestjob()
-        self._jobsdone = 0
-        self._jobsreceived = 0
+            try:
+                worker.reset(state)
+                worker.requestjob()
+            except Pyro4.errors.PyroError as err:
+                with self.lock_update:
+                    self._drop_worker(workerid, "reset failed: %s" % err)
+        with self.lock_update:
+            self._state = state  # to restart workers if one is lost while merging
+            for workerid in self.workers:
+                self.completed[workerid] = []
+            self._jobsdone = 0
+            self._jobsreceived = 0
 
     @Pyro4.expose
     @Pyro4.oneway
@@ -264,6 +442,7 @@ class Dispatcher(object):
         The job done event is logged and then control is asynchronously transfered back to the worker
         (who can then request another job). In this way, control flow basically oscillates between
         :meth:`gensim.models.lda_dispatcher.Dispatcher.jobdone` and :meth:`gensim.models.lda_worker.Worker.requestjob`.
+        Jobs finished by a worker that was already dropped are ignored, they were re-dispatched.
 
         Parameters
         ----------
@@ -271,7 +450,19 @@ class Dispatcher(object):
             The ID of the worker that finished the job (used for logging).
 
         """
+        if workerid not in self.workers or not self.leases[workerid]:
+            logger.info("ignoring job finished by dropped worker #%s", workerid)
+            return
+        job, size, started = self.leases[workerid].popleft()
+        self.completed[workerid].append((job, size))
+        stat = self.stats[workerid]
+        now = time.time()
+        stat['jobs'] += 1
+        stat['documents'] += len(job)
+        stat['busy'] += now - max(started, stat['finished_at'])  # don't count overlapping leases twice
+        stat['finished_at'] = now
         self._jobsdone += 1
+        self.jobs_changed.notify_all()
         logger.info("worker #%s finished job #%i", workerid, self._jobsdone)
         self.workers[workerid].requestjob()  # tell the worker to ask for another job, asynchronously (one-way)
 
@@ -300,8 +491,18 @@ def main():
     parser = argparse.ArgumentParser(description=__doc__[:-135], formatter_class=argparse.RawTextHelpFormatter)
     parser.add_argument(
         "--maxsize",
-        help="How many jobs (=chunks of N documents) to keep 'pre-fetched' in a queue (default: %(default)s)",
-        type=int, default=MAX_JOBS_QUEUE
+        help="How many jobs (=chunks of N documents) to keep 'pre-fetched' in a queue (default: no limit)",
+        type=int, default=None
+    )
+    parser.add_argument(
+        "--maxmem",
+        help="How much memory in MB the jobs 'pre-fetched' in the queue may take (default: %(default)s)",
+        type=int, default=MAX_JOBS_MEMORY // 1024 ** 2
+    )
+    parser.add_argument(
+        "--lease-timeout",
+        help="Seconds a worker may spend on a job before it is considered lost (default: %(default)s)",
+        type=float, default=LEASE_TIMEOUT
     )
     parser.add_argument("--host", help="Nameserver hostname (default: %(default)s)", default=None)
     parser.add_argument("--port", help="Nameserver port (default: %(default)s)", default=None, type=int)
@@ -324,7 +525,9 @@ def main():
         "port": args.port,
         "hmac_key": args.hmac
     }
-    utils.pyro_daemon(LDA_DISPATCHER_PREFIX, Dispatcher(maxsize=args.maxsize, ns_conf=ns_conf), ns_conf=ns_conf)
+    utils.pyro_daemon(LDA_DISPATCHER_PREFIX, Dispatcher(
+        maxsize=args.maxsize, ns_conf=ns_conf, maxmem=args.maxmem * 1024 ** 2, lease_timeout=args.lease_timeout
+    ), ns_conf=ns_conf)
     logger.info("finished running %s", " ".join(sys.argv))
 
 
@@ -104,6 +104,8 @@ class Worker(object):
 
         """
         self.lock_update = threading.Lock()
+        self.lock_request = threading.Lock()
+        self.requesting = False  # is a requestjob loop running?
         self.jobsdone = 0  # how many jobs has this worker completed?
         # id of this worker in the dispatcher; just a convenience var for easy access/logging TODO remove?
         self.myid = myid
@@ -127,16 +129,35 @@ class Worker(object):
         if self.model is None:
             raise RuntimeError("worker must be initialized before receiving jobs")
 
+        # keep a single loop asking for jobs: `reset` starts a new one while the previous one may still be waiting,
+        # and piled up loops would hold one server thread each, both here and in the dispatcher
+        with self.lock_request:
+            if self.requesting:
+                return
+            self.requesting = True
+
         job = None
-        while job is None and not self.finished:
+        while job is None:
+            with self.lock_request:
+                if self.finished:
+                    self.requesting = False
+                    break
             try:
                 job = self.dispatcher.getjob(self.myid)
             except Queue.Empty:
                 # no new job: try again, unless we're finished with all work
                 continue
+            except RuntimeError as err:
+                # the dispatcher dropped this worker (e.g. its lease expired) and gave its jobs to others
+                logger.warning("worker #%s stopping: %s", self.myid, err)
+                with self.lock_request:
+                    self.requesting = False
+                return
         if job is not None:
             logger.info("worker #%s received job #%i", self.myid, self.jobsdone)
             self.processjob(job)
+            with self.lock_request:
+                self.requesting = False  # before notifying the dispatcher, which asks for the next request
             self.dispatcher.jobdone(self.myid)
         else:
             logger.info("worker #%i stopping asking for jobs", self.myid)
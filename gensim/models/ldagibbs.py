@@ -0,0 +1,423 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Latent Dirichlet Allocation (LDA) estimated by multithreaded collapsed Gibbs sampling.
+
+Unlike the variational :class:`~gensim.models.ldamodel.LdaModel`, whose E-step costs O(`num_topics`) per token,
+sampling a new topic for a token costs O(1) here, independent of the number of topics: topics are drawn by a few
+Metropolis-Hastings steps cycling between a word proposal and a document proposal, as in
+`Yuan et al.: "LightLDA: Big Topic Models on Modest Compute Clusters" <https://arxiv.org/abs/1412.1576>`_.
+Both proposals are drawn in constant time by picking the topic of another random token of the same word or of the
+same document, so no alias tables need to be built or refreshed. This makes models with thousands of topics
+practical.
+
+The documents are split between `workers` threads, which sample without the GIL and update the shared counts
+atomically. Requires the compiled :mod:`gensim.models.ldagibbs_inner`.
+
+Usage examples
+--------------
+
+Train a model and get the topics of a new document
+
+.. sourcecode:: pycon
+
+    >>> from gensim.test.utils import common_corpus, common_dictionary
+    >>> from gensim.models.ldagibbs import LdaGibbsModel
+    >>>
+    >>> lda = LdaGibbsModel(common_corpus, id2word=common_dictionary, num_topics=5, iterations=200)
+    >>> topics = lda.show_topics()
+    >>> vector = lda[common_corpus[0]]
+
+The model implements :class:`~gensim.models.basemodel.BaseTopicModel`, so it can be evaluated with
+:class:`~gensim.models.coherencemodel.CoherenceModel`
+
+.. sourcecode:: pycon
+
+    >>> from gensim.models import CoherenceModel
+    >>>
+    >>> coherence = CoherenceModel(model=lda, corpus=common_corpus, coherence='u_mass').get_coherence()
+
+"""
+
+import logging
+import threading
+from multiprocessing import cpu_count
+
+import numpy as np
+from scipy.special import gammaln
+from six.moves import range
+
+from gensim import interfaces, matutils, utils
+from gensim.models import basemodel
+
+try:
+    from gensim.models.ldagibbs_inner import sample, infer, FAST_VERSION
+except ImportError:
+    FAST_VERSION = -1
+
+logger = logging.getLogger(__name__)
+
+
+class LdaGibbsModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
+    """Latent Dirichlet Allocation trained by multithreaded Metropolis-Hastings collapsed Gibbs sampling.
+
+    Attributes
+    ----------
+    word_topics : numpy.ndarray
+        Number of tokens of each word assigned to each topic by the last sample, shape (`num_terms`, `num_topics`).
+    topic_counts : numpy.ndarray
+        Number of tokens assigned to each topic by the last sample.
+
+    """
+    def __init__(self, corpus=None, num_topics=100, id2word=None, alpha=None, eta=0.01, iterations=100,
+                 workers=None, mh_steps=2, eval_every=10, random_state=None, minimum_probability=0.01):
+        """
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, float), optional
+            Training corpus in BoW format. Counts are rounded to whole tokens.
+            If not given, the model is left untrained (presumably because you want to call
+            :meth:`~gensim.models.ldagibbs.LdaGibbsModel.train` manually).
+        num_topics : int, optional
+            Number of topics.
+        id2word : {dict of (int, str), :class:`gensim.corpora.dictionary.Dictionary`}, optional
+            Mapping from word IDs to words, which determines the vocabulary size.
+        alpha : float, optional
+            Symmetric document-topic prior, `50 / num_topics` by default.
+        eta : float, optional
+            Symmetric topic-word prior.
+        iterations : int, optional
+            Number of sampling sweeps over the corpus.
+        workers : int, optional
+            Number of sampling threads, the number of cores by default.
+        mh_steps : int, optional
+            Number of Metropolis-Hastings steps per token and sweep.
+        eval_every : int, optional
+            Log the log-likelihood of the words every that many sweeps, 0 to disable.
+        random_state : {numpy.random.RandomState, int}, optional
+            Either a RandomState object or a seed to generate one. Results are only reproducible with one worker.
+        minimum_probability : float, optional
+            Topics with a probability lower than this threshold are filtered out of document topic distributions.
+
+        """
+        if FAST_VERSION < 0:
+            raise RuntimeError(
+                "LdaGibbsModel requires the compiled gensim.models.ldagibbs_inner extension, "
+                "reinstall gensim with a C compiler available"
+            )
+
+        if corpus is None and id2word is None:
+            raise ValueError(
+                'at least one of corpus/id2word must be specified, to establish input space dimensionality'
+            )
+        if id2word is None:
+            logger.warning("no word id mapping provided; initializing from corpus, assuming identity")
+            id2word = utils.dict_from_corpus(corpus)
+        self.id2word = id2word
+        self.num_terms = 1 + max(self.id2word.keys()) if len(self.id2word) else 0
+        if self.num_terms == 0:
+            raise ValueError("cannot compute LDA over an empty collection (no terms)")
+
+        self.num_topics = int(num_topics)
+        self.alpha = 50.0 / self.num_topics if alpha is None else float(alpha)
+        self.eta = float(eta)
+        self.iterations = iterations
+        self.workers = max(1, cpu_count()) if workers is None else workers
+        self.mh_steps = mh_steps
+        self.eval_every = eval_every
+        self.minimum_probability = minimum_probability
+        self.random_state = utils.get_random_state(random_state)
+
+        self.word_topics = np.zeros((self.num_terms, self.num_topics), dtype=np.int32)
+        self.topic_counts = np.zeros(self.num_topics, dtype=np.int32)
+
+        if corpus is not None:
+            self.train(corpus)
+
+    def __str__(self):
+        """Get a string representation of the current object.
+
+        Returns
+        -------
+        str
+            Human readable representation of the most important model parameters.
+
+        """
+        return "LdaGibbsModel(num_terms=%s, num_topics=%s, alpha=%s, eta=%s)" % (
+            self.num_terms, self.num_topics, self.alpha, self.eta
+        )
+
+    def train(self, corpus, iterations=None):
+        """Estimate the topics of `corpus`, starting from a random assignment of its tokens.
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, float)
+            Training corpus in BoW format.
+        iterations : int, optional
+            Number of sampling sweeps, `self.iterations` by default.
+
+        """
+        iterations = self.iterations if iterations is None else iterations
+        words, doc_ptr = _corpus_tokens(corpus)
+        if len(words) and (words.min() < 0 or words.max() >= self.num_terms):
+            raise ValueError("term ids out of range for a model of %i terms" % self.num_terms)
+        num_docs = len(doc_ptr) - 1
+
+        # the tokens of each word, for the word proposal
+        word_tokens = np.argsort(words, kind='mergesort').astype(np.int64)
+        word_ptr = np.zeros(self.num_terms + 1, dtype=np.int64)
+        np.cumsum(np.bincount(words, minlength=self.num_terms), out=word_ptr[1:])
+
+        topics = self.random_state.randint(0, self.num_topics, size=len(words)).astype(np.int32)
+        self.word_topics[...] = 0
+        np.add.at(self.word_topics, (words, topics), 1)
+        self.topic_counts[...] = np.bincount(topics, minlength=self.num_topics)
+
+        # split the documents into ranges with about the same number of tokens
+        workers = max(1, min(self.workers, num_docs))
+        bounds = np.searchsorted(doc_ptr, np.linspace(0, doc_ptr[-1], workers + 1)[1:-1])
+        ranges = list(zip([0] + list(bounds), list(bounds) + [num_docs]))
+
+        logger.info(
+            "running Gibbs sampling LDA, %i topics, %i sweeps over %i documents (%i tokens) in %i threads",
+            self.num_topics, iterations, num_docs, len(words), workers
+        )
+        for iteration in range(iterations):
+            seeds = self.random_state.randint(1, 2 ** 31 - 1, size=len(ranges))
+            threads = [
+                threading.Thread(target=sample, args=(
+                    words, topics, doc_ptr, word_ptr, word_tokens, self.word_topics, self.topic_counts,
+                    start, end, self.alpha, self.eta, self.mh_steps, int(seed)
+                ))
+                for (start, end), seed in zip(ranges, seeds)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            if self.eval_every and (iteration + 1) % self.eval_every == 0:
+                logger.info("sweep %i/%i: word log-likelihood %.4e", iteration + 1, iterations, self.log_likelihood())
+
+    def log_likelihood(self):
+        """Get the log-likelihood of the training words given their current topic assignments, log p(w | z).
+
+        Returns
+        -------
+        float
+            The log-likelihood.
+
+        """
+        eta_sum = self.eta * self.num_terms
+        return float(
+            self.num_topics * (gammaln(eta_sum) - self.num_terms * gammaln(self.eta))
+            - gammaln(self.topic_counts + eta_sum).sum()
+            + gammaln(self.word_topics + self.eta).sum()
+        )
+
+    def get_topics(self):
+        """Get the term-topic matrix learned during training.
+
+        Returns
+        -------
+        numpy.ndarray
+            The probability for each word in each topic, shape (`num_topics`, `num_terms`).
+
+        """
+        topics = self.word_topics.T + self.eta
+        return topics / (self.topic_counts + self.eta * self.num_terms)[:, None]
+
+    def get_topic_terms(self, topicid, topn=10):
+        """Get the most probable words of a topic, as word ids.
+
+        Parameters
+        ----------
+        topicid : int
+            The ID of the topic.
+        topn : int, optional
+            Number of words returned.
+
+        Returns
+        -------
+        list of (int, float)
+            Word ID - probability pairs for the most probable words of the topic.
+
+        """
+        topic = (self.word_topics[:, topicid] + self.eta) / (self.topic_counts[topicid] + self.eta * self.num_terms)
+        bestn = matutils.argsort(topic, topn, reverse=True)
+        return [(idx, topic[idx]) for idx in bestn]
+
+    def show_topic(self, topicid, topn=10):
+        """Get the most probable words of a topic.
+
+        Parameters
+        ----------
+        topicid : int
+            The ID of the topic.
+        topn : int, optional
+            Number of words returned.
+
+        Returns
+        -------
+        list of (str, float)
+            Word - probability pairs for the most probable words of the topic.
+
+        """
+        return [(self.id2word[idx], value) for idx, value in self.get_topic_terms(topicid, topn)]
+
+    def show_topics(self, num_topics=10, num_words=10, log=False, formatted=True):
+        """Get a representation of the largest topics.
+
+        Parameters
+        ----------
+        num_topics : int, optional
+            Number of topics to be returned, all of them if negative. Topics with the most tokens come first.
+        num_words : int, optional
+            Number of words to be presented for each topic.
+        log : bool, optional
+            Whether the output is also logged, besides being returned.
+        formatted : bool, optional
+            Whether the topic representations should be formatted as strings. If False, they are returned as
+            2 tuples of (word, probability).
+
+        Returns
+        -------
+        list of (int, {str, list of (str, float)})
+            Topic ids with their representations.
+
+        """
+        if num_topics < 0 or num_topics >= self.num_topics:
+            num_topics = self.num_topics
+        shown = []
+        for topicid in matutils.argsort(self.topic_counts, num_topics, reverse=True):
+            topicid = int(topicid)
+            topic = self.show_topic(topicid, num_words)
+            if formatted:
+                topic = ' + '.join('%.3f*"%s"' % (v, k) for k, v in topic)
+            shown.append((topicid, topic))
+            if log:
+                logger.info("topic #%i (%i tokens): %s", topicid, self.topic_counts[topicid], topic)
+        return shown
+
+    def inference(self, chunk, iterations=50, burn_in=None):
+        """Estimate the topic distributions of new documents, by Gibbs sampling their tokens with the learned topics.
+
+        Parameters
+        ----------
+        chunk : iterable of list of (int, float)
+            Documents in BoW format. Counts are rounded to whole tokens.
+        iterations : int, optional
+            Number of sampling sweeps.
+        burn_in : int, optional
+            Number of initial sweeps not used for the estimate, `iterations // 2` by default.
+
+        Returns
+        -------
+        numpy.ndarray
+            Topic distribution of each document, shape (`len(chunk)`, `self.num_topics`).
+
+        """
+        burn_in = iterations // 2 if burn_in is None else burn_in
+        words, doc_ptr = _corpus_tokens(chunk, self.num_terms)
+        counts = infer(
+            np.ascontiguousarray(self.get_topics().T), words, doc_ptr, self.alpha,
+            iterations, burn_in, int(self.random_state.randint(1, 2 ** 31 - 1))
+        )
+        counts += self.alpha * max(1, iterations - burn_in)
+        return counts / counts.sum(axis=1)[:, None]
+
+    def _transform_chunk(self, chunk):
+        """Get the topic distributions of a chunk of documents, see
+        :meth:`~gensim.models.ldagibbs.LdaGibbsModel.inference`.
+
+        Parameters
+        ----------
+        chunk : scipy.sparse.csc_matrix
+            Chunk of documents as columns.
+
+        Returns
+        -------
+        numpy.ndarray
+            Topic distributions of the documents, shape (number of documents, `self.num_topics`).
+
+        """
+        return self.inference(matutils.Sparse2Corpus(chunk))
+
+    def get_document_topics(self, bow, minimum_probability=None):
+        """Get the topic distribution of a document.
+
+        Parameters
+        ----------
+        bow : list of (int, float)
+            The document in BoW format.
+        minimum_probability : float, optional
+            Topics with an assigned probability lower than this threshold will be discarded.
+
+        Returns
+        -------
+        list of (int, float)
+            Topic distribution of the document, as (topic id, probability) pairs.
+
+        """
+        if minimum_probability is None:
+            minimum_probability = self.minimum_probability
+        minimum_probability = max(minimum_probability, 1e-8)  # never allow zero values in sparse output
+        topic_dist = self.inference([bow])[0]
+        return [
+            (topicid, float(topicvalue)) for topicid, topicvalue in enumerate(topic_dist)
+            if topicvalue >= minimum_probability
+        ]
+
+    def __getitem__(self, bow):
+        """Get the topic distribution of a document, or of each document of a corpus.
+
+        Parameters
+        ----------
+        bow : {list of (int, float), iterable of list of (int, float)}
+            The document in BoW format, or a corpus.
+
+        Returns
+        -------
+        {list of (int, float), :class:`~gensim.interfaces.TransformedCorpus`}
+            Topic distribution of the document or documents.
+
+        """
+        is_corpus, bow = utils.is_corpus(bow)
+        if is_corpus:
+            return self._apply(bow)
+        return self.get_document_topics(bow)
+
+
+def _corpus_tokens(corpus, num_terms=None):
+    """Expand a BoW corpus into tokens.
+
+    Parameters
+    ----------
+    corpus : iterable of list of (int, float)
+        Documents in BoW format. Counts are rounded to whole tokens.
+    num_terms : int, optional
+        If given, words with ids outside `[0, num_terms)` are skipped.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+        Word id of each token (int32), and `doc_ptr` (int64): document `d` is made of the tokens
+        `doc_ptr[d]:doc_ptr[d + 1]`.
+
+    """
+    words, lengths = [], []
+    for doc in corpus:
+        ids = np.fromiter((idx for idx, _ in doc), dtype=np.int32, count=len(doc))
+        cts = np.fromiter((cnt for _, cnt in doc), dtype=np.float64, count=len(doc))
+        doc_words = np.repeat(ids, np.rint(cts).astype(np.int64).clip(0))
+        if num_terms is not None:
+            doc_words = doc_words[(doc_words >= 0) & (doc_words < num_terms)]
+        words.append(doc_words)
+        lengths.append(len(doc_words))
+    doc_ptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=doc_ptr[1:])
+    words = np.concatenate(words) if words else np.zeros(0, dtype=np.int32)
+    return words.astype(np.int32, copy=False), doc_ptr
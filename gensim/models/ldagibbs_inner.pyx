@@ -0,0 +1,240 @@
+#!/usr/bin/env cython
+# coding: utf-8
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+# cython: embedsignature=True
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Optimized collapsed Gibbs sampling for :class:`~gensim.models.ldagibbs.LdaGibbsModel` (fast Cython version)."""
+
+cimport cython
+import numpy as np
+
+cdef extern from *:
+    """
+    #if defined(_MSC_VER)
+    #include <intrin.h>
+    #define gibbs_atomic_add(ptr, value) _InterlockedExchangeAdd((volatile long *)(ptr), (value))
+    #else
+    #define gibbs_atomic_add(ptr, value) __sync_fetch_and_add((ptr), (value))
+    #endif
+    """
+    int gibbs_atomic_add(int *ptr, int value) nogil
+
+
+FAST_VERSION = 1
+
+
+cdef inline unsigned long long _random(unsigned long long *state) nogil:
+    """Next value of a xorshift64* generator."""
+    cdef unsigned long long x = state[0]
+    x ^= x >> 12
+    x ^= x << 25
+    x ^= x >> 27
+    state[0] = x
+    return x * 2685821657736338717ULL
+
+
+cdef inline double _uniform(unsigned long long *state) nogil:
+    """Random number uniformly distributed in [0, 1)."""
+    return (_random(state) >> 11) * (1.0 / 9007199254740992.0)
+
+
+cdef inline Py_ssize_t _randint(unsigned long long *state, Py_ssize_t n) nogil:
+    """Random integer uniformly distributed in [0, n)."""
+    return <Py_ssize_t>(_uniform(state) * n)
+
+
+def sample(int[::1] words, int[::1] topics, long long[::1] doc_ptr, long long[::1] word_ptr,
+           long long[::1] word_tokens, int[:, ::1] word_topics, int[::1] topic_counts, Py_ssize_t doc_start,
+           Py_ssize_t doc_end, double alpha, double eta, int mh_steps, unsigned long long seed):
+    """Run one sweep of Metropolis-Hastings collapsed Gibbs sampling over the tokens of a range of documents,
+    without holding the GIL.
+
+    Each new topic of a token is drawn by `mh_steps` Metropolis-Hastings steps, alternating a word proposal
+    proportional to `n_wk + eta` (the topic of another random token of the same word) and a document proposal
+    proportional to `n_dk + alpha` (the topic of another random token of the same document), as in LightLDA.
+    Both proposals cost O(1) per token, independent of the number of topics.
+
+    Several threads may sample disjoint document ranges of the same corpus concurrently: the shared counts are
+    updated with atomic operations.
+
+    Parameters
+    ----------
+    words : numpy.ndarray
+        Word id of each token, int32.
+    topics : numpy.ndarray
+        Current topic of each token, int32. Updated in place.
+    doc_ptr : numpy.ndarray
+        Document `d` is made of the tokens `doc_ptr[d]:doc_ptr[d + 1]`, int64.
+    word_ptr : numpy.ndarray
+        The tokens of word `w` are `word_tokens[word_ptr[w]:word_ptr[w + 1]]`, int64.
+    word_tokens : numpy.ndarray
+        Token positions sorted by word, int64.
+    word_topics : numpy.ndarray
+        Number of tokens of each word assigned to each topic, shape (`num_terms`, `num_topics`), int32.
+        Updated in place.
+    topic_counts : numpy.ndarray
+        Number of tokens assigned to each topic, int32. Updated in place.
+    doc_start : int
+        First document to sample.
+    doc_end : int
+        Document after the last one to sample.
+    alpha : float
+        Symmetric document-topic prior.
+    eta : float
+        Symmetric topic-word prior.
+    mh_steps : int
+        Number of Metropolis-Hastings steps per token.
+    seed : int
+        Seed of the random generator of this sweep, must not be 0.
+
+    """
+    cdef unsigned long long state = seed or 1
+    doc_topics = np.zeros(word_topics.shape[1], dtype=np.int32)
+    cdef int[::1] doc_topics_view = doc_topics
+    with nogil:
+        _sample(
+            &words[0], &topics[0], &doc_ptr[0], &word_ptr[0], &word_tokens[0], &word_topics[0, 0],
+            &topic_counts[0], &doc_topics_view[0], word_topics.shape[0], word_topics.shape[1], doc_start, doc_end,
+            alpha, eta, mh_steps, &state
+        )
+
+
+cdef void _sample(
+        int *words, int *topics, long long *doc_ptr, long long *word_ptr, long long *word_tokens,
+        int *word_topics, int *topic_counts, int *doc_topics, Py_ssize_t num_terms, Py_ssize_t num_topics,
+        Py_ssize_t doc_start, Py_ssize_t doc_end, double alpha, double eta, int mh_steps,
+        unsigned long long *state) nogil:
+    """Body of :func:`~gensim.models.ldagibbs_inner.sample`."""
+    cdef Py_ssize_t d, i, j, start, end, doc_len, word_start, word_len, step
+    cdef int w, s, t
+    cdef double eta_sum = eta * num_terms, ratio
+
+    for d in range(doc_start, doc_end):
+        start, end = doc_ptr[d], doc_ptr[d + 1]
+        doc_len = end - start
+        for i in range(start, end):
+            doc_topics[topics[i]] += 1
+
+        for i in range(start, end):
+            w = words[i]
+            s = topics[i]
+            word_start, word_len = word_ptr[w], word_ptr[w + 1] - word_ptr[w]
+            # remove the token from the counts
+            doc_topics[s] -= 1
+            gibbs_atomic_add(&word_topics[w * num_topics + s], -1)
+            gibbs_atomic_add(&topic_counts[s], -1)
+
+            for step in range(mh_steps):
+                if step % 2 == 0:
+                    # word proposal, q(k) ~ n_wk + eta: the topic of another token of the word, or a uniform topic
+                    if _uniform(state) * (word_len - 1 + num_topics * eta) < word_len - 1:
+                        j = word_tokens[word_start + _randint(state, word_len - 1)]
+                        if j == i:
+                            j = word_tokens[word_start + word_len - 1]
+                        t = topics[j]
+                    else:
+                        t = <int>_randint(state, num_topics)
+                    if t == s:
+                        continue
+                    ratio = (
+                        (doc_topics[t] + alpha) * (topic_counts[s] + eta_sum)
+                        / ((doc_topics[s] + alpha) * (topic_counts[t] + eta_sum))
+                    )
+                else:
+                    # document proposal, q(k) ~ n_dk + alpha: the topic of another token of the document
+                    if _uniform(state) * (doc_len - 1 + num_topics * alpha) < doc_len - 1:
+                        j = start + _randint(state, doc_len - 1)
+                        if j == i:
+                            j = end - 1
+                        t = topics[j]
+                    else:
+                        t = <int>_randint(state, num_topics)
+                    if t == s:
+                        continue
+                    ratio = (
+                        (word_topics[w * num_topics + t] + eta) * (topic_counts[s] + eta_sum)
+                        / ((word_topics[w * num_topics + s] + eta) * (topic_counts[t] + eta_sum))
+                    )
+                if ratio >= 1.0 or _uniform(state) < ratio:
+                    s = t
+
+            topics[i] = s
+            doc_topics[s] += 1
+            gibbs_atomic_add(&word_topics[w * num_topics + s], 1)
+            gibbs_atomic_add(&topic_counts[s], 1)
+
+        for i in range(start, end):
+            doc_topics[topics[i]] = 0
+
+
+def infer(double[:, ::1] word_probs, int[::1] words, long long[::1] doc_ptr, double alpha, int iterations,
+          int burn_in, unsigned long long seed):
+    """Estimate the topic distributions of new documents by Gibbs sampling with fixed topics,
+    without holding the GIL.
+
+    Parameters
+    ----------
+    word_probs : numpy.ndarray
+        Probability of each word in each topic, shape (`num_terms`, `num_topics`).
+    words : numpy.ndarray
+        Word id of each token, int32.
+    doc_ptr : numpy.ndarray
+        Document `d` is made of the tokens `doc_ptr[d]:doc_ptr[d + 1]`, int64.
+    alpha : float
+        Symmetric document-topic prior.
+    iterations : int
+        Number of sweeps over the documents.
+    burn_in : int
+        Number of initial sweeps whose samples are discarded.
+    seed : int
+        Seed of the random generator, must not be 0.
+
+    Returns
+    -------
+    numpy.ndarray
+        Topic counts of each document summed over the sweeps after burn-in, shape (`num_docs`, `num_topics`).
+
+    """
+    cdef unsigned long long state = seed or 1
+    cdef Py_ssize_t num_docs = doc_ptr.shape[0] - 1, num_topics = word_probs.shape[1]
+    cdef Py_ssize_t d, i, k, iteration
+    cdef int w, s
+    cdef double total, u
+    counts = np.zeros((num_docs, num_topics), dtype=np.float64)
+    doc_topics = np.zeros(num_topics, dtype=np.float64)
+    cumulative = np.zeros(num_topics, dtype=np.float64)
+    topics = np.zeros(words.shape[0], dtype=np.int32)
+    cdef double[:, ::1] counts_view = counts
+    cdef double[::1] doc_topics_view = doc_topics, cumulative_view = cumulative
+    cdef int[::1] topics_view = topics
+
+    with nogil:
+        for d in range(num_docs):
+            for i in range(doc_ptr[d], doc_ptr[d + 1]):
+                s = <int>_randint(&state, num_topics)
+                topics_view[i] = s
+                doc_topics_view[s] += 1
+            for iteration in range(iterations):
+                for i in range(doc_ptr[d], doc_ptr[d + 1]):
+                    w = words[i]
+                    doc_topics_view[topics_view[i]] -= 1
+                    total = 0.0
+                    for k in range(num_topics):
+                        total += (doc_topics_view[k] + alpha) * word_probs[w, k]
+                        cumulative_view[k] = total
+                    u = _uniform(&state) * total
+                    s = 0
+                    while s < num_topics - 1 and cumulative_view[s] <= u:
+                        s += 1
+                    topics_view[i] = s
+                    doc_topics_view[s] += 1
+                if iteration >= burn_in:
+                    for k in range(num_topics):
+                        counts_view[d, k] += doc_topics_view[k]
+            for k in range(num_topics):
+                doc_topics_view[k] = 0
+    return counts
@@ -76,6 +76,18 @@ Update the model by incrementally training on the new corpus
     >>> lda.update(other_corpus)
     >>> vector = lda[unseen_doc]
 
+Export a lightweight, inference-only model for serving
+
+.. sourcecode:: pycon
+
+    >>> from gensim.test.utils import get_tmpfile
+    >>>
+    >>> frozen = lda.freeze(dtype=np.float16)  # keeps only expElogbeta and alpha
+    >>> vector = frozen[unseen_doc]  # deterministic
+    >>> frozen.save(get_tmpfile("frozen_lda"))
+    >>> frozen = LdaInferenceModel.load(get_tmpfile("frozen_lda"), mmap='r')
+    >>> gamma = frozen.inference(other_corpus)  # a whole batch at once
+
 A lot of parameters can be tuned to optimize training for your specific case
 
 .. sourcecode:: pycon
@@ -89,23 +101,34 @@ import numbers
 import os
 
 import numpy as np
+import scipy.sparse
 import six
 from scipy.special import gammaln, psi  # gamma function utils
 from scipy.special import polygamma
 from six.moves import range
 from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 
 from gensim import interfaces, utils, matutils
 from gensim.matutils import (
     kullback_leibler, hellinger, jaccard_distance, jensen_shannon,
-    dirichlet_expectation, logsumexp, mean_absolute_difference
+    dirichlet_expectation, mean_absolute_difference
 )
 from gensim.models import basemodel, CoherenceModel
 from gensim.models.callbacks import Callback
 
+try:
+    from gensim.models.ldamodel_inner import e_step
+except ImportError:
+    FAST_VERSION = -1
+else:
+    FAST_VERSION = 1
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of (term, topic) values held at once per thread by the vectorized bound computation.
+BOUND_BLOCK_SIZE = 2 ** 20
+
 
 def update_dir_prior(prior, N, logphat, rho):
     """Update a given prior using Newton's method, described in
@@ -146,6 +169,37 @@ def update_dir_prior(prior, N, logphat, rho):
     return prior
 
 
+def truncate_topics(sstats, topk):
+    """Keep only the `topk` largest topics of each term in the sufficient statistics of a chunk.
+
+    The other values of each column are set to zero, and the kept ones are rescaled so that the column sums,
+    i.e. the expected counts of each term, are unchanged.
+
+    Parameters
+    ----------
+    sstats : numpy.ndarray
+        Sufficient statistics, shape (`num_topics`, `num_terms`). Modified in place.
+    topk : int
+        Number of topics kept per term.
+
+    Returns
+    -------
+    numpy.ndarray
+        `sstats`.
+
+    """
+    num_topics, num_terms = sstats.shape
+    if topk >= num_topics or not num_terms:
+        return sstats
+    totals = sstats.sum(axis=0)
+    dropped = np.argpartition(sstats, num_topics - topk, axis=0)[:num_topics - topk]
+    sstats[dropped, np.arange(num_terms)] = 0.0
+    kept = sstats.sum(axis=0)
+    np.divide(totals, kept, out=totals, where=kept > 0)
+    sstats *= totals
+    return sstats
+
+
 class LdaState(utils.SaveLoad):
     """Encapsulate information for distributed computation of :class:`~gensim.models.ldamodel.LdaModel` objects.
 
@@ -229,7 +283,9 @@ class LdaState(utils.SaveLoad):
         else:
             logger.info("merging changes from %i documents into a model of %i documents", other.numdocs, targetsize)
             scale = 1.0 * targetsize / other.numdocs
-        self.sstats += rhot * scale * other.sstats
+        # one topic at a time, to avoid a temporary copy of the whole matrix
+        for topic_sstats, other_sstats in zip(self.sstats, other.sstats):
+            topic_sstats += rhot * scale * other_sstats
 
         self.numdocs = targetsize
 
@@ -349,7 +405,8 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
                  alpha='symmetric', eta=None, decay=0.5, offset=1.0, eval_every=10,
                  iterations=50, gamma_threshold=0.001, minimum_probability=0.01,
                  random_state=None, ns_conf=None, minimum_phi_value=0.01,
-                 per_word_topics=False, callbacks=None, dtype=np.float32):
+                 per_word_topics=False, callbacks=None, dtype=np.float32, sstats_topk=None, memory_budget=None,
+                 eval_sample=None, eval_seed=0):
         """
 
         Parameters
@@ -363,8 +420,10 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         id2word : {dict of (int, str), :class:`gensim.corpora.dictionary.Dictionary`}
             Mapping from word IDs to words. It is used to determine the vocabulary size, as well as for
             debugging and topic printing.
-        distributed : bool, optional
-            Whether distributed computing should be used to accelerate training.
+        distributed : {bool, :class:`~gensim.models.transport.Transport`}, optional
+            Whether distributed computing should be used to accelerate training. True uses the dispatcher found
+            through a Pyro4 name server, or pass a transport such as :class:`~gensim.models.transport.ProcessTransport`
+            to train with local worker processes.
         chunksize :  int, optional
             Number of documents to be used in each training chunk.
         passes : int, optional
@@ -417,10 +476,26 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             Metric callbacks to log and visualize evaluation metrics of the model during training.
         dtype : {numpy.float16, numpy.float32, numpy.float64}, optional
             Data-type to use during calculations inside model. All inputs are also converted.
+        sstats_topk : int, optional
+            If set, the sufficient statistics of each chunk only keep the `sstats_topk` most likely topics of each
+            term (see :func:`~gensim.models.ldamodel.truncate_topics`) before being added to the model.
+        memory_budget : int, optional
+            If set, the topics are initialized and updated a few topics at a time, so that the temporary arrays of
+            these steps take about `memory_budget` bytes, instead of several `num_topics x num_terms` matrices.
+            `expElogbeta` is then updated in place. Useful for large vocabularies.
+        eval_sample : {int, float}, optional
+            If set, the perplexity estimated every `eval_every` updates only evaluates a random subsample of the
+            current chunk: a number of documents, or a fraction of them if a float, see the `sample` parameter of
+            :meth:`~gensim.models.ldamodel.LdaModel.log_perplexity`.
+        eval_seed : int, optional
+            Seed of the subsample drawn with `eval_sample`.
 
         """
         self.dtype = np.finfo(dtype).dtype
 
+        if scipy.sparse.issparse(corpus):
+            corpus = matutils.Sparse2Corpus(corpus)
+
         # store user-supplied parameters
         self.id2word = id2word
         if corpus is None and self.id2word is None:
@@ -454,6 +529,10 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         self.minimum_phi_value = minimum_phi_value
         self.per_word_topics = per_word_topics
         self.callbacks = callbacks
+        self.sstats_topk = sstats_topk
+        self.memory_budget = memory_budget
+        self.eval_sample = eval_sample
+        self.eval_seed = eval_seed
 
         self.alpha, self.optimize_alpha = self.init_dir_prior(alpha, 'alpha')
 
@@ -486,28 +565,31 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
                 raise NotImplementedError("auto-optimizing alpha not implemented in distributed LDA")
             # set up distributed version
             try:
-                import Pyro4
-                if ns_conf is None:
-                    ns_conf = {}
-
-                with utils.getNS(**ns_conf) as ns:
-                    from gensim.models.lda_dispatcher import LDA_DISPATCHER_PREFIX
-                    self.dispatcher = Pyro4.Proxy(ns.list(prefix=LDA_DISPATCHER_PREFIX)[LDA_DISPATCHER_PREFIX])
-                    logger.debug("looking for dispatcher at %s" % str(self.dispatcher._pyroUri))
-                    self.dispatcher.initialize(
-                        id2word=self.id2word, num_topics=self.num_topics, chunksize=chunksize,
-                        alpha=alpha, eta=eta, distributed=False
-                    )
-                    self.numworkers = len(self.dispatcher.getworkers())
-                    logger.info("using distributed version with %i workers", self.numworkers)
+                from gensim.models.transport import Transport, PyroTransport
+                transport = distributed if isinstance(distributed, Transport) else PyroTransport(ns_conf)
+                self.dispatcher = transport.get_dispatcher('lda')
+                self.dispatcher.initialize(
+                    id2word=self.id2word, num_topics=self.num_topics, chunksize=chunksize,
+                    alpha=alpha, eta=eta, distributed=False
+                )
+                self.numworkers = len(self.dispatcher.getworkers())
+                logger.info("using distributed version with %i workers", self.numworkers)
             except Exception as err:
                 logger.error("failed to initialize distributed LDA (%s)", err)
                 raise RuntimeError("failed to initialize distributed LDA (%s)" % err)
 
         # Initialize the variational distribution q(beta|lambda)
         self.state = LdaState(self.eta, (self.num_topics, self.num_terms), dtype=self.dtype)
-        self.state.sstats[...] = self.random_state.gamma(100., 1. / 100., (self.num_topics, self.num_terms))
-        self.expElogbeta = np.exp(dirichlet_expectation(self.state.sstats))
+        if memory_budget is None:
+            self.state.sstats[...] = self.random_state.gamma(100., 1. / 100., (self.num_topics, self.num_terms))
+            self.expElogbeta = np.exp(dirichlet_expectation(self.state.sstats))
+        else:
+            # same random values, drawn a few topics at a time
+            self.expElogbeta = np.empty_like(self.state.sstats)
+            for topics in self._topic_blocks():
+                sstats = self.state.sstats[topics]
+                sstats[...] = self.random_state.gamma(100., 1. / 100., sstats.shape)
+                self.expElogbeta[topics] = np.exp(dirichlet_expectation(sstats))
 
         # Check that we haven't accidentally fallen back to np.float64
         assert self.eta.dtype == self.dtype
@@ -604,16 +686,129 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             If omitted, it will get Elogbeta from state.
         """
 
+        if current_Elogbeta is None and getattr(self, 'memory_budget', None) is not None:
+            self._sync_state_blocks()
+            return
         if current_Elogbeta is None:
             current_Elogbeta = self.state.get_Elogbeta()
         self.expElogbeta = np.exp(current_Elogbeta)
         assert self.expElogbeta.dtype == self.dtype
 
+    def _topic_blocks(self):
+        """Split the topics into blocks that fit into `self.memory_budget`.
+
+        Yields
+        ------
+        slice
+            Topics of the next block.
+
+        """
+        # room for a few float64 temporaries per value
+        step = max(1, int(self.memory_budget // (32 * max(1, self.num_terms))))
+        for start in range(0, self.num_topics, step):
+            yield slice(start, start + step)
+
+    def _sync_state_blocks(self):
+        """Update `self.expElogbeta` from the state a few topics at a time, see `memory_budget`.
+
+        Returns
+        -------
+        float
+            Mean absolute difference between the previous and the new Elogbeta.
+
+        """
+        previous = self.expElogbeta
+        if previous.shape == self.state.sstats.shape and previous.dtype == self.dtype and previous.flags.writeable:
+            current = previous  # update in place
+        else:
+            current = np.empty(self.state.sstats.shape, dtype=self.dtype)
+        eta = self.state.eta
+        diff = 0.0
+        for topics in self._topic_blocks():
+            lambda_ = self.state.sstats[topics] + (eta[topics] if eta.ndim == 2 else eta)
+            Elogbeta = dirichlet_expectation(lambda_)
+            if previous.shape == current.shape:
+                # the previous Elogbeta, up to values whose exp underflowed
+                previous_Elogbeta = np.log(np.maximum(previous[topics], np.finfo(previous.dtype).tiny))
+                diff += np.abs(previous_Elogbeta - Elogbeta).sum()
+            current[topics] = np.exp(Elogbeta)
+        self.expElogbeta = current
+        return diff / max(1, current.size)
+
     def clear(self):
         """Clear the model's state to free some memory. Used in the distributed implementation."""
         self.state = None
         self.Elogbeta = None
 
+    def _chunk_arrays(self, chunk):
+        """Get the term ids and counts of each document in `chunk`.
+
+        Parameters
+        ----------
+        chunk : {list of list of (int, float), scipy.sparse.csc}
+            Corpus chunk, documents as columns if sparse.
+
+        Yields
+        ------
+        ({list of int, numpy.ndarray}, numpy.ndarray)
+            Term ids and counts (of type `self.dtype`) of each document.
+
+        """
+        if scipy.sparse.issparse(chunk):
+            indptr, indices, data = chunk.indptr, chunk.indices, chunk.data.astype(self.dtype, copy=False)
+            for d in range(chunk.shape[1]):
+                yield indices[indptr[d]:indptr[d + 1]], data[indptr[d]:indptr[d + 1]]
+            return
+        integer_types = six.integer_types + (np.integer,)
+        for doc in chunk:
+            if len(doc) > 0 and not isinstance(doc[0][0], integer_types):
+                # make sure the term IDs are ints, otherwise np will get upset
+                ids = [int(idx) for idx, _ in doc]
+            else:
+                ids = [idx for idx, _ in doc]
+            cts = np.fromiter((cnt for _, cnt in doc), dtype=self.dtype, count=len(doc))
+            yield ids, cts
+
+    def _chunk_csr(self, chunk):
+        """Get the term ids and counts of all documents in `chunk` as flat arrays.
+
+        Parameters
+        ----------
+        chunk : {list of list of (int, float), scipy.sparse.csc}
+            Corpus chunk, documents as columns if sparse.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+            `indptr`, `indices` and `data` (of type `self.dtype`): document `d` is made of the term ids
+            `indices[indptr[d]:indptr[d + 1]]` with counts `data[indptr[d]:indptr[d + 1]]`.
+
+        """
+        if scipy.sparse.issparse(chunk):
+            return chunk.indptr, chunk.indices, chunk.data.astype(self.dtype, copy=False)
+        indptr = np.zeros(len(chunk) + 1, dtype=np.int64)
+        np.cumsum([len(doc) for doc in chunk], out=indptr[1:])
+        indices = np.fromiter((idx for doc in chunk for idx, _ in doc), dtype=np.int64, count=indptr[-1])
+        data = np.fromiter((cnt for doc in chunk for _, cnt in doc), dtype=self.dtype, count=indptr[-1])
+        return indptr, indices, data
+
+    def _check_term_ids(self, indices):
+        """Check that term ids are within the vocabulary of the model.
+
+        Parameters
+        ----------
+        indices : numpy.ndarray
+            Term ids, such as the `indices` of a sparse chunk.
+
+        Raises
+        ------
+        IndexError
+            If a term id is negative, or not smaller than `self.num_terms`.
+
+        """
+        if len(indices) and (indices.min() < 0 or indices.max() >= self.num_terms):
+            raise IndexError("term ids out of range for a model of %i terms" % self.num_terms)
+
     def inference(self, chunk, collect_sstats=False):
         """Given a chunk of sparse document vectors, estimate gamma (parameters controlling the topic weights)
         for each document in the chunk.
@@ -624,6 +819,10 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         `Lee, Seung: Algorithms for non-negative matrix factorization"
         <https://papers.nips.cc/paper/1861-algorithms-for-non-negative-matrix-factorization.pdf>`_.
 
+        For float32 and float64 models, the whole chunk is processed by the compiled
+        :func:`gensim.models.ldamodel_inner.e_step` if available (`FAST_VERSION >= 0`), which releases the GIL,
+        so that several threads can run inference at the same time.
+
         Parameters
         ----------
         chunk : {list of list of (int, float), scipy.sparse.csc}
@@ -639,16 +838,22 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             only returned if `collect_sstats` == True and corresponds to the sufficient statistics for the M step.
 
         """
-        try:
-            len(chunk)
-        except TypeError:
-            # convert iterators/generators to plain list, so we have len() etc.
-            chunk = list(chunk)
-        if len(chunk) > 1:
-            logger.debug("performing inference on a chunk of %i documents", len(chunk))
+        if scipy.sparse.issparse(chunk):
+            # documents are columns => the column slices of csc are the term ids and counts of each document
+            chunk = chunk.tocsc()
+            num_docs = chunk.shape[1]
+        else:
+            try:
+                len(chunk)
+            except TypeError:
+                # convert iterators/generators to plain list, so we have len() etc.
+                chunk = list(chunk)
+            num_docs = len(chunk)
+        if num_docs > 1:
+            logger.debug("performing inference on a chunk of %i documents", num_docs)
 
         # Initialize the variational distribution q(theta|gamma) for the chunk
-        gamma = self.random_state.gamma(100., 1. / 100., (len(chunk), self.num_topics)).astype(self.dtype, copy=False)
+        gamma = self.random_state.gamma(100., 1. / 100., (num_docs, self.num_topics)).astype(self.dtype, copy=False)
         Elogtheta = dirichlet_expectation(gamma)
         expElogtheta = np.exp(Elogtheta)
 
@@ -661,19 +866,22 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             sstats = None
         converged = 0
 
+        if FAST_VERSION >= 0 and self.dtype in (np.float32, np.float64):
+            indptr, indices, data = self._chunk_csr(chunk)
+            converged = e_step(
+                np.ascontiguousarray(self.expElogbeta), np.asarray(self.alpha, dtype=self.dtype),
+                indptr, indices, data, gamma, sstats, self.iterations, self.gamma_threshold
+            )
+            if num_docs > 1:
+                logger.debug("%i/%i documents converged within %i iterations", converged, num_docs, self.iterations)
+            return gamma, sstats
+
         # Now, for each document d update that document's gamma and phi
         # Inference code copied from Hoffman's `onlineldavb.py` (esp. the
         # Lee&Seung trick which speeds things up by an order of magnitude, compared
         # to Blei's original LDA-C code, cool!).
-        integer_types = six.integer_types + (np.integer,)
         epsilon = np.finfo(self.dtype).eps
-        for d, doc in enumerate(chunk):
-            if len(doc) > 0 and not isinstance(doc[0][0], integer_types):
-                # make sure the term IDs are ints, otherwise np will get upset
-                ids = [int(idx) for idx, _ in doc]
-            else:
-                ids = [idx for idx, _ in doc]
-            cts = np.fromiter((cnt for _, cnt in doc), dtype=self.dtype, count=len(doc))
+        for d, (ids, cts) in enumerate(self._chunk_arrays(chunk)):
             gammad = gamma[d, :]
             Elogthetad = Elogtheta[d, :]
             expElogthetad = expElogtheta[d, :]
@@ -706,8 +914,8 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
                 # statistics for the M step.
                 sstats[:, ids] += np.outer(expElogthetad.T, cts / phinorm)
 
-        if len(chunk) > 1:
-            logger.debug("%i/%i documents converged within %i iterations", converged, len(chunk), self.iterations)
+        if num_docs > 1:
+            logger.debug("%i/%i documents converged within %i iterations", converged, num_docs, self.iterations)
 
         if collect_sstats:
             # This step finishes computing the sufficient statistics for the
@@ -739,12 +947,85 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         """
         if state is None:
             state = self.state
-        gamma, sstats = self.inference(chunk, collect_sstats=True)
-        state.sstats += sstats
+        if FAST_VERSION >= 0 and self.dtype in (np.float32, np.float64):
+            # only the statistics of the chunk's terms, instead of a whole num_topics x num_terms matrix
+            gamma, terms, sstats = self._inference_columns(chunk)
+            state.sstats[:, terms] += sstats
+        else:
+            gamma, sstats = self.inference(chunk, collect_sstats=True)
+            if getattr(self, 'sstats_topk', None):
+                truncate_topics(sstats, self.sstats_topk)
+            state.sstats += sstats
         state.numdocs += gamma.shape[0]  # avoids calling len(chunk) on a generator
         assert gamma.dtype == self.dtype
         return gamma
 
+    def _inference_columns(self, chunk):
+        """Same as :meth:`~gensim.models.ldamodel.LdaModel.inference` with `collect_sstats=True`, using the
+        compiled E-step and returning the sufficient statistics of the terms that occur in `chunk` only.
+
+        Parameters
+        ----------
+        chunk : {list of list of (int, float), scipy.sparse.csc}
+            The corpus chunk on which the inference step will be performed.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+            Gamma of the chunk's documents, the sorted ids of the chunk's terms, and their sufficient statistics of
+            shape (`self.num_topics`, number of terms), truncated if `self.sstats_topk` is set.
+
+        """
+        if scipy.sparse.issparse(chunk):
+            chunk = chunk.tocsc()
+            num_docs = chunk.shape[1]
+        else:
+            try:
+                len(chunk)
+            except TypeError:
+                chunk = list(chunk)
+            num_docs = len(chunk)
+        if num_docs > 1:
+            logger.debug("performing inference on a chunk of %i documents", num_docs)
+
+        gamma = self.random_state.gamma(100., 1. / 100., (num_docs, self.num_topics)).astype(self.dtype, copy=False)
+        indptr, indices, data = self._chunk_csr(chunk)
+        terms, sstats = self._e_step_columns(indptr, indices, data, gamma)
+        return gamma, terms, sstats
+
+    def _e_step_columns(self, indptr, indices, data, gamma):
+        """Run :func:`~gensim.models.ldamodel_inner.e_step` on the columns of `expElogbeta` of the chunk's terms.
+
+        Parameters
+        ----------
+        indptr : numpy.ndarray
+            Document `d` is made of the term ids `indices[indptr[d]:indptr[d + 1]]` with counts `data[...]`.
+        indices : numpy.ndarray
+            Term ids of all documents.
+        data : numpy.ndarray
+            Term counts of all documents, of type `self.dtype`.
+        gamma : numpy.ndarray
+            Initial gamma of the documents, updated in place.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            Sorted ids of the chunk's terms and their sufficient statistics.
+
+        """
+        terms, local_indices = np.unique(indices, return_inverse=True)
+        expElogbeta = np.ascontiguousarray(self.expElogbeta[:, terms])
+        sstats = np.zeros_like(expElogbeta)
+        converged = e_step(
+            expElogbeta, np.asarray(self.alpha, dtype=self.dtype), indptr, local_indices, data, gamma, sstats,
+            self.iterations, self.gamma_threshold
+        )
+        if len(gamma) > 1:
+            logger.debug("%i/%i documents converged within %i iterations", converged, len(gamma), self.iterations)
+        if getattr(self, 'sstats_topk', None):
+            truncate_topics(sstats, self.sstats_topk)
+        return terms, sstats
+
     def update_alpha(self, gammat, rho):
         """Update parameters for the Dirichlet prior on the per-document topic weights.
 
@@ -796,7 +1077,7 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         assert self.eta.dtype == self.dtype
         return self.eta
 
-    def log_perplexity(self, chunk, total_docs=None):
+    def log_perplexity(self, chunk, total_docs=None, sample=None, seed=0, workers=None):
         """Calculate and return per-word likelihood bound, using a chunk of documents as evaluation corpus.
 
         Also output the calculated statistics, including the perplexity=2^(-bound), to log at INFO level.
@@ -807,6 +1088,13 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             The corpus chunk on which the inference step will be performed.
         total_docs : int, optional
             Number of docs used for evaluation of the perplexity.
+        sample : {int, float}, optional
+            Evaluate a random subsample of `chunk` only: a number of documents, or a fraction of them if a float.
+        seed : int, optional
+            Seed of the random subsample: the same documents are drawn for the same seed and size of `chunk`,
+            so that the perplexity of successive models is compared on the same held-out documents.
+        workers : int, optional
+            Number of threads computing the bound, see :meth:`~gensim.models.ldamodel.LdaModel.bound`.
 
         Returns
         -------
@@ -814,14 +1102,28 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             The variational bound score calculated for each word.
 
         """
+        if scipy.sparse.issparse(chunk):
+            chunk = chunk.tocsc()
+            self._check_term_ids(chunk.indices)
+        else:
+            indptr, indices, data = self._chunk_csr(list(chunk))
+            self._check_term_ids(indices)
+            chunk = scipy.sparse.csc_matrix((data, indices, indptr), shape=(self.num_terms, len(indptr) - 1))
+        num_docs = chunk.shape[1]
         if total_docs is None:
-            total_docs = len(chunk)
-        corpus_words = sum(cnt for document in chunk for _, cnt in document)
-        subsample_ratio = 1.0 * total_docs / len(chunk)
-        perwordbound = self.bound(chunk, subsample_ratio=subsample_ratio) / (subsample_ratio * corpus_words)
+            total_docs = num_docs
+        if sample is not None:
+            size = int(round(sample * num_docs)) if isinstance(sample, float) else int(sample)
+            if size < num_docs:
+                docs = np.random.RandomState(seed).choice(num_docs, max(size, 1), replace=False)
+                chunk = chunk[:, np.sort(docs)]
+        corpus_words = chunk.sum()
+        subsample_ratio = 1.0 * total_docs / chunk.shape[1]
+        score = self.bound(chunk, subsample_ratio=subsample_ratio, workers=workers)
+        perwordbound = score / (subsample_ratio * corpus_words)
         logger.info(
             "%.3f per-word bound, %.1f perplexity estimate based on a held-out corpus of %i documents with %i words",
-            perwordbound, np.exp2(-perwordbound), len(chunk), corpus_words
+            perwordbound, np.exp2(-perwordbound), chunk.shape[1], corpus_words
         )
         return perwordbound
 
@@ -876,6 +1178,9 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             performance hit. For distributed computing it may be desirable to keep the chunks as `numpy.ndarray`.
 
         """
+        if scipy.sparse.issparse(corpus):
+            corpus = matutils.Sparse2Corpus(corpus)
+
         # use parameters given in constructor, unless user explicitly overrode them
         if decay is None:
             decay = self.decay
@@ -957,25 +1262,30 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             dirty = False
 
             reallen = 0
-            chunks = utils.grouper(corpus, chunksize, as_numpy=chunks_as_numpy, dtype=self.dtype)
+            if self.dispatcher or chunks_as_numpy:
+                chunks = utils.grouper(corpus, chunksize, as_numpy=chunks_as_numpy, dtype=self.dtype)
+            else:
+                # sparse chunks, read directly from the storage of corpora that support it
+                chunks = matutils.corpus2csc_chunks(corpus, chunksize, num_terms=self.num_terms, dtype=self.dtype)
             for chunk_no, chunk in enumerate(chunks):
-                reallen += len(chunk)  # keep track of how many documents we've processed so far
+                chunk_len = chunk.shape[1] if scipy.sparse.issparse(chunk) else len(chunk)
+                reallen += chunk_len  # keep track of how many documents we've processed so far
 
                 if eval_every and ((reallen == lencorpus) or ((chunk_no + 1) % (eval_every * self.numworkers) == 0)):
-                    self.log_perplexity(chunk, total_docs=lencorpus)
+                    self.log_perplexity(chunk, total_docs=lencorpus, sample=self.eval_sample, seed=self.eval_seed)
 
                 if self.dispatcher:
                     # add the chunk to dispatcher's job queue, so workers can munch on it
                     logger.info(
                         "PROGRESS: pass %i, dispatching documents up to #%i/%i",
-                        pass_, chunk_no * chunksize + len(chunk), lencorpus
+                        pass_, chunk_no * chunksize + chunk_len, lencorpus
                     )
                     # this will eventually block until some jobs finish, because the queue has a small finite length
                     self.dispatcher.putjob(chunk)
                 else:
                     logger.info(
                         "PROGRESS: pass %i, at document #%i/%i",
-                        pass_, chunk_no * chunksize + len(chunk), lencorpus
+                        pass_, chunk_no * chunksize + chunk_len, lencorpus
                     )
                     gammat = self.do_estep(chunk, other)
 
@@ -1037,15 +1347,19 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         logger.debug("updating topics")
         # update self with the new blend; also keep track of how much did
         # the topics change through this update, to assess convergence
-        previous_Elogbeta = self.state.get_Elogbeta()
-        self.state.blend(rho, other)
+        if getattr(self, 'memory_budget', None) is None:
+            previous_Elogbeta = self.state.get_Elogbeta()
+            self.state.blend(rho, other)
 
-        current_Elogbeta = self.state.get_Elogbeta()
-        self.sync_state(current_Elogbeta)
+            current_Elogbeta = self.state.get_Elogbeta()
+            self.sync_state(current_Elogbeta)
+            diff = mean_absolute_difference(previous_Elogbeta.ravel(), current_Elogbeta.ravel())
+        else:
+            self.state.blend(rho, other)
+            diff = self._sync_state_blocks()
 
         # print out some debug info at the end of each EM iteration
         self.print_topics(5)
-        diff = mean_absolute_difference(previous_Elogbeta.ravel(), current_Elogbeta.ravel())
         logger.info("topic diff=%f, rho=%f", diff, rho)
 
         if self.optimize_eta:
@@ -1055,9 +1369,12 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             # only update if this isn't an additional pass
             self.num_updates += other.numdocs
 
-    def bound(self, corpus, gamma=None, subsample_ratio=1.0):
+    def bound(self, corpus, gamma=None, subsample_ratio=1.0, workers=None):
         """Estimate the variational bound of documents from the corpus as E_q[log p(corpus)] - E_q[log q(corpus)].
 
+        The corpus is streamed in chunks of `self.chunksize` documents, each converted to a sparse matrix and
+        evaluated at once with vectorized operations.
+
         Parameters
         ----------
         corpus : {iterable of list of (int, float), scipy.sparse.csc}, optional
@@ -1069,6 +1386,9 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             Percentage of the whole corpus represented by the passed `corpus` argument (in case this was a sample).
             Set to 1.0 if the whole corpus was passed.This is used as a multiplicative factor to scale the likelihood
             appropriately.
+        workers : int, optional
+            Number of threads evaluating chunks in parallel, 1 by default. Only used with the compiled E-step
+            (`FAST_VERSION >= 0`) and a float32 or float64 model, which release the GIL.
 
         Returns
         -------
@@ -1076,29 +1396,46 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             The variational bound score calculated for each document.
 
         """
-        score = 0.0
         _lambda = self.state.get_lambda()
         Elogbeta = dirichlet_expectation(_lambda)
+        fast = FAST_VERSION >= 0 and self.dtype in (np.float32, np.float64)
+        workers = (workers or 1) if fast else 1
 
-        for d, doc in enumerate(corpus):  # stream the input doc-by-doc, in case it's too large to fit in RAM
-            if d % self.chunksize == 0:
-                logger.debug("bound: at document #%i", d)
-            if gamma is None:
-                gammad, _ = self.inference([doc])
-            else:
-                gammad = gamma[d]
-            Elogthetad = dirichlet_expectation(gammad)
-
-            assert gammad.dtype == self.dtype
-            assert Elogthetad.dtype == self.dtype
-
-            # E[log p(doc | theta, beta)]
-            score += sum(cnt * logsumexp(Elogthetad + Elogbeta[:, int(id)]) for id, cnt in doc)
+        if scipy.sparse.issparse(corpus):
+            corpus = corpus.tocsc()
+            chunks = (corpus[:, start:start + self.chunksize] for start in range(0, corpus.shape[1], self.chunksize))
+        else:
+            chunks = matutils.corpus2csc_chunks(corpus, self.chunksize, num_terms=self.num_terms, dtype=self.dtype)
+
+        def jobs():
+            start = 0
+            for chunk in chunks:
+                logger.debug("bound: at document #%i", start)
+                # scipy doesn't check the ids of matrices built from raw arrays, and slicing them can crash
+                self._check_term_ids(chunk.indices)
+                num_docs = chunk.shape[1]
+                if gamma is not None:
+                    yield chunk, np.asarray(gamma[start:start + num_docs]), False
+                elif fast:
+                    # draw the initial gamma here rather than in the threads, so that the result is reproducible
+                    yield chunk, self.random_state.gamma(
+                        100., 1. / 100., (num_docs, self.num_topics)).astype(self.dtype, copy=False), True
+                else:
+                    yield chunk, None, True
+                start += num_docs
 
-            # E[log p(theta | alpha) - log q(theta | gamma)]; assumes alpha is a vector
-            score += np.sum((self.alpha - gammad) * Elogthetad)
-            score += np.sum(gammaln(gammad) - gammaln(self.alpha))
-            score += gammaln(np.sum(self.alpha)) - gammaln(np.sum(gammad))
+        if workers > 1:
+            pool = ThreadPool(workers)
+            try:
+                # a batch of chunks at a time, so that the corpus is streamed
+                score = sum(
+                    sum(pool.map(lambda job: self._bound_chunk(Elogbeta, *job), batch))
+                    for batch in utils.grouper(jobs(), workers)
+                )
+            finally:
+                pool.terminate()
+        else:
+            score = sum(self._bound_chunk(Elogbeta, *job) for job in jobs())
 
         # Compensate likelihood for when `corpus` above is only a sample of the whole corpus. This ensures
         # that the likelihood is always roughly on the same scale.
@@ -1117,6 +1454,70 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
 
         return score
 
+    def _bound_chunk(self, Elogbeta, chunk, gamma, infer):
+        """Get the terms of :meth:`~gensim.models.ldamodel.LdaModel.bound` that depend on the documents of a chunk.
+
+        Parameters
+        ----------
+        Elogbeta : numpy.ndarray
+            Expectation of log(beta), shape (`self.num_topics`, `self.num_terms`).
+        chunk : scipy.sparse.csc
+            The chunk, documents as columns.
+        gamma : numpy.ndarray
+            Topic weight variational parameters of the chunk's documents, or their initial value if `infer` is set.
+            Inferred by :meth:`~gensim.models.ldamodel.LdaModel.inference` if None.
+        infer : bool
+            Whether `gamma` must be inferred.
+
+        Returns
+        -------
+        float
+            E[log p(docs | theta, beta)] + E[log p(theta | alpha) - log q(theta | gamma)] of the chunk's documents.
+
+        """
+        indptr, indices, data = chunk.indptr, chunk.indices, chunk.data.astype(self.dtype, copy=False)
+        if infer and gamma is None:
+            gamma, _ = self.inference(chunk)
+        elif infer:
+            e_step(
+                np.ascontiguousarray(self.expElogbeta), np.asarray(self.alpha, dtype=self.dtype),
+                indptr, indices, data, gamma, None, self.iterations, self.gamma_threshold
+            )
+        Elogtheta = dirichlet_expectation(gamma)
+        num_docs = gamma.shape[0]
+
+        # E[log p(doc | theta, beta)] = sum_dw n_dw * logsumexp_k(Elogtheta_dk + Elogbeta_kw)
+        # = sum_dw n_dw * (log(sum_k exp(Elogtheta_dk - m_d) * exp(Elogbeta_kw - m_w)) + m_d + m_w),
+        # with m_d, m_w the maxima over topics: one dot product per term instead of K exponentials
+        terms, local_indices = np.unique(indices, return_inverse=True)
+        Elogbetad = np.ascontiguousarray(Elogbeta[:, terms].T, dtype=np.float64)
+        Elogthetad = Elogtheta.astype(np.float64)
+        beta_max, theta_max = Elogbetad.max(axis=1), Elogthetad.max(axis=1)
+        expElogbetad = np.exp(Elogbetad - beta_max[:, np.newaxis])
+        expElogthetad = np.exp(Elogthetad - theta_max[:, np.newaxis])
+
+        score = 0.0
+        docs = np.repeat(np.arange(num_docs), np.diff(indptr))
+        block = max(1, BOUND_BLOCK_SIZE // self.num_topics)
+        for start in range(0, len(indices), block):
+            rows, cols = docs[start:start + block], local_indices[start:start + block]
+            norm = np.einsum('ij,ij->i', expElogthetad[rows], expElogbetad[cols])
+            underflow = norm == 0
+            with np.errstate(divide='ignore'):
+                likelihood = np.log(norm) + theta_max[rows] + beta_max[cols]
+            if underflow.any():
+                # topics too far apart for the products, fall back to an explicit logsumexp
+                x = Elogthetad[rows[underflow]] + Elogbetad[cols[underflow]]
+                x_max = x.max(axis=1)
+                likelihood[underflow] = x_max + np.log(np.exp(x - x_max[:, np.newaxis]).sum(axis=1))
+            score += np.dot(data[start:start + block], likelihood)
+
+        # E[log p(theta | alpha) - log q(theta | gamma)]; assumes alpha is a vector
+        score += np.sum((self.alpha - gamma) * Elogtheta)
+        score += np.sum(gammaln(gamma)) - num_docs * np.sum(gammaln(self.alpha))
+        score += num_docs * gammaln(np.sum(self.alpha)) - np.sum(gammaln(np.sum(gamma, axis=1)))
+        return score
+
     def show_topics(self, num_topics=10, num_words=10, log=False, formatted=True):
         """Get a representation for selected topics.
 
@@ -1359,6 +1760,24 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
 
         return document_topics, word_topic, word_phi  # returns 2-tuple
 
+    def _transform_chunk(self, chunk):
+        """Get the normalized topic distributions of a chunk of documents, as in
+        :meth:`~gensim.models.ldamodel.LdaModel.get_document_topics`.
+
+        Parameters
+        ----------
+        chunk : scipy.sparse.csc_matrix
+            Chunk of documents as columns.
+
+        Returns
+        -------
+        numpy.ndarray
+            Topic distributions of the documents, shape (number of documents, `self.num_topics`).
+
+        """
+        gamma, _ = self.inference(chunk)
+        return gamma / gamma.sum(axis=1)[:, None]
+
     def get_term_topics(self, word_id, minimum_probability=None):
         """Get the most relevant topics to the given word.
 
@@ -1523,6 +1942,25 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         """
         return self.get_document_topics(bow, eps, self.minimum_phi_value, self.per_word_topics)
 
+    def freeze(self, dtype=None):
+        """Export the parts of the model needed to infer topic distributions of new documents.
+
+        Parameters
+        ----------
+        dtype : {numpy.float16, numpy.float32, numpy.float64}, optional
+            Data-type of the stored topics, `self.dtype` by default. With float16, inference still runs in float32.
+
+        Returns
+        -------
+        :class:`~gensim.models.ldamodel.LdaInferenceModel`
+            Inference-only model.
+
+        """
+        return LdaInferenceModel(
+            self.expElogbeta, self.alpha, iterations=self.iterations, gamma_threshold=self.gamma_threshold,
+            minimum_probability=self.minimum_probability, dtype=dtype or self.dtype
+        )
+
     def save(self, fname, ignore=('state', 'dispatcher'), separately=None, *args, **kwargs):
         """Save the model to a file.
 
@@ -1650,6 +2088,14 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             result.dtype = np.float64  # float64 was implicitly used before (cause it's default in numpy)
             logging.info("dtype was not set in saved %s file %s, assuming np.float64", result.__class__.__name__, fname)
 
+        # sstats_topk, memory_budget and the evaluation sample are absent in older models
+        if not hasattr(result, 'sstats_topk'):
+            result.sstats_topk = None
+        if not hasattr(result, 'memory_budget'):
+            result.memory_budget = None
+        if not hasattr(result, 'eval_sample'):
+            result.eval_sample, result.eval_seed = None, 0
+
         state_fname = utils.smart_extension(fname, '.state')
         try:
             result.state = LdaState.load(state_fname, *args, **kwargs)
@@ -1668,3 +2114,179 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             except Exception as e:
                 logging.warning("failed to load id2word dictionary from %s: %s", id2word_fname, e)
         return result
+
+
+class LdaInferenceModel(interfaces.TransformationABC):
+    """Frozen, inference-only version of :class:`~gensim.models.ldamodel.LdaModel`, see
+    :meth:`~gensim.models.ldamodel.LdaModel.freeze`.
+
+    Keeps only `expElogbeta` and `alpha`. Unlike :meth:`~gensim.models.ldamodel.LdaModel.inference`, gamma starts
+    from the deterministic `alpha + document length / num_topics`, so the same document always gets the same
+    topics, and batches of documents are processed by one call of the compiled E-step if available.
+
+    """
+    def __init__(self, expElogbeta, alpha, iterations=50, gamma_threshold=0.001, minimum_probability=0.01,
+                 dtype=np.float32):
+        """
+
+        Parameters
+        ----------
+        expElogbeta : numpy.ndarray
+            Exponentiated expected log topic-word probabilities, shape (`num_topics`, `num_terms`).
+        alpha : numpy.ndarray
+            Document-topic prior, shape (`num_topics`,).
+        iterations : int, optional
+            Maximum number of iterations per document.
+        gamma_threshold : float, optional
+            Minimum change in the value of the gamma parameters to continue iterating.
+        minimum_probability : float, optional
+            Topics with a probability lower than this threshold will be filtered out.
+        dtype : {numpy.float16, numpy.float32, numpy.float64}, optional
+            Data-type of the stored `expElogbeta`. Inference runs in float32 for float16 topics.
+
+        """
+        self.dtype = np.finfo(dtype).dtype
+        self.compute_dtype = np.float32 if self.dtype == np.float16 else self.dtype
+        self.expElogbeta = np.ascontiguousarray(expElogbeta, dtype=self.dtype)
+        self.alpha = np.asarray(alpha, dtype=self.compute_dtype)
+        self.num_topics, self.num_terms = self.expElogbeta.shape
+        self.iterations = iterations
+        self.gamma_threshold = gamma_threshold
+        self.minimum_probability = minimum_probability
+
+    def __str__(self):
+        """Get a string representation of the current object.
+
+        Returns
+        -------
+        str
+            Human readable representation of the most important model parameters.
+
+        """
+        return "LdaInferenceModel(num_terms=%s, num_topics=%s, dtype=%s)" % (
+            self.num_terms, self.num_topics, self.dtype
+        )
+
+    def inference(self, chunk):
+        """Estimate the variational parameters `gamma` of a batch of documents.
+
+        Parameters
+        ----------
+        chunk : {list of list of (int, float), scipy.sparse.csc}
+            The documents, as a list of bag-of-words or a sparse matrix with documents as columns.
+
+        Returns
+        -------
+        numpy.ndarray
+            Gamma parameters controlling the topic weights, shape (`len(chunk)`, `self.num_topics`).
+
+        """
+        if scipy.sparse.issparse(chunk):
+            chunk = chunk.tocsc()
+            indptr, indices, data = chunk.indptr, chunk.indices, chunk.data.astype(self.compute_dtype)
+        else:
+            chunk = list(chunk)
+            indptr = np.zeros(len(chunk) + 1, dtype=np.int64)
+            np.cumsum([len(doc) for doc in chunk], out=indptr[1:])
+            indices = np.fromiter((idx for doc in chunk for idx, _ in doc), dtype=np.int64, count=indptr[-1])
+            data = np.fromiter((cnt for doc in chunk for _, cnt in doc), dtype=self.compute_dtype, count=indptr[-1])
+
+        # only the columns of the batch's terms, in the computation dtype
+        terms, local_indices = np.unique(indices, return_inverse=True)
+        if len(terms) and (terms[0] < 0 or terms[-1] >= self.num_terms):
+            raise ValueError("term ids out of range for a model of %i terms" % self.num_terms)
+        expElogbeta = np.ascontiguousarray(self.expElogbeta[:, terms], dtype=self.compute_dtype)
+        cumulated = np.concatenate([[0], np.cumsum(data, dtype=np.float64)])
+        lengths = cumulated[indptr[1:]] - cumulated[indptr[:-1]]
+        gamma = self.alpha + (lengths / self.num_topics)[:, None].astype(self.compute_dtype)
+
+        if FAST_VERSION >= 0:
+            e_step(expElogbeta, self.alpha, indptr, local_indices, data, gamma, None,
+                   self.iterations, self.gamma_threshold)
+            return gamma
+
+        epsilon = np.finfo(self.compute_dtype).eps
+        for d, gammad in enumerate(gamma):
+            ids, cts = local_indices[indptr[d]:indptr[d + 1]], data[indptr[d]:indptr[d + 1]]
+            expElogthetad = np.exp(dirichlet_expectation(gammad))
+            expElogbetad = expElogbeta[:, ids]
+            phinorm = np.dot(expElogthetad, expElogbetad) + epsilon
+            for _ in range(self.iterations):
+                lastgamma = gammad.copy()
+                gammad[:] = self.alpha + expElogthetad * np.dot(cts / phinorm, expElogbetad.T)
+                expElogthetad = np.exp(dirichlet_expectation(gammad))
+                phinorm = np.dot(expElogthetad, expElogbetad) + epsilon
+                if mean_absolute_difference(gammad, lastgamma) < self.gamma_threshold:
+                    break
+        return gamma
+
+    def get_document_topics(self, bow, minimum_probability=None):
+        """Get the topic distribution for the given document.
+
+        Parameters
+        ----------
+        bow : list of (int, float)
+            The document in BOW format.
+        minimum_probability : float, optional
+            Topics with an assigned probability lower than this threshold will be discarded.
+
+        Returns
+        -------
+        list of (int, float)
+            Topic distribution for the document, as (topic id, probability) pairs.
+
+        """
+        return self._topics(self.inference([bow])[0], minimum_probability)
+
+    def _topics(self, gammad, minimum_probability=None):
+        """Get the (topic id, probability) pairs of a document from its `gammad`."""
+        if minimum_probability is None:
+            minimum_probability = self.minimum_probability
+        minimum_probability = max(minimum_probability, 1e-8)  # never allow zero values in sparse output
+        topic_dist = gammad / gammad.sum()
+        return [
+            (topicid, float(topicvalue)) for topicid, topicvalue in enumerate(topic_dist)
+            if topicvalue >= minimum_probability
+        ]
+
+    def __getitem__(self, bow, chunksize=2000):
+        """Get the topic distribution of a document, or of each document of a corpus.
+
+        Parameters
+        ----------
+        bow : {list of (int, float), iterable of list of (int, float)}
+            The document in BOW format, or a corpus.
+        chunksize : int, optional
+            For a corpus, number of documents inferred in one batch. If None, `bow` is inferred as a single batch
+            and a list is returned.
+
+        Returns
+        -------
+        {list of (int, float), :class:`~gensim.interfaces.TransformedCorpus`, list of list of (int, float)}
+            Topic distribution of the document or documents.
+
+        """
+        is_corpus, bow = utils.is_corpus(bow)
+        if not is_corpus:
+            return self.get_document_topics(bow)
+        if chunksize:
+            return self._apply(bow, chunksize=chunksize)
+        return [self._topics(gammad) for gammad in self.inference(bow)]
+
+    def save(self, fname, separately=('expElogbeta',), *args, **kwargs):
+        """Save the model to a file, with `expElogbeta` stored separately, so that it can be memory-mapped
+        by :meth:`~gensim.models.ldamodel.LdaInferenceModel.load` with `mmap='r'`.
+
+        Parameters
+        ----------
+        fname : str
+            Path to the system file where the model will be persisted.
+        separately : list of str, optional
+            Attributes stored into separate files.
+        *args
+            Positional arguments propagated to :meth:`~gensim.utils.SaveLoad.save`.
+        **kwargs
+            Key word arguments propagated to :meth:`~gensim.utils.SaveLoad.save`.
+
+        """
+        super(LdaInferenceModel, self).save(fname, separately=list(separately), *args, **kwargs)
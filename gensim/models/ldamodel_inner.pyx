@@ -0,0 +1,190 @@
+#!/usr/bin/env cython
+# coding: utf-8
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+# cython: embedsignature=True
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Optimized E-step of :class:`~gensim.models.ldamodel.LdaModel` (fast Cython version)."""
+
+cimport cython
+import numpy as np
+cimport numpy as np
+from libc.math cimport exp
+
+from gensim._matutils cimport DTYPE_t, _dirichlet_expectation_1d, _mean_absolute_difference
+
+
+def e_step(expElogbeta, alpha, indptr, indices, data, gamma, sstats=None, int iterations=50,
+           double gamma_threshold=0.001):
+    """Estimate the variational parameters `gamma` of a chunk of documents, without holding the GIL.
+
+    Same as the per-document loop of :meth:`~gensim.models.ldamodel.LdaModel.inference`, for a whole chunk at once.
+    The chunk is passed in CSR form (documents as rows), which is also the CSC form with documents as columns
+    used by :func:`~gensim.matutils.corpus2csc`.
+
+    Parameters
+    ----------
+    expElogbeta : numpy.ndarray
+        Exponentiated expectation of log(beta), shape (`num_topics`, `num_terms`), float32 or float64, C-contiguous.
+        Only read, so it may be a read-only memory-mapped array.
+    alpha : numpy.ndarray
+        Document-topic prior, shape (`num_topics`,), same dtype as `expElogbeta`.
+    indptr : numpy.ndarray
+        Document `d` is made of the term ids `indices[indptr[d]:indptr[d + 1]]` with counts `data[...]`.
+    indices : numpy.ndarray
+        Term ids of all documents.
+    data : numpy.ndarray
+        Term counts of all documents.
+    gamma : numpy.ndarray
+        Initial variational parameters, shape (`num_docs`, `num_topics`), same dtype as `expElogbeta`, C-contiguous.
+        Updated in place.
+    sstats : numpy.ndarray, optional
+        If given, sufficient statistics of the chunk, `sstats[k, w] = sum_d n_{dw} * phi_{dwk}`, are added to it
+        in place. Shape and dtype of `expElogbeta`, C-contiguous. Threads running concurrently must use separate
+        `sstats` arrays.
+    iterations : int, optional
+        Maximum number of iterations per document.
+    gamma_threshold : float, optional
+        Minimum mean change of gamma for the iterations of a document to continue.
+
+    Returns
+    -------
+    int
+        Number of documents that converged within `iterations`.
+
+    """
+    cdef double[::1] alpha64, data64
+    cdef double[:, ::1] gamma64, sstats64, work64, doc_work64
+    cdef float[::1] alpha32, data32
+    cdef float[:, ::1] gamma32, sstats32, work32, doc_work32
+    cdef long long[::1] indptr_view, indices_view
+    cdef double *expElogbeta64
+    cdef float *expElogbeta32
+    cdef Py_ssize_t num_terms = expElogbeta.shape[1]
+    cdef bint collect
+    cdef double epsilon
+    cdef int converged
+
+    dtype = expElogbeta.dtype
+    if dtype != np.float32 and dtype != np.float64:
+        raise TypeError("e_step supports float32 and float64 models, not %s" % dtype)
+    if gamma.dtype != dtype or alpha.dtype != dtype or (sstats is not None and sstats.dtype != dtype):
+        raise TypeError("gamma, alpha and sstats must have the same dtype as expElogbeta")
+    num_topics = expElogbeta.shape[0]
+    if gamma.shape[1] != num_topics or alpha.shape[0] != num_topics or gamma.shape[0] != len(indptr) - 1:
+        raise ValueError("inconsistent shapes of expElogbeta, alpha, gamma and the chunk")
+    if sstats is not None and sstats.shape != expElogbeta.shape:
+        raise ValueError("sstats must have the same shape as expElogbeta")
+
+    if not expElogbeta.flags.c_contiguous:
+        raise ValueError("expElogbeta must be C-contiguous")
+    # memoryviews need writeable buffers, copy the small read-only inputs
+    alpha = np.require(alpha, requirements=['C', 'W'])
+    indptr = np.require(indptr, dtype=np.int64, requirements=['C', 'W'])
+    indices = np.require(indices, dtype=np.int64, requirements=['C', 'W'])
+    data = np.require(data, dtype=dtype, requirements=['C', 'W'])
+    if len(indices) and (indices.min() < 0 or indices.max() >= expElogbeta.shape[1]):
+        raise ValueError("term ids out of range for a model of %i terms" % expElogbeta.shape[1])
+    max_len = int(np.diff(indptr).max()) if len(indptr) > 1 else 0
+    # per-call work buffers, so that concurrent calls from several threads don't share state
+    work = np.empty((4, num_topics), dtype=dtype)
+    doc_work = np.empty((max_len + 1, num_topics + 1), dtype=dtype)
+    collect = sstats is not None
+    if not collect:
+        sstats = np.empty((1, 1), dtype=dtype)
+    epsilon = np.finfo(dtype).eps
+
+    # bind the arguments to C variables, so that the E-step itself runs without the GIL
+    indptr_view, indices_view = indptr, indices
+    if dtype == np.float64:
+        expElogbeta64 = <double *>np.PyArray_DATA(expElogbeta)
+        alpha64, data64, gamma64, sstats64, work64, doc_work64 = alpha, data, gamma, sstats, work, doc_work
+        with nogil:
+            converged = _e_step[double](
+                expElogbeta64, num_terms, alpha64, indptr_view, indices_view, data64, gamma64, sstats64, collect,
+                work64, doc_work64, iterations, gamma_threshold, epsilon
+            )
+    else:
+        expElogbeta32 = <float *>np.PyArray_DATA(expElogbeta)
+        alpha32, data32, gamma32, sstats32, work32, doc_work32 = alpha, data, gamma, sstats, work, doc_work
+        with nogil:
+            converged = _e_step[float](
+                expElogbeta32, num_terms, alpha32, indptr_view, indices_view, data32, gamma32, sstats32, collect,
+                work32, doc_work32, iterations, gamma_threshold, epsilon
+            )
+    return converged
+
+
+cdef int _e_step(
+        DTYPE_t *expElogbeta, Py_ssize_t num_terms, DTYPE_t[::1] alpha, long long[::1] indptr,
+        long long[::1] indices, DTYPE_t[::1] data, DTYPE_t[:, ::1] gamma, DTYPE_t[:, ::1] sstats, bint collect,
+        DTYPE_t[:, ::1] work, DTYPE_t[:, ::1] doc_work, int iterations, double gamma_threshold,
+        double epsilon) nogil:
+    """Body of :func:`~gensim.models.ldamodel_inner.e_step`, for one dtype."""
+    cdef Py_ssize_t num_docs = gamma.shape[0], num_topics = gamma.shape[1]
+    cdef Py_ssize_t d, k, w, n, start, term, iteration
+    cdef int converged = 0
+    cdef DTYPE_t weight
+    # vectors passed to the helpers of _matutils are strided, the rest contiguous
+    cdef DTYPE_t[:] gammad, Elogthetad = work[0], lastgamma = work[2]
+    cdef DTYPE_t[::1] expElogthetad = work[1], accumulated = work[3]
+    cdef DTYPE_t[:, ::1] expElogbetad = doc_work[:, :num_topics]
+    cdef DTYPE_t[:] phinorm = doc_work[:, num_topics]
+
+    for d in range(num_docs):
+        start = indptr[d]
+        n = indptr[d + 1] - start
+        gammad = gamma[d]
+
+        _dirichlet_expectation_1d(gammad, Elogthetad)
+        for k in range(num_topics):
+            expElogthetad[k] = exp(Elogthetad[k])
+        # gather the columns of the document's terms, so that the inner loops run over contiguous memory
+        for w in range(n):
+            term = indices[start + w]
+            for k in range(num_topics):
+                expElogbetad[w, k] = expElogbeta[k * num_terms + term]
+        _phinorm(expElogthetad, expElogbetad, phinorm, n, epsilon)
+
+        for iteration in range(iterations):
+            lastgamma[:] = gammad
+            accumulated[:] = 0
+            for w in range(n):
+                weight = data[start + w] / phinorm[w]
+                for k in range(num_topics):
+                    accumulated[k] += weight * expElogbetad[w, k]
+            for k in range(num_topics):
+                gammad[k] = alpha[k] + expElogthetad[k] * accumulated[k]
+            _dirichlet_expectation_1d(gammad, Elogthetad)
+            for k in range(num_topics):
+                expElogthetad[k] = exp(Elogthetad[k])
+            _phinorm(expElogthetad, expElogbetad, phinorm, n, epsilon)
+            if _mean_absolute_difference(gammad, lastgamma) < gamma_threshold:
+                converged += 1
+                break
+
+        if collect:
+            # sstats[k, w] += n_{dw} * expElogtheta_{dk} * expElogbeta_{kw} / phinorm_{dw}
+            for w in range(n):
+                term = indices[start + w]
+                weight = data[start + w] / phinorm[w]
+                for k in range(num_topics):
+                    sstats[k, term] += weight * expElogthetad[k] * expElogbetad[w, k]
+
+    return converged
+
+
+cdef inline void _phinorm(
+        DTYPE_t[::1] expElogthetad, DTYPE_t[:, ::1] expElogbetad, DTYPE_t[:] phinorm, Py_ssize_t n,
+        double epsilon) nogil:
+    """Normalizer of the optimal phi of each term of a document."""
+    cdef Py_ssize_t w, k
+    cdef DTYPE_t total
+    for w in range(n):
+        total = 0
+        for k in range(expElogthetad.shape[0]):
+            total += expElogthetad[k] * expElogbetad[w, k]
+        phinorm[w] = total + epsilon
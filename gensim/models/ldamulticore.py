@@ -11,6 +11,13 @@ The parallelization uses multiprocessing; in case this doesn't work for you for
 try the :class:`gensim.models.ldamodel.LdaModel` class which is an equivalent, but more straightforward and single-core
 implementation.
 
+With `backend='thread'`, the E-step runs instead in threads of the training process, using the compiled
+:func:`gensim.models.ldamodel_inner.e_step` which releases the GIL. The threads read the model's `expElogbeta` directly
+and accumulate the sufficient statistics of the terms they saw, so neither the model state nor full
+`num_topics x num_terms` matrices are copied between processes for each chunk. Only the E-step runs in parallel:
+reading the corpus, converting the chunks and the M-step stay in the calling thread, so the gain over a single
+thread depends on the number of physical cores and on the share of the training time spent in the E-step.
+
 The training algorithm:
 
 * is **streamed**: training documents may come in sequentially, no random access required,
@@ -81,21 +88,39 @@ Query, or update the model using new, unseen documents
     >>> # Update the model by incrementally training on the new corpus.
     >>> lda.update(other_corpus)  # update the LDA model with additional documents
 
+Checkpoint a long training run, so that running the same training again resumes it where it was interrupted
+
+.. sourcecode:: pycon
+
+    >>> from gensim.test.utils import get_tmpfile
+    >>>
+    >>> checkpoint_fname = get_tmpfile("lda.checkpoint")
+    >>> lda = LdaMulticore(common_corpus, id2word=common_dictionary, num_topics=10, checkpoint_fname=checkpoint_fname)
+
 """
 
+import copy
 import logging
+import os
+import threading
+import time
 
 import numpy as np
+import scipy.sparse
 
-from gensim import utils
+from gensim import matutils, utils
+from gensim.models import ldamodel
 from gensim.models.ldamodel import LdaModel, LdaState
 
 import six
-from six.moves import queue, range
+from six.moves import cPickle as _pickle, queue, range
 from multiprocessing import Pool, Queue, cpu_count
 
 logger = logging.getLogger(__name__)
 
+CHECKPOINT_INTERVAL = 600
+"""Seconds between checkpoints of the training progress."""
+
 
 class LdaMulticore(LdaModel):
     """An optimized implementation of the LDA algorithm, able to harness the power of multicore CPUs.
@@ -106,7 +131,9 @@ class LdaMulticore(LdaModel):
                  chunksize=2000, passes=1, batch=False, alpha='symmetric',
                  eta=None, decay=0.5, offset=1.0, eval_every=10, iterations=50,
                  gamma_threshold=0.001, random_state=None, minimum_probability=0.01,
-                 minimum_phi_value=0.01, per_word_topics=False, dtype=np.float32):
+                 minimum_phi_value=0.01, per_word_topics=False, dtype=np.float32, backend='process',
+                 sstats_topk=None, memory_budget=None, eval_sample=None, eval_seed=0, checkpoint_fname=None,
+                 checkpoint_interval=CHECKPOINT_INTERVAL):
         """
 
         Parameters
@@ -168,11 +195,51 @@ class LdaMulticore(LdaModel):
             each word, along with their phi values multiplied by the feature length (i.e. word count).
         dtype : {numpy.float16, numpy.float32, numpy.float64}, optional
             Data-type to use during calculations inside model. All inputs are also converted.
+        backend : {'process', 'thread'}, optional
+            Where the E-step runs during training:
+
+                * 'process': in `workers` worker processes, which get a copy of the model with each chunk,
+                * 'thread': in `workers` threads running the compiled E-step, which releases the GIL so that the
+                  threads can use several cores, each keeping the sufficient statistics of the terms it saw, merged
+                  into the model once per update. The corpus is still read and the M-step still runs in the calling
+                  thread. Requires the compiled :mod:`gensim.models.ldamodel_inner` and a float32 or float64
+                  `dtype`, otherwise 'process' is used.
+        sstats_topk : int, optional
+            If set, the sufficient statistics of each chunk only keep the `sstats_topk` most likely topics of each
+            term (see :func:`~gensim.models.ldamodel.truncate_topics`) before being added to the model.
+        memory_budget : int, optional
+            If set, the topics are initialized and updated a few topics at a time, so that the temporary arrays of
+            these steps take about `memory_budget` bytes, instead of several `num_topics x num_terms` matrices.
+        eval_sample : {int, float}, optional
+            If set, the perplexity estimated every `eval_every` updates only evaluates a random subsample of the
+            current chunk: a number of documents, or a fraction of them if a float, see the `sample` parameter of
+            :meth:`~gensim.models.ldamodel.LdaModel.log_perplexity`.
+        eval_seed : int, optional
+            Seed of the subsample drawn with `eval_sample`.
+        checkpoint_fname : str, optional
+            If set, the training progress is saved to this file every `checkpoint_interval` seconds and at the end of
+            :meth:`~gensim.models.ldamulticore.LdaMulticore.update`, see
+            :func:`~gensim.models.ldamulticore.save_checkpoint`. An update of a model with the same settings over
+            a corpus of the same length then resumes from the checkpoint instead of starting from the beginning of
+            the corpus, or returns at once if the checkpoint was saved at the end of the training.
+        checkpoint_interval : float, optional
+            Seconds between two checkpoints.
 
         """
+        self.checkpoint_fname = checkpoint_fname
+        self.checkpoint_interval = checkpoint_interval
         self.workers = max(1, cpu_count() - 1) if workers is None else workers
         self.batch = batch
 
+        if backend not in ('process', 'thread'):
+            raise ValueError("backend must be 'process' or 'thread', not %r" % backend)
+        if backend == 'thread' and (ldamodel.FAST_VERSION < 0 or dtype not in (np.float32, np.float64)):
+            logger.warning(
+                "the thread backend needs the compiled E-step and a float32 or float64 dtype; using processes"
+            )
+            backend = 'process'
+        self.backend = backend
+
         if isinstance(alpha, six.string_types) and alpha == 'auto':
             raise NotImplementedError("auto-tuning alpha not implemented in multicore LDA; use plain LdaModel.")
 
@@ -181,7 +248,8 @@ class LdaMulticore(LdaModel):
             id2word=id2word, chunksize=chunksize, passes=passes, alpha=alpha, eta=eta,
             decay=decay, offset=offset, eval_every=eval_every, iterations=iterations,
             gamma_threshold=gamma_threshold, random_state=random_state, minimum_probability=minimum_probability,
-            minimum_phi_value=minimum_phi_value, per_word_topics=per_word_topics, dtype=dtype
+            minimum_phi_value=minimum_phi_value, per_word_topics=per_word_topics, dtype=dtype,
+            sstats_topk=sstats_topk, memory_budget=memory_budget, eval_sample=eval_sample, eval_seed=eval_seed
         )
 
     def update(self, corpus, chunks_as_numpy=False):
@@ -203,6 +271,12 @@ class LdaMulticore(LdaModel):
         this equals the online update of Hoffman et al. and is guaranteed to
         converge for any `decay` in (0.5, 1.0>.
 
+        If `self.checkpoint_fname` is set, the progress is checkpointed after an M-step every
+        `self.checkpoint_interval` seconds. If the checkpoint was saved by an update of this model with the same
+        settings, starting with the same number of updates, over a corpus of the same length (for example by an
+        interrupted run of the same script), the update resumes from it: the chunks already merged into the
+        checkpointed model are skipped.
+
         Parameters
         ----------
         corpus : {iterable of list of (int, float), scipy.sparse.csc}, optional
@@ -214,6 +288,9 @@ class LdaMulticore(LdaModel):
             performance hit. For distributed computing it may be desirable to keep the chunks as `numpy.ndarray`.
 
         """
+        if scipy.sparse.issparse(corpus):
+            corpus = matutils.Sparse2Corpus(corpus)
+
         try:
             lencorpus = len(corpus)
         except TypeError:
@@ -223,8 +300,6 @@ class LdaMulticore(LdaModel):
             logger.warning("LdaMulticore.update() called with an empty corpus")
             return
 
-        self.state.numdocs += lencorpus
-
         if self.batch:
             updatetype = "batch"
             updateafter = lencorpus
@@ -234,6 +309,17 @@ class LdaMulticore(LdaModel):
         eval_every = self.eval_every or 0
         evalafter = min(lencorpus, eval_every * updateafter)
 
+        progress = self._resume(lencorpus, updateafter)
+        if progress is None:
+            self.state.numdocs += lencorpus
+            progress = {
+                'config': self._checkpoint_config(lencorpus, updateafter), 'start_updates': self.num_updates,
+                'pass': 0, 'chunks': 0, 'done': set(),
+            }
+        elif progress['pass'] >= self.passes:
+            logger.info("training already completed according to checkpoint %s", self.checkpoint_fname)
+            return
+
         updates_per_pass = max(1, lencorpus / updateafter)
         logger.info(
             "running %s LDA training, %s topics, %i passes over the supplied corpus of %i documents, "
@@ -249,6 +335,45 @@ class LdaMulticore(LdaModel):
                 "consider increasing the number of passes or iterations to improve accuracy"
             )
 
+        writer = None
+        if getattr(self, 'checkpoint_fname', None):
+            writer = CheckpointWriter(self.checkpoint_fname, self.checkpoint_interval)
+        try:
+            if getattr(self, 'backend', 'process') == 'thread':
+                self._update_threads(corpus, lencorpus, updateafter, eval_every, chunks_as_numpy, progress, writer)
+            else:
+                self._update_processes(corpus, lencorpus, updateafter, eval_every, chunks_as_numpy, progress, writer)
+            if writer is not None:
+                self._checkpoint(writer, progress)
+                writer.close()
+                if writer.errors:
+                    raise writer.errors[0]
+        finally:
+            if writer is not None:
+                # a failed training keeps the last complete checkpoint
+                writer.close()
+
+    def _update_processes(self, corpus, lencorpus, updateafter, eval_every, chunks_as_numpy, progress, writer):
+        """Run :meth:`~gensim.models.ldamulticore.LdaMulticore.update` with the E-step in worker processes.
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, float)
+            Stream of document vectors.
+        lencorpus : int
+            Number of documents in `corpus`.
+        updateafter : int
+            Number of documents between two M-steps.
+        eval_every : int
+            Log perplexity every that many updates, 0 to disable.
+        chunks_as_numpy : bool
+            Whether chunks should be lists of `numpy.ndarray`.
+        progress : dict
+            Training progress, see :meth:`~gensim.models.ldamulticore.LdaMulticore._resume`. Updated in place.
+        writer : :class:`~gensim.models.ldamulticore.CheckpointWriter`
+            Writer of the checkpoints, None to disable them.
+
+        """
         job_queue = Queue(maxsize=2 * self.workers)
         result_queue = Queue()
 
@@ -264,56 +389,520 @@ class LdaMulticore(LdaModel):
             LDA model if necessary.
 
             """
-            merged_new = False
             while not result_queue.empty():
-                other.merge(result_queue.get())
+                chunk_no, result = result_queue.get()
+                other.merge(result)
+                merged.append(chunk_no)
                 queue_size[0] -= 1
-                merged_new = True
 
-            if (force and merged_new and queue_size[0] == 0) or (other.numdocs >= updateafter):
+            if (force and other.numdocs > 0 and queue_size[0] == 0) or (other.numdocs >= updateafter):
                 self.do_mstep(rho(), other, pass_ > 0)
                 other.reset()
                 if eval_every > 0 and (force or (self.num_updates / updateafter) % eval_every == 0):
-                    self.log_perplexity(chunk, total_docs=lencorpus)
+                    self.log_perplexity(chunk, total_docs=lencorpus, sample=self.eval_sample, seed=self.eval_seed)
+                _mark_done(progress, merged)
+                del merged[:]
+                if writer is not None and writer.due():
+                    self._checkpoint(writer, progress)
 
         logger.info("training LDA model using %i processes", self.workers)
         pool = Pool(self.workers, worker_e_step, (job_queue, result_queue,))
-        for pass_ in range(self.passes):
-            queue_size, reallen = [0], 0
-            other = LdaState(self.eta, self.state.sstats.shape)
-
-            chunk_stream = utils.grouper(corpus, self.chunksize, as_numpy=chunks_as_numpy)
-            for chunk_no, chunk in enumerate(chunk_stream):
-                reallen += len(chunk)  # keep track of how many documents we've processed so far
-
-                # put the chunk into the workers' input job queue
-                while True:
-                    try:
-                        job_queue.put((chunk_no, chunk, self), block=False)
-                        queue_size[0] += 1
-                        logger.info(
-                            "PROGRESS: pass %i, dispatched chunk #%i = documents up to #%i/%i, "
-                            "outstanding queue size %i",
-                            pass_, chunk_no, chunk_no * self.chunksize + len(chunk), lencorpus, queue_size[0]
-                        )
-                        break
-                    except queue.Full:
-                        # in case the input job queue is full, keep clearing the
-                        # result queue, to make sure we don't deadlock
-                        process_result_queue()
-
-                process_result_queue()
-            # endfor single corpus pass
-
-            # wait for all outstanding jobs to finish
-            while queue_size[0] > 0:
+        try:
+            for pass_ in range(progress['pass'], self.passes):
+                queue_size, reallen, merged = [0], 0, []
+                other = LdaState(self.eta, self.state.sstats.shape)
+
+                chunk_stream = utils.grouper(corpus, self.chunksize, as_numpy=chunks_as_numpy)
+                for chunk_no, chunk in enumerate(chunk_stream):
+                    reallen += len(chunk)  # keep track of how many documents we've processed so far
+                    if chunk_no < progress['chunks'] or chunk_no in progress['done']:
+                        continue  # already trained on before the checkpoint we resumed from
+
+                    # put the chunk into the workers' input job queue
+                    while True:
+                        try:
+                            job_queue.put((chunk_no, chunk, self), block=False)
+                            queue_size[0] += 1
+                            logger.info(
+                                "PROGRESS: pass %i, dispatched chunk #%i = documents up to #%i/%i, "
+                                "outstanding queue size %i",
+                                pass_, chunk_no, chunk_no * self.chunksize + len(chunk), lencorpus, queue_size[0]
+                            )
+                            break
+                        except queue.Full:
+                            # in case the input job queue is full, keep clearing the
+                            # result queue, to make sure we don't deadlock
+                            process_result_queue()
+
+                    process_result_queue()
+                # endfor single corpus pass
+
+                # wait for all outstanding jobs to finish, and apply the results merged while dispatching
                 process_result_queue(force=True)
+                while queue_size[0] > 0:
+                    process_result_queue(force=True)
+
+                if reallen != lencorpus:
+                    raise RuntimeError("input corpus size changed during training (don't use generators as input)")
+                progress.update({'pass': pass_ + 1, 'chunks': 0, 'done': set()})
+            # endfor entire update
+
+        finally:
+            pool.terminate()
+
+    def _checkpoint_config(self, lencorpus, updateafter):
+        """Get the settings that a checkpoint must have been saved with to resume training from it.
+
+        Parameters
+        ----------
+        lencorpus : int
+            Number of documents in the training corpus.
+        updateafter : int
+            Number of documents between two M-steps.
+
+        Returns
+        -------
+        dict
+            Training settings.
+
+        """
+        return {
+            'num_topics': self.num_topics, 'num_terms': self.num_terms, 'dtype': np.dtype(self.dtype).name,
+            'lencorpus': lencorpus, 'chunksize': self.chunksize, 'updateafter': updateafter, 'passes': self.passes,
+        }
+
+    def _resume(self, lencorpus, updateafter):
+        """Restore the model from `self.checkpoint_fname`, if it was saved by the same training.
+
+        Parameters
+        ----------
+        lencorpus : int
+            Number of documents in the training corpus.
+        updateafter : int
+            Number of documents between two M-steps.
+
+        Returns
+        -------
+        dict
+            Training progress, None if there is no checkpoint to resume from. The `config` and `start_updates`
+            identify the training; in pass `pass`, the `chunks` first chunks and the chunks in the set `done` are
+            already merged into the model.
+
+        """
+        fname = getattr(self, 'checkpoint_fname', None)
+        if not fname or not os.path.exists(fname):
+            return None
+        checkpoint, sstats = load_checkpoint(fname)
+        if checkpoint['config'] != self._checkpoint_config(lencorpus, updateafter) \
+                or checkpoint['start_updates'] != self.num_updates:
+            logger.warning("ignoring checkpoint %s, saved by a different training", fname)
+            return None
+
+        self.state.sstats = np.array(sstats, dtype=self.dtype)  # a writable copy of the memory-mapped array
+        self.state.numdocs = checkpoint['numdocs']
+        self.state.eta = checkpoint['state_eta']
+        self.eta = checkpoint['eta']
+        self.num_updates = checkpoint['num_updates']
+        self.random_state.set_state(checkpoint['random_state'])
+        if getattr(self, 'memory_budget', None) is None:
+            self.sync_state()
+        else:
+            self._sync_state_blocks()
+        logger.info(
+            "resuming training from checkpoint %s, at pass %i, chunk #%i",
+            fname, checkpoint['pass'], checkpoint['chunks']
+        )
+        progress = {key: checkpoint[key] for key in ('config', 'start_updates', 'pass', 'chunks')}
+        progress['done'] = set(checkpoint['done'])
+        return progress
+
+    def _checkpoint(self, writer, progress):
+        """Queue a checkpoint of the model and of the training `progress` in `writer`.
+
+        Only the sufficient statistics are copied here; the E-step workers keep running while `writer` saves them.
+
+        Parameters
+        ----------
+        writer : :class:`~gensim.models.ldamulticore.CheckpointWriter`
+            Writer of the checkpoints.
+        progress : dict
+            Training progress, see :meth:`~gensim.models.ldamulticore.LdaMulticore._resume`.
+
+        """
+        checkpoint = {
+            'config': progress['config'], 'start_updates': progress['start_updates'], 'pass': progress['pass'],
+            'chunks': progress['chunks'], 'done': sorted(progress['done']), 'num_updates': self.num_updates,
+            'numdocs': self.state.numdocs, 'eta': copy.deepcopy(self.eta), 'state_eta': copy.deepcopy(self.state.eta),
+            'random_state': self.random_state.get_state(),
+        }
+        writer.put(checkpoint, self.state.sstats.copy())
+
+    def bound(self, corpus, gamma=None, subsample_ratio=1.0, workers=None):
+        """Estimate the variational bound of documents, see :meth:`~gensim.models.ldamodel.LdaModel.bound`.
+
+        With the thread backend, the chunks of `corpus` are evaluated by `self.workers` threads by default.
+
+        Parameters
+        ----------
+        corpus : {iterable of list of (int, float), scipy.sparse.csc}, optional
+            Stream of document vectors or sparse matrix of shape (`num_terms`, `num_documents`) used to estimate the
+            variational bounds.
+        gamma : numpy.ndarray, optional
+            Topic weight variational parameters for each document. If not supplied, it will be inferred from the model.
+        subsample_ratio : float, optional
+            Percentage of the whole corpus represented by the passed `corpus` argument (in case this was a sample).
+        workers : int, optional
+            Number of threads evaluating chunks in parallel.
+
+        Returns
+        -------
+        numpy.ndarray
+            The variational bound score calculated for each document.
+
+        """
+        if workers is None:
+            workers = self.workers if getattr(self, 'backend', 'process') == 'thread' else 1
+        return super(LdaMulticore, self).bound(corpus, gamma=gamma, subsample_ratio=subsample_ratio, workers=workers)
+
+    def _update_threads(self, corpus, lencorpus, updateafter, eval_every, chunks_as_numpy, progress, writer):
+        """Run :meth:`~gensim.models.ldamulticore.LdaMulticore.update` with the E-step in threads.
+
+        Chunks are dispatched until `updateafter` documents are queued, then the threads' statistics are merged
+        into a single :class:`~gensim.models.ldamodel.LdaState` and the M-step runs, while no thread is reading
+        the model. Initial `gamma` values are drawn here, in the order of the chunks, so that the result doesn't
+        depend on the thread scheduling (up to floating point rounding of the merge).
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, float)
+            Stream of document vectors.
+        lencorpus : int
+            Number of documents in `corpus`.
+        updateafter : int
+            Number of documents between two M-steps.
+        eval_every : int
+            Log perplexity every that many updates, 0 to disable.
+        chunks_as_numpy : bool
+            Whether chunks should be lists of `numpy.ndarray`.
+        progress : dict
+            Training progress, see :meth:`~gensim.models.ldamulticore.LdaMulticore._resume`. Updated in place.
+        writer : :class:`~gensim.models.ldamulticore.CheckpointWriter`
+            Writer of the checkpoints, None to disable them.
+
+        """
+        job_queue = queue.Queue(maxsize=2 * self.workers)
+        accumulators = [SparseSstats(self.num_topics, self.dtype) for _ in range(self.workers)]
+        errors = []
+        threads = [
+            threading.Thread(target=worker_thread_e_step, args=(self, job_queue, accumulator, errors))
+            for accumulator in accumulators
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        def mstep(other, pass_, chunk, force):
+            job_queue.join()
+            if errors:
+                raise errors[0]
+            for accumulator in accumulators:
+                accumulator.merge_into(other)
+            if other.numdocs:
+                rho = pow(self.offset + pass_ + (self.num_updates / self.chunksize), -self.decay)
+                self.do_mstep(rho, other, pass_ > 0)
+                other.reset()
+                if eval_every > 0 and (force or (self.num_updates / updateafter) % eval_every == 0):
+                    self.log_perplexity(chunk, total_docs=lencorpus, sample=self.eval_sample, seed=self.eval_seed)
+            _mark_done(progress, dispatched)
+            del dispatched[:]
+            if writer is not None and writer.due():
+                self._checkpoint(writer, progress)
+
+        logger.info("training LDA model using %i threads", self.workers)
+        try:
+            for pass_ in range(progress['pass'], self.passes):
+                reallen, queued, dispatched = 0, 0, []
+                other = LdaState(self.eta, self.state.sstats.shape, self.dtype)
+
+                chunk_stream = utils.grouper(corpus, self.chunksize, as_numpy=chunks_as_numpy)
+                for chunk_no, chunk in enumerate(chunk_stream):
+                    reallen += len(chunk)
+                    if chunk_no < progress['chunks'] or chunk_no in progress['done']:
+                        continue  # already trained on before the checkpoint we resumed from
+                    indptr, indices, data = self._chunk_csr(chunk)
+                    gamma = self.random_state.gamma(100., 1. / 100., (len(chunk), self.num_topics))
+                    job_queue.put((chunk_no, indptr, indices, data, gamma.astype(self.dtype, copy=False)))
+                    dispatched.append(chunk_no)
+                    queued += len(chunk)
+                    logger.info(
+                        "PROGRESS: pass %i, dispatched chunk #%i = documents up to #%i/%i",
+                        pass_, chunk_no, chunk_no * self.chunksize + len(chunk), lencorpus
+                    )
+                    if queued >= updateafter:
+                        mstep(other, pass_, chunk, force=False)
+                        queued = 0
+                # endfor single corpus pass
+
+                if queued:
+                    mstep(other, pass_, chunk, force=True)
+
+                if reallen != lencorpus:
+                    raise RuntimeError("input corpus size changed during training (don't use generators as input)")
+                progress.update({'pass': pass_ + 1, 'chunks': 0, 'done': set()})
+            # endfor entire update
+        finally:
+            for _ in threads:
+                job_queue.put(None)
+            for thread in threads:
+                thread.join()
+
+
+def _mark_done(progress, chunk_nos):
+    """Record that the chunks `chunk_nos` of the current pass are merged into the model.
 
-            if reallen != lencorpus:
-                raise RuntimeError("input corpus size changed during training (don't use generators as input)")
-        # endfor entire update
+    Parameters
+    ----------
+    progress : dict
+        Training progress, see :meth:`~gensim.models.ldamulticore.LdaMulticore._resume`. Updated in place.
+    chunk_nos : list of int
+        IDs of the chunks.
+
+    """
+    done = progress['done']
+    done.update(chunk_nos)
+    while progress['chunks'] in done:
+        done.remove(progress['chunks'])
+        progress['chunks'] += 1
+
+
+def _replace(src, dst):
+    """Rename `src` to `dst`, atomically replacing an existing `dst`."""
+    if os.path.exists(dst) and not hasattr(os, 'replace'):
+        os.remove(dst)  # python 2 on Windows can't rename over an existing file
+    getattr(os, 'replace', os.rename)(src, dst)
+
+
+def save_checkpoint(fname, checkpoint, sstats):
+    """Atomically save a checkpoint of :class:`~gensim.models.ldamulticore.LdaMulticore` training.
+
+    The sufficient statistics are stored in a separate `.npy` file, which can be memory-mapped on load. The
+    `checkpoint` itself is pickled into `fname` last, which commits the new checkpoint: if the process dies before,
+    the previous checkpoint stays complete, as the statistics alternate between two files.
+
+    Parameters
+    ----------
+    fname : str
+        Path to the checkpoint.
+    checkpoint : dict
+        Training progress and small model attributes.
+    sstats : numpy.ndarray
+        Sufficient statistics of the model, see :class:`~gensim.models.ldamodel.LdaState`.
+
+    """
+    slot = 1 - utils.unpickle(fname)['slot'] if os.path.exists(fname) else 0
+    sstats_fname = '%s.sstats%i.npy' % (fname, slot)
+    with open(sstats_fname + '.tmp', 'wb') as fout:
+        np.save(fout, sstats)
+        fout.flush()
+        os.fsync(fout.fileno())
+    _replace(sstats_fname + '.tmp', sstats_fname)
+
+    checkpoint = dict(checkpoint, slot=slot, sstats=os.path.basename(sstats_fname))
+    with open(fname + '.tmp', 'wb') as fout:
+        _pickle.dump(checkpoint, fout, protocol=2)
+        fout.flush()
+        os.fsync(fout.fileno())
+    _replace(fname + '.tmp', fname)
+
+
+def load_checkpoint(fname, mmap='r'):
+    """Load a checkpoint saved by :func:`~gensim.models.ldamulticore.save_checkpoint`.
+
+    Parameters
+    ----------
+    fname : str
+        Path to the checkpoint.
+    mmap : str, optional
+        Memory-map the sufficient statistics with this mode (see :func:`numpy.load`), None to read them into memory.
+
+    Returns
+    -------
+    (dict, numpy.ndarray)
+        The checkpoint and the sufficient statistics.
+
+    """
+    checkpoint = utils.unpickle(fname)
+    sstats = np.load(os.path.join(os.path.dirname(fname), checkpoint['sstats']), mmap_mode=mmap)
+    return checkpoint, sstats
+
+
+class CheckpointWriter(object):
+    """Save checkpoints of :class:`~gensim.models.ldamulticore.LdaMulticore` training in a background thread,
+    so that the training doesn't wait for the disk.
+
+    """
+    def __init__(self, fname, interval=CHECKPOINT_INTERVAL):
+        """
+
+        Parameters
+        ----------
+        fname : str
+            Path to the checkpoint, see :func:`~gensim.models.ldamulticore.save_checkpoint`.
+        interval : float, optional
+            Seconds between two checkpoints.
+
+        """
+        self.fname = fname
+        self.interval = interval
+        self.last_checkpoint = time.time()
+        self.errors = []
+        self.jobs = queue.Queue(maxsize=1)
+        self.thread = threading.Thread(target=self._write_checkpoints)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def due(self):
+        """Is it time for a new checkpoint?
+
+        Returns
+        -------
+        bool
+            True if `interval` seconds passed since the last checkpoint, and no checkpoint is waiting to be written.
+
+        """
+        return time.time() - self.last_checkpoint >= self.interval and not self.jobs.full()
 
-        pool.terminate()
+    def put(self, checkpoint, sstats):
+        """Queue a checkpoint to be saved. Blocks only while another checkpoint is waiting to be written.
+
+        Parameters
+        ----------
+        checkpoint : dict
+            Training progress and small model attributes.
+        sstats : numpy.ndarray
+            Sufficient statistics of the model, not modified until saved.
+
+        """
+        self.jobs.put((checkpoint, sstats))
+        self.last_checkpoint = time.time()
+
+    def close(self):
+        """Wait until the queued checkpoints are written, and stop the thread. Errors are kept in `self.errors`."""
+        if self.thread.is_alive():
+            self.jobs.put(None)
+            self.thread.join()
+
+    def _write_checkpoints(self):
+        """Save the queued checkpoints, until getting None."""
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            checkpoint, sstats = job
+            try:
+                if not self.errors:
+                    save_checkpoint(self.fname, checkpoint, sstats)
+                    logger.info(
+                        "checkpoint: pass %i, %i updates, saved to %s",
+                        checkpoint['pass'], checkpoint['num_updates'], self.fname
+                    )
+            except Exception as err:
+                logger.exception("failed to save checkpoint %s", self.fname)
+                self.errors.append(err)
+
+
+class SparseSstats(object):
+    """Sufficient statistics of the terms seen by one E-step thread of
+    :class:`~gensim.models.ldamulticore.LdaMulticore`.
+
+    Only the columns of the terms that occurred in the processed chunks are stored, in `values`, with their term ids
+    in `terms` (sorted), so the memory used grows with the vocabulary actually seen rather than `num_terms`.
+
+    """
+    def __init__(self, num_topics, dtype=np.float32):
+        """
+
+        Parameters
+        ----------
+        num_topics : int
+            Number of topics of the model.
+        dtype : {numpy.float32, numpy.float64}, optional
+            Data-type of the statistics.
+
+        """
+        self.terms = np.zeros(0, dtype=np.int64)
+        self.values = np.zeros((num_topics, 0), dtype=dtype)
+        self.numdocs = 0
+
+    def add(self, terms, values, numdocs):
+        """Add the statistics of a chunk.
+
+        Parameters
+        ----------
+        terms : numpy.ndarray
+            Sorted, unique term ids of the chunk.
+        values : numpy.ndarray
+            Statistics of these terms, shape (`num_topics`, `len(terms)`).
+        numdocs : int
+            Number of documents in the chunk.
+
+        """
+        if not len(self.terms):
+            self.terms, self.values = terms, values
+        else:
+            merged = np.union1d(self.terms, terms)
+            if len(merged) != len(self.terms):
+                expanded = np.zeros((self.values.shape[0], len(merged)), dtype=self.values.dtype)
+                expanded[:, np.searchsorted(merged, self.terms)] = self.values
+                self.terms, self.values = merged, expanded
+            self.values[:, np.searchsorted(merged, terms)] += values
+        self.numdocs += numdocs
+
+    def merge_into(self, state):
+        """Add the statistics to a dense :class:`~gensim.models.ldamodel.LdaState` and clear them.
+
+        Parameters
+        ----------
+        state : :class:`~gensim.models.ldamodel.LdaState`
+            State to update.
+
+        """
+        state.sstats[:, self.terms] += self.values
+        state.numdocs += self.numdocs
+        self.__init__(self.values.shape[0], self.values.dtype)
+
+
+def worker_thread_e_step(model, input_queue, accumulator, errors):
+    """Perform E-step for each job, in a thread.
+
+    Parameters
+    ----------
+    model : :class:`~gensim.models.ldamulticore.LdaMulticore`
+        The model being trained, whose `expElogbeta` is only read.
+    input_queue : queue.Queue of (int, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray)
+        Each job is a chunk ID, the chunk as `indptr`, `indices` and `data` arrays (see
+        :func:`~gensim.models.ldamodel_inner.e_step`) and the initial `gamma`. `None` stops the thread.
+    accumulator : :class:`~gensim.models.ldamulticore.SparseSstats`
+        Statistics of this thread.
+    errors : list of Exception
+        Exceptions raised while processing a job are appended here.
+
+    """
+    while True:
+        job = input_queue.get()
+        if job is None:
+            input_queue.task_done()
+            break
+        chunk_no, indptr, indices, data, gamma = job
+        try:
+            if not errors:
+                terms, sstats = model._e_step_columns(indptr, indices, data, gamma)
+                accumulator.add(terms, sstats, len(gamma))
+                logger.debug("processed chunk #%i of %i documents", chunk_no, len(gamma))
+        except Exception as err:
+            errors.append(err)
+        finally:
+            input_queue.task_done()
 
 
 def worker_e_step(input_queue, result_queue):
@@ -324,8 +913,9 @@ def worker_e_step(input_queue, result_queue):
     input_queue : queue of (int, list of (int, float), :class:`~gensim.models.lda_worker.Worker`)
         Each element is a job characterized by its ID, the corpus chunk to be processed in BOW format and the worker
         responsible for processing it.
-    result_queue : queue of :class:`~gensim.models.ldamodel.LdaState`
-        After the worker finished the job, the state of the resulting (trained) worker model is appended to this queue.
+    result_queue : queue of (int, :class:`~gensim.models.ldamodel.LdaState`)
+        After the worker finished the job, the ID of the job and the state of the resulting (trained) worker model
+        are appended to this queue.
 
     """
     logger.debug("worker process entering E-step loop")
@@ -337,6 +927,6 @@ def worker_e_step(input_queue, result_queue):
         worker_lda.do_estep(chunk)  # TODO: auto-tune alpha?
         del chunk
         logger.debug("processed chunk, queuing the result")
-        result_queue.put(worker_lda.state)
+        result_queue.put((chunk_no, worker_lda.state))
         del worker_lda  # free up some memory
         logger.debug("result put")
@@ -372,8 +372,10 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             Number of documents to be used in each training chunk.
         decay : float, optional
             Weight of existing observations relatively to new ones.
-        distributed : bool, optional
-            If True - distributed mode (parallel execution on several machines) will be used.
+        distributed : {bool, :class:`~gensim.models.transport.Transport`}, optional
+            If True - distributed mode (parallel execution on several machines) will be used, through the dispatcher
+            registered with the Pyro4 name server. Pass a transport such as
+            :class:`~gensim.models.transport.ProcessTransport` to use local worker processes instead.
         onepass : bool, optional
             Whether the one-pass algorithm should be used for training.
             Pass `False` to force a multi-pass stochastic algorithm.
@@ -426,9 +428,9 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
                     "run either distributed one-pass, or serial randomized."
                 )
             try:
-                import Pyro4
-                dispatcher = Pyro4.Proxy('PYRONAME:gensim.lsi_dispatcher')
-                logger.debug("looking for dispatcher at %s", str(dispatcher._pyroUri))
+                from gensim.models.transport import Transport, PyroTransport
+                transport = distributed if isinstance(distributed, Transport) else PyroTransport()
+                dispatcher = transport.get_dispatcher('lsi')
                 dispatcher.initialize(
                     id2word=self.id2word, num_topics=num_topics, chunksize=chunksize, decay=decay,
                     power_iters=self.power_iters, extra_samples=self.extra_samples, distributed=False, onepass=onepass
@@ -488,15 +490,11 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
                 if self.dispatcher:
                     logger.info('initializing %s workers', self.numworkers)
                     self.dispatcher.reset()
-                for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
+                # construct each job as a sparse matrix, to minimize memory overhead
+                # definitely avoid materializing it as a dense matrix!
+                jobs = matutils.corpus2csc_chunks(corpus, chunksize, num_terms=self.num_terms, dtype=self.dtype)
+                for chunk_no, job in enumerate(jobs):
                     logger.info("preparing a new chunk of documents")
-                    nnz = sum(len(doc) for doc in chunk)
-                    # construct the job as a sparse matrix, to minimize memory overhead
-                    # definitely avoid materializing it as a dense matrix!
-                    logger.debug("converting corpus to csc format")
-                    job = matutils.corpus2csc(
-                        chunk, num_docs=len(chunk), num_terms=self.num_terms, num_nnz=nnz, dtype=self.dtype)
-                    del chunk
                     doc_no += job.shape[1]
                     if self.dispatcher:
                         # distributed version: add this job to the job queue, so workers can work on it
@@ -614,6 +612,32 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             result = matutils.Dense2Corpus(topic_dist)
         return result
 
+    def _transform_chunk(self, chunk):
+        """Project a chunk of documents into the latent space, as in
+        :meth:`~gensim.models.lsimodel.LsiModel.__getitem__`.
+
+        Parameters
+        ----------
+        chunk : scipy.sparse.csc_matrix
+            Chunk of documents as columns.
+
+        Returns
+        -------
+        numpy.ndarray
+            Latent vectors of the documents, shape (number of documents, `self.num_topics`). If the projection
+            has fewer factors than `self.num_topics`, the remaining columns are zero.
+
+        """
+        vec = scipy.sparse.csc_matrix(
+            (chunk.data.astype(self.projection.u.dtype, copy=False), chunk.indices, chunk.indptr),
+            shape=(self.num_terms, chunk.shape[1])
+        )
+        topic_dist = vec.T.dot(self.projection.u[:, :self.num_topics])
+        missing = self.num_topics - topic_dist.shape[1]
+        if missing > 0:
+            topic_dist = np.hstack([topic_dist, np.zeros((chunk.shape[1], missing), dtype=topic_dist.dtype)])
+        return topic_dist
+
     def get_topics(self):
         """Get the topic vectors.
 
@@ -943,12 +967,11 @@ def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
             q, _ = matutils.qr_destroy(q)  # orthonormalize the range after each power iteration step
     else:
         num_docs = 0
-        for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
+        # construct the chunks as sparse matrices, to minimize memory overhead
+        # definitely avoid materializing them as dense (num_terms x chunksize) matrices!
+        # documents = columns of sparse CSC
+        for chunk_no, chunk in enumerate(matutils.corpus2csc_chunks(corpus, chunksize, num_terms, dtype=dtype)):
             logger.info('PROGRESS: at document #%i', (chunk_no * chunksize))
-            # construct the chunk as a sparse matrix, to minimize memory overhead
-            # definitely avoid materializing it as a dense (num_terms x chunksize) matrix!
-            s = sum(len(doc) for doc in chunk)
-            chunk = matutils.corpus2csc(chunk, num_terms=num_terms, dtype=dtype)  # documents = columns of sparse CSC
             m, n = chunk.shape
             assert m == num_terms
             assert n <= chunksize  # the very last chunk of A is allowed to be smaller in size
@@ -967,10 +990,9 @@ def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
             logger.info("running power iteration #%i", power_iter + 1)
             yold = q.copy()
             q[:] = 0.0
-            for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
+            # documents = columns of sparse CSC
+            for chunk_no, chunk in enumerate(matutils.corpus2csc_chunks(corpus, chunksize, num_terms, dtype=dtype)):
                 logger.info('PROGRESS: at document #%i/%i', chunk_no * chunksize, num_docs)
-                # documents = columns of sparse CSC
-                chunk = matutils.corpus2csc(chunk, num_terms=num_terms, dtype=dtype)
                 tmp = chunk.T * yold
                 tmp = chunk * tmp
                 del chunk
@@ -993,9 +1015,9 @@ def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
         # input corpus A, to avoid using O(number of documents) memory
         x = np.zeros(shape=(qt.shape[0], qt.shape[0]), dtype=dtype)
         logger.info("2nd phase: constructing %s covariance matrix", str(x.shape))
-        for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
+        chunks = matutils.corpus2csc_chunks(corpus, chunksize, num_terms, dtype=qt.dtype)
+        for chunk_no, chunk in enumerate(chunks):
             logger.info('PROGRESS: at document #%i/%i', chunk_no * chunksize, num_docs)
-            chunk = matutils.corpus2csc(chunk, num_terms=num_terms, dtype=qt.dtype)
             b = qt * chunk  # dense * sparse matrix multiply
             del chunk
             x += np.dot(b, b.T)  # TODO should call the BLAS routine SYRK, but there is no SYRK wrapper in scipy :(
@@ -507,6 +507,28 @@ class Nmf(interfaces.TransformationABC, basemodel.BaseTopicModel):
             if not minimum_probability or proba > minimum_probability
         ]
 
+    def _transform_chunk(self, chunk):
+        """Get the topic distributions of a chunk of documents, as in
+        :meth:`~gensim.models.nmf.Nmf.get_document_topics`.
+
+        Parameters
+        ----------
+        chunk : scipy.sparse.csc_matrix
+            Chunk of documents as columns.
+
+        Returns
+        -------
+        numpy.ndarray
+            Topic distributions of the documents, shape (number of documents, `self.num_topics`).
+
+        """
+        v = scipy.sparse.csc_matrix((chunk.data, chunk.indices, chunk.indptr), shape=(self.num_tokens, chunk.shape[1]))
+        h = self._solveproj(v, self._W, v_max=np.inf)
+        if self.normalize:
+            totals = h.sum(axis=0)
+            h = np.divide(h, totals, out=np.zeros_like(h), where=totals != 0)
+        return h.T
+
     def _setup(self, v):
         """Infer info from the first batch and initialize the matrices.
 
@@ -20,6 +20,7 @@ from gensim import interfaces, matutils, utils
 from six import iteritems
 
 import numpy as np
+import scipy.sparse
 
 logger = logging.getLogger(__name__)
 
@@ -253,8 +254,8 @@ class TfidfModel(interfaces.TransformationABC):
 
         Parameters
         ----------
-        corpus : iterable of iterable of (int, int), optional
-            Input corpus
+        corpus : {iterable of iterable of (int, int), scipy.sparse.csc}, optional
+            Input corpus, or a sparse matrix of shape (`num_terms`, `num_documents`).
         id2word : {dict, :class:`~gensim.corpora.Dictionary`}, optional
             Mapping token - id, that was used for converting input data to bag of words format.
         dictionary : :class:`~gensim.corpora.Dictionary`
@@ -335,7 +336,11 @@ class TfidfModel(interfaces.TransformationABC):
                     "constructor received both corpus and explicit inverse document frequencies; ignoring the corpus"
                 )
             self.num_docs, self.num_nnz = dictionary.num_docs, dictionary.num_nnz
-            self.dfs = dictionary.dfs.copy()
+            if isinstance(dictionary.dfs, np.ndarray):
+                # array-backed dictionaries, e.g. CompactDictionary
+                self.dfs = dict(enumerate(dictionary.dfs.tolist()))
+            else:
+                self.dfs = dictionary.dfs.copy()
             self.idfs = precompute_idfs(self.wglobal, self.dfs, self.num_docs)
             if id2word is None:
                 self.id2word = dictionary
@@ -371,20 +376,27 @@ class TfidfModel(interfaces.TransformationABC):
 
         Parameters
         ----------
-        corpus : iterable of iterable of (int, int)
-            Input corpus.
+        corpus : {iterable of iterable of (int, int), scipy.sparse.csc}
+            Input corpus, or a sparse matrix of shape (`num_terms`, `num_documents`).
 
         """
         logger.info("collecting document frequencies")
         dfs = {}
         numnnz, docno = 0, -1
 
-        for docno, bow in enumerate(corpus):
-            if docno % 10000 == 0:
-                logger.info("PROGRESS: processing document #%i", docno)
-            numnnz += len(bow)
-            for termid, _ in bow:
-                dfs[termid] = dfs.get(termid, 0) + 1
+        if scipy.sparse.issparse(corpus):
+            # documents are columns: the document frequency of a term is the number of stored entries in its row
+            corpus = corpus.tocsc()
+            termids, docfreqs = np.unique(corpus.indices, return_counts=True)
+            dfs = dict(zip(termids.tolist(), docfreqs.tolist()))
+            docno, numnnz = corpus.shape[1] - 1, corpus.nnz
+        else:
+            for docno, bow in enumerate(corpus):
+                if docno % 10000 == 0:
+                    logger.info("PROGRESS: processing document #%i", docno)
+                numnnz += len(bow)
+                for termid, _ in bow:
+                    dfs[termid] = dfs.get(termid, 0) + 1
         # keep some stats about the training corpus
         self.num_docs = docno + 1
         self.num_nnz = numnnz
@@ -0,0 +1,642 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Pluggable transports between distributed :class:`~gensim.models.ldamodel.LdaModel` /
+:class:`~gensim.models.lsimodel.LsiModel` and their workers.
+
+A transport gives a model its dispatcher: an object with the methods `initialize`, `getworkers`, `putjob`,
+`getstate`, `reset` and `exit` that the models call in distributed mode.
+
+* :class:`~gensim.models.transport.PyroTransport` finds the dispatcher started by the
+  :mod:`gensim.models.lda_dispatcher` or :mod:`gensim.models.lsi_dispatcher` script through a Pyro4 name server.
+  This is what `distributed=True` uses.
+* :class:`~gensim.models.transport.ProcessTransport` runs the dispatcher in the training process and starts
+  worker processes on the local machine: no name server or other external service is needed.
+* :class:`~gensim.models.transport.SocketTransport` runs the dispatcher in the training process and waits for
+  workers to connect over TCP, started on any machine with ``python -m gensim.models.transport HOST:PORT``.
+
+With the last two, jobs are streamed to each worker in batches of `batch_size` chunks, messages are pickled and
+compressed with zlib, and the jobs of a worker that dies (including those it already finished since the last
+merge, whose results died with it) are given back to the other workers.
+
+Usage examples
+--------------
+
+Train LDA in 4 local worker processes
+
+.. sourcecode:: pycon
+
+    >>> from gensim.test.utils import common_corpus, common_dictionary
+    >>> from gensim.models import LdaModel
+    >>> from gensim.models.transport import ProcessTransport
+    >>>
+    >>> lda = LdaModel(common_corpus, id2word=common_dictionary, num_topics=2, distributed=ProcessTransport(workers=4))
+    >>> lda.dispatcher.exit()  # stop the worker processes
+
+Or with workers connecting over TCP, each started with
+``python -m gensim.models.transport localhost:9999 --authkey KEY``. Messages are unpickled on both ends, so the
+shared `authkey` is mandatory: only listen on interfaces reachable by machines you trust.
+
+.. sourcecode:: pycon
+
+    >>> from gensim.models.transport import SocketTransport
+    >>>
+    >>> transport = SocketTransport(('localhost', 9999), workers=8, authkey=b'secret shared with the workers')
+    >>> lda = LdaModel(common_corpus, id2word=common_dictionary, num_topics=2, distributed=transport)  # doctest: +SKIP
+
+"""
+
+import argparse
+import binascii
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import zlib
+from multiprocessing.connection import Client, Listener
+
+from six.moves import queue, cPickle as _pickle
+
+from gensim import utils
+from gensim.models.ldamodel import LdaModel, LdaState
+from gensim.models.lsimodel import LsiModel
+
+logger = logging.getLogger(__name__)
+
+
+# How many jobs (=chunks of N documents) to keep "pre-fetched" in the dispatcher's queue.
+MAX_JOBS_QUEUE = 10
+
+# Name server prefixes of the dispatchers of each model kind.
+DISPATCHER_PREFIXES = {'lda': 'gensim.lda_dispatcher', 'lsi': 'gensim.lsi_dispatcher'}
+
+
+def send_message(conn, message, compress=1):
+    """Pickle and compress `message` and send it over `conn`.
+
+    Parameters
+    ----------
+    conn : :class:`multiprocessing.connection.Connection`
+        The connection.
+    message : object
+        Picklable message.
+    compress : int, optional
+        zlib compression level, 0 to send uncompressed.
+
+    """
+    data = _pickle.dumps(message, protocol=2)
+    if compress:
+        conn.send_bytes(b'z' + zlib.compress(data, compress))
+    else:
+        conn.send_bytes(b'p' + data)
+
+
+def recv_message(conn):
+    """Receive a message sent by :func:`~gensim.models.transport.send_message`.
+
+    Parameters
+    ----------
+    conn : :class:`multiprocessing.connection.Connection`
+        The connection.
+
+    Returns
+    -------
+    object
+        The message.
+
+    """
+    data = conn.recv_bytes()
+    if data[:1] == b'z':
+        return _pickle.loads(zlib.decompress(data[1:]))
+    return _pickle.loads(data[1:])
+
+
+class Transport(object):
+    """Base class of the ways a distributed model reaches its dispatcher."""
+
+    def get_dispatcher(self, kind):
+        """Get the dispatcher for a model.
+
+        Parameters
+        ----------
+        kind : {'lda', 'lsi'}
+            Kind of model.
+
+        Returns
+        -------
+        object
+            Dispatcher, with the methods `initialize`, `getworkers`, `putjob`, `getstate`, `reset` and `exit`.
+
+        """
+        raise NotImplementedError
+
+
+class PyroTransport(Transport):
+    """Dispatcher started by the `lda_dispatcher` / `lsi_dispatcher` scripts, found through a Pyro4 name server."""
+
+    def __init__(self, ns_conf=None):
+        """
+
+        Parameters
+        ----------
+        ns_conf : dict of (str, object), optional
+            Key word parameters propagated to :func:`gensim.utils.getNS` to get a Pyro4 name server.
+
+        """
+        self.ns_conf = ns_conf if ns_conf is not None else {}
+
+    def get_dispatcher(self, kind):
+        """Get a Pyro4 proxy of the dispatcher registered with the name server, see
+        :meth:`~gensim.models.transport.Transport.get_dispatcher`."""
+        import Pyro4
+        prefix = DISPATCHER_PREFIXES[kind]
+        with utils.getNS(**self.ns_conf) as ns:
+            dispatcher = Pyro4.Proxy(ns.list(prefix=prefix)[prefix])
+        logger.debug("looking for dispatcher at %s", dispatcher._pyroUri)
+        return dispatcher
+
+
+class ProcessTransport(Transport):
+    """Dispatcher running in the training process, with worker processes started on the local machine."""
+
+    def __init__(self, workers=None, batch_size=1, compress=1, maxsize=MAX_JOBS_QUEUE):
+        """
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of worker processes, the number of cores by default.
+        batch_size : int, optional
+            Maximum number of jobs sent to a worker in one message.
+        compress : int, optional
+            zlib compression level of the messages, 0 to disable.
+        maxsize : int, optional
+            Maximum number of jobs kept pre-fetched in the dispatcher's queue.
+
+        """
+        self.workers = multiprocessing.cpu_count() if workers is None else workers
+        self.batch_size = batch_size
+        self.compress = compress
+        self.maxsize = maxsize
+
+    def get_dispatcher(self, kind):
+        """Get a new :class:`~gensim.models.transport.Dispatcher`, see
+        :meth:`~gensim.models.transport.Transport.get_dispatcher`."""
+        return Dispatcher(kind, self, batch_size=self.batch_size, compress=self.compress, maxsize=self.maxsize)
+
+    def connect(self):
+        """Start the worker processes.
+
+        Returns
+        -------
+        list of (str, :class:`multiprocessing.connection.Connection`, {:class:`multiprocessing.Process`, None})
+            Name, connection and process of each worker.
+
+        """
+        connections = []
+        for _ in range(self.workers):
+            conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=worker_loop, args=(child_conn, self.compress))
+            process.daemon = True
+            process.start()
+            child_conn.close()
+            connections.append(('local:%i' % process.pid, conn, process))
+        return connections
+
+
+class SocketTransport(ProcessTransport):
+    """Dispatcher running in the training process, with workers connecting over TCP.
+
+    Start each worker with ``python -m gensim.models.transport HOST:PORT --authkey KEY``.
+
+    Warnings
+    --------
+    Both ends unpickle the messages they receive, so anyone able to connect could run code on the dispatcher or a
+    worker. The connections are therefore always authenticated with `authkey`, and the address should only be
+    reachable by trusted machines.
+
+    """
+    def __init__(self, address, workers, authkey=None, batch_size=1, compress=1, maxsize=MAX_JOBS_QUEUE):
+        """
+
+        Parameters
+        ----------
+        address : (str, int)
+            Host and port to listen on.
+        workers : int
+            Number of workers to wait for.
+        authkey : {bytes, str}, optional
+            Shared secret, which the workers must also use. If not given, a random one is generated: it is logged
+            and kept in `self.authkey`.
+        batch_size : int, optional
+            Maximum number of jobs sent to a worker in one message.
+        compress : int, optional
+            zlib compression level of the messages, 0 to disable.
+        maxsize : int, optional
+            Maximum number of jobs kept pre-fetched in the dispatcher's queue.
+
+        """
+        super(SocketTransport, self).__init__(workers, batch_size=batch_size, compress=compress, maxsize=maxsize)
+        self.address = tuple(address)
+        if authkey is None:
+            authkey = binascii.hexlify(os.urandom(16))
+            logger.warning(
+                "no authkey given, start the workers with `python -m gensim.models.transport HOST:PORT --authkey %s`",
+                authkey.decode('ascii')
+            )
+        self.authkey = authkey if isinstance(authkey, bytes) else authkey.encode('utf8')
+        if not self.authkey:
+            raise ValueError("SocketTransport requires a non-empty authkey")
+
+    def connect(self):
+        """Wait for the workers to connect.
+
+        Returns
+        -------
+        list of (str, :class:`multiprocessing.connection.Connection`, None)
+            Name and connection of each worker.
+
+        """
+        connections = []
+        listener = Listener(self.address, authkey=self.authkey)
+        try:
+            logger.info("waiting for %i workers on %s:%s", self.workers, *listener.address)
+            while len(connections) < self.workers:
+                conn = listener.accept()
+                name = '%s:%s' % listener.last_accepted
+                logger.info("worker %s connected", name)
+                send_message(conn, ('compress', self.compress), self.compress)
+                connections.append((name, conn, None))
+        finally:
+            listener.close()
+        return connections
+
+
+class _WorkerHandle(object):
+    """Connection to one worker, as seen by the dispatcher."""
+
+    def __init__(self, workerid, name, conn, process):
+        self.workerid = workerid
+        self.name = name
+        self.conn = conn
+        self.process = process
+        self.lock = threading.Lock()
+        self.alive = True
+        self.completed = []  # jobs done since the last reset, lost if the worker dies
+        self.jobsdone = 0
+
+
+class Dispatcher(object):
+    """Dispatcher of :class:`~gensim.models.transport.ProcessTransport` and
+    :class:`~gensim.models.transport.SocketTransport`, running in the training process.
+
+    One thread per worker streams batches of jobs from the shared queue to its worker and waits for the reply.
+
+    """
+    def __init__(self, kind, transport, batch_size=1, compress=1, maxsize=MAX_JOBS_QUEUE):
+        """
+
+        Parameters
+        ----------
+        kind : {'lda', 'lsi'}
+            Kind of model trained by the workers.
+        transport : :class:`~gensim.models.transport.ProcessTransport`
+            Transport providing the worker connections.
+        batch_size : int, optional
+            Maximum number of jobs sent to a worker in one message.
+        compress : int, optional
+            zlib compression level of the messages, 0 to disable.
+        maxsize : int, optional
+            Maximum number of jobs kept pre-fetched in the queue.
+
+        """
+        if kind not in DISPATCHER_PREFIXES:
+            raise ValueError("unknown model kind %r" % kind)
+        self.kind = kind
+        self.transport = transport
+        self.batch_size = batch_size
+        self.compress = compress
+        self.maxsize = maxsize
+        self.workers = {}
+
+    def initialize(self, **model_params):
+        """Start the workers and initialize their models.
+
+        Parameters
+        ----------
+        **model_params
+            Keyword parameters of the workers' models.
+
+        Raises
+        ------
+        RuntimeError
+            When no worker could be started.
+
+        """
+        self.jobs = queue.Queue(maxsize=self.maxsize)
+        self.lock_update = threading.Lock()
+        self.jobs_changed = threading.Condition(self.lock_update)
+        self._jobsdone = 0
+        self._jobsreceived = 0
+        self.error = None
+        self.stopped = False
+
+        self.workers = {}
+        for workerid, (name, conn, process) in enumerate(self.transport.connect()):
+            worker = _WorkerHandle(workerid, name, conn, process)
+            logger.info("registering worker #%i at %s", workerid, name)
+            try:
+                self._request(worker, ('initialize', self.kind, model_params))
+            except (EOFError, IOError, OSError) as err:
+                logger.warning("unresponsive worker at %s (%s), ignoring it", name, err)
+                continue
+            self.workers[workerid] = worker
+        if not self.workers:
+            raise RuntimeError("no workers could be started")
+
+        for worker in self.workers.values():
+            thread = threading.Thread(target=self._feed, args=(worker,))
+            thread.daemon = True
+            thread.start()
+
+    def _request(self, worker, message):
+        """Send `message` to `worker` and return its reply."""
+        with worker.lock:
+            send_message(worker.conn, message, self.compress)
+            reply = recv_message(worker.conn)
+        if isinstance(reply, tuple) and reply and reply[0] == 'error':
+            raise RuntimeError("worker %s failed: %s" % (worker.name, reply[1]))
+        return reply
+
+    def _feed(self, worker):
+        """Stream batches of jobs to `worker`, until it dies or the dispatcher exits."""
+        while worker.alive and not self.stopped:
+            try:
+                batch = [self.jobs.get(block=True, timeout=1)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.jobs.get(block=False))
+                except queue.Empty:
+                    break
+            try:
+                self._request(worker, ('jobs', batch))
+            except (EOFError, IOError, OSError) as err:
+                self._worker_died(worker, err, batch)
+                return
+            except RuntimeError as err:
+                # the job itself failed, redoing it elsewhere wouldn't help: report the error to the training
+                logger.error("worker #%i failed to process %i jobs: %s", worker.workerid, len(batch), err)
+                with self.jobs_changed:
+                    if self.error is None:
+                        self.error = err
+                    self.jobs_changed.notify_all()
+                continue
+            with self.jobs_changed:
+                worker.completed.extend(batch)
+                worker.jobsdone += len(batch)
+                self._jobsdone += len(batch)
+                self.jobs_changed.notify_all()
+            logger.info("worker #%i finished %i jobs (%i done in total)", worker.workerid, len(batch), self._jobsdone)
+
+    def _worker_died(self, worker, err, batch=()):
+        """Forget a dead worker and give its jobs to the other workers."""
+        with self.jobs_changed:
+            lost = list(batch)
+            if worker.alive:
+                # already reported by another thread otherwise, only the batch in flight is left to re-queue
+                worker.alive = False
+                lost.extend(worker.completed)
+                self._jobsdone -= len(worker.completed)
+                worker.completed = []
+                del self.workers[worker.workerid]
+                self.jobs_changed.notify_all()
+        logger.warning(
+            "worker #%i at %s died (%s), re-queueing its %i jobs", worker.workerid, worker.name, err, len(lost)
+        )
+        if not self.workers:
+            logger.error("no workers left")
+            return
+        for job in lost:
+            self.jobs.put(job)
+
+    def getworkers(self):
+        """Get the names of all live workers.
+
+        Returns
+        -------
+        list of str
+            Name of each worker.
+
+        """
+        return [worker.name for worker in self.workers.values()]
+
+    def putjob(self, job):
+        """Add a job to the queue, blocking while the queue is full.
+
+        Parameters
+        ----------
+        job : iterable of list of (int, float)
+            The corpus chunk in BoW format.
+
+        Raises
+        ------
+        RuntimeError
+            When all workers died, or a worker failed to process a job since the last reset.
+
+        """
+        if not self.workers:
+            raise RuntimeError("no workers left")
+        if self.error is not None:
+            raise self.error
+        with self.lock_update:
+            self._jobsreceived += 1
+        self.jobs.put(job)
+        logger.info("added a new job (len(queue)=%i items)", self.jobs.qsize())
+
+    def getstate(self):
+        """Wait for all jobs to finish, then merge and return the states of all workers.
+
+        Returns
+        -------
+        {:class:`~gensim.models.ldamodel.LdaState`, :class:`~gensim.models.lsimodel.Projection`}
+            Merged state.
+
+        Raises
+        ------
+        RuntimeError
+            When all workers died, or a worker failed to process a job since the last reset.
+
+        """
+        result = None
+        while True:
+            with self.jobs_changed:
+                while self._jobsdone < self._jobsreceived and self.workers and self.error is None:
+                    self.jobs_changed.wait(1.0)
+                if self.error is not None:
+                    raise self.error
+                if not self.workers:
+                    raise RuntimeError("all workers died")
+
+            logger.info("merging states from %i workers", len(self.workers))
+            for worker in list(self.workers.values()):
+                try:
+                    state = self._request(worker, ('getstate',))
+                except (EOFError, IOError, OSError) as err:
+                    self._worker_died(worker, err)
+                    break
+                with self.lock_update:
+                    worker.completed = []  # merged, no longer lost if the worker dies
+                if result is None:
+                    result = state
+                else:
+                    result.merge(state)
+            else:
+                return result
+            # a worker died while collecting the states: its jobs are being redone, wait for them and merge the rest
+
+    def reset(self, state=None):
+        """Reinitialize all workers for a new EM iteration (LDA) or decomposition (LSI).
+
+        Parameters
+        ----------
+        state : :class:`~gensim.models.ldamodel.LdaState`, optional
+            State of the model, required for LDA.
+
+        """
+        for worker in list(self.workers.values()):
+            logger.info("resetting worker #%i", worker.workerid)
+            try:
+                self._request(worker, ('reset', state))
+            except (EOFError, IOError, OSError) as err:
+                self._worker_died(worker, err)
+        with self.lock_update:
+            for worker in self.workers.values():
+                worker.completed = []
+            self._jobsdone = 0
+            self._jobsreceived = 0
+            self.error = None
+        # jobs left over from a failed iteration
+        while True:
+            try:
+                self.jobs.get(block=False)
+            except queue.Empty:
+                break
+
+    def jobsdone(self):
+        """Get the number of jobs completed since the last reset.
+
+        Returns
+        -------
+        int
+            Number of jobs already completed.
+
+        """
+        return self._jobsdone
+
+    def exit(self):
+        """Terminate all workers."""
+        self.stopped = True
+        for worker in list(self.workers.values()):
+            logger.info("terminating worker #%i", worker.workerid)
+            try:
+                with worker.lock:
+                    send_message(worker.conn, ('exit',), self.compress)
+            except (EOFError, IOError, OSError):
+                pass
+            worker.conn.close()
+            if worker.process is not None:
+                worker.process.join(5)
+        self.workers = {}
+
+
+def worker_loop(conn, compress=1):
+    """Serve the requests of a :class:`~gensim.models.transport.Dispatcher` until told to exit.
+
+    Parameters
+    ----------
+    conn : :class:`multiprocessing.connection.Connection`
+        Connection to the dispatcher.
+    compress : int, optional
+        zlib compression level of the replies, 0 to disable.
+
+    """
+    model, kind = None, None
+    while True:
+        try:
+            message = recv_message(conn)
+        except EOFError:
+            break
+        command = message[0]
+        if command == 'exit':
+            break
+        try:
+            if command == 'compress':
+                compress = message[1]
+                continue
+            elif command == 'initialize':
+                kind, model_params = message[1], message[2]
+                model = LdaModel(**model_params) if kind == 'lda' else LsiModel(**model_params)
+                reply = ('ok',)
+            elif command == 'jobs':
+                for job in message[1]:
+                    if kind == 'lda':
+                        model.do_estep(job)
+                    else:
+                        model.add_documents(job)
+                reply = ('done', len(message[1]))
+            elif command == 'getstate':
+                if kind == 'lda':
+                    # start from empty statistics: a merged state must not be merged again, and jobs of a dead
+                    # worker may still arrive before the next reset
+                    reply = model.state
+                    model.state = LdaState(model.eta, reply.sstats.shape, dtype=model.dtype)
+                else:
+                    reply = model.projection
+                    model.projection = model.projection.empty_like()
+            elif command == 'reset':
+                if kind == 'lda':
+                    model.state = message[1]
+                    model.sync_state()
+                    model.state.reset()
+                else:
+                    model.projection = model.projection.empty_like()
+                reply = ('ok',)
+            else:
+                raise ValueError("unknown command %r" % command)
+        except Exception as err:
+            logger.exception("failed to process %s", command)
+            reply = ('error', repr(err))
+        send_message(conn, reply, compress)
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Worker of a distributed LdaModel or LsiModel using a SocketTransport.",
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("address", help="Address of the dispatcher, as HOST:PORT")
+    parser.add_argument("--authkey", help="Shared secret of the dispatcher", required=True)
+    parser.add_argument(
+        '-v', '--verbose', help='Verbose flag', action='store_const', dest="loglevel",
+        const=logging.INFO, default=logging.WARNING
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=args.loglevel)
+    logger.info("running %s", " ".join(sys.argv))
+
+    host, port = args.address.rsplit(':', 1)
+    if not args.authkey:
+        parser.error("the authkey must not be empty")
+    worker_loop(Client((host, int(port)), authkey=args.authkey.encode('utf8')))
+    logger.info("finished running %s", " ".join(sys.argv))
+
+
+if __name__ == '__main__':
+    main()
@@ -21,6 +21,15 @@ This actually creates several files:
 * `OUTPUT_PREFIX_tfidf.mm`: TF-IDF representation in Matix Market format
 * `OUTPUT_PREFIX_tfidf.mm.index`: index for `OUTPUT_PREFIX_tfidf.mm`
 * `OUTPUT_PREFIX.tfidf_model`: TF-IDF model
+* `OUTPUT_PREFIX_tokens.pkl`: tokenized articles, with its checkpoint in `OUTPUT_PREFIX_tokens.pkl.checkpoint`
+
+The tokenized articles are cached as they are extracted, so only the first pass
+parses the dump, and an interrupted run picks up from its last checkpoint when
+started again with the same arguments. Delete the cache once the run finishes.
+
+For a "multistream" dump, the index sitting next to it
+(`...-multistream-index.txt.bz2`) lets the worker processes decompress and
+parse separate parts of the dump in parallel.
 
 The output Matrix Market files can then be compressed (e.g., by bzip2) to save
 disk space; gensim's corpus iterators can work with compressed input, too.
@@ -80,7 +89,7 @@ if __name__ == '__main__':
     if online:
         dictionary = HashDictionary(id_range=keep_words, debug=debug)
         dictionary.allow_update = True  # start collecting document frequencies
-        wiki = WikiCorpus(inp, lemmatize=lemmatize, dictionary=dictionary)
+        wiki = WikiCorpus(inp, lemmatize=lemmatize, dictionary=dictionary, cache_fname=outp + '_tokens.pkl')
         # ~4h on my macbook pro without lemmatization, 3.1m articles (august 2012)
         MmCorpus.serialize(outp + '_bow.mm', wiki, progress_cnt=10000, metadata=True)
         # with HashDictionary, the token->id mapping is only fully instantiated now, after `serialize`
@@ -89,11 +98,13 @@ if __name__ == '__main__':
         wiki.save(outp + '_corpus.pkl.bz2')
         dictionary.allow_update = False
     else:
-        wiki = WikiCorpus(inp, lemmatize=lemmatize)  # takes about 9h on a macbook pro, for 3.5m articles (june 2011)
+        # takes about 9h on a macbook pro, for 3.5m articles (june 2011)
+        wiki = WikiCorpus(inp, lemmatize=lemmatize, cache_fname=outp + '_tokens.pkl')
         # only keep the most frequent words (out of total ~8.2m unique tokens)
         wiki.dictionary.filter_extremes(no_below=20, no_above=0.1, keep_n=DEFAULT_DICT_SIZE)
         # save dictionary and bag-of-words (term-document frequency matrix)
-        MmCorpus.serialize(outp + '_bow.mm', wiki, progress_cnt=10000, metadata=True)  # another ~9h
+        # reads the tokens cached by the first pass instead of parsing the dump again
+        MmCorpus.serialize(outp + '_bow.mm', wiki, progress_cnt=10000, metadata=True)
         wiki.dictionary.save_as_text(outp + '_wordids.txt.bz2')
         # load back the id->word mapping directly from file
         # this seems to save more memory, compared to keeping the wiki.dictionary object from above
@@ -233,6 +233,25 @@ def query_shard(args):
     return result
 
 
+def _yields_bow(corpus):
+    """Check whether the first document of `corpus` is in BoW format, rather than a numpy or scipy.sparse vector.
+
+    Parameters
+    ----------
+    corpus : :class:`~gensim.interfaces.CorpusABC`
+        Corpus, iterated again afterwards.
+
+    Returns
+    -------
+    bool
+        True if the first document is a BoW, False otherwise or if the corpus is empty.
+
+    """
+    for document in corpus:
+        return not isinstance(document, numpy.ndarray) and not scipy.sparse.issparse(document)
+    return False
+
+
 class Similarity(interfaces.SimilarityABC):
     """Compute cosine similarity of a dynamic query against a corpus of documents ('the index').
 
@@ -792,22 +811,33 @@ class MatrixSimilarity(interfaces.SimilarityABC):
                 )
             logger.info("creating matrix with %i documents and %i features", corpus_len, num_features)
             self.index = numpy.empty(shape=(corpus_len, num_features), dtype=dtype)
-            # iterate over corpus, populating the numpy index matrix with (normalized)
-            # document vectors
-            for docno, vector in enumerate(corpus):
-                if docno % 1000 == 0:
+            # only BoW documents can be read as sparse chunks: corpora yielding numpy or scipy.sparse vectors
+            # (such as ShardedCorpus with `gensim=False`) are stored without normalization below
+            if isinstance(corpus, interfaces.CorpusABC) and _yields_bow(corpus):
+                # populate the index in blocks of (normalized) documents, read as sparse chunks
+                docno = 0
+                for chunk in corpus.iter_csc_chunks(chunksize, num_terms=num_features, dtype=numpy.float32):
                     logger.debug("PROGRESS: at document #%i/%i", docno, corpus_len)
-                # individual documents in fact may be in numpy.scipy.sparse format as well.
-                # it's not documented because other it's not fully supported throughout.
-                # the user better know what he's doing (no normalization, must
-                # explicitly supply num_features etc).
-                if isinstance(vector, numpy.ndarray):
-                    pass
-                elif scipy.sparse.issparse(vector):
-                    vector = vector.toarray().flatten()
-                else:
-                    vector = matutils.unitvec(matutils.sparse2full(vector, num_features))
-                self.index[docno] = vector
+                    for vector in chunk.T.toarray():
+                        self.index[docno] = matutils.unitvec(vector)
+                        docno += 1
+            else:
+                # iterate over corpus, populating the numpy index matrix with (normalized)
+                # document vectors
+                for docno, vector in enumerate(corpus):
+                    if docno % 1000 == 0:
+                        logger.debug("PROGRESS: at document #%i/%i", docno, corpus_len)
+                    # individual documents in fact may be in numpy.scipy.sparse format as well.
+                    # it's not documented because other it's not fully supported throughout.
+                    # the user better know what he's doing (no normalization, must
+                    # explicitly supply num_features etc).
+                    if isinstance(vector, numpy.ndarray):
+                        pass
+                    elif scipy.sparse.issparse(vector):
+                        vector = vector.toarray().flatten()
+                    else:
+                        vector = matutils.unitvec(matutils.sparse2full(vector, num_features))
+                    self.index[docno] = vector
 
     def __len__(self):
         return self.index.shape[0]
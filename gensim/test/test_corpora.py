@@ -10,20 +10,27 @@ Automated tests for checking corpus I/O formats (the corpora package).
 
 from __future__ import unicode_literals
 
+import bz2
 import codecs
 import itertools
 import logging
 import os.path
+import re
 import tempfile
 import unittest
 
 import numpy as np
 
+import scipy.sparse
+
+from gensim import matutils, utils
 from gensim.corpora import (bleicorpus, mmcorpus, lowcorpus, svmlightcorpus,
-                            ucicorpus, malletcorpus, textcorpus, indexedcorpus, wikicorpus)
+                            ucicorpus, malletcorpus, textcorpus, indexedcorpus, wikicorpus, csrcorpus,
+                            prefetchcorpus, compressedcorpus)
+from gensim.corpora.dictionary import Dictionary, old2new_array, remap_bow
 from gensim.interfaces import TransformedCorpus
 from gensim.utils import to_unicode
-from gensim.test.utils import datapath, get_tmpfile, common_corpus
+from gensim.test.utils import datapath, get_tmpfile, common_corpus, common_texts
 
 
 class DummyTransformer(object):
@@ -106,6 +113,34 @@ class CorpusTestCase(unittest.TestCase):
         corpus2 = list(self.corpus_class(tmpf))
         self.assertEqual(corpus, corpus2)
 
+    def test_remap_ids(self):
+        if not hasattr(self.corpus_class, 'remap_ids'):
+            return
+        tmpf = get_tmpfile('gensim_corpus.tst')
+        self.corpus_class.serialize(tmpf, self.TEST_CORPUS)
+        corpus = self.corpus_class(tmpf)
+
+        old2new = np.array([0, -1, 1])
+        expected = [remap_bow(doc, old2new) for doc in corpus]
+        remapped = corpus.remap_ids(get_tmpfile('gensim_remapped.tst'), old2new)
+        self.assertEqual(list(remapped), expected)
+        self.assertEqual(remapped[2], expected[2])
+
+    def test_iter_csc_chunks(self):
+        fname = datapath('testcorpus.' + self.file_extension.lstrip('.'))
+        corpus = self.corpus_class(fname)
+        docs = list(corpus)
+        num_terms = 1 + max([termid for doc in docs for termid, _ in doc] or [0])
+        expected = matutils.corpus2csc(docs, num_terms=num_terms, num_docs=len(docs)).toarray()
+
+        for chunksize in [1, 4, 100]:
+            chunks = list(corpus.iter_csc_chunks(chunksize, num_terms=num_terms))
+            self.assertEqual([chunk.shape for chunk in chunks[:-1]], [(num_terms, chunksize)] * (len(chunks) - 1))
+            matrix = scipy.sparse.hstack(chunks).toarray() if chunks else np.zeros((num_terms, 0))
+            self.assertTrue(np.allclose(matrix, expected))
+        for chunk in corpus.iter_csc_chunks(2, num_terms=num_terms, dtype=np.float32):
+            self.assertEqual(chunk.dtype, np.float32)
+
     def test_serialize(self):
         corpus = self.TEST_CORPUS
         tmpf = get_tmpfile('gensim_corpus.tst')
@@ -248,6 +283,89 @@ class TestMmCorpusWithIndex(CorpusTestCase):
         self.assertEqual(self.corpus[3], [(1, 1.0), (5, 2.0), (8, 1.0)])
         self.assertEqual(tuple(self.corpus.index), (97, 121, 169, 201, 225, 249, 258, 276, 303))
 
+    def test_remap_ids_parallel(self):
+        dictionary = Dictionary(common_texts)
+        corpus = [dictionary.doc2bow(text) for text in common_texts]
+        tmpf = get_tmpfile('gensim_corpus.tst')
+        self.corpus_class.serialize(tmpf, corpus)
+        old2new = dictionary.filter_extremes(no_below=2, no_above=0.5)
+
+        remapped_fname, expected_fname = get_tmpfile('gensim_remapped.tst'), get_tmpfile('gensim_expected.tst')
+        for workers in (1, 3):
+            remapped = self.corpus_class(tmpf).remap_ids(remapped_fname, old2new, workers=workers)
+            expected = [dictionary.doc2bow(text) for text in common_texts]
+            self.assertEqual(list(remapped), expected)
+            self.assertEqual([remapped[docno] for docno in range(len(expected))], expected)
+            self.assertEqual(remapped.num_terms, len(dictionary))
+
+            # the output is identical to serializing the remapped corpus from scratch
+            self.corpus_class.serialize(expected_fname, expected, id2word=dictionary)
+            with open(remapped_fname, 'rb') as fin, open(expected_fname, 'rb') as fin_expected:
+                self.assertEqual(fin.read(), fin_expected.read())
+            self.assertEqual(list(remapped.index), list(self.corpus_class(expected_fname).index))
+
+        # irregular whitespace is rewritten line by line
+        block = b'1 2 0.5\n1\t3  1\n2 1 7\n'
+        out, docnos, line_offsets = mmcorpus._remap_mm_block(block, np.array([-1, 0, 1]))
+        self.assertEqual(out, b'1 1 0.5\n1 2 1\n')
+        self.assertEqual(docnos.tolist(), [0, 0])
+        self.assertEqual(line_offsets.tolist(), [0, 8])
+
+        # a mapping that changes the order of ids is handled too
+        remapped = self.corpus_class(tmpf).remap_ids(remapped_fname, {0: 2, 2: 0}, workers=2)
+        self.assertEqual(list(remapped), [remap_bow(doc, old2new_array({0: 2, 2: 0})) for doc in corpus])
+
+    def test_serialize_sparse(self):
+        # a sparse matrix with documents as columns (as from `Dictionary.doc2bow_batch`) is serialized directly
+        tmpf = get_tmpfile('gensim_corpus.tst')
+        self.corpus_class.serialize(tmpf, matutils.corpus2csc(self.TEST_CORPUS))
+        self.assertEqual(list(self.corpus_class(tmpf)), self.TEST_CORPUS)
+
+    def test_iter_parallel(self):
+        tmpf = get_tmpfile('gensim_corpus.tst')
+        docs = [[(termid, float(docno + termid)) for termid in range(docno % 7)] for docno in range(300)]
+        self.corpus_class.serialize(tmpf, docs)
+        corpus = self.corpus_class(tmpf)
+        expected = list(enumerate(corpus))
+        self.assertEqual([doc for doc in expected if doc[1]], [(i, doc) for i, doc in enumerate(docs) if doc])
+
+        for use_index in [True, False]:
+            if not use_index:
+                corpus.index = None
+            for workers in [1, 3]:
+                # tiny blocks, so that documents are split across blocks
+                self.assertEqual(list(corpus.iter_parallel(workers=workers, blocksize=50)), expected)
+                unordered = list(corpus.iter_parallel(workers=workers, ordered=False, blocksize=50))
+                self.assertEqual(sorted(unordered), expected)
+
+        # ranges never split a document
+        ranges = mmcorpus.mm_doc_ranges(tmpf, 10)
+        self.assertEqual(len(ranges), 10)
+        with open(tmpf, 'rb') as fin:
+            data = fin.read()
+        for (start, end), (next_start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, next_start)
+            last_line = data[start:end].splitlines()[-1]
+            self.assertNotEqual(last_line.split()[0], data[next_start:].split()[0])
+
+        self.assertEqual(list(self.corpus_class(tmpf, workers=2)), docs)
+
+        # stopping early leaves no thread blocked
+        iterator = corpus.iter_parallel(workers=2, blocksize=50)
+        next(iterator)
+        iterator.close()
+
+    def test_iter_parallel_errors(self):
+        tmpf = get_tmpfile('gensim_corpus.tst')
+        with open(tmpf, 'w') as fout:
+            fout.write('%%MatrixMarket matrix coordinate real general\n3 3 3\n1 1 1\n2 x 1\n3 1 1\n')
+        corpus = self.corpus_class(tmpf)
+        self.assertRaises(ValueError, lambda: list(corpus.iter_parallel(workers=2)))
+        with open(tmpf, 'w') as fout:
+            fout.write('%%MatrixMarket matrix coordinate real general\n3 3 3\n2 1 1\n1 2 1\n3 1 1\n')
+        corpus = self.corpus_class(tmpf)
+        self.assertRaises(ValueError, lambda: list(corpus.iter_parallel(workers=1)))
+
 
 class TestMmCorpusNoIndex(CorpusTestCase):
     def setUp(self):
@@ -280,6 +398,11 @@ class TestMmCorpusNoIndexGzip(CorpusTestCase):
         self.corpus = self.corpus_class(datapath('test_mmcorpus_no_index.mm.gz'))
         self.file_extension = '.mm'
 
+    def test_iter_parallel(self):
+        # compressed files are read sequentially
+        expected = list(enumerate(self.corpus))
+        self.assertEqual(list(self.corpus.iter_parallel(workers=2)), expected)
+
     def test_serialize_compressed(self):
         # MmCorpus needs file write with seek => doesn't support compressed output (only input)
         pass
@@ -394,6 +517,204 @@ class TestSvmLightCorpus(CorpusTestCase):
         self.assertEqual(serialized_corpus[1], second_corpus)
 
 
+class TestCsrCorpus(CorpusTestCase):
+    def setUp(self):
+        self.corpus_class = csrcorpus.CsrCorpus
+        self.file_extension = '.csr'
+
+    def test_serialize_compressed(self):
+        # binary format is memory-mapped, compression not supported
+        pass
+
+    def test_load_matches_mm(self):
+        corpus = self.corpus_class(datapath('testcorpus.csr'))
+        expected = list(mmcorpus.MmCorpus(datapath('testcorpus.mm')))
+        self.assertEqual(list(corpus), expected)
+        self.assertEqual(corpus.num_terms, 12)
+        self.assertEqual(corpus.num_nnz, 28)
+        self.assertEqual(corpus[-1], expected[-1])
+        self.assertRaises(IndexError, lambda: corpus[9])
+
+    def test_csr(self):
+        corpus = self.corpus_class(datapath('testcorpus.csr'))
+        dense = matutils.corpus2dense(mmcorpus.MmCorpus(datapath('testcorpus.mm')), 12).T
+        for start, stop in [(None, None), (2, 5), (8, 9), (4, 4), (-3, None)]:
+            sparse = corpus.csr(start, stop)
+            self.assertTrue(isinstance(sparse, scipy.sparse.csr_matrix))
+            self.assertTrue(np.allclose(sparse.toarray(), dense[start:stop]))
+        # no copy: the matrix is backed by the memory-mapped file
+        self.assertTrue(np.shares_memory(corpus.csr(2, 5).data, corpus.data))
+
+    def test_serialize_sparse(self):
+        tmpf = get_tmpfile('gensim_corpus.tst')
+        docs = list(mmcorpus.MmCorpus(datapath('testcorpus.mm')))
+        sparse = matutils.corpus2csc(docs)
+        for corpus in [sparse, matutils.Sparse2Corpus(sparse), self.corpus_class(datapath('testcorpus.csr'))]:
+            self.corpus_class.serialize(tmpf, corpus)
+            self.assertEqual(list(self.corpus_class(tmpf)), docs)
+
+    def test_serialize_chunks(self):
+        tmpf = get_tmpfile('gensim_corpus.tst')
+        corpus = [[(2, 1.0), (0, 3.0)], [], [(7, 0.5)]] * 5
+        self.corpus_class.save_corpus(tmpf, corpus, chunksize=4)
+        loaded = self.corpus_class(tmpf)
+        self.assertEqual(list(loaded), [sorted(doc) for doc in corpus])
+        self.assertEqual(loaded.num_terms, 8)
+        self.assertFalse(os.path.exists(tmpf + '.index'))
+
+    def test_pickle(self):
+        corpus = self.corpus_class(datapath('testcorpus.csr'))
+        tmpf = get_tmpfile('gensim_corpus.tst')
+        corpus.save(tmpf)
+        loaded = self.corpus_class.load(tmpf)
+        self.assertEqual(list(loaded), list(corpus))
+
+
+class TestBlockCompressedCorpus(unittest.TestCase):
+    def setUp(self):
+        self.fname = get_tmpfile('gensim_corpus.blk')
+        self.corpus = list(mmcorpus.MmCorpus(datapath('testcorpus.mm')))
+
+    def tearDown(self):
+        for ext in ('', '.index', '.vocab'):
+            try:
+                os.remove(self.fname + ext)
+            except OSError:
+                pass
+
+    def test_serializers(self):
+        serializers = [mmcorpus.MmCorpus, bleicorpus.BleiCorpus, svmlightcorpus.SvmLightCorpus, ucicorpus.UciCorpus]
+        for serializer in serializers:
+            compressedcorpus.BlockCompressedCorpus.serialize(
+                self.fname, self.corpus, serializer=serializer, docs_per_block=2
+            )
+            corpus = compressedcorpus.BlockCompressedCorpus(self.fname)
+            self.assertEqual(serializer, corpus.corpus_class)
+            self.assertEqual(5, len(corpus.raw_starts) - 1)
+            self.assertEqual(self.corpus, list(corpus))
+            self.assertEqual(len(self.corpus), len(corpus))
+            for docno in (8, 0, 3, 4):
+                self.assertEqual(self.corpus[docno], corpus[docno])
+            self.assertEqual(self.corpus[2:5], list(corpus[2:5]))
+
+    def test_parallel_iter(self):
+        corpus = [[(termid, float(count)) for termid, count in enumerate(np.random.randint(0, 3, 50)) if count]
+                  for _ in range(500)]
+        compressedcorpus.BlockCompressedCorpus.serialize(self.fname, corpus, docs_per_block=7, workers=3)
+        loaded = compressedcorpus.BlockCompressedCorpus(self.fname, workers=3)
+        self.assertEqual(corpus, list(loaded))
+        self.assertEqual(corpus[123], loaded[123])
+        # iterating while indexing into the same corpus
+        self.assertEqual(corpus[:3], [loaded[docno] for docno, _ in zip(range(3), loaded)])
+
+    def test_compression(self):
+        plain = get_tmpfile('gensim_corpus.mm')
+        corpus = [[(termid, float(count)) for termid, count in enumerate(np.random.randint(0, 2, 200)) if count]
+                  for _ in range(200)]
+        mmcorpus.MmCorpus.serialize(plain, corpus)
+        compressedcorpus.BlockCompressedCorpus.serialize(self.fname, corpus, codec='zlib')
+        self.assertLess(4 * os.path.getsize(self.fname), os.path.getsize(plain))
+
+    def test_block_file(self):
+        compressedcorpus.BlockCompressedCorpus.serialize(self.fname, self.corpus, docs_per_block=1)
+        corpus = compressedcorpus.BlockCompressedCorpus(self.fname)
+        expected_fname = get_tmpfile('gensim_corpus.mm')
+        mmcorpus.MmCorpus.save_corpus(expected_fname, self.corpus)
+        with open(expected_fname, 'rb') as fin:
+            expected = fin.read()
+        for workers in (1, 2):
+            fileobj = corpus.open(workers)
+            self.assertEqual(expected.splitlines(True), list(fileobj))
+            fileobj.seek(50)
+            self.assertEqual(expected[50:120], fileobj.read(70))
+            self.assertEqual(expected[120:].split(b'\n')[0] + b'\n', fileobj.readline())
+            fileobj.close()
+            self.assertEqual(expected, fileobj.read())
+            fileobj.release()
+
+    def test_errors(self):
+        self.assertRaises(
+            ValueError, compressedcorpus.BlockCompressedCorpus.serialize, self.fname, self.corpus, codec='rar'
+        )
+        self.assertRaises(ValueError, compressedcorpus.BlockCompressedCorpus, datapath('testcorpus.mm'))
+
+    def test_pickle(self):
+        compressedcorpus.BlockCompressedCorpus.serialize(self.fname, self.corpus)
+        corpus = compressedcorpus.BlockCompressedCorpus(self.fname)
+        self.assertEqual(self.corpus[1], corpus[1])
+        tmpf = get_tmpfile('gensim_corpus.tst')
+        corpus.save(tmpf)
+        self.assertEqual(self.corpus, list(compressedcorpus.BlockCompressedCorpus.load(tmpf)))
+
+
+class TestPrefetchCorpus(unittest.TestCase):
+    def setUp(self):
+        self.corpus = mmcorpus.MmCorpus(datapath('testcorpus.mm'))
+
+    def test_iter(self):
+        for mode in ('thread', 'process'):
+            corpus = prefetchcorpus.PrefetchCorpus(self.corpus, prefetch=1, chunksize=2, mode=mode)
+            self.assertEqual(list(self.corpus), list(corpus))
+            self.assertEqual(len(self.corpus), len(corpus))
+            self.assertEqual(5, corpus.stats['chunks'])
+            self.assertEqual(0, corpus.stats['pickled'])
+
+    def test_iter_csc_chunks(self):
+        expected = list(matutils.corpus2csc_chunks(self.corpus, 4, num_terms=20, dtype=np.float32))
+        for mode in ('thread', 'process'):
+            corpus = prefetchcorpus.PrefetchCorpus(self.corpus, mode=mode)
+            chunks = list(corpus.iter_csc_chunks(4, num_terms=20, dtype=np.float32))
+            self.assertEqual(len(expected), len(chunks))
+            for chunk, expected_chunk in zip(chunks, expected):
+                self.assertEqual((expected_chunk.shape, np.float32), (chunk.shape, chunk.dtype))
+                self.assertTrue(np.array_equal(expected_chunk.toarray(), chunk.toarray()))
+
+    def test_small_buffers(self):
+        corpus = prefetchcorpus.PrefetchCorpus(self.corpus, chunksize=2, mode='process', buffer_size=16)
+        self.assertEqual(list(self.corpus), list(corpus))
+        self.assertEqual(5, corpus.stats['pickled'])
+
+    def test_early_exit(self):
+        for mode in ('thread', 'process'):
+            corpus = prefetchcorpus.PrefetchCorpus(self.corpus, prefetch=1, chunksize=1, mode=mode)
+            for doc in corpus:
+                break
+            self.assertEqual(list(self.corpus)[0], doc)
+            self.assertEqual(1, corpus.stats['chunks'])
+
+    def test_errors(self):
+        class BrokenCorpus(object):
+            def __iter__(self):
+                yield [(0, 1.0)]
+                raise IOError("broken corpus")
+
+        self.assertRaises(IOError, list, prefetchcorpus.PrefetchCorpus(BrokenCorpus(), chunksize=1))
+        self.assertRaises(
+            RuntimeError, list, prefetchcorpus.PrefetchCorpus(BrokenCorpus(), chunksize=1, mode='process')
+        )
+        self.assertRaises(ValueError, prefetchcorpus.PrefetchCorpus, self.corpus, mode='fork')
+        self.assertRaises(ValueError, prefetchcorpus.PrefetchCorpus, self.corpus, prefetch=0)
+
+    def test_models(self):
+        from gensim.models import LdaModel, LsiModel
+        from gensim.similarities import Similarity
+
+        for mode in ('thread', 'process'):
+            corpus = prefetchcorpus.PrefetchCorpus(self.corpus, mode=mode)
+            expected = LdaModel(self.corpus, num_topics=2, chunksize=3, random_state=0)
+            lda = LdaModel(corpus, num_topics=2, chunksize=3, random_state=0)
+            self.assertEqual(3, corpus.stats['chunks'])
+            self.assertTrue(np.allclose(expected.get_topics(), lda.get_topics()))
+
+            expected = LsiModel(self.corpus, num_topics=2, chunksize=3)
+            lsi = LsiModel(corpus, num_topics=2, chunksize=3)
+            self.assertTrue(np.allclose(np.abs(expected.projection.u), np.abs(lsi.projection.u)))
+
+            expected = Similarity(None, self.corpus, num_features=12)
+            index = Similarity(None, corpus, num_features=12)
+            self.assertTrue(np.allclose(expected[self.corpus[0]], index[self.corpus[0]]))
+
+
 class TestBleiCorpus(CorpusTestCase):
     def setUp(self):
         self.corpus_class = bleicorpus.BleiCorpus
@@ -592,6 +913,42 @@ class TestTextCorpus(CorpusTestCase):
         sample2 = list(corpus.sample_texts(5, seed=42))
         self.assertEqual(sample1, sample2)
 
+    def test_workers(self):
+        lines = ["document %d with word%d and word%d" % (i, i % 7, i % 11) for i in range(2500)]
+        corpus = self.corpus_from_lines(lines)
+        parallel = self.corpus_class(corpus.input, workers=2, metadata=True)
+        self.assertEqual(corpus.dictionary.token2id, parallel.dictionary.token2id)
+        texts = list(parallel.get_texts())
+        self.assertEqual([text for text, _ in texts], list(corpus.get_texts()))
+        self.assertEqual([lineno for _, (lineno,) in texts], list(range(len(lines))))
+        self.assertEqual(len(parallel), len(lines))
+
+    def test_cache(self):
+        lines = ["document%d is cached" % i for i in range(10)]
+        corpus = self.corpus_from_lines(lines)
+        cache_dir = tempfile.mkdtemp()
+        cached = self.corpus_class(corpus.input, cache_dir=cache_dir)
+        cache_fname = cached.get_cache_fname()
+        self.assertTrue(os.path.exists(cache_fname))
+        self.assertEqual(list(cached.get_texts()), list(corpus.get_texts()))
+
+        # later passes don't preprocess again
+        cached.token_filters = []
+        cached.get_cache_fname = lambda: cache_fname
+        self.assertEqual(list(cached.get_texts()), list(corpus.get_texts()))
+
+        # a different pipeline or input gets a different cache
+        del cached.get_cache_fname
+        self.assertNotEqual(cached.get_cache_fname(), cache_fname)
+        cached.token_filters = [textcorpus.remove_short]
+        self.assertNotEqual(cached.get_cache_fname(), cache_fname)
+        cached.token_filters = [textcorpus.remove_short, textcorpus.remove_stopwords]
+        self.assertEqual(cached.get_cache_fname(), cache_fname)
+        with open(corpus.input, 'a') as fout:
+            fout.write('\nnew document')
+        self.assertNotEqual(cached.get_cache_fname(), cache_fname)
+        self.assertEqual(len(list(cached.get_texts())), 11)
+
     def test_save(self):
         pass
 
@@ -765,6 +1122,95 @@ class TestWikiCorpus(TestTextCorpus):
     #     self.assertEqual(type(first), list)
     #     self.assertTrue(isinstance(first[0], bytes) or isinstance(first[0], str))
 
+    @unittest.skipIf(wikicorpus.FAST_VERSION < 0, "the compiled wiki markup stripper is not available")
+    def test_compiled_markup_stripper(self):
+        from gensim.corpora import _wikimarkup
+        texts = [
+            'x\n{|\n|-\n! A !! B\n| bgcolor=red | 1 || [http://a.b c]\n|}\n<ref name=a/>[[a|b]] {{c|{{d}}}}',
+            'see [[File:a.png|thumb|caption [[b]]]]<!-- c -->\n[[Category:x]]\n[[en:A]]\n[[de:B]]\n',
+        ]
+        for fname in ('bgwiki-latest-pages-articles-shortened.xml.bz2', 'enwiki-table-markup.xml.bz2', self.enwiki):
+            with bz2.BZ2File(datapath(fname)) as fin:
+                texts.extend(text for _, text, _ in wikicorpus.extract_pages(fin))
+        for text in texts:
+            text = utils.decode_htmlentities(to_unicode(text))
+            self.assertEqual(_wikimarkup.remove_template(text), wikicorpus.remove_template(text))
+            self.assertEqual(_wikimarkup.remove_file(text), wikicorpus.remove_file(text))
+            for promote_remaining, simplify_links in itertools.product([True, False], repeat=2):
+                self.assertEqual(
+                    _wikimarkup.remove_markup(text, promote_remaining, simplify_links),
+                    wikicorpus.remove_markup(text, promote_remaining, simplify_links)
+                )
+
+    def _make_multistream(self, pages_per_stream=30):
+        """Split the sample dump into a multistream dump and its index, the way Wikipedia publishes them."""
+        with bz2.BZ2File(self.enwiki) as fin:
+            xml = fin.read()
+        parts = xml.split(b'<page>')
+        header, pages = parts[0], [b'<page>' + page for page in parts[1:]]
+        pages[-1], footer = pages[-1].split(b'</mediawiki>')
+        footer = b'</mediawiki>' + footer
+        fname = get_tmpfile('enwiki-pages-articles-multistream.xml.bz2')
+        index_fname = get_tmpfile('enwiki-pages-articles-multistream-index.txt.bz2')
+        index = []
+        with open(fname, 'wb') as fout:
+            fout.write(bz2.compress(header))
+            for start in range(0, len(pages), pages_per_stream):
+                offset = fout.tell()
+                group = pages[start:start + pages_per_stream]
+                for page in group:
+                    title = re.search(b'<title>(.*?)</title>', page).group(1)
+                    pageid = re.search(b'<id>(.*?)</id>', page).group(1)
+                    index.append(b'%d:%s:%s\n' % (offset, pageid, title))
+                fout.write(bz2.compress(b''.join(group)))
+            fout.write(bz2.compress(footer))
+        with bz2.BZ2File(index_fname, 'wb') as fout:
+            fout.write(b''.join(index))
+        return fname, index_fname
+
+    def test_multistream(self):
+        fname, index_fname = self._make_multistream()
+        self.assertEqual(wikicorpus.multistream_index_fname(fname), index_fname)
+
+        expected = self.corpus_class(self.enwiki, dictionary={})
+        expected.metadata = True
+        corpus = self.corpus_class(fname, dictionary={}, processes=2)
+        corpus.metadata = True
+        self.assertEqual(corpus.index_fname, index_fname)
+        self.assertEqual(list(corpus.get_texts()), list(expected.get_texts()))
+
+    def test_resume_from_checkpoint(self):
+        fname, _ = self._make_multistream(pages_per_stream=10)
+        cache_fname = get_tmpfile('enwiki_tokens.pkl')
+        for stale in (cache_fname, cache_fname + '.checkpoint'):
+            if os.path.exists(stale):
+                os.remove(stale)
+        expected = list(self.corpus_class(self.enwiki, dictionary={}).get_texts())
+
+        # stop after each batch, so that the next pass has to resume from a checkpoint
+        original_interval = wikicorpus.CHECKPOINT_INTERVAL
+        wikicorpus.CHECKPOINT_INTERVAL = -1
+        try:
+            corpus = self.corpus_class(fname, dictionary={}, processes=1, cache_fname=cache_fname)
+            texts = corpus.get_texts()
+            crashed = list(itertools.islice(texts, 20))
+            texts.close()
+            self.assertEqual(crashed, expected[:20])
+            checkpoint = utils.unpickle(cache_fname + '.checkpoint')
+            self.assertFalse(checkpoint['complete'])
+            self.assertTrue(0 < checkpoint['streams'] < 21)
+
+            self.assertEqual(list(corpus.get_texts()), expected)
+            self.assertTrue(utils.unpickle(cache_fname + '.checkpoint')['complete'])
+            # tokens cached with different settings are not reused
+            corpus = self.corpus_class(fname, dictionary={}, lower=False, cache_fname=cache_fname)
+            self.assertNotEqual(list(corpus.get_texts()), expected)
+            # a complete cache is read without touching the dump
+            os.remove(fname)
+            self.assertNotEqual(list(corpus.get_texts()), expected)
+        finally:
+            wikicorpus.CHECKPOINT_INTERVAL = original_interval
+
     def test_sample_text(self):
         # Cannot instantiate WikiCorpus from lines
         pass
@@ -781,6 +1227,14 @@ class TestWikiCorpus(TestTextCorpus):
         # An empty file is not legit XML
         pass
 
+    def test_workers(self):
+        # WikiCorpus parallelizes with its own `processes`
+        pass
+
+    def test_cache(self):
+        # WikiCorpus caches tokens with its own `cache_fname`
+        pass
+
     def test_custom_filterfunction(self):
         def reject_all(elem, *args, **kwargs):
             return False
@@ -878,6 +1332,59 @@ class TestTextDirectoryCorpus(unittest.TestCase):
         self.assertEqual(1, corpus.length)
         self.assertEqual('\n'.join(lines), docs[0])
 
+    def write_lines(self, dirpath, name, num_lines):
+        with open(os.path.join(dirpath, name), 'w') as f:
+            f.write('\n'.join('%s line %d with some words' % (name, i) for i in range(num_lines)))
+
+    def test_manifest(self):
+        dirpath = tempfile.mkdtemp()
+        self.write_lines(dirpath, 'a.txt', 10)
+        self.write_lines(dirpath, 'b.txt', 5)
+        with open(os.path.join(dirpath, 'c.txt'), 'wb') as f:
+            f.write(b'mac\rline\r\nwindows  \r\n\nunix\n')
+        manifest_fname = get_tmpfile('test_manifest.pkl')
+        if os.path.exists(manifest_fname):
+            os.remove(manifest_fname)
+
+        corpus = textcorpus.TextDirectoryCorpus(dirpath, lines_are_documents=True, manifest_fname=manifest_fname)
+        docs = list(corpus.getstream())
+        self.assertEqual(len(corpus), len(docs))
+        for docno, doc in enumerate(docs):
+            self.assertEqual(corpus.get_document(docno), doc)
+        self.assertEqual(list(corpus), [corpus[docno] for docno in range(len(docs))])
+        self.assertRaises(IndexError, corpus.get_document, len(docs))
+
+        # only the changed file is re-read
+        self.write_lines(dirpath, 'b.txt', 7)
+        corpus = textcorpus.TextDirectoryCorpus(
+            dirpath, lines_are_documents=True, manifest_fname=manifest_fname, dictionary=corpus.dictionary
+        )
+        unchanged = corpus.manifest[os.path.join(dirpath, 'a.txt')]
+        self.assertEqual(len(corpus), len(docs) + 2)
+        self.assertIs(corpus.manifest[os.path.join(dirpath, 'a.txt')], unchanged)
+        docs = list(corpus.getstream())
+        self.assertIn('b.txt line 6 with some words', docs)
+        self.assertEqual([corpus.get_document(docno) for docno in range(len(docs))], docs)
+
+        corpus.lines_are_documents = False
+        self.assertEqual(len(corpus), 3)
+        filenames = [os.path.basename(path) for path in corpus.iter_filepaths()]
+        self.assertEqual(corpus.get_document(filenames.index('c.txt')), 'mac\nline\nwindows  \n\nunix')
+
+    def test_workers(self):
+        dirpath = tempfile.mkdtemp()
+        for fileno in range(5):
+            self.write_lines(dirpath, 'file%d.txt' % fileno, 700)
+        for lines_are_documents in (True, False):
+            corpus = textcorpus.TextDirectoryCorpus(dirpath, lines_are_documents=lines_are_documents)
+            parallel = textcorpus.TextDirectoryCorpus(
+                dirpath, lines_are_documents=lines_are_documents, workers=2, metadata=True
+            )
+            self.assertEqual(corpus.dictionary.token2id, parallel.dictionary.token2id)
+            texts = list(parallel.get_texts())
+            self.assertEqual([text for text, _ in texts], list(corpus.get_texts()))
+            self.assertEqual([docno for _, (docno,) in texts], list(range(len(corpus))))
+
     def test_non_trivial_structure(self):
         """Test with non-trivial directory structure, shown below:
         .
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Unit tests for the `corpora.CompactDictionary` class.
+"""
+
+from collections import Mapping
+import logging
+import unittest
+
+import numpy as np
+
+from gensim import matutils
+from gensim.corpora import CompactDictionary, Dictionary
+from gensim.models import LdaModel, TfidfModel
+from gensim.test.utils import get_tmpfile, common_texts, common_corpus
+
+
+class TestCompactDictionary(unittest.TestCase):
+    def setUp(self):
+        self.texts = common_texts + [[u'žluťoučký', u'kůň', u'kůň']]
+        self.dictionary = Dictionary(self.texts)
+        self.compact = CompactDictionary.from_dictionary(self.dictionary)
+
+    def test_mapping(self):
+        d, compact = self.dictionary, self.compact
+        self.assertTrue(isinstance(compact, Mapping))
+        self.assertEqual(len(compact), len(d))
+        self.assertEqual(dict(compact.items()), dict(d.items()))
+        self.assertEqual(dict(compact.token2id.items()), d.token2id)
+        self.assertEqual(compact.token2id[u'kůň'], d.token2id[u'kůň'])
+        self.assertEqual(compact.token2id['kůň'.encode('utf8')], d.token2id[u'kůň'])
+        self.assertTrue(u'kůň' in compact.token2id)
+        self.assertFalse(u'unknown' in compact.token2id)
+        self.assertRaises(KeyError, lambda: compact[len(d)])
+        self.assertRaises(KeyError, lambda: compact.token2id['unknown'])
+
+    def test_statistics(self):
+        d, compact = self.dictionary, self.compact
+        self.assertEqual(dict(enumerate(compact.dfs.tolist())), d.dfs)
+        self.assertEqual(dict(enumerate(compact.cfs.tolist())), d.cfs)
+        self.assertEqual(
+            (compact.num_docs, compact.num_pos, compact.num_nnz), (d.num_docs, d.num_pos, d.num_nnz)
+        )
+        self.assertEqual(compact.to_dictionary().token2id, d.token2id)
+
+    def test_from_documents(self):
+        compact = CompactDictionary(self.texts)
+        self.assertEqual(dict(compact.items()), dict(self.dictionary.items()))
+
+    def test_sparse_ids(self):
+        d = Dictionary(self.texts)
+        d.token2id['gap'] = len(d) + 5
+        self.assertRaises(ValueError, CompactDictionary.from_dictionary, d)
+
+    def test_doc2bow(self):
+        texts = self.texts + [['unknown', 'human', 'human'], [], [b'human', u'system']]
+        for text in texts:
+            self.assertEqual(self.compact.doc2bow(text), self.dictionary.doc2bow(text))
+            self.assertEqual(self.compact.doc2idx(text), self.dictionary.doc2idx(text))
+        bows = self.compact.doc2bow_batch(texts)
+        self.assertEqual(list(matutils.Sparse2Corpus(bows)), [self.dictionary.doc2bow(text) for text in texts])
+        self.assertRaises(TypeError, self.compact.doc2idx, 'human')
+
+    def test_many_tokens(self):
+        texts = [['token%i' % i for i in range(j, j + 100)] for j in range(0, 5000, 50)]
+        d = Dictionary(texts)
+        compact = CompactDictionary.from_dictionary(d)
+        self.assertEqual(dict(compact.token2id.items()), d.token2id)
+        text = ['token4999', 'token0', 'tokenX']
+        self.assertEqual(compact.doc2bow(text), d.doc2bow(text))
+
+    def test_filter(self):
+        for method, args in [
+            ('filter_extremes', dict(no_below=2, no_above=0.5, keep_n=5)),
+            ('filter_extremes', dict(no_below=3, no_above=0.5, keep_n=None, keep_tokens=[u'kůň'])),
+            ('filter_n_most_frequent', dict(remove_n=3)),
+            ('filter_tokens', dict(bad_ids=[0, 5, 100])),
+            ('filter_tokens', dict(good_ids=[1, 2, 3])),
+        ]:
+            d = Dictionary(self.texts)
+            compact = CompactDictionary.from_dictionary(d)
+            expected = getattr(d, method)(**args)
+            old2new = getattr(compact, method)(**args)
+            self.assertEqual(old2new.tolist(), expected.tolist())
+            self.assertEqual(dict(compact.token2id.items()), d.token2id)
+            self.assertEqual(dict(enumerate(compact.dfs.tolist())), d.dfs)
+            self.assertEqual(dict(enumerate(compact.cfs.tolist())), d.cfs)
+
+    def test_save_load_mmap(self):
+        fname = get_tmpfile('gensim_compactdictionary.tst')
+        self.compact.save(fname, sep_limit=0)
+        loaded = CompactDictionary.load(fname, mmap='r')
+        self.assertTrue(isinstance(loaded.token_bytes, np.memmap))
+        self.assertEqual(dict(loaded.items()), dict(self.compact.items()))
+        self.assertEqual(loaded.doc2bow(self.texts[-1]), self.dictionary.doc2bow(self.texts[-1]))
+
+    def test_models(self):
+        compact = CompactDictionary.from_dictionary(Dictionary(common_texts))
+        tfidf = TfidfModel(dictionary=compact)
+        expected = TfidfModel(dictionary=Dictionary(common_texts))
+        self.assertEqual(tfidf.idfs, expected.idfs)
+
+        lda = LdaModel(common_corpus, id2word=compact, num_topics=2, passes=1, random_state=0)
+        self.assertEqual(lda.num_terms, len(compact))
+        self.assertTrue(all(word in compact.token2id for word, _ in lda.show_topic(0)))
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.WARNING)
+    unittest.main()
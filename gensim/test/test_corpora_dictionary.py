@@ -19,6 +19,7 @@ import os.path
 import scipy
 import gensim
 from gensim.corpora import Dictionary
+from gensim.corpora.dictionary import remap_bow
 from gensim.utils import to_utf8
 from gensim.test.utils import get_tmpfile, common_texts
 from six import PY3
@@ -149,6 +150,34 @@ class TestDictionary(unittest.TestCase):
         expected = {0: 2, 1: 2, 2: 2, 3: 2, 4: 2, 5: 2, 6: 2, 7: 2}
         self.assertEqual(d.dfs, expected)
 
+    def test_collection_frequencies(self):
+        d = Dictionary([['a', 'b', 'a'], ['a', 'c']])
+        self.assertEqual(d.cfs, {d.token2id['a']: 3, d.token2id['b']: 1, d.token2id['c']: 1})
+
+        d.filter_tokens(bad_ids=[d.token2id['b']])
+        self.assertEqual(d.cfs, {d.token2id['a']: 3, d.token2id['c']: 1})
+
+        d.merge_with(Dictionary([['c', 'd', 'c']]))
+        self.assertEqual(d.cfs, {d.token2id['a']: 3, d.token2id['c']: 3, d.token2id['d']: 1})
+
+    def test_filter_remap(self):
+        d = Dictionary(self.texts)
+        corpus = [d.doc2bow(text) for text in self.texts]
+        old2new = d.filter_extremes(no_below=2, no_above=0.5, keep_n=5)
+        self.assertEqual(len(old2new), 12)
+        self.assertEqual(sorted(old2new[old2new >= 0].tolist()), list(range(len(d))))
+        self.assertEqual([remap_bow(bow, old2new) for bow in corpus], [d.doc2bow(text) for text in self.texts])
+
+        old2new = d.filter_n_most_frequent(2)
+        self.assertEqual((old2new >= 0).sum(), len(d))
+
+        d = Dictionary(self.texts)
+        d.token2id['gap'] = 20
+        old2new = d.compactify()
+        self.assertEqual(old2new[20], len(d) - 1)
+        self.assertEqual(old2new[12:20].tolist(), [-1] * 8)
+        self.assertEqual(d.token2id['gap'], len(d) - 1)
+
     def testFilterTokens(self):
         self.maxDiff = 10000
         d = Dictionary(self.texts)
@@ -180,6 +209,34 @@ class TestDictionary(unittest.TestCase):
         # unicode must be converted to utf8
         self.assertEqual(d.doc2bow([u'\u017elu\u0165ou\u010dk\xfd']), [(0, 1)])
 
+    def test_doc2bow_batch(self):
+        d = Dictionary(self.texts)
+        texts = self.texts + [['unknown', 'human', 'human'], [], [b'human', u'system']]
+        bows = d.doc2bow_batch(texts)
+        self.assertEqual(bows.shape, (len(d), len(texts)))
+        self.assertEqual(list(gensim.matutils.Sparse2Corpus(bows)), [d.doc2bow(text) for text in texts])
+
+        # updating from a batch must give the same ids and statistics as updating document by document
+        texts = [['b', 'c', 'a', 'c'], ['d', 'a'], ['b', 'e', 'd', 'e', 'e']]
+        expected = Dictionary()
+        for text in texts:
+            expected.doc2bow(text, allow_update=True)
+        d = Dictionary()
+        d.doc2bow_batch(texts, allow_update=True)
+        self.assertEqual(d.token2id, expected.token2id)
+        self.assertEqual(d.dfs, expected.dfs)
+        self.assertEqual(d.cfs, expected.cfs)
+        self.assertEqual((d.num_docs, d.num_pos, d.num_nnz), (expected.num_docs, expected.num_pos, expected.num_nnz))
+
+        self.assertRaises(TypeError, d.doc2bow_batch, ['a b c'])
+
+    def test_doc2idx_batch(self):
+        d = Dictionary(self.texts)
+        texts = [['human', 'unknown', 'system'], [], ['trees']]
+        indptr, ids = d.doc2idx_batch(texts, unknown_word_index=-5)
+        self.assertEqual(indptr.tolist(), [0, 3, 3, 4])
+        self.assertEqual(ids.tolist(), [i for text in texts for i in d.doc2idx(text, unknown_word_index=-5)])
+
     def test_saveAsText(self):
         """`Dictionary` can be saved as textfile. """
         tmpf = get_tmpfile('save_dict_test.txt')
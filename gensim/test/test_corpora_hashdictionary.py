@@ -13,6 +13,7 @@ import unittest
 import os
 import zlib
 
+from gensim import matutils
 from gensim.corpora.hashdictionary import HashDictionary
 from gensim.test.utils import get_tmpfile, common_texts
 
@@ -135,6 +136,31 @@ class TestHashDictionary(unittest.TestCase):
         for ex in expected:
             self.assertEqual(d.token2id[ex], expected[ex])
 
+    def test_doc2bow_batch(self):
+        texts = self.texts + [[u'žluťoučký', u'kůň', u'kůň'], []]
+        expected = HashDictionary(myhash=zlib.adler32)
+        bows = [expected.doc2bow(text, allow_update=True) for text in texts]
+        for myhash in (zlib.adler32, lambda key: len(key)):
+            d = HashDictionary(myhash=myhash)
+            batch = d.doc2bow_batch(texts, allow_update=True)
+            self.assertEqual(batch.shape, (d.id_range, len(texts)))
+            self.assertEqual(list(matutils.Sparse2Corpus(batch)), [d.doc2bow(text) for text in texts])
+
+        d = HashDictionary(texts, myhash=zlib.adler32)
+        self.assertEqual(d.dfs, expected.dfs)
+        self.assertEqual(d.dfs_debug, expected.dfs_debug)
+        self.assertEqual(d.id2token, expected.id2token)
+        self.assertEqual((d.num_docs, d.num_pos, d.num_nnz), (expected.num_docs, expected.num_pos, expected.num_nnz))
+        self.assertEqual(list(matutils.Sparse2Corpus(d.doc2bow_batch(texts))), bows)
+
+    def test_debug_max_tokens(self):
+        d = HashDictionary(self.texts, debug_max_tokens=5)
+        self.assertEqual(len(d.token2id), 5)
+        self.assertEqual(set(d.dfs_debug), set(d.token2id))
+        self.assertEqual(sum(len(tokens) for tokens in d.id2token.values()), 5)
+        # hashing doesn't depend on the debug cap
+        self.assertEqual(d.doc2bow(self.texts[0]), HashDictionary().doc2bow(self.texts[0]))
+
     def testFilter(self):
         d = HashDictionary(self.texts, myhash=zlib.adler32)
         d.filter_extremes()
@@ -42,6 +42,14 @@ class TestHdpModel(unittest.TestCase, basetmtests.TestBaseTopicModel):
 
         return
 
+    def testTransformCorpus(self):
+        expected = [self.model[doc] for doc in corpus]
+        csr = self.model.transform_corpus(corpus, workers=2, output='csr', minimum_probability=0.01)
+        self.assertEqual(csr.shape[0], len(corpus))
+        for doc, row in zip(expected, csr):
+            self.assertEqual([topicid for topicid, _ in doc], row.indices.tolist())
+            self.assertTrue(np.allclose([value for _, value in doc], row.data))
+
     def testLDAmodel(self):
         """
         Create ldamodel object, and check if the corresponding alphas are equal.
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Automated tests for checking transformation algorithms (the models package).
+"""
+
+
+import logging
+import unittest
+
+import numpy as np
+
+from gensim.corpora import mmcorpus, Dictionary
+from gensim.models import ldagibbs, CoherenceModel
+from gensim.test import basetmtests
+from gensim.test.utils import datapath, get_tmpfile, common_texts
+
+dictionary = Dictionary(common_texts)
+corpus = [dictionary.doc2bow(text) for text in common_texts]
+
+
+@unittest.skipIf(ldagibbs.FAST_VERSION < 0, "the compiled Gibbs sampler is not available")
+class TestLdaGibbsModel(unittest.TestCase, basetmtests.TestBaseTopicModel):
+    def setUp(self):
+        self.corpus = mmcorpus.MmCorpus(datapath('testcorpus.mm'))
+        self.class_ = ldagibbs.LdaGibbsModel
+        self.model = self.class_(corpus, id2word=dictionary, num_topics=2, alpha=0.1, iterations=200, random_state=1)
+
+    def testCounts(self):
+        num_tokens = sum(cnt for doc in corpus for _, cnt in doc)
+        self.assertEqual(self.model.topic_counts.sum(), num_tokens)
+        self.assertTrue((self.model.word_topics >= 0).all())
+        np.testing.assert_array_equal(self.model.word_topics.sum(axis=0), self.model.topic_counts)
+        np.testing.assert_array_equal(
+            self.model.word_topics.sum(axis=1),
+            np.bincount([w for doc in corpus for w, _ in doc], weights=[c for doc in corpus for _, c in doc])
+        )
+
+    def testTransform(self):
+        # the two clusters of the toy corpus, "graph/trees/minors" and "human/computer/system", are separated
+        first, last = self.model[corpus[0]], self.model[corpus[-1]]
+        self.assertNotEqual(max(first, key=lambda x: x[1])[0], max(last, key=lambda x: x[1])[0])
+        self.assertAlmostEqual(sum(p for _, p in first), 1.0, places=5)
+
+        transformed = list(self.model[self.corpus])
+        self.assertEqual(len(transformed), len(self.corpus))
+        theta = self.model.inference(corpus + [[], [(100, 1)]])
+        self.assertEqual(theta.shape, (len(corpus) + 2, 2))
+        np.testing.assert_allclose(theta.sum(axis=1), 1.0)
+        np.testing.assert_allclose(theta[-1], [0.5, 0.5])  # no known words
+
+    def testInvalidIds(self):
+        for bad in ([(0, 1), (-1, 1)], [(0, 1), (len(dictionary), 1)]):
+            self.assertRaises(ValueError, self.model.train, [bad])
+        # unknown words, including negative ids, are skipped during inference
+        np.testing.assert_allclose(self.model.inference([[(-1, 3), (-len(dictionary), 2)]])[0], [0.5, 0.5])
+
+    def testNoExtension(self):
+        fast_version, ldagibbs.FAST_VERSION = ldagibbs.FAST_VERSION, -1
+        try:
+            self.assertRaises(RuntimeError, self.class_, corpus, id2word=dictionary, num_topics=2)
+        finally:
+            ldagibbs.FAST_VERSION = fast_version
+
+    def testThreads(self):
+        model = self.class_(corpus * 20, id2word=dictionary, num_topics=3, iterations=50, workers=4, random_state=1)
+        self.assertEqual(model.topic_counts.sum(), 20 * sum(cnt for doc in corpus for _, cnt in doc))
+        np.testing.assert_array_equal(model.word_topics.sum(axis=0), model.topic_counts)
+
+        model2 = self.class_(corpus * 20, id2word=dictionary, num_topics=3, iterations=50, workers=1, random_state=1)
+        model3 = self.class_(corpus * 20, id2word=dictionary, num_topics=3, iterations=50, workers=1, random_state=1)
+        np.testing.assert_array_equal(model2.word_topics, model3.word_topics)
+
+    def testCoherence(self):
+        coherence = CoherenceModel(model=self.model, corpus=corpus, dictionary=dictionary, coherence='u_mass')
+        self.assertTrue(np.isfinite(coherence.get_coherence()))
+
+    def testPersistence(self):
+        fname = get_tmpfile('gensim_models_ldagibbs.tst')
+        self.model.save(fname)
+        model2 = self.class_.load(fname)
+        np.testing.assert_array_equal(self.model.word_topics, model2.word_topics)
+        self.assertEqual(self.model.show_topics(), model2.show_topics())
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
+    unittest.main()
@@ -12,16 +12,19 @@ Automated tests for checking transformation algorithms (the models package).
 import logging
 import unittest
 import numbers
+import threading
+import time
 
 import six
 import numpy as np
 from numpy.testing import assert_allclose
+from scipy.special import gammaln, logsumexp
 
 from gensim.corpora import mmcorpus, Dictionary
 from gensim.models import ldamodel, ldamulticore
 from gensim import matutils, utils
 from gensim.test import basetmtests
-from gensim.test.utils import datapath, get_tmpfile, common_texts
+from gensim.test.utils import datapath, get_tmpfile, common_texts, temporary_file
 
 dictionary = Dictionary(common_texts)
 corpus = [dictionary.doc2bow(text) for text in common_texts]
@@ -64,6 +67,247 @@ class TestLdaModel(unittest.TestCase, basetmtests.TestBaseTopicModel):
             )
         self.assertTrue(passed)
 
+    def testSparseChunks(self):
+        # inference on a csc chunk (documents as columns) gives the same result as on the documents
+        chunk = list(self.corpus)
+        self.model.random_state = np.random.RandomState(0)
+        gamma, sstats = self.model.inference(chunk, collect_sstats=True)
+        self.model.random_state = np.random.RandomState(0)
+        sparse_gamma, sparse_sstats = self.model.inference(
+            matutils.corpus2csc(chunk, num_terms=len(dictionary)), collect_sstats=True
+        )
+        assert_allclose(gamma, sparse_gamma)
+        assert_allclose(sstats, sparse_sstats)
+        self.model.random_state = np.random.RandomState(0)
+        perplexity = self.model.log_perplexity(chunk)
+        self.model.random_state = np.random.RandomState(0)
+        self.assertAlmostEqual(perplexity, self.model.log_perplexity(matutils.corpus2csc(chunk)))
+
+        # training reads sparse chunks directly from the corpus, with the same result
+        model = ldamodel.LdaModel(self.corpus, id2word=dictionary, num_topics=2, passes=2, random_state=1)
+        expected = ldamodel.LdaModel(chunk, id2word=dictionary, num_topics=2, passes=2, random_state=1)
+        assert_allclose(model.state.sstats, expected.state.sstats)
+
+    @unittest.skipIf(ldamodel.FAST_VERSION < 0, "the compiled E-step is not available")
+    def testCompiledInference(self):
+        from gensim.models.ldamodel_inner import e_step
+        chunk = list(self.corpus) + [[]]
+        for dtype in (np.float32, np.float64):
+            model = self.class_(corpus, id2word=dictionary, num_topics=3, passes=2, random_state=1, dtype=dtype)
+            model.random_state = np.random.RandomState(0)
+            gamma, sstats = model.inference(chunk, collect_sstats=True)
+            ldamodel.FAST_VERSION = -1
+            try:
+                model.random_state = np.random.RandomState(0)
+                expected_gamma, expected_sstats = model.inference(chunk, collect_sstats=True)
+            finally:
+                ldamodel.FAST_VERSION = 1
+            self.assertEqual(gamma.dtype, dtype)
+            self.assertEqual(sstats.dtype, dtype)
+            assert_allclose(gamma, expected_gamma, rtol=1e-4)
+            assert_allclose(sstats, expected_sstats, rtol=1e-4, atol=1e-6)
+
+        # statistics are accumulated in place, and separate threads give the same result as one call
+        csc = matutils.corpus2csc(chunk, num_terms=len(dictionary), dtype=np.float64)
+        gamma = np.random.RandomState(0).gamma(100., 1. / 100., (len(chunk), 3))
+        args = (np.ascontiguousarray(model.expElogbeta), model.alpha, csc.indptr, csc.indices, csc.data)
+        sstats = np.zeros_like(model.expElogbeta)
+        e_step(*args, gamma=gamma.copy(), sstats=sstats)
+        accumulated = sstats.copy()
+        e_step(*args, gamma=gamma.copy(), sstats=accumulated)
+        assert_allclose(accumulated, 2 * sstats)
+
+        halves = [(0, 5), (5, len(chunk))]
+        partial = [np.zeros_like(sstats) for _ in halves]
+        gammas = [gamma[start:end].copy() for start, end in halves]
+        threads = [
+            threading.Thread(target=e_step, args=(
+                args[0], args[1], csc[:, start:end].indptr, csc[:, start:end].indices, csc[:, start:end].data,
+                gammas[i], partial[i]
+            ))
+            for i, (start, end) in enumerate(halves)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert_allclose(partial[0] + partial[1], sstats)
+
+    @unittest.skipIf(ldamodel.FAST_VERSION < 0, "the compiled E-step is not available")
+    def testCompiledInferenceReleasesGil(self):
+        from gensim.models.ldamodel_inner import e_step
+        random_state = np.random.RandomState(0)
+        num_topics, num_terms, num_docs = 200, 2000, 800
+        expElogbeta = random_state.gamma(1., 1., (num_topics, num_terms))
+        alpha = np.full(num_topics, 0.1)
+
+        def run(num_docs):
+            indptr = np.arange(0, 50 * num_docs + 1, 50)
+            indices = random_state.randint(0, num_terms, 50 * num_docs)
+            gamma = random_state.gamma(100., 1. / 100., (num_docs, num_topics))
+            return lambda: e_step(expElogbeta, alpha, indptr, indices, np.ones(len(indices)), gamma.copy())
+
+        long_run, short_run = run(num_docs), run(1)
+        started, duration = threading.Event(), []
+
+        def background():
+            started.set()
+            start = time.time()
+            long_run()
+            duration.append(time.time() - start)
+
+        thread = threading.Thread(target=background)
+        thread.start()
+        started.wait()
+        start = time.time()
+        time.sleep(0.05)
+        short_run()
+        elapsed = time.time() - start
+        thread.join()
+        # with the GIL held by the long E-step, this thread couldn't wake up and run until it finished
+        self.assertLess(elapsed, duration[0] / 2)
+
+    def testTruncateTopics(self):
+        sstats = np.array([[1., 0., 4.], [2., 0., 1.], [5., 0., 1.]])
+        ldamodel.truncate_topics(sstats, 1)
+        assert_allclose(sstats, [[0., 0., 6.], [0., 0., 0.], [8., 0., 0.]])
+
+        model = self.class_(corpus, id2word=dictionary, num_topics=3, passes=2, random_state=1, sstats_topk=1)
+        self.assertEqual(model.sstats_topk, 1)
+        gamma, sstats = model.inference(corpus, collect_sstats=True)
+        state = ldamodel.LdaState(model.eta, model.state.sstats.shape, model.dtype)
+        model.random_state = np.random.RandomState(0)
+        model.do_estep(corpus, state)
+        self.assertTrue(((state.sstats > 0).sum(axis=0) <= 1).all())
+        assert_allclose(state.sstats.sum(axis=0), sstats.sum(axis=0), rtol=1e-4)
+
+    def testMemoryBudget(self):
+        # the same updates as without a budget; compare LdaModel, whose updates don't depend on worker timing
+        kwargs = dict(id2word=dictionary, num_topics=5, passes=3, random_state=1, dtype=np.float64)
+        model = ldamodel.LdaModel(corpus, memory_budget=1000, **kwargs)
+        expected = ldamodel.LdaModel(corpus, **kwargs)
+        assert_allclose(model.state.sstats, expected.state.sstats)
+        assert_allclose(model.expElogbeta, expected.expElogbeta)
+
+        fname = get_tmpfile('gensim_models_lda_budget.tst')
+        model.save(fname)
+        model2 = ldamodel.LdaModel.load(fname, mmap='r')
+        self.assertEqual(model2.memory_budget, 1000)
+        model2.update(corpus)  # read-only expElogbeta is replaced rather than updated in place
+        model.update(corpus)
+        assert_allclose(model.expElogbeta, model2.expElogbeta)
+
+    def testFreeze(self):
+        model = self.class_(corpus, id2word=dictionary, num_topics=3, passes=5, random_state=1)
+        frozen = model.freeze()
+        self.assertIsInstance(frozen, ldamodel.LdaInferenceModel)
+        docs = list(self.corpus) + [[]]
+
+        # deterministic, and close to the model's own (randomly initialized) inference
+        gamma = frozen.inference(docs)
+        assert_allclose(frozen.inference(docs), gamma)
+        expected = model.inference(docs)[0]
+        assert_allclose(gamma / gamma.sum(axis=1)[:, None], expected / expected.sum(axis=1)[:, None], atol=1e-2)
+        self.assertEqual([frozen[doc] for doc in docs], list(frozen[docs]))
+        self.assertEqual(frozen.__getitem__(docs, chunksize=None), list(frozen[docs]))
+        for unknown in ([(0, 1.0), (-1, 1.0)], [(0, 1.0), (len(dictionary), 1.0)]):
+            self.assertRaises(ValueError, frozen.inference, [unknown])
+
+        ldamodel.FAST_VERSION, fast_version = -1, ldamodel.FAST_VERSION
+        try:
+            assert_allclose(frozen.inference(docs), gamma, rtol=1e-4)
+        finally:
+            ldamodel.FAST_VERSION = fast_version
+
+        frozen = model.freeze(dtype=np.float16)
+        self.assertEqual(frozen.expElogbeta.dtype, np.float16)
+        fname = get_tmpfile('gensim_models_lda_frozen.tst')
+        frozen.save(fname)
+        frozen2 = ldamodel.LdaInferenceModel.load(fname, mmap='r')
+        self.assertIsInstance(frozen2.expElogbeta, np.memmap)
+        assert_allclose(frozen2.inference(docs), frozen.inference(docs))
+        assert_allclose(frozen2.inference(docs), gamma, rtol=1e-2)
+
+    def testTransformCorpus(self):
+        model = self.class_(corpus, id2word=dictionary, num_topics=3, random_state=1, dtype=np.float64)
+        expected = matutils.corpus2dense(model.get_document_topics(corpus, minimum_probability=0), 3).T
+
+        # the initial gamma is random, so inferred topics are only the same up to convergence
+        dense = model.transform_corpus(corpus, workers=2, output='dense', chunksize=4)
+        assert_allclose(dense, expected, atol=1e-2)
+
+        csr = model.transform_corpus(corpus, output='csr', minimum_probability=0.2)
+        self.assertEqual(csr.shape, (len(corpus), 3))
+        assert_allclose(csr.toarray(), np.where(expected >= 0.2, expected, 0), atol=1e-2)
+
+        fname = get_tmpfile('gensim_lda_topics.mm')
+        topics = model.transform_corpus(corpus, workers=3, output='mmcorpus', fname=fname, chunksize=2)
+        self.assertEqual((len(topics), topics.num_terms), (len(corpus), 3))
+        assert_allclose(matutils.corpus2dense(topics, 3).T, np.where(expected >= 0.01, expected, 0), atol=1e-2)
+
+        self.assertEqual(model.transform_corpus([], output='dense').shape, (0, 3))
+        self.assertRaises(ValueError, model.transform_corpus, corpus, output='mmcorpus')
+
+    def testBound(self):
+        model = self.class_(corpus, id2word=dictionary, num_topics=3, chunksize=4, random_state=1, dtype=np.float64)
+        gamma, _ = model.inference(corpus)
+
+        # same as the document-by-document definition
+        Elogbeta = matutils.dirichlet_expectation(model.state.get_lambda())
+        expected = model.bound([], gamma=gamma[:0])
+        for doc, gammad in zip(corpus, gamma):
+            Elogthetad = matutils.dirichlet_expectation(gammad)
+            expected += sum(cnt * logsumexp(Elogthetad + Elogbeta[:, id]) for id, cnt in doc)
+            expected += np.sum((model.alpha - gammad) * Elogthetad)
+            expected += np.sum(gammaln(gammad) - gammaln(model.alpha))
+            expected += gammaln(np.sum(model.alpha)) - gammaln(np.sum(gammad))
+        self.assertAlmostEqual(model.bound(corpus, gamma=gamma), expected, places=6)
+        self.assertAlmostEqual(model.bound(matutils.corpus2csc(corpus), gamma=gamma), expected, places=6)
+
+        # inferred gamma doesn't depend on the number of threads
+        model.random_state = np.random.RandomState(0)
+        score = model.bound(corpus)
+        model.random_state = np.random.RandomState(0)
+        self.assertAlmostEqual(model.bound(corpus, workers=3), score)
+
+        # a random held-out subsample, the same for the same seed
+        sample = model.log_perplexity(corpus, sample=4, seed=1, workers=2)
+        docs = sorted(np.random.RandomState(1).choice(len(corpus), 4, replace=False))
+        held_out = [corpus[d] for d in docs]
+        self.assertAlmostEqual(
+            sample, model.log_perplexity(held_out, total_docs=len(corpus)), delta=abs(sample) * 0.05
+        )
+        model.random_state = np.random.RandomState(0)
+        sample = model.log_perplexity(corpus, sample=0.5, seed=1)
+        model.random_state = np.random.RandomState(0)
+        self.assertEqual(sample, model.log_perplexity(corpus, sample=0.5, seed=1))
+
+        # term ids out of the vocabulary
+        unknown = [[(0, 1.0), (len(dictionary) + 5, 1.0)]]
+        self.assertRaises(IndexError, model.log_perplexity, unknown)
+        self.assertRaises(IndexError, model.bound, unknown)
+
+    def testEvalSample(self):
+        model = self.class_(
+            id2word=dictionary, num_topics=2, chunksize=len(corpus), eval_every=1, eval_sample=3, eval_seed=2
+        )
+        calls = []
+        log_perplexity = ldamodel.LdaModel.log_perplexity
+
+        def recording_log_perplexity(self, chunk, **kwargs):
+            calls.append(kwargs)
+            return log_perplexity(self, chunk, **kwargs)
+
+        # patch the class rather than the instance, so LdaMulticore can still pickle the model for its workers
+        ldamodel.LdaModel.log_perplexity = recording_log_perplexity
+        try:
+            model.update(corpus)
+        finally:
+            ldamodel.LdaModel.log_perplexity = log_perplexity
+        self.assertTrue(calls)
+        for kwargs in calls:
+            self.assertEqual((kwargs['sample'], kwargs['seed']), (3, 2))
+
     def testAlphaAuto(self):
         model1 = self.class_(corpus, id2word=dictionary, alpha='symmetric', passes=10)
         modelauto = self.class_(corpus, id2word=dictionary, alpha='auto', passes=10)
@@ -504,6 +748,91 @@ class TestLdaMulticore(TestLdaModel):
     def testAlphaAuto(self):
         self.assertRaises(RuntimeError, self.class_, alpha='auto')
 
+    @unittest.skipIf(ldamodel.FAST_VERSION < 0, "the compiled E-step is not available")
+    def testThreadBackend(self):
+        kwargs = dict(id2word=dictionary, num_topics=3, chunksize=4, passes=3, eval_every=0, dtype=np.float64)
+        # a single thread follows exactly the same updates as LdaModel
+        model = self.class_(corpus * 5, workers=1, backend='thread', random_state=1, **kwargs)
+        expected = ldamodel.LdaModel(corpus * 5, random_state=1, **kwargs)
+        self.assertEqual(model.backend, 'thread')
+        assert_allclose(model.state.sstats, expected.state.sstats)
+        assert_allclose(model.expElogbeta, expected.expElogbeta)
+        self.assertEqual(model.num_updates, expected.num_updates)
+
+        model = self.class_(corpus * 5, workers=3, backend='thread', random_state=1, **kwargs)
+        model2 = self.class_(corpus * 5, workers=3, backend='thread', random_state=1, **kwargs)
+        assert_allclose(model.expElogbeta, model2.expElogbeta)
+        self.assertEqual(model.state.numdocs, 5 * len(corpus))
+        self.assertRaises(ValueError, self.class_, backend='gpu')
+
+    @unittest.skipIf(ldamodel.FAST_VERSION < 0, "the compiled E-step is not available")
+    def testCheckpoint(self):
+        class Interrupted(Exception):
+            pass
+
+        def interrupted_corpus(docs):
+            for doc in docs:
+                if doc is docs[-1]:
+                    raise Interrupted
+                yield doc
+
+        class FlakyCorpus(object):
+            # interrupts the training during the second pass
+            def __init__(self):
+                self.passes = 0
+
+            def __len__(self):
+                return len(corpus) * 5
+
+            def __iter__(self):
+                self.passes += 1
+                return iter(corpus * 5) if self.passes < 2 else interrupted_corpus(corpus * 5)
+
+        with temporary_file('gensim_lda_multicore.checkpoint') as fname:
+            kwargs = dict(
+                id2word=dictionary, num_topics=3, chunksize=4, passes=3, eval_every=0, dtype=np.float64, workers=2,
+                backend='thread', random_state=1, checkpoint_fname=fname, checkpoint_interval=0
+            )
+            self.assertRaises(Interrupted, self.class_, FlakyCorpus(), **kwargs)
+            checkpoint, sstats = ldamulticore.load_checkpoint(fname)
+            self.assertTrue(checkpoint['num_updates'] > 0)
+            self.assertTrue(isinstance(sstats, np.memmap))
+
+            # resuming from the checkpoint gives the same model as an uninterrupted training
+            model = self.class_(corpus * 5, **kwargs)
+            expected = self.class_(corpus * 5, **dict(kwargs, checkpoint_fname=None))
+            assert_allclose(model.state.sstats, expected.state.sstats)
+            assert_allclose(model.expElogbeta, expected.expElogbeta)
+            self.assertEqual(model.num_updates, expected.num_updates)
+            self.assertEqual(model.state.numdocs, expected.state.numdocs)
+
+            # the training is complete: nothing left to do
+            model = self.class_(corpus * 5, **kwargs)
+            assert_allclose(model.state.sstats, expected.state.sstats)
+
+            # a further update is a new training
+            model.update(corpus * 5)
+            self.assertEqual(model.num_updates, 2 * expected.num_updates)
+            self.assertEqual(ldamulticore.load_checkpoint(fname)[0]['num_updates'], model.num_updates)
+
+            # resuming with the process backend
+            kwargs.update(backend='process', checkpoint_fname=fname + '.process')
+            self.assertRaises(Interrupted, self.class_, FlakyCorpus(), **kwargs)
+            model = self.class_(corpus * 5, **kwargs)
+            self.assertEqual(model.num_updates, expected.num_updates)
+            self.assertEqual(model.state.numdocs, expected.state.numdocs)
+
+    def testSparseSstats(self):
+        accumulator = ldamulticore.SparseSstats(2, np.float64)
+        accumulator.add(np.array([1, 4]), np.array([[1., 2.], [3., 4.]]), 2)
+        accumulator.add(np.array([0, 4]), np.array([[5., 6.], [7., 8.]]), 1)
+        self.assertEqual(list(accumulator.terms), [0, 1, 4])
+        state = ldamodel.LdaState(np.full(6, 0.1), (2, 6), np.float64)
+        accumulator.merge_into(state)
+        assert_allclose(state.sstats, [[5., 1., 0., 0., 8., 0.], [7., 3., 0., 0., 12., 0.]])
+        self.assertEqual(state.numdocs, 3)
+        self.assertEqual(len(accumulator.terms), 0)
+
 
 # endclass TestLdaMulticore
 
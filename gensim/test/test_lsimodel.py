@@ -80,6 +80,20 @@ class TestLsiModel(unittest.TestCase, basetmtests.TestBaseTopicModel):
         ])
         self.assertTrue(np.allclose(abs(got), abs(expected)))  # must equal up to sign
 
+    def testTransformCorpus(self):
+        """Test the whole corpus transformation at once."""
+        expected = matutils.corpus2dense(self.model[self.corpus], 2).T
+        for workers in (1, 3):
+            dense = self.model.transform_corpus(self.corpus, workers=workers, output='dense', chunksize=2)
+            self.assertTrue(np.allclose(dense, expected))
+        csr = self.model.transform_corpus([doc for doc in self.corpus], output='csr')
+        self.assertTrue(np.allclose(csr.toarray(), expected))
+
+        # the projection of a single document has a single factor, the other topics are zero
+        model = lsimodel.LsiModel([list(self.corpus)[0]], num_topics=3)
+        self.assertEqual(model.transform_corpus(self.corpus, output='dense').shape, (len(self.corpus), 3))
+        self.assertEqual(model.transform_corpus([], output='dense').shape, (0, 3))
+
     def testOnlineTransform(self):
         corpus = list(self.corpus)
         doc = corpus[0]  # use the corpus' first document for testing
@@ -100,6 +100,25 @@ class TestNmf(unittest.TestCase, basetmtests.TestBaseTopicModel):
         # must contain the same values, up to re-ordering
         self.assertTrue(np.allclose(sorted(vec), sorted(expected), rtol=1e-4))
 
+    def testTransformCorpus(self):
+        expected = matutils.corpus2dense(self.model.get_document_topics(common_corpus, minimum_probability=0), 2).T
+        dense = self.model.transform_corpus(common_corpus, workers=2, output='dense')
+        self.assertEqual(dense.shape, (len(common_corpus), 2))
+        self.assertTrue(np.allclose(dense.sum(axis=1), 1))
+        # the chunk is solved at once, with a single stopping condition for all of its documents
+        self.assertTrue(np.allclose(dense, expected, atol=0.05))
+
+        fname = get_tmpfile('gensim_nmf_topics.mm')
+        topics = self.model.transform_corpus(common_corpus, output='mmcorpus', fname=fname, minimum_probability=0)
+        self.assertTrue(np.allclose(matutils.corpus2dense(topics, 2).T, dense, atol=0.05))
+
+        # empty documents get all-zero rows, as they get no topics from model[corpus]
+        empty = self.model.transform_corpus([[], common_corpus[0]], output='dense')
+        self.assertEqual(list(self.model[[[]]]), [[]])
+        self.assertTrue(np.all(empty[0] == 0))
+        self.assertTrue(np.allclose(empty[1].sum(), 1))
+        self.assertEqual(self.model.transform_corpus([[]]).nnz, 0)
+
     def testTopTopics(self):
         top_topics = self.model.top_topics(common_corpus)
 
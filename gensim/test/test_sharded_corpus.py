@@ -1,6 +1,7 @@
 """
 Testing the test sharded corpus.
 """
+import itertools
 import os
 
 import unittest
@@ -256,6 +257,73 @@ class TestShardedCorpus(unittest.TestCase):
             fname = dataset._shard_name(n)
             self.assertTrue(os.path.isfile(fname))
 
+    def test_remap_ids(self):
+
+        old2new = np.full(self.dim, -1, dtype=np.int64)
+        old2new[::3] = np.arange(len(old2new[::3]))
+        for sparse_serialization, mmap_shards in itertools.product((False, True), (False, True)):
+            corpus = ShardedCorpus(self.tmp_fname + '.src', self.data, dim=self.dim, shardsize=100,
+                                   sparse_serialization=sparse_serialization, mmap_shards=mmap_shards,
+                                   overwrite=True)
+            remapped = corpus.remap_ids(self.tmp_fname + '.remapped', old2new, workers=2)
+
+            self.assertEqual(len(old2new[::3]), remapped.dim)
+            self.assertEqual(corpus.n_shards, remapped.n_shards)
+            loaded = ShardedCorpus.load(self.tmp_fname + '.remapped')
+            for i in (0, 150, len(corpus) - 1):
+                expected = np.asarray(corpus[i]).reshape(-1)[::3]
+                self.assertTrue(np.allclose(expected, np.asarray(loaded[i]).reshape(-1)))
+
+        # a dict mapping to new ids with gaps or duplicates is rejected
+        for bad in ({0: 5, 2: 1}, {0: 0, 2: 0}):
+            self.assertRaises(ValueError, corpus.remap_ids, self.tmp_fname + '.remapped', bad)
+        remapped = corpus.remap_ids(self.tmp_fname + '.remapped', {0: 1, 2: 0})
+        self.assertTrue(np.allclose(np.asarray(remapped[0]).reshape(-1), np.asarray(corpus[0]).reshape(-1)[[2, 0]]))
+
+    def test_iter_csc_chunks(self):
+        for sparse_serialization in (False, True):
+            corpus = ShardedCorpus(self.tmp_fname + '.chunks', self.data, dim=self.dim, shardsize=100,
+                                   sparse_serialization=sparse_serialization, overwrite=True)
+            expected = np.asarray(corpus[0:len(corpus)])
+            # chunks spanning several shards, and chunks within one shard
+            for chunksize in (30, 250):
+                chunks = list(corpus.iter_csc_chunks(chunksize))
+                self.assertTrue(all(chunk.shape == (self.dim, chunksize) for chunk in chunks[:-1]))
+                self.assertTrue(np.allclose(sparse.hstack(chunks).toarray().T, expected))
+
+    def test_mmap_shards(self):
+        for sparse_serialization in (False, True):
+            expected = ShardedCorpus(self.tmp_fname + '.pickled', self.data, dim=self.dim, shardsize=100,
+                                     sparse_serialization=sparse_serialization, sparse_retrieval=True,
+                                     overwrite=True)
+            ShardedCorpus(self.tmp_fname + '.mmap', self.data, dim=self.dim, shardsize=100,
+                          sparse_serialization=sparse_serialization, sparse_retrieval=True,
+                          mmap_shards=True, overwrite=True)
+            loaded = ShardedCorpus.load(self.tmp_fname + '.mmap')
+            self.assertTrue(loaded.mmap_shards)
+
+            for key in (130, slice(220, 227), slice(50, 350), slice(0, len(loaded)), [250, 3, 130, 131, 3]):
+                self.assertEqual((expected[key] != loaded[key]).getnnz(), 0)
+
+            # a slice within one shard is a view into the memory-mapped shard
+            loaded.sparse_retrieval = sparse_serialization
+            item = loaded[220:227]
+            shard = loaded.current_shard.data if sparse_serialization else loaded.current_shard
+            view = item.data if sparse_serialization else item
+            self.assertTrue(np.may_share_memory(view, shard))
+            self.assertFalse(view.flags.writeable)
+
+    def test_mmap_shards_resize(self):
+        for sparse_serialization in (False, True):
+            corpus = ShardedCorpus(self.tmp_fname + '.mmap', self.data, dim=self.dim, shardsize=100,
+                                   sparse_serialization=sparse_serialization, mmap_shards=True, overwrite=True)
+            expected = np.asarray(corpus[0:len(corpus)])
+            corpus.resize_shards(250)
+            self.assertEqual(4, corpus.n_shards)
+            self.assertFalse(os.path.exists(corpus._shard_name(4)))
+            self.assertTrue(np.allclose(np.asarray(corpus[0:len(corpus)]), expected))
+            self.assertTrue(np.allclose(np.asarray(corpus[[999, 0, 500]]), expected[[999, 0, 500]]))
+
     def test_init_with_generator(self):
 
         def data_generator():
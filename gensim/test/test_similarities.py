@@ -23,7 +23,7 @@ from gensim.models import word2vec
 from gensim.models import doc2vec
 from gensim.models import KeyedVectors
 from gensim.models import TfidfModel
-from gensim import matutils, similarities
+from gensim import interfaces, matutils, similarities
 from gensim.models import Word2Vec, FastText
 from gensim.test.utils import (datapath, get_tmpfile,
     common_texts as texts, common_dictionary as dictionary, common_corpus as corpus)
@@ -296,6 +296,23 @@ class TestMatrixSimilarity(unittest.TestCase, _TestSimilarityABC):
     def setUp(self):
         self.cls = similarities.MatrixSimilarity
 
+    def testDenseCorpus(self):
+        # a CorpusABC may yield numpy or scipy.sparse vectors, which are stored as they are
+        class DenseCorpus(interfaces.CorpusABC):
+            def __init__(self, vectors):
+                self.vectors = vectors
+
+            def __iter__(self):
+                return iter(self.vectors)
+
+            def __len__(self):
+                return len(self.vectors)
+
+        vectors = [numpy.array([1, 2, 0]), numpy.array([0, 3, 4])]
+        for dense_corpus in (DenseCorpus(vectors), DenseCorpus([scipy.sparse.csr_matrix(vec) for vec in vectors])):
+            index = self.cls(dense_corpus, num_features=3)
+            numpy.testing.assert_array_equal(index.index, [[1, 2, 0], [0, 3, 4]])
+
 
 class TestWmdSimilarity(unittest.TestCase, _TestSimilarityABC):
     def setUp(self):
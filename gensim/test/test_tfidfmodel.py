@@ -14,6 +14,7 @@ import unittest
 
 import numpy as np
 
+from gensim import matutils
 from gensim.corpora.mmcorpus import MmCorpus
 from gensim.models import tfidfmodel
 from gensim.test.utils import datapath, get_tmpfile, common_dictionary, common_corpus
@@ -66,6 +67,11 @@ class TestTfidfModel(unittest.TestCase):
         model2 = tfidfmodel.TfidfModel(dictionary=common_dictionary)
         self.assertEqual(model1.idfs, model2.idfs)
 
+        # create the transformation model from a sparse matrix, documents as columns
+        model3 = tfidfmodel.TfidfModel(matutils.corpus2csc(common_corpus))
+        self.assertEqual(model1.dfs, model3.dfs)
+        self.assertEqual((model1.num_docs, model1.num_nnz), (model3.num_docs, model3.num_nnz))
+
     def test_persistence(self):
         # Test persistence without using `smartirs`
         fname = get_tmpfile('gensim_models.tst')
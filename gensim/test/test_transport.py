@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Automated tests for the local transports of distributed LDA and LSI.
+"""
+
+
+import logging
+import sys
+import time
+import unittest
+
+import numpy as np
+import scipy.linalg
+
+from gensim import matutils, utils
+from gensim.corpora.mmcorpus import MmCorpus
+from gensim.models import ldamodel, lsimodel, transport
+from gensim.test.utils import datapath, common_corpus, common_dictionary
+
+
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        self.corpus = MmCorpus(datapath('testcorpus.mm'))
+
+    def testMessages(self):
+        conn, other = transport.multiprocessing.Pipe()
+        for compress in (0, 1):
+            transport.send_message(conn, ('jobs', [[(0, 1.0)]]), compress)
+            self.assertEqual(transport.recv_message(other), ('jobs', [[(0, 1.0)]]))
+
+    def testSocketAuthkey(self):
+        self.assertEqual(transport.SocketTransport(('localhost', 9999), workers=1, authkey='key').authkey, b'key')
+        generated = transport.SocketTransport(('localhost', 9999), workers=1)
+        self.assertEqual(len(generated.authkey), 32)
+        self.assertNotEqual(generated.authkey, transport.SocketTransport(('localhost', 9999), workers=1).authkey)
+        self.assertRaises(ValueError, transport.SocketTransport, ('localhost', 9999), workers=1, authkey=b'')
+
+        # workers refuse to start without a key
+        argv = sys.argv
+        try:
+            for args in (['localhost:9999'], ['localhost:9999', '--authkey', '']):
+                sys.argv = ['transport.py'] + args
+                self.assertRaises(SystemExit, transport.main)
+        finally:
+            sys.argv = argv
+
+    def testDistributedLda(self):
+        model = ldamodel.LdaModel(
+            common_corpus, id2word=common_dictionary, num_topics=2, chunksize=2, passes=2, random_state=0,
+            distributed=transport.ProcessTransport(workers=2, batch_size=2)
+        )
+        try:
+            self.assertEqual(model.numworkers, 2)
+            topics = model.get_topics()
+            self.assertEqual(topics.shape, (2, len(common_dictionary)))
+            self.assertTrue(np.allclose(topics.sum(axis=1), 1.0, atol=1e-5))
+            # training moved the topics away from their random initialization
+            self.assertTrue(np.all(model.state.numdocs > 0))
+        finally:
+            model.dispatcher.exit()
+
+    def testWorkerError(self):
+        model = ldamodel.LdaModel(
+            id2word=common_dictionary, num_topics=2, eval_every=0, distributed=transport.ProcessTransport(workers=1)
+        )
+        try:
+            # the term id is out of range: the job fails in the worker, and the error reaches the training
+            self.assertRaises(RuntimeError, model.update, [[(0, 1.0), (len(common_dictionary) + 5, 1.0)]])
+            # the next iteration starts afresh
+            model.update(common_corpus)
+            self.assertTrue(np.all(np.isfinite(model.get_topics())))
+        finally:
+            model.dispatcher.exit()
+
+    def testDistributedLsi(self):
+        model = lsimodel.LsiModel(
+            self.corpus, num_topics=2, chunksize=3, distributed=transport.ProcessTransport(workers=2)
+        )
+        try:
+            serial = lsimodel.LsiModel(self.corpus, num_topics=2)
+            # merging the workers' decompositions is approximate, like the serial one-pass algorithm
+            self.assertTrue(np.allclose(model.projection.s, serial.projection.s, rtol=0.05))
+        finally:
+            model.dispatcher.exit()
+
+    def testWorkerDeath(self):
+        dispatcher = transport.ProcessTransport(workers=2).get_dispatcher('lsi')
+        dispatcher.initialize(
+            id2word=utils.dict_from_corpus(self.corpus), num_topics=9, chunksize=3, distributed=False
+        )
+        try:
+            chunks = [[doc for doc in self.corpus][i:i + 3] for i in range(0, len(self.corpus), 3)]
+            for chunk in chunks:
+                dispatcher.putjob(chunk)
+            while dispatcher.jobsdone() < len(chunks):
+                time.sleep(0.01)
+            # kill a worker after it finished its jobs: their results died with it, so they must be redone
+            victim = max(dispatcher.workers.values(), key=lambda worker: len(worker.completed))
+            self.assertTrue(victim.completed)
+            victim.process.terminate()
+            victim.process.join()
+            projection = dispatcher.getstate()
+            self.assertEqual(len(dispatcher.getworkers()), 1)
+
+            # with as many factors as documents, merging is exact and must find all singular values of the corpus
+            s = scipy.linalg.svd(matutils.corpus2dense(self.corpus, self.corpus.num_terms), compute_uv=False)
+            self.assertTrue(np.allclose(projection.s, s[:len(projection.s)]))
+        finally:
+            dispatcher.exit()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
+    unittest.main()
@@ -254,6 +254,10 @@ ext_modules = [
         include_dirs=[model_dir]),
     Extension('gensim.corpora._mmreader',
         sources=['./gensim/corpora/_mmreader.c']),
+    Extension('gensim.corpora._hashdictionary',
+        sources=['./gensim/corpora/_hashdictionary.c']),
+    Extension('gensim.corpora._wikimarkup',
+        sources=['./gensim/corpora/_wikimarkup.c']),
     Extension('gensim.models.fasttext_inner',
         sources=['./gensim/models/fasttext_inner.c'],
         include_dirs=[model_dir]),
@@ -263,7 +267,13 @@ ext_modules = [
     Extension('gensim._matutils',
         sources=['./gensim/_matutils.c']),
     Extension('gensim.models.nmf_pgd',
-        sources=['./gensim/models/nmf_pgd.c'])
+        sources=['./gensim/models/nmf_pgd.c']),
+    Extension('gensim.models.ldamodel_inner',
+        sources=['./gensim/models/ldamodel_inner.c'],
+        include_dirs=[model_dir]),
+    Extension('gensim.models.ldagibbs_inner',
+        sources=['./gensim/models/ldagibbs_inner.c'],
+        include_dirs=[model_dir]),
 ]
 
 if not (os.name == 'nt' and sys.version_info[0] < 3):